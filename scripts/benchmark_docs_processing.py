@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Benchmark documentation HTML processing on and off the event loop.
+
+Processes saved documentation pages concurrently with each HtmlProcessingPool mode while a
+ticker coroutine measures how late the event loop wakes it up. Inline processing is the
+behaviour before processing was moved off the loop.
+
+Usage:
+    python scripts/benchmark_docs_processing.py [--pages DIR] [--rounds N] [--workers N]
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from functools import partial
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.resources.processors.executor import HtmlProcessingPool  # noqa: E402
+from src.resources.processors.html_processor import HTML_PARSER, process_docs_html  # noqa: E402
+
+DEFAULT_PAGES = Path(__file__).resolve().parent.parent / "tests" / "fixtures" / "docs"
+TICK_SECONDS = 0.001
+
+
+async def _measure_lag(stop: asyncio.Event, lags: list[float]) -> None:
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        expected = loop.time() + TICK_SECONDS
+        await asyncio.sleep(TICK_SECONDS)
+        lags.append(max(0.0, loop.time() - expected))
+
+
+async def _run_mode(mode: str, pages: list[tuple[str, str]], rounds: int, workers: int) -> dict:
+    pool = HtmlProcessingPool(mode=mode, workers=workers)
+    # Start workers before timing so pool startup is not counted
+    await pool.run(partial(process_docs_html, url=pages[0][0]), pages[0][1])
+
+    stop = asyncio.Event()
+    lags: list[float] = []
+    ticker = asyncio.create_task(_measure_lag(stop, lags))
+    jobs = [(url, html) for url, html in pages for _ in range(rounds)]
+    started = time.perf_counter()
+    await asyncio.gather(
+        *(pool.run(partial(process_docs_html, url=url), html) for url, html in jobs)
+    )
+    elapsed = time.perf_counter() - started
+    stop.set()
+    await ticker
+    pool.shutdown()
+
+    lags.sort()
+    return {
+        "mode": mode,
+        "pages_per_second": len(jobs) / elapsed,
+        "p99_lag_ms": lags[int(len(lags) * 0.99) - 1] * 1000 if lags else elapsed * 1000,
+        "max_lag_ms": lags[-1] * 1000 if lags else elapsed * 1000,
+        "median_lag_ms": statistics.median(lags) * 1000 if lags else elapsed * 1000,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--pages", type=Path, default=DEFAULT_PAGES, help="Directory of .html pages"
+    )
+    parser.add_argument("--rounds", type=int, default=8, help="Times each page is processed")
+    parser.add_argument("--workers", type=int, default=min(4, os.cpu_count() or 1))
+    args = parser.parse_args()
+
+    pages = [
+        (f"https://help.splunk.com/en/splunk-enterprise/{path.stem}", path.read_text())
+        for path in sorted(args.pages.glob("*.html"))
+    ]
+    if not pages:
+        sys.exit(f"No .html pages found in {args.pages}")
+
+    size_kb = sum(len(html) for _, html in pages) / 1024
+    print(f"{len(pages)} page(s), {size_kb:.0f} KB, parser={HTML_PARSER}, workers={args.workers}")
+    print(f"{'mode':<8} {'pages/s':>9} {'p50 lag ms':>11} {'p99 lag ms':>11} {'max lag ms':>11}")
+    for mode in ("inline", "thread", "process"):
+        result = asyncio.run(_run_mode(mode, pages, args.rounds, args.workers))
+        print(
+            f"{result['mode']:<8} {result['pages_per_second']:>9.1f} "
+            f"{result['median_lag_ms']:>11.1f} {result['p99_lag_ms']:>11.1f} "
+            f"{result['max_lag_ms']:>11.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Benchmark the HTTP middleware stack: per-request overhead and SSE time to first byte.
+
+Calls a small Starlette app directly through ASGI (no sockets, so only middleware cost is
+measured) with three stacks:
+
+- none: the bare app
+- basehttp: header capture and a pass-through Sentry layer as ``BaseHTTPMiddleware``
+  subclasses, as before the middleware was rewritten
+- asgi: the current raw ASGI ``HeaderCaptureMiddleware`` and ``SentryHTTPMiddleware``
+
+Every request carries Splunk and session headers. The SSE endpoint sends one event, waits, then
+sends a second; time to first byte is measured until the first event reaches the server.
+
+Usage:
+    python scripts/benchmark_http_middleware.py [--requests N] [--streams N]
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from starlette.applications import Starlette  # noqa: E402
+from starlette.middleware.base import BaseHTTPMiddleware  # noqa: E402
+from starlette.requests import Request  # noqa: E402
+from starlette.responses import JSONResponse, StreamingResponse  # noqa: E402
+from starlette.routing import Route  # noqa: E402
+
+from src.core.sentry.http_middleware import SentryHTTPMiddleware  # noqa: E402
+from src.core.shared_context import http_headers_context  # noqa: E402
+from src.server import (  # noqa: E402
+    HEADER_CLIENT_CONFIG_CACHE,
+    HeaderCaptureMiddleware,
+    _extract_session_id_from_headers,
+    extract_client_config_from_headers,
+)
+
+SESSION_ID = "benchmark-session"
+HEADERS = [
+    (b"host", b"localhost:8001"),
+    (b"accept", b"application/json, text/event-stream"),
+    (b"content-type", b"application/json"),
+    (b"user-agent", b"benchmark/1.0"),
+    (b"mcp-session-id", SESSION_ID.encode()),
+    (b"x-splunk-host", b"splunk.example.com"),
+    (b"x-splunk-port", b"8089"),
+    (b"x-splunk-username", b"admin"),
+    (b"x-splunk-password", b"changeme"),
+    (b"x-splunk-verify-ssl", b"false"),
+]
+EVENT_GAP_SECONDS = 0.01
+
+
+class LegacyHeaderCapture(BaseHTTPMiddleware):
+    """Header capture as a BaseHTTPMiddleware (the implementation it replaced)."""
+
+    async def dispatch(self, request: Request, call_next):
+        headers = dict(request.headers)
+        http_headers_context.set(headers)
+        client_config = extract_client_config_from_headers(headers)
+        if client_config:
+            request.state.client_config = client_config
+            session_key = _extract_session_id_from_headers(headers)
+            if session_key:
+                HEADER_CLIENT_CONFIG_CACHE[session_key] = client_config
+        return await call_next(request)
+
+
+class LegacyPassThrough(BaseHTTPMiddleware):
+    """A BaseHTTPMiddleware that only forwards, like the Sentry layer with Sentry disabled."""
+
+    async def dispatch(self, request: Request, call_next):
+        return await call_next(request)
+
+
+async def ping(request: Request) -> JSONResponse:
+    return JSONResponse({"ok": True})
+
+
+async def events(request: Request) -> StreamingResponse:
+    async def stream():
+        yield b"event: message\ndata: {}\n\n"
+        await asyncio.sleep(EVENT_GAP_SECONDS)
+        yield b"event: message\ndata: {}\n\n"
+
+    return StreamingResponse(stream(), media_type="text/event-stream")
+
+
+def _build(stack: str):
+    app = Starlette(routes=[Route("/mcp", ping), Route("/events", events)])
+    if stack == "basehttp":
+        return LegacyHeaderCapture(LegacyPassThrough(app))
+    if stack == "asgi":
+        return HeaderCaptureMiddleware(SentryHTTPMiddleware(app))
+    return app
+
+
+def _scope(path: str) -> dict:
+    return {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": HEADERS,
+        "server": ("localhost", 8001),
+        "client": ("127.0.0.1", 50000),
+        "state": {},
+    }
+
+
+async def _request(app, path: str) -> tuple[float, float]:
+    """Return (seconds to first body bytes, seconds to completion) for one request."""
+    started = time.perf_counter()
+    first_body = None
+    done = asyncio.Event()
+
+    async def receive():
+        await done.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        nonlocal first_body
+        if message["type"] == "http.response.body":
+            if first_body is None and message.get("body"):
+                first_body = time.perf_counter()
+            if not message.get("more_body"):
+                done.set()
+
+    await app(_scope(path), receive, send)
+    finished = time.perf_counter()
+    return (first_body or finished) - started, finished - started
+
+
+async def _run_stack(stack: str, requests: int, streams: int) -> dict:
+    app = _build(stack)
+    for _ in range(50):
+        await _request(app, "/mcp")
+
+    request_times = [(await _request(app, "/mcp"))[1] for _ in range(requests)]
+    ttfb = [(await _request(app, "/events"))[0] for _ in range(streams)]
+
+    request_times.sort()
+    ttfb.sort()
+    return {
+        "stack": stack,
+        "mean_us": statistics.fmean(request_times) * 1e6,
+        "p99_us": request_times[int(len(request_times) * 0.99) - 1] * 1e6,
+        "ttfb_ms": statistics.median(ttfb) * 1000,
+        "ttfb_p99_ms": ttfb[int(len(ttfb) * 0.99) - 1] * 1000,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=5000, help="JSON requests per stack")
+    parser.add_argument("--streams", type=int, default=200, help="SSE requests per stack")
+    args = parser.parse_args()
+
+    try:
+        results = [
+            asyncio.run(_run_stack(stack, args.requests, args.streams))
+            for stack in ("none", "basehttp", "asgi")
+        ]
+    finally:
+        HEADER_CLIENT_CONFIG_CACHE.pop(SESSION_ID, None)
+
+    baseline = results[0]["mean_us"]
+    print(f"{args.requests} requests and {args.streams} SSE streams per stack")
+    print(
+        f"{'stack':<9} {'mean us':>9} {'p99 us':>9} {'overhead us':>12} "
+        f"{'ttfb ms':>9} {'ttfb p99 ms':>12}"
+    )
+    for result in results:
+        print(
+            f"{result['stack']:<9} {result['mean_us']:>9.1f} {result['p99_us']:>9.1f} "
+            f"{result['mean_us'] - baseline:>12.1f} {result['ttfb_ms']:>9.3f} "
+            f"{result['ttfb_p99_ms']:>12.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Build the offline documentation bundle served when help.splunk.com is unreachable.
+
+Renders every topic the documentation tools list (SPL commands, admin and troubleshooting
+topics, CIM data models, configuration spec files and Dashboard Studio topics) through the
+regular documentation resources, and packs each processed page into a compressed archive that
+the server reads through MCP_DOCS_BUNDLE_PATH.
+
+Usage:
+    python scripts/build_docs_bundle.py [--output PATH] [--version latest --version 9.4]
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.resources.dashboard_studio_docs import (  # noqa: E402
+    DASHBOARD_STUDIO_TOPICS,
+    DashboardStudioDocsResource,
+)
+from src.resources.docs_bundle import DEFAULT_BUNDLE_PATH, DocsBundleWriter  # noqa: E402
+from src.resources.docs_cache import doc_cache  # noqa: E402
+from src.resources.splunk_cim import CIMDataModelResource, SplunkCIMResource  # noqa: E402
+from src.resources.splunk_docs import (  # noqa: E402
+    AdminGuideResource,
+    SPLCommandResource,
+    SplunkSpecReferenceResource,
+    TroubleshootingResource,
+)
+from src.tools.docs.splunk_docs_tools import (  # noqa: E402
+    ADMIN_TOPICS,
+    COMMON_CONFIG_FILES,
+    SPL_COMMANDS,
+)
+
+
+def _resources(versions: list[str]) -> list:
+    resources = []
+    for version in versions:
+        resources += [SPLCommandResource(version, c["command"]) for c in SPL_COMMANDS]
+        resources += [AdminGuideResource(version, t["topic"]) for t in ADMIN_TOPICS]
+        resources += [
+            TroubleshootingResource(version, topic)
+            for topic in TroubleshootingResource.TROUBLESHOOTING_TOPICS
+        ]
+        resources += [
+            CIMDataModelResource(version, model) for model in SplunkCIMResource.CIM_DATA_MODELS
+        ]
+    # Spec files and Dashboard Studio topics are not versioned by the resources
+    resources += [SplunkSpecReferenceResource(config) for config in COMMON_CONFIG_FILES]
+    resources += [
+        DashboardStudioDocsResource(topic)
+        for topic, info in DASHBOARD_STUDIO_TOPICS.items()
+        if "url" in info
+    ]
+    return resources
+
+
+async def build(output: Path, versions: list[str], concurrency: int) -> int:
+    writer = DocsBundleWriter(versions)
+
+    def record(url: str, category: str, version: str, content: str | None) -> None:
+        if content is None:
+            writer.add_missing(url)
+        else:
+            writer.add(url, content, category, version)
+
+    # Crawl upstream only: skip the existing bundle and the persistent cache tier
+    doc_cache.bundle = None
+    doc_cache.disk = None
+    doc_cache.add_listener(record)
+
+    resources = _resources(versions)
+    limit = asyncio.Semaphore(concurrency)
+    failures = 0
+
+    async def render(resource) -> None:
+        nonlocal failures
+        async with limit:
+            try:
+                await resource.get_content(None)
+            except Exception as e:
+                failures += 1
+                print(f"  failed: {resource.uri}: {e}", file=sys.stderr)
+
+    started = time.perf_counter()
+    print(f"Rendering {len(resources)} documentation topics for versions {', '.join(versions)}")
+    await asyncio.gather(*(render(resource) for resource in resources))
+
+    if not writer.pages:
+        print("No documentation pages could be fetched; bundle not written", file=sys.stderr)
+        return 1
+
+    path = writer.write(output)
+    print(
+        f"Wrote {path} ({path.stat().st_size / 1024:.0f} KB): {len(writer.pages)} pages, "
+        f"{len(writer.missing)} missing, {failures} failed topics "
+        f"in {time.perf_counter() - started:.1f}s"
+    )
+    return 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--output", type=Path, default=Path(DEFAULT_BUNDLE_PATH))
+    parser.add_argument(
+        "--version",
+        action="append",
+        dest="versions",
+        help="Splunk documentation version to include (repeatable, default: latest)",
+    )
+    parser.add_argument("--concurrency", type=int, default=4, help="Topics rendered at once")
+    args = parser.parse_args()
+
+    sys.exit(asyncio.run(build(args.output, args.versions or ["latest"], args.concurrency)))
+
+
+if __name__ == "__main__":
+    main()
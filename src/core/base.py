@@ -6,6 +6,7 @@ Provides consistent interfaces and shared functionality for all MCP components.
 
 import logging
 from abc import ABC, abstractmethod
+from collections.abc import Callable
 from typing import Any
 
 from fastmcp import Context
@@ -28,6 +29,229 @@ class SplunkContext:
         self.client_config = client_config or {}
 
 
+def client_config_from_context(ctx: Context, log: logging.Logger = logger) -> dict[str, Any] | None:
+    """
+    Get client configuration from MCP context.
+
+    Checks multiple sources in priority order:
+    1. Context state (set by middleware per request)
+    2. HTTP request headers (for HTTP transport)
+    3. MCP client environment variables (lifespan context)
+
+    Args:
+        ctx: MCP context
+        log: Logger to report the chosen source to
+
+    Returns:
+        Client configuration dict or None
+    """
+    # Priority 1: Context state (preferred, set by middleware)
+    try:
+        if hasattr(ctx, "get_state"):
+            state_cfg = ctx.get_state("client_config")  # type: ignore[attr-defined]
+            if state_cfg:
+                log.debug(
+                    "Using client config from context state (keys=%s)", list(state_cfg.keys())
+                )
+                return state_cfg
+    except Exception as e:
+        log.debug("Failed to get client config from context state: %s", e)
+
+    # Priority 2: HTTP headers (using FastMCP runtime dependencies)
+    try:
+        from fastmcp.server.dependencies import get_http_headers
+
+        headers = get_http_headers(include_all=True)
+        if headers:
+            log.debug(
+                "Attempting to extract config from HTTP headers (available: %s)",
+                list(headers.keys()),
+            )
+
+            # Extract Splunk configuration from headers
+            from src.server import extract_client_config_from_headers
+
+            client_config = extract_client_config_from_headers(headers)
+
+            if client_config:
+                log.debug(
+                    "Using client config from HTTP headers (keys=%s)",
+                    list(client_config.keys()),
+                )
+                return client_config
+    except Exception as e:
+        log.debug("Failed to get client config from HTTP headers: %s", e)
+
+    # Priority 3: Lifespan context (client environment)
+    try:
+        splunk_ctx = ctx.request_context.lifespan_context
+        if hasattr(splunk_ctx, "client_config") and splunk_ctx.client_config:
+            log.debug("Using client config from environment variables")
+            return splunk_ctx.client_config
+    except Exception as e:
+        log.debug("Failed to get client config from lifespan context: %s", e)
+
+    log.debug("No client config found in any source")
+    return None
+
+
+def splunk_context_from(ctx: Context) -> Any:
+    """
+    Get Splunk context from available sources with proper fallback handling.
+
+    Returns:
+        SplunkContext object, dict, or None
+    """
+    try:
+        # Try lifespan context first (traditional path)
+        if hasattr(ctx.request_context, "lifespan_context"):
+            return ctx.request_context.lifespan_context
+    except Exception:
+        pass
+
+    try:
+        # Fallback: try to get from server instance (module initialization path)
+        from fastmcp.server.dependencies import get_server
+
+        server = get_server()
+        if hasattr(server, "_splunk_context"):
+            return server._splunk_context
+    except Exception:
+        pass
+
+    return None
+
+
+def splunk_available(ctx: Context) -> tuple[bool, client.Service | None, str]:
+    """
+    Check if Splunk is available and return status.
+
+    Returns:
+        Tuple of (is_available, service, error_message)
+    """
+    # Get splunk context from available sources
+    splunk_ctx = splunk_context_from(ctx)
+
+    # First, prefer per-request client configuration (HTTP headers / client env)
+    try:
+        client_config = None
+        # From HTTP request state (preferred for HTTP transport)
+        if (
+            hasattr(ctx.request_context, "request")
+            and hasattr(ctx.request_context.request, "state")
+            and hasattr(ctx.request_context.request.state, "client_config")
+        ):
+            client_config = ctx.request_context.request.state.client_config
+        # Or from context client_config (handle both dict and object)
+        elif splunk_ctx:
+            if hasattr(splunk_ctx, "client_config"):
+                client_config = splunk_ctx.client_config
+            elif isinstance(splunk_ctx, dict) and "client_config" in splunk_ctx:
+                client_config = splunk_ctx["client_config"]
+
+        if client_config:
+            try:
+                from src.client.splunk_client import get_splunk_service
+
+                service = get_splunk_service(client_config)
+                return True, service, ""
+            except Exception as e:
+                # Fall back to server default if client-config connection fails
+                logger.warning(f"Client-config Splunk connection failed in availability check: {e}")
+    except Exception:
+        # Ignore header/env extraction issues and continue with server default
+        pass
+
+    # Fallback: use server default service established at startup
+    # Handle both SplunkContext objects and dict formats
+    is_connected = False
+    service = None
+
+    if splunk_ctx:
+        if hasattr(splunk_ctx, "is_connected") and hasattr(splunk_ctx, "service"):
+            # SplunkContext object
+            is_connected = splunk_ctx.is_connected
+            service = splunk_ctx.service
+        elif isinstance(splunk_ctx, dict):
+            # Dict format
+            is_connected = splunk_ctx.get("is_connected", False)
+            service = splunk_ctx.get("service", None)
+
+    if not is_connected or not service:
+        return (
+            False,
+            None,
+            "Splunk service is not available. MCP server is running in degraded mode.",
+        )
+
+    return True, service, ""
+
+
+async def splunk_service_from_context(
+    ctx: Context,
+    tool_level_config: dict[str, Any] | None = None,
+    *,
+    client_config_from: Callable[[Context], dict[str, Any] | None] | None = None,
+    check_available: Callable[
+        [Context], tuple[bool, client.Service | None, str]
+    ] = splunk_available,
+    log: logging.Logger = logger,
+) -> client.Service:
+    """
+    Get Splunk service connection using client config or fallback to server default.
+
+    Priority order:
+    1. Tool-level configuration (passed as parameter)
+    2. MCP client configuration (from headers or environment)
+    3. Server default connection
+
+    Args:
+        ctx: MCP context
+        tool_level_config: Optional tool-level Splunk configuration
+        client_config_from: Resolves the MCP client configuration (default:
+            ``client_config_from_context``)
+        check_available: Resolves the server default connection
+        log: Logger to report the chosen connection to
+
+    Returns:
+        Splunk service connection
+
+    Raises:
+        Exception: If no connection available and client config doesn't work
+    """
+    # Priority 1: Tool-level configuration
+    if tool_level_config:
+        try:
+            from src.client.splunk_client import get_splunk_service
+
+            log.debug("Using tool-level Splunk configuration")
+            return get_splunk_service(tool_level_config)
+        except Exception as e:
+            log.warning(f"Failed to connect with tool-level config: {e}")
+
+    # Priority 2: MCP client configuration
+    if client_config_from is None:
+        client_config = client_config_from_context(ctx, log)
+    else:
+        client_config = client_config_from(ctx)
+    if client_config:
+        try:
+            from src.client.splunk_client import get_splunk_service
+
+            log.debug("Using MCP client configuration")
+            return get_splunk_service(client_config)
+        except Exception as e:
+            log.warning(f"Failed to connect with MCP client config: {e}")
+
+    # Priority 3: Server default connection
+    is_available, service, error = check_available(ctx)
+
+    if not is_available:
+        raise Exception(f"Splunk connection not available: {error}")
+
+    return service
+
+
 class BaseTool(ABC):
     """
     Base class for all MCP tools.
@@ -68,65 +292,9 @@ class BaseTool(ABC):
         """
         Get client configuration from MCP context.
 
-        Checks multiple sources in priority order:
-        1. Context state (set by middleware per request)
-        2. HTTP request headers (for HTTP transport)
-        3. MCP client environment variables (lifespan context)
-
-        Args:
-            ctx: MCP context
-
-        Returns:
-            Client configuration dict or None
+        See ``client_config_from_context`` for the sources, in priority order.
         """
-        # Priority 1: Context state (preferred, set by middleware)
-        try:
-            if hasattr(ctx, "get_state"):
-                state_cfg = ctx.get_state("client_config")  # type: ignore[attr-defined]
-                if state_cfg:
-                    self.logger.info(
-                        "Using client config from context state (keys=%s)", list(state_cfg.keys())
-                    )
-                    return state_cfg
-        except Exception as e:
-            self.logger.debug("Failed to get client config from context state: %s", e)
-
-        # Priority 2: HTTP headers (using FastMCP runtime dependencies)
-        try:
-            from fastmcp.server.dependencies import get_http_headers
-
-            headers = get_http_headers(include_all=True)
-            if headers:
-                self.logger.debug(
-                    "Attempting to extract config from HTTP headers (available: %s)",
-                    list(headers.keys()),
-                )
-
-                # Extract Splunk configuration from headers
-                from src.server import extract_client_config_from_headers
-
-                client_config = extract_client_config_from_headers(headers)
-
-                if client_config:
-                    self.logger.info(
-                        "Using client config from HTTP headers (keys=%s)",
-                        list(client_config.keys()),
-                    )
-                    return client_config
-        except Exception as e:
-            self.logger.debug("Failed to get client config from HTTP headers: %s", e)
-
-        # Priority 3: Lifespan context (client environment)
-        try:
-            splunk_ctx = ctx.request_context.lifespan_context
-            if hasattr(splunk_ctx, "client_config") and splunk_ctx.client_config:
-                self.logger.info("Using client config from environment variables")
-                return splunk_ctx.client_config
-        except Exception as e:
-            self.logger.debug("Failed to get client config from lifespan context: %s", e)
-
-        self.logger.debug("No client config found in any source")
-        return None
+        return client_config_from_context(ctx, self.logger)
 
     async def get_splunk_service(
         self, ctx: Context, tool_level_config: dict[str, Any] | None = None
@@ -134,49 +302,16 @@ class BaseTool(ABC):
         """
         Get Splunk service connection using client config or fallback to server default.
 
-        Priority order:
-        1. Tool-level configuration (passed as parameter)
-        2. MCP client configuration (from headers or environment)
-        3. Server default connection
-
-        Args:
-            ctx: MCP context
-            tool_level_config: Optional tool-level Splunk configuration
-
-        Returns:
-            Splunk service connection
-
-        Raises:
-            Exception: If no connection available and client config doesn't work
+        See ``splunk_service_from_context``; client configuration and the server default are
+        resolved through this tool's methods, so subclasses can override them.
         """
-        # Priority 1: Tool-level configuration
-        if tool_level_config:
-            try:
-                from src.client.splunk_client import get_splunk_service
-
-                self.logger.info("Using tool-level Splunk configuration")
-                return get_splunk_service(tool_level_config)
-            except Exception as e:
-                self.logger.warning(f"Failed to connect with tool-level config: {e}")
-
-        # Priority 2: MCP client configuration
-        client_config = self.get_client_config_from_context(ctx)
-        if client_config:
-            try:
-                from src.client.splunk_client import get_splunk_service
-
-                self.logger.info("Using MCP client configuration")
-                return get_splunk_service(client_config)
-            except Exception as e:
-                self.logger.warning(f"Failed to connect with MCP client config: {e}")
-
-        # Priority 3: Server default connection
-        is_available, service, error = self.check_splunk_available(ctx)
-
-        if not is_available:
-            raise Exception(f"Splunk connection not available: {error}")
-
-        return service
+        return await splunk_service_from_context(
+            ctx,
+            tool_level_config,
+            client_config_from=self.get_client_config_from_context,
+            check_available=self.check_splunk_available,
+            log=self.logger,
+        )
 
     def check_splunk_available(self, ctx: Context) -> tuple[bool, client.Service | None, str]:
         """
@@ -185,64 +320,7 @@ class BaseTool(ABC):
         Returns:
             Tuple of (is_available, service, error_message)
         """
-        # Get splunk context from available sources
-        splunk_ctx = self._get_splunk_context(ctx)
-
-        # First, prefer per-request client configuration (HTTP headers / client env)
-        try:
-            client_config = None
-            # From HTTP request state (preferred for HTTP transport)
-            if (
-                hasattr(ctx.request_context, "request")
-                and hasattr(ctx.request_context.request, "state")
-                and hasattr(ctx.request_context.request.state, "client_config")
-            ):
-                client_config = ctx.request_context.request.state.client_config
-            # Or from context client_config (handle both dict and object)
-            elif splunk_ctx:
-                if hasattr(splunk_ctx, "client_config"):
-                    client_config = splunk_ctx.client_config
-                elif isinstance(splunk_ctx, dict) and "client_config" in splunk_ctx:
-                    client_config = splunk_ctx["client_config"]
-
-            if client_config:
-                try:
-                    from src.client.splunk_client import get_splunk_service
-
-                    service = get_splunk_service(client_config)
-                    return True, service, ""
-                except Exception as e:
-                    # Fall back to server default if client-config connection fails
-                    logger.warning(
-                        f"Client-config Splunk connection failed in availability check: {e}"
-                    )
-        except Exception:
-            # Ignore header/env extraction issues and continue with server default
-            pass
-
-        # Fallback: use server default service established at startup
-        # Handle both SplunkContext objects and dict formats
-        is_connected = False
-        service = None
-
-        if splunk_ctx:
-            if hasattr(splunk_ctx, "is_connected") and hasattr(splunk_ctx, "service"):
-                # SplunkContext object
-                is_connected = splunk_ctx.is_connected
-                service = splunk_ctx.service
-            elif isinstance(splunk_ctx, dict):
-                # Dict format
-                is_connected = splunk_ctx.get("is_connected", False)
-                service = splunk_ctx.get("service", None)
-
-        if not is_connected or not service:
-            return (
-                False,
-                None,
-                "Splunk service is not available. MCP server is running in degraded mode.",
-            )
-
-        return True, service, ""
+        return splunk_available(ctx)
 
     def _get_splunk_context(self, ctx: Context):
         """
@@ -251,24 +329,7 @@ class BaseTool(ABC):
         Returns:
             SplunkContext object, dict, or None
         """
-        try:
-            # Try lifespan context first (traditional path)
-            if hasattr(ctx.request_context, "lifespan_context"):
-                return ctx.request_context.lifespan_context
-        except Exception:
-            pass
-
-        try:
-            # Fallback: try to get from server instance (module initialization path)
-            from fastmcp.server.dependencies import get_server
-
-            server = get_server()
-            if hasattr(server, "_splunk_context"):
-                return server._splunk_context
-        except Exception:
-            pass
-
-        return None
+        return splunk_context_from(ctx)
 
     def format_error_response(self, error: str, **kwargs) -> dict[str, Any]:
         """Format a consistent error response"""
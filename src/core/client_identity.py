@@ -348,6 +348,17 @@ class ClientConnectionManager:
             self._remove_client(client_id)
             self.logger.info(f"Cleaned up idle client: {client_id}")
 
+    def discard_connections(self) -> int:
+        """
+        Forget pooled connections without logging them out.
+
+        Used in forked worker processes: the sessions still belong to the parent, so each
+        worker opens its own connections on demand.
+        """
+        count = len(self._connections)
+        self._connections.clear()
+        return count
+
     def _remove_client(self, client_id: str):
         """Remove client and cleanup resources"""
         if client_id in self._connections:
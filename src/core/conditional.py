@@ -0,0 +1,162 @@
+"""
+Conditional resource reads.
+
+Clients that poll resources such as the SPL cheat sheet or Dashboard Studio references
+re-download the same content every time. A resource's ETag is the quoted MD5 of its content,
+the same hash ``EmbeddedResource`` keeps for cached content, so a client can derive it from the
+text it already holds. Clients pass the ETag they have:
+
+- in the resource URI: ``dashboard-studio://cheatsheet?if_none_match=<etag>``
+- or in the request metadata: ``{"_meta": {"ifNoneMatch": "<etag>"}}``
+
+and receive a small JSON not-modified marker instead of the content when it is unchanged.
+The ``if_none_match`` parameter is removed from the URI before the resource is resolved, so
+it works for static resources and templates alike.
+
+MCP ``resources/read`` results do not carry the ETag: the MCP SDK's ``ReadResourceContents``
+has no metadata field, so MCP clients compute it from the content they hold. Only custom HTTP
+routes send it, through ``conditional_response``, which sets an ``ETag`` header and answers a
+matching ``If-None-Match`` with ``304 Not Modified``.
+"""
+
+import hashlib
+import json
+import logging
+from collections.abc import Iterable, Sequence
+from typing import Any
+from urllib.parse import unquote_plus
+
+import mcp.types as mt
+from fastmcp.server.middleware import Middleware, MiddlewareContext
+from mcp.server.lowlevel.helper_types import ReadResourceContents
+from pydantic import AnyUrl
+from starlette.requests import Request
+from starlette.responses import Response
+
+logger = logging.getLogger(__name__)
+
+IF_NONE_MATCH_PARAM = "if_none_match"
+IF_NONE_MATCH_META = "ifNoneMatch"
+
+
+def content_etag(content: str | bytes) -> str:
+    """Quoted MD5 of content (UTF-8 encoded when text)."""
+    data = content.encode("utf-8") if isinstance(content, str) else content
+    return chunked_etag((data,))
+
+
+def chunked_etag(chunks: Iterable[bytes]) -> str:
+    """``content_etag`` of the concatenated chunks, without joining them."""
+    digest = hashlib.md5()
+    for chunk in chunks:
+        digest.update(chunk)
+    return f'"{digest.hexdigest()}"'
+
+
+def etag_matches(etag: str, if_none_match: str | None) -> bool:
+    """Whether an If-None-Match value (a list of ETags, quoted or not, or ``*``) matches."""
+    if not if_none_match:
+        return False
+    wanted = etag.strip('"')
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate.strip('"') == wanted:
+            return True
+    return False
+
+
+def split_if_none_match(uri: str) -> tuple[str, str | None]:
+    """Remove the ``if_none_match`` query parameter from a URI and return its value."""
+    base, sep, query = uri.partition("?")
+    if not sep:
+        return uri, None
+    value = None
+    kept = []
+    for pair in query.split("&"):
+        name, _, raw = pair.partition("=")
+        if name == IF_NONE_MATCH_PARAM:
+            value = unquote_plus(raw)
+        elif pair:
+            kept.append(pair)
+    if value is None:
+        return uri, None
+    return (f"{base}?{'&'.join(kept)}" if kept else base), value
+
+
+def not_modified_marker(etag: str) -> str:
+    return json.dumps({"status": "not_modified", "etag": etag})
+
+
+def _meta_if_none_match(context: MiddlewareContext) -> str | None:
+    if context.fastmcp_context is None:
+        return None
+    try:
+        meta = context.fastmcp_context.request_context.meta
+    except Exception:
+        return None
+    if meta is None:
+        return None
+    value = (meta.model_extra or {}).get(IF_NONE_MATCH_META)
+    return str(value) if value else None
+
+
+class ConditionalReadMiddleware(Middleware):
+    """Answers resource reads whose content matches the client's ETag with a marker."""
+
+    def __init__(self):
+        super().__init__()
+        self.conditional = 0
+        self.not_modified = 0
+        self.bytes_saved = 0
+
+    async def on_read_resource(
+        self,
+        context: MiddlewareContext[mt.ReadResourceRequestParams],
+        call_next,
+    ) -> Sequence[ReadResourceContents]:
+        uri, if_none_match = split_if_none_match(str(context.message.uri))
+        if if_none_match is not None:
+            context = context.copy(message=context.message.model_copy(update={"uri": AnyUrl(uri)}))
+        else:
+            if_none_match = _meta_if_none_match(context)
+
+        contents = list(await call_next(context))
+        if not if_none_match or len(contents) != 1:
+            return contents
+
+        self.conditional += 1
+        content = contents[0].content
+        etag = content_etag(content)
+        if not etag_matches(etag, if_none_match):
+            return contents
+        self.not_modified += 1
+        self.bytes_saved += len(content)
+        logger.debug("Resource %s not modified (%s)", uri, etag)
+        return [
+            ReadResourceContents(content=not_modified_marker(etag), mime_type="application/json")
+        ]
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "conditional": self.conditional,
+            "not_modified": self.not_modified,
+            "bytes_saved": self.bytes_saved,
+        }
+
+
+def conditional_response(
+    request: Request, content: str | bytes, media_type: str, headers: dict[str, str] | None = None
+) -> Response:
+    """Response with an ETag, or 304 when the request's If-None-Match already matches it."""
+    etag = content_etag(content)
+    headers = {**(headers or {}), "ETag": etag, "Cache-Control": "no-cache"}
+    if etag_matches(etag, request.headers.get("if-none-match")):
+        return Response(status_code=304, headers=headers)
+    return Response(content=content, media_type=media_type, headers=headers)
+
+
+conditional_reads = ConditionalReadMiddleware()
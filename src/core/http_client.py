@@ -0,0 +1,200 @@
+"""
+Shared, pooled HTTP client for outbound documentation fetches.
+
+Documentation, CIM and Dashboard Studio resources all fetch pages from help.splunk.com. Creating
+an ``httpx.AsyncClient`` per request pays DNS, TCP and TLS setup on every fetch; this module
+keeps one client per process whose connection pool is reused across requests. The client is
+opened when the HTTP server starts and closed on shutdown; when used outside that lifecycle
+(stdio transport, scripts, tests) it is opened lazily on first use.
+
+Environment variables:
+- MCP_HTTP_MAX_CONNECTIONS (default: 20)
+- MCP_HTTP_MAX_KEEPALIVE (default: 10)
+- MCP_HTTP_MAX_PER_HOST (default: 6)
+- MCP_HTTP_TIMEOUT_SECONDS (default: 30)
+- MCP_HTTP_CONNECT_TIMEOUT_SECONDS (default: 10)
+- MCP_HTTP2 (default: true; used when the ``h2`` package is installed)
+"""
+
+import asyncio
+import logging
+import os
+from typing import Any
+from urllib.parse import urlsplit
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+try:
+    import h2  # noqa: F401
+
+    HAS_HTTP2 = True
+except ImportError:
+    HAS_HTTP2 = False
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, default))
+    except ValueError:
+        logger.warning("Ignoring invalid %s=%r", name, os.getenv(name))
+        return default
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, default))
+    except ValueError:
+        logger.warning("Ignoring invalid %s=%r", name, os.getenv(name))
+        return default
+
+
+class SharedHttpClient:
+    """
+    Lifecycle-managed ``httpx.AsyncClient`` with a bounded pool and per-host concurrency caps.
+
+    Requests made through ``get`` are counted, and new connections are observed through
+    httpcore's trace hook, so ``stats`` reports how often pooled connections were reused.
+    """
+
+    def __init__(
+        self,
+        max_connections: int | None = None,
+        max_keepalive: int | None = None,
+        max_per_host: int | None = None,
+        timeout: float | None = None,
+        connect_timeout: float | None = None,
+        http2: bool | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ):
+        self.max_connections = max_connections or _env_int("MCP_HTTP_MAX_CONNECTIONS", 20)
+        self.max_keepalive = max_keepalive or _env_int("MCP_HTTP_MAX_KEEPALIVE", 10)
+        self.max_per_host = max_per_host or _env_int("MCP_HTTP_MAX_PER_HOST", 6)
+        self.timeout = timeout or _env_float("MCP_HTTP_TIMEOUT_SECONDS", 30.0)
+        self.connect_timeout = connect_timeout or _env_float(
+            "MCP_HTTP_CONNECT_TIMEOUT_SECONDS", 10.0
+        )
+        if http2 is None:
+            http2 = (os.getenv("MCP_HTTP2") or "true").strip().lower() == "true"
+        self.http2 = http2 and HAS_HTTP2
+        self._transport = transport
+        self._client: httpx.AsyncClient | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._host_limits: dict[str, asyncio.Semaphore] = {}
+        self.requests = 0
+        self.connections_opened = 0
+        self.errors = 0
+        self.http_versions: dict[str, int] = {}
+
+    @property
+    def is_open(self) -> bool:
+        return self._client is not None and not self._client.is_closed
+
+    async def start(self) -> None:
+        """Open the client on the running event loop (idempotent)."""
+        self._ensure_client()
+
+    async def aclose(self) -> None:
+        """Close the client and its pooled connections."""
+        client, self._client = self._client, None
+        self._host_limits.clear()
+        if client is not None and not client.is_closed:
+            await client.aclose()
+            logger.info("Closed shared HTTP client (%s)", self.stats())
+
+    async def get(
+        self,
+        url: str,
+        *,
+        headers: dict[str, str] | None = None,
+        timeout: float | None = None,
+    ) -> httpx.Response:
+        """
+        GET url through the shared pool.
+
+        Args:
+            url: Absolute URL
+            headers: Extra request headers
+            timeout: Overall timeout for this request; defaults to the client policy
+
+        Raises:
+            httpx.HTTPError: on transport failures; HTTP error statuses are returned as-is
+        """
+        client = self._ensure_client()
+        host = urlsplit(url).netloc
+        limit = self._host_limits.get(host)
+        if limit is None:
+            limit = self._host_limits[host] = asyncio.Semaphore(self.max_per_host)
+
+        request_timeout = (
+            httpx.Timeout(timeout, connect=self.connect_timeout)
+            if timeout is not None
+            else httpx.USE_CLIENT_DEFAULT
+        )
+
+        async with limit:
+            self.requests += 1
+            try:
+                response = await client.get(
+                    url,
+                    headers=headers,
+                    timeout=request_timeout,
+                    extensions={"trace": self._trace},
+                )
+            except httpx.HTTPError:
+                self.errors += 1
+                raise
+        self.http_versions[response.http_version] = (
+            self.http_versions.get(response.http_version, 0) + 1
+        )
+        return response
+
+    def stats(self) -> dict[str, Any]:
+        reused = max(0, self.requests - self.errors - self.connections_opened)
+        completed = self.requests - self.errors
+        return {
+            "open": self.is_open,
+            "http2": self.http2,
+            "limits": {
+                "max_connections": self.max_connections,
+                "max_keepalive": self.max_keepalive,
+                "max_per_host": self.max_per_host,
+                "timeout_seconds": self.timeout,
+                "connect_timeout_seconds": self.connect_timeout,
+            },
+            "requests": self.requests,
+            "errors": self.errors,
+            "connections_opened": self.connections_opened,
+            "connections_reused": reused,
+            "reuse_rate": round(reused / completed, 4) if completed > 0 else 0.0,
+            "http_versions": dict(self.http_versions),
+        }
+
+    def _ensure_client(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        if self._client is not None and not self._client.is_closed and self._loop is loop:
+            return self._client
+        # A client (and its semaphores) is bound to the loop it was opened on
+        self._host_limits.clear()
+        self._loop = loop
+        self._client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_keepalive,
+            ),
+            timeout=httpx.Timeout(self.timeout, connect=self.connect_timeout),
+            http2=self.http2,
+            follow_redirects=True,
+            transport=self._transport,
+        )
+        logger.debug("Opened shared HTTP client (http2=%s)", self.http2)
+        return self._client
+
+    async def _trace(self, event: str, info: dict[str, Any]) -> None:
+        if event == "connection.connect_tcp.complete":
+            self.connections_opened += 1
+
+
+# Shared by every documentation fetcher in the process
+shared_http_client = SharedHttpClient()
@@ -322,18 +322,26 @@ class ResourceLoader:
             self.logger.info("Registering troubleshooting documentation handler...")
 
             @self.mcp_server.resource(
-                "splunk-docs://{version}/troubleshooting/{topic}", name="get_troubleshooting_docs"
+                "splunk-docs://{version}/troubleshooting/{topic}{?section,max_chars,page}",
+                name="get_troubleshooting_docs",
             )
-            async def get_troubleshooting_docs(version: str, topic: str) -> str:
+            async def get_troubleshooting_docs(
+                version: str,
+                topic: str,
+                section: str | None = None,
+                max_chars: int | None = None,
+                page: int = 1,
+            ) -> str:
                 """Get Splunk troubleshooting documentation for specific version and topic"""
                 try:
+                    from ..resources.docs_sections import render_slice
                     from ..resources.splunk_docs import create_troubleshooting_resource
 
                     ctx = get_context()
 
                     resource = create_troubleshooting_resource(version, topic)
                     content = await resource.get_content(ctx)
-                    return content
+                    return render_slice(content, section, max_chars, page)
                 except Exception as e:
                     self.logger.error(f"Error getting troubleshooting docs for {topic}: {e}")
                     return f"""# Error: Troubleshooting Documentation
@@ -356,18 +364,26 @@ Try using the discovery resource: `splunk-docs://discovery`
             self.logger.info("Registering SPL command documentation handler...")
 
             @self.mcp_server.resource(
-                "splunk-docs://{version}/spl-reference/{command}", name="get_spl_command_docs"
+                "splunk-docs://{version}/spl-reference/{command}{?section,max_chars,page}",
+                name="get_spl_command_docs",
             )
-            async def get_spl_command_docs(version: str, command: str) -> str:
+            async def get_spl_command_docs(
+                version: str,
+                command: str,
+                section: str | None = None,
+                max_chars: int | None = None,
+                page: int = 1,
+            ) -> str:
                 """Get SPL command documentation for specific version and command"""
                 try:
+                    from ..resources.docs_sections import render_slice
                     from ..resources.splunk_docs import create_spl_command_resource
 
                     ctx = get_context()
 
                     resource = create_spl_command_resource(version, command)
                     content = await resource.get_content(ctx)
-                    return content
+                    return render_slice(content, section, max_chars, page)
                 except Exception as e:
                     self.logger.error(f"Error getting SPL command docs for {command}: {e}")
                     return f"""# Error: SPL Command Documentation
@@ -390,18 +406,26 @@ Try using the discovery resource: `splunk-docs://discovery`
             self.logger.info("Registering admin guide documentation handler...")
 
             @self.mcp_server.resource(
-                "splunk-docs://{version}/admin/{topic}", name="get_admin_guide_docs"
+                "splunk-docs://{version}/admin/{topic}{?section,max_chars,page}",
+                name="get_admin_guide_docs",
             )
-            async def get_admin_guide_docs(version: str, topic: str) -> str:
+            async def get_admin_guide_docs(
+                version: str,
+                topic: str,
+                section: str | None = None,
+                max_chars: int | None = None,
+                page: int = 1,
+            ) -> str:
                 """Get Splunk administration documentation for specific version and topic"""
                 try:
+                    from ..resources.docs_sections import render_slice
                     from ..resources.splunk_docs import create_admin_guide_resource
 
                     ctx = get_context()
 
                     resource = create_admin_guide_resource(version, topic)
                     content = await resource.get_content(ctx)
-                    return content
+                    return render_slice(content, section, max_chars, page)
                 except Exception as e:
                     self.logger.error(f"Error getting admin docs for {topic}: {e}")
                     return f"""# Error: Administration Documentation
@@ -423,17 +447,25 @@ Try using the discovery resource: `splunk-docs://discovery`
             # Register configuration spec documentation handler
             self.logger.info("Registering configuration spec documentation handler...")
 
-            @self.mcp_server.resource("splunk-spec://{config}", name="get_spec_reference_docs")
-            async def get_spec_reference_docs(config: str) -> str:
+            @self.mcp_server.resource(
+                "splunk-spec://{config}{?section,max_chars,page}", name="get_spec_reference_docs"
+            )
+            async def get_spec_reference_docs(
+                config: str,
+                section: str | None = None,
+                max_chars: int | None = None,
+                page: int = 1,
+            ) -> str:
                 """Get Splunk configuration specification documentation (auto-detects version)"""
                 try:
+                    from ..resources.docs_sections import render_slice
                     from ..resources.splunk_docs import create_spec_reference_resource
 
                     ctx = get_context()
 
                     resource = create_spec_reference_resource(config)
                     content = await resource.get_content(ctx)
-                    return content
+                    return render_slice(content, section, max_chars, page)
                 except Exception as e:
                     self.logger.error(f"Error getting spec docs for {config}: {e}")
                     return f"""# Error: Configuration Specification Documentation
@@ -464,17 +496,26 @@ Try using the discovery resource: `splunk-docs://discovery`
             # Register CIM data model documentation handler
             self.logger.info("Registering CIM data model documentation handler...")
 
-            @self.mcp_server.resource("splunk-cim://{version}/{model}", name="get_cim_data_model")
-            async def get_cim_data_model(version: str, model: str) -> str:
+            @self.mcp_server.resource(
+                "splunk-cim://{version}/{model}{?section,max_chars,page}", name="get_cim_data_model"
+            )
+            async def get_cim_data_model(
+                version: str,
+                model: str,
+                section: str | None = None,
+                max_chars: int | None = None,
+                page: int = 1,
+            ) -> str:
                 """Get Splunk CIM data model documentation for specific version and model"""
                 try:
+                    from ..resources.docs_sections import render_slice
                     from ..resources.splunk_cim import create_cim_data_model_resource
 
                     ctx = get_context()
 
                     resource = create_cim_data_model_resource(version, model)
                     content = await resource.get_content(ctx)
-                    return content
+                    return render_slice(content, section, max_chars, page)
                 except Exception as e:
                     self.logger.error(f"Error getting CIM docs for {model}: {e}")
                     return f"""# Error: CIM Data Model Documentation
@@ -505,18 +546,25 @@ Try using the discovery resource: `splunk-cim://discovery`
             self.logger.info("Registering Dashboard Studio documentation handler...")
 
             @self.mcp_server.resource(
-                "dashboard-studio://{topic}", name="get_dashboard_studio_docs"
+                "dashboard-studio://{topic}{?section,max_chars,page}",
+                name="get_dashboard_studio_docs",
             )
-            async def get_dashboard_studio_docs(topic: str) -> str:
+            async def get_dashboard_studio_docs(
+                topic: str,
+                section: str | None = None,
+                max_chars: int | None = None,
+                page: int = 1,
+            ) -> str:
                 """Get Dashboard Studio documentation for specific topic"""
                 try:
                     from ..resources.dashboard_studio_docs import create_dashboard_studio_resource
+                    from ..resources.docs_sections import render_slice
 
                     ctx = get_context()
 
                     resource = create_dashboard_studio_resource(topic)
                     content = await resource.get_content(ctx)
-                    return content
+                    return render_slice(content, section, max_chars, page)
                 except Exception as e:
                     self.logger.error(f"Error getting Dashboard Studio docs for {topic}: {e}")
                     return f"""# Error: Dashboard Studio Documentation
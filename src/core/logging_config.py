@@ -0,0 +1,207 @@
+"""
+Process-wide logging: a background writer thread, session correlation and sampling.
+
+Log calls on the event loop only render the message and enqueue the record; a ``QueueListener``
+thread formats and writes it to the log file and stderr, so slow disks or terminals do not
+stall request handling.
+
+Every record carries a ``session`` attribute read from the ``current_session_id`` ContextVar,
+which the HTTP and MCP middleware set per request. It is attached by a filter on the queue
+handler, so only records that pass the level check pay for it, and it is read in the emitting
+task, before the record crosses to the writer thread.
+
+Hot-path loggers can be sampled with MCP_LOG_SAMPLING, a comma-separated list of
+``logger=rate`` pairs (e.g. ``src.server=0.1,src.core.loader=0.5``). A rate of 0.1 keeps one
+record in ten for that logger and its children. Warnings and errors are never sampled.
+
+Environment variables:
+- MCP_LOG_LEVEL (default: INFO)
+- MCP_LOG_FORMAT (default: text; ``json`` writes one JSON object per line)
+- MCP_LOG_SAMPLING (default: none)
+"""
+
+import atexit
+import copy
+import json
+import logging
+import os
+import queue
+import threading
+from contextvars import ContextVar
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+TEXT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - [%(session)s] %(message)s"
+
+# Session correlation for logs; set by the HTTP and MCP middleware for each request
+current_session_id: ContextVar[str] = ContextVar("current_session_id", default="-")
+
+_queue_handler: QueueHandler | None = None
+_listener: QueueListener | None = None
+
+
+class LogQueueHandler(QueueHandler):
+    """Queue handler that keeps the traceback separate from the message for the writer."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.message = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+class SessionFilter(logging.Filter):
+    """Attach the current session id to each record as ``record.session``."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not hasattr(record, "session"):
+            record.session = current_session_id.get()
+        return True
+
+
+class SamplingFilter(logging.Filter):
+    """Keep one in every ``1/rate`` records below WARNING from the configured loggers."""
+
+    def __init__(self, rates: dict[str, float]):
+        super().__init__()
+        self.rates = {name: rate for name, rate in rates.items() if rate < 1}
+        self._every: dict[str, int] = {}
+        self._seen: dict[str, int] = {}
+        self._lock = threading.Lock()
+        self.dropped = 0
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING or not self.rates:
+            return True
+        every = self._every.get(record.name)
+        if every is None:
+            every = self._every[record.name] = self._interval(record.name)
+        if every == 1:
+            return True
+        with self._lock:
+            seen = self._seen.get(record.name, 0)
+            self._seen[record.name] = seen + 1
+        if seen % every == 0:
+            return True
+        self.dropped += 1
+        return False
+
+    def _interval(self, name: str) -> int:
+        # The most specific configured logger wins
+        while name:
+            rate = self.rates.get(name)
+            if rate is not None:
+                return max(1, round(1 / rate)) if rate > 0 else 1 << 62
+            name = name.rpartition(".")[0]
+        return 1
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per record with time, level, logger, session and message."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: dict[str, Any] = {
+            "time": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "session": getattr(record, "session", "-"),
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exception"] = record.exc_text
+        return json.dumps(entry, default=str)
+
+
+def parse_sampling(spec: str | None) -> dict[str, float]:
+    """Parse ``logger=rate,...``; invalid pairs are ignored with a warning."""
+    rates: dict[str, float] = {}
+    for item in (spec or "").split(","):
+        if not item.strip():
+            continue
+        name, _, rate = item.partition("=")
+        try:
+            rates[name.strip()] = min(1.0, max(0.0, float(rate)))
+        except ValueError:
+            logger.warning("Ignoring invalid MCP_LOG_SAMPLING entry %r", item)
+    return rates
+
+
+def configure_logging(
+    level: int,
+    log_file: str | None = None,
+    json_output: bool | None = None,
+    sampling: dict[str, float] | None = None,
+    force: bool = False,
+) -> QueueListener | None:
+    """
+    Route the root logger through a queue to a writer thread for the file and stderr handlers.
+
+    Like ``logging.basicConfig``, does nothing when the root logger already has handlers
+    (e.g. under pytest) unless ``force`` is set. Calling it again replaces the previous
+    configuration.
+    """
+    global _queue_handler, _listener
+    root = logging.getLogger()
+    if not force and any(handler is not _queue_handler for handler in root.handlers):
+        return None
+    if json_output is None:
+        json_output = (os.getenv("MCP_LOG_FORMAT") or "text").strip().lower() == "json"
+    if sampling is None:
+        sampling = parse_sampling(os.getenv("MCP_LOG_SAMPLING"))
+
+    formatter = JsonFormatter() if json_output else logging.Formatter(TEXT_FORMAT)
+    handlers: list[logging.Handler] = [logging.StreamHandler()]
+    if log_file:
+        handlers.insert(0, logging.FileHandler(log_file))
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    queue_handler = LogQueueHandler(queue.SimpleQueue())
+    queue_handler.addFilter(SessionFilter())
+    if sampling:
+        queue_handler.addFilter(SamplingFilter(sampling))
+
+    if _queue_handler is not None:
+        root.removeHandler(_queue_handler)
+        stop_logging()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+        handler.close()
+    root.addHandler(queue_handler)
+    root.setLevel(level)
+
+    _queue_handler = queue_handler
+    _listener = QueueListener(queue_handler.queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    return _listener
+
+
+def restart_logging() -> None:
+    """Start a new writer thread in a forked process; threads do not survive fork()."""
+    global _listener
+    if _queue_handler is None or _listener is None:
+        return
+    # Records queued by the parent before the fork are written by the parent
+    _queue_handler.queue = queue.SimpleQueue()
+    _listener = QueueListener(_queue_handler.queue, *_listener.handlers, respect_handler_level=True)
+    _listener.start()
+
+
+def stop_logging() -> None:
+    """Write queued records, stop the writer thread and close its handlers."""
+    global _listener
+    listener, _listener = _listener, None
+    if listener is not None:
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+
+
+atexit.register(stop_logging)
@@ -0,0 +1,213 @@
+"""
+Per-identity cache of rendered Splunk resources.
+
+``splunk://`` resources (apps, indexes, saved searches, recent searches, health and configuration
+files) and ``SplunkEmbeddedResource`` subclasses render their content from live REST calls. IDE
+clients poll resources, so every poll used to resolve a connection, ping Splunk and re-read every
+endpoint. Rendered content is kept per resource URI and identity for the ``CACHE_TTL_SECONDS``
+declared on each resource class:
+
+- concurrent reads of the same resource by the same identity share one render
+- once the TTL has passed, the stale content is returned while a background task renders it
+  again with the identity and Splunk service of the previous render; the refresh never sees the
+  request's context, so ``render`` must depend only on (identity, service) and values bound
+  when it was created
+- when a refresh fails (e.g. the session expired), the next read renders in the foreground
+  and reconnects with its own context, answering with the stale content if that fails too
+- content older than the TTL plus MCP_SPLUNK_RESOURCE_MAX_STALE_SECONDS is rendered again
+  before answering
+- renders that report an error are returned but not cached
+
+The identity covers the connection (scheme, host, port and user) and a hash of the credentials.
+Clients sharing a Splunk account share entries, but a client with different credentials never
+reads content rendered for another.
+
+Environment variables:
+- MCP_SPLUNK_RESOURCE_CACHE (default: true)
+- MCP_SPLUNK_RESOURCE_MAX_STALE_SECONDS (default: 600)
+- MCP_SPLUNK_RESOURCE_CACHE_MAX_ENTRIES (default: 512)
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Returns (identity, service) for the requesting client
+Connect = Callable[[], Awaitable[tuple[Any, Any]]]
+# Renders content with (identity, service); returns the content and whether it may be cached
+Render = Callable[[Any, Any], Awaitable[tuple[str, bool]]]
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, default))
+    except ValueError:
+        logger.warning("Ignoring invalid %s=%r", name, os.getenv(name))
+        return default
+
+
+def resource_cache_key(uri: str, client_config: dict[str, Any] | None) -> str:
+    """Cache key for a resource read with a client configuration (or the server default)."""
+    from src.client.splunk_client import get_splunk_config
+
+    from .server_info import connection_identity
+
+    config = get_splunk_config(client_config)
+    credentials = hashlib.sha256(str(config.get("password") or "").encode()).hexdigest()[:16]
+    return f"{uri}|{connection_identity(client_config)}|{credentials}"
+
+
+class SplunkResourceCache:
+    """Rendered resource content per (URI, identity), refreshed in the background once stale."""
+
+    def __init__(
+        self,
+        enabled: bool | None = None,
+        max_stale: float | None = None,
+        max_entries: int | None = None,
+    ):
+        if enabled is None:
+            enabled = (os.getenv("MCP_SPLUNK_RESOURCE_CACHE") or "true").strip().lower() == "true"
+        self.enabled = enabled
+        self.max_stale = (
+            _env_float("MCP_SPLUNK_RESOURCE_MAX_STALE_SECONDS", 600.0)
+            if max_stale is None
+            else max_stale
+        )
+        self.max_entries = int(
+            _env_float("MCP_SPLUNK_RESOURCE_CACHE_MAX_ENTRIES", 512)
+            if max_entries is None
+            else max_entries
+        )
+        self._entries: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._loading: dict[str, asyncio.Task] = {}
+        self._refreshing: set[asyncio.Task] = set()
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.refreshes = 0
+        self.failures = 0
+
+    async def get(self, key: str, ttl: float, connect: Connect, render: Render) -> str:
+        """
+        Return the content for key, rendering it only when it is missing or too old.
+
+        ``connect`` is only awaited by a foreground render for this caller. Errors raised
+        while rendering on a miss propagate to every caller waiting on that render, unless
+        stale content is still within MCP_SPLUNK_RESOURCE_MAX_STALE_SECONDS.
+        """
+        if not self.enabled or ttl <= 0:
+            return await self._render(key, connect, render, store=False)
+
+        now = time.monotonic()
+        entry = self._entries.get(key)
+        stale: str | None = None
+        if entry is not None:
+            age = now - entry["rendered_at"]
+            content: str = entry["content"]
+            if age <= ttl:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return content
+            if age <= ttl + self.max_stale:
+                if entry["service"] is not None:
+                    self.stale_hits += 1
+                    self._schedule_refresh(key, render, entry)
+                    return content
+                stale = content
+
+        self.misses += 1
+        task = self._loading.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._render(key, connect, render))
+            self._loading[key] = task
+            task.add_done_callback(lambda done: self._forget_load(key, done))
+        else:
+            self.coalesced += 1
+        try:
+            rendered: str = await asyncio.shield(task)
+        except Exception as e:
+            if stale is None:
+                raise
+            self.failures += 1
+            logger.warning("Serving stale %s: %s", key.split("|", 1)[0], e)
+            return stale
+        return rendered
+
+    def invalidate(self, prefix: str | None = None) -> int:
+        """Forget entries whose key starts with prefix (a resource URI), or all of them."""
+        keys = [key for key in self._entries if prefix is None or key.startswith(prefix)]
+        for key in keys:
+            del self._entries[key]
+        return len(keys)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "entries": len(self._entries),
+            "max_stale_seconds": self.max_stale,
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "refreshes": self.refreshes,
+            "failures": self.failures,
+        }
+
+    def _store(self, key: str, content: str, identity: Any, service: Any) -> None:
+        self._entries[key] = {
+            "content": content,
+            "identity": identity,
+            "service": service,
+            "rendered_at": time.monotonic(),
+        }
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _schedule_refresh(self, key: str, render: Render, entry: dict[str, Any]) -> None:
+        if key in self._loading:
+            return
+        task = asyncio.ensure_future(self._refresh(key, render, entry))
+        self._loading[key] = task
+        self._refreshing.add(task)
+        task.add_done_callback(self._refreshing.discard)
+        task.add_done_callback(lambda done: self._forget_load(key, done))
+        self.refreshes += 1
+
+    def _forget_load(self, key: str, task: asyncio.Task) -> None:
+        if self._loading.get(key) is task:
+            del self._loading[key]
+
+    async def _render(self, key: str, connect: Connect, render: Render, store: bool = True) -> str:
+        identity, service = await connect()
+        content, cacheable = await render(identity, service)
+        if store and cacheable:
+            self._store(key, content, identity, service)
+        return content
+
+    async def _refresh(self, key: str, render: Render, entry: dict[str, Any]) -> str:
+        # Reads that miss while the refresh runs wait for it, so it answers like _render
+        content: str = entry["content"]
+        try:
+            rendered, cacheable = await render(entry["identity"], entry["service"])
+        except Exception as e:
+            # The session may have expired; the next read reconnects with its own context
+            self.failures += 1
+            logger.warning("Background refresh of %s failed: %s", key.split("|", 1)[0], e)
+            entry["service"] = None
+            return content
+        if cacheable:
+            self._store(key, rendered, entry["identity"], entry["service"])
+        return rendered
+
+
+splunk_resource_cache = SplunkResourceCache()
@@ -0,0 +1,149 @@
+"""
+Server-side paged listing for Splunk REST entity collections.
+
+Pushes paging (``count``/``offset``), filtering (``search``), ordering (``sort_key``/``sort_dir``)
+and field projection (``f=``) down to the REST endpoint so tools only transfer the entities and
+attributes they actually return, instead of iterating full splunklib collections client-side.
+"""
+
+import json
+import logging
+from collections.abc import Iterator
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PAGE_SIZE = 100
+
+
+class RestEntityListing:
+    """
+    Lazily iterate the entries of a Splunk REST collection endpoint.
+
+    Entries are fetched one page at a time with ``output_mode=json`` and yielded as the raw
+    JSON entry dicts (``name``, ``id``, ``updated``, ``content``, ``acl``). After iteration,
+    ``paging()`` reports ``total``/``has_more`` consistently for every listing tool.
+
+    Example:
+        listing = RestEntityListing(
+            service, "/services/apps/local", count=50, fields=["label", "version"]
+        )
+        apps = [entry["name"] for entry in listing]
+        return {"apps": apps, **listing.paging()}
+    """
+
+    def __init__(
+        self,
+        service: Any,
+        endpoint: str,
+        count: int = 0,
+        offset: int = 0,
+        search: str | list[str] | None = None,
+        sort_key: str | None = None,
+        sort_dir: str = "asc",
+        fields: list[str] | None = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        **params: Any,
+    ):
+        """
+        Args:
+            service: Splunk service (anything exposing ``get(path, **query)``)
+            endpoint: REST collection path, e.g. ``/servicesNS/-/-/saved/searches``
+            count: Maximum number of entries to yield (0 = all)
+            offset: Index of the first entry to return
+            search: REST ``search`` filter expression(s); multiple expressions are ANDed
+            sort_key: Field to sort by on the server
+            sort_dir: ``asc`` or ``desc``
+            fields: Content fields to return (``f=`` projection); ``None`` returns all
+            page_size: Entries requested per round trip
+            **params: Additional query parameters passed to the endpoint
+        """
+        self.service = service
+        self.endpoint = endpoint
+        self.count = max(0, int(count or 0))
+        self.offset = max(0, int(offset or 0))
+        self.page_size = max(1, int(page_size))
+
+        self._params: dict[str, Any] = {"output_mode": "json", **params}
+        searches = [search] if isinstance(search, str) else list(search or [])
+        searches = [s for s in searches if s]
+        if searches:
+            self._params["search"] = searches[0] if len(searches) == 1 else searches
+        if sort_key:
+            self._params["sort_key"] = sort_key
+            self._params["sort_dir"] = sort_dir
+        if fields:
+            self._params["f"] = list(fields)
+
+        self._total: int | None = None
+        self._yielded = 0
+        self._exhausted = False
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        position = self.offset
+        while True:
+            remaining = self.count - self._yielded if self.count else self.page_size
+            if remaining <= 0:
+                return
+            request_count = min(self.page_size, remaining)
+
+            data = self._fetch_page(position, request_count)
+            entries = data.get("entry", []) or []
+            paging = data.get("paging") or {}
+            if "total" in paging:
+                self._total = int(paging["total"])
+
+            for entry in entries:
+                self._yielded += 1
+                yield entry
+
+            position += len(entries)
+            if len(entries) < request_count or (
+                self._total is not None and position >= self._total
+            ):
+                self._exhausted = True
+                return
+
+    def _fetch_page(self, offset: int, count: int) -> dict[str, Any]:
+        logger.debug("GET %s (offset=%d, count=%d)", self.endpoint, offset, count)
+        response = self.service.get(self.endpoint, count=count, offset=offset, **self._params)
+        body = response.body.read()
+        return json.loads(body) if body else {}
+
+    @property
+    def total(self) -> int:
+        """Total entries matching the filters on the server (known after the first page)."""
+        if self._total is not None:
+            return self._total
+        return self.offset + self._yielded
+
+    @property
+    def has_more(self) -> bool:
+        """Whether entries beyond those yielded remain on the server."""
+        if self._total is not None:
+            return self.offset + self._yielded < self._total
+        return not self._exhausted
+
+    def paging(self) -> dict[str, Any]:
+        """Paging summary shared by all listing tool responses."""
+        next_offset = self.offset + self._yielded
+        return {
+            "total": self.total,
+            "offset": self.offset,
+            "has_more": self.has_more,
+            "next_offset": next_offset if self.has_more else None,
+        }
+
+
+def acl_filters(
+    owner: str | None = None, app: str | None = None, sharing: str | None = None
+) -> list[str]:
+    """Build REST ``search`` expressions that filter entities by their ACL on the server."""
+    filters = []
+    if owner:
+        filters.append(f"eai:acl.owner={owner}")
+    if app:
+        filters.append(f"eai:acl.app={app}")
+    if sharing:
+        filters.append(f"eai:acl.sharing={sharing}")
+    return filters
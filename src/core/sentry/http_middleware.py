@@ -3,57 +3,59 @@
 import logging
 import time
 import uuid
-from typing import cast
 
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import Response
+from starlette.datastructures import URL
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
+from ..shared_context import SESSION_HEADERS, scope_headers
 from .config import _sentry_initialized, mcp_request_id, mcp_session_id
 from .context import add_breadcrumb
 
 logger = logging.getLogger(__name__)
 
 
-class SentryHTTPMiddleware(BaseHTTPMiddleware):
-    """ASGI middleware for Sentry HTTP request tracing."""
+class SentryHTTPMiddleware:
+    """ASGI middleware for Sentry HTTP request tracing.
 
-    async def dispatch(self, request: Request, call_next) -> Response:
+    Implemented as a plain ASGI wrapper so streamed responses (Streamable HTTP/SSE) reach the
+    client directly; the status is read from the ``http.response.start`` message and the
+    duration covers the time until the response headers were sent.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process HTTP request with Sentry tracing."""
-        if not _sentry_initialized:
-            return cast(Response, await call_next(request))
+        if scope["type"] != "http" or not _sentry_initialized:
+            await self.app(scope, receive, send)
+            return
 
         try:
             import sentry_sdk
         except ImportError:
-            return cast(Response, await call_next(request))
+            await self.app(scope, receive, send)
+            return
+
+        headers = scope_headers(scope, (*SESSION_HEADERS, b"x-request-id"), prefix=None)
 
         # Extract session ID from headers
-        session_id = (
-            request.headers.get("MCP-Session-ID")
-            or request.headers.get("mcp-session-id")
-            or request.headers.get("X-Session-ID")
-            or request.headers.get("x-session-id")
-        )
+        session_id = headers.get("mcp-session-id") or headers.get("x-session-id")
 
         # Normalize session ID (handle "id, id" format)
         if session_id and "," in session_id:
             session_id = session_id.split(",")[0].strip()
 
         # Generate request ID
-        request_id = (
-            request.headers.get("X-Request-ID")
-            or request.headers.get("x-request-id")
-            or str(uuid.uuid4())[:8]
-        )
+        request_id = headers.get("x-request-id") or str(uuid.uuid4())[:8]
 
         # Set context for downstream use
         session_token = mcp_session_id.set(session_id)
         request_token = mcp_request_id.set(request_id)
 
         # Determine transaction name based on path
-        path = request.url.path
-        method = request.method
+        path = scope["path"]
+        method = scope["method"]
 
         if "/mcp" in path:
             transaction_name = f"MCP {method} {path}"
@@ -74,11 +76,12 @@ class SentryHTTPMiddleware(BaseHTTPMiddleware):
                 transaction.set_tag("mcp.request.id", request_id)
 
                 transaction.set_data("http.method", method)
-                transaction.set_data("http.url", str(request.url))
+                transaction.set_data("http.url", str(URL(scope=scope)))
                 transaction.set_data("http.path", path)
 
-                if request.client:
-                    transaction.set_data("client.ip", request.client.host)
+                client = scope.get("client")
+                if client:
+                    transaction.set_data("client.ip", client[0])
 
                 add_breadcrumb(
                     message=f"HTTP {method} {path}",
@@ -87,20 +90,22 @@ class SentryHTTPMiddleware(BaseHTTPMiddleware):
                     data={"method": method, "path": path, "session_id": session_id},
                 )
 
-                response = cast(Response, await call_next(request))
-
-                duration_ms = (time.perf_counter() - start_time) * 1000
-                transaction.set_data("http.status_code", response.status_code)
-                transaction.set_data("http.duration_ms", round(duration_ms, 2))
-
-                if response.status_code >= 500:
-                    transaction.set_status("internal_error")
-                elif response.status_code >= 400:
-                    transaction.set_status("invalid_argument")
-                else:
-                    transaction.set_status("ok")
-
-                return response
+                async def send_with_status(message: Message) -> None:
+                    if message["type"] == "http.response.start":
+                        status_code = message["status"]
+                        duration_ms = (time.perf_counter() - start_time) * 1000
+                        transaction.set_data("http.status_code", status_code)
+                        transaction.set_data("http.duration_ms", round(duration_ms, 2))
+
+                        if status_code >= 500:
+                            transaction.set_status("internal_error")
+                        elif status_code >= 400:
+                            transaction.set_status("invalid_argument")
+                        else:
+                            transaction.set_status("ok")
+                    await send(message)
+
+                await self.app(scope, receive, send_with_status)
 
         except Exception as e:
             sentry_sdk.capture_exception(e)
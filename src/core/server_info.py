@@ -0,0 +1,256 @@
+"""
+Per-connection cache of Splunk server information.
+
+Documentation tools and resources pick the documentation version matching the connected Splunk
+instance. Reading ``/services/server/info`` for every lookup costs a REST round trip (and, for
+client-supplied credentials, a login), so the version, build, server name and product type are
+kept per connection identity: the scheme, host, port and user a connection is made with.
+
+Entries are served for MCP_SERVER_INFO_TTL_SECONDS. After that the stale entry is still returned
+while a background task re-reads it, so a lookup never waits on Splunk once the version is
+known. Connections that could not be read are not retried for MCP_SERVER_INFO_RETRY_SECONDS.
+At most MCP_SERVER_INFO_MAX_ENTRIES connections are kept; the least recently used is dropped
+first.
+
+Environment variables:
+- MCP_SERVER_INFO_TTL_SECONDS (default: 3600)
+- MCP_SERVER_INFO_RETRY_SECONDS (default: 60)
+- MCP_SERVER_INFO_MAX_ENTRIES (default: 256)
+"""
+
+import asyncio
+import logging
+import os
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass
+from functools import partial
+from typing import Any
+
+from fastmcp import Context
+
+from src.core.base import BaseTool, client_config_from_context, splunk_service_from_context
+
+logger = logging.getLogger(__name__)
+
+Connect = Callable[[], Awaitable[Any]]
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, default))
+    except ValueError:
+        logger.warning("Ignoring invalid %s=%r", name, os.getenv(name))
+        return default
+
+
+@dataclass(frozen=True)
+class ServerInfo:
+    """The parts of ``/services/server/info`` the documentation tools rely on."""
+
+    version: str
+    build: str = ""
+    server_name: str = ""
+    product_type: str = ""
+
+    def as_dict(self) -> dict[str, str]:
+        return asdict(self)
+
+
+def parse_server_info(info: Any) -> ServerInfo:
+    """Build ServerInfo from the content of a ``/services/server/info`` entry."""
+    return ServerInfo(
+        version=str(info.get("version") or "latest"),
+        build=str(info.get("build") or ""),
+        server_name=str(info.get("serverName") or info.get("host") or ""),
+        product_type=str(info.get("product_type") or ""),
+    )
+
+
+def read_server_info(service: Any) -> ServerInfo:
+    """Read server information from a Splunk service (one blocking REST call)."""
+    return parse_server_info(service.info)
+
+
+def connection_identity(client_config: dict[str, Any] | None = None) -> str:
+    """Identify the Splunk connection a client configuration (or the server default) resolves to."""
+    from src.client.splunk_client import get_splunk_config
+
+    config = get_splunk_config(client_config)
+    return f"{config['scheme']}://{config['username'] or ''}@{config['host']}:{config['port']}"
+
+
+class ServerInfoCache:
+    """
+    Server information per connection identity, refreshed in the background once stale.
+
+    Used from the event loop. Concurrent misses for the same connection share one read.
+    """
+
+    def __init__(
+        self,
+        ttl: float | None = None,
+        retry_seconds: float | None = None,
+        max_entries: int | None = None,
+    ):
+        self.ttl = _env_float("MCP_SERVER_INFO_TTL_SECONDS", 3600.0) if ttl is None else ttl
+        self.retry_seconds = (
+            _env_float("MCP_SERVER_INFO_RETRY_SECONDS", 60.0)
+            if retry_seconds is None
+            else retry_seconds
+        )
+        self.max_entries = int(
+            _env_float("MCP_SERVER_INFO_MAX_ENTRIES", 256) if max_entries is None else max_entries
+        )
+        self._entries: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._loading: dict[str, asyncio.Task] = {}
+        self._refreshing: set[asyncio.Task] = set()
+        self.hits = 0
+        self.misses = 0
+        self.refreshes = 0
+        self.failures = 0
+
+    def peek(self, key: str) -> ServerInfo | None:
+        """Return the known server information for a connection, however old."""
+        entry = self._entries.get(key)
+        info: ServerInfo | None = entry["info"] if entry else None
+        return info
+
+    def put(self, key: str, info: ServerInfo, service: Any = None) -> None:
+        """Record server information read elsewhere (e.g. by the health check)."""
+        previous = self._entries.get(key) or {}
+        self._store(
+            key,
+            {
+                "info": info,
+                "service": service if service is not None else previous.get("service"),
+                "fetched_at": time.monotonic(),
+                "failed_at": None,
+            },
+        )
+
+    async def get(self, key: str, connect: Connect) -> ServerInfo | None:
+        """
+        Return server information for a connection, reading it only when it is not known.
+
+        ``connect`` returns a Splunk service for the connection and is only awaited on a miss
+        or when a background refresh cannot reuse the service from the previous read.
+        """
+        now = time.monotonic()
+        entry = self._entries.get(key)
+        if entry and entry["info"] is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            if now - entry["fetched_at"] > self.ttl and not self._backing_off(entry, now):
+                self._schedule_refresh(key, connect, entry)
+            info: ServerInfo = entry["info"]
+            return info
+        if entry and self._backing_off(entry, now):
+            return None
+
+        self.misses += 1
+        task = self._loading.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._load(key, connect))
+            self._loading[key] = task
+            task.add_done_callback(lambda done: self._forget_load(key, done))
+        return await asyncio.shield(task)
+
+    def invalidate(self, key: str | None = None) -> None:
+        """Forget one connection, or every connection when key is None."""
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "connections": len(self._entries),
+            "known": sum(1 for entry in self._entries.values() if entry["info"] is not None),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "refreshes": self.refreshes,
+            "failures": self.failures,
+        }
+
+    def _store(self, key: str, entry: dict[str, Any]) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _backing_off(self, entry: dict[str, Any], now: float) -> bool:
+        failed_at = entry["failed_at"]
+        return failed_at is not None and now - failed_at < self.retry_seconds
+
+    def _schedule_refresh(self, key: str, connect: Connect, entry: dict[str, Any]) -> None:
+        if key in self._loading:
+            return
+        task = asyncio.ensure_future(self._load(key, connect, entry["service"]))
+        self._loading[key] = task
+        self._refreshing.add(task)
+        task.add_done_callback(self._refreshing.discard)
+        task.add_done_callback(lambda done: self._forget_load(key, done))
+        self.refreshes += 1
+
+    def _forget_load(self, key: str, task: asyncio.Task) -> None:
+        if self._loading.get(key) is task:
+            del self._loading[key]
+
+    async def _load(self, key: str, connect: Connect, service: Any = None) -> ServerInfo | None:
+        if service is not None:
+            try:
+                info = await asyncio.to_thread(read_server_info, service)
+                self.put(key, info, service)
+                return info
+            except Exception as e:
+                # The session may have expired; reconnect below
+                logger.debug("Cached Splunk service for %s could not be reused: %s", key, e)
+        try:
+            service = await connect()
+            info = await asyncio.to_thread(read_server_info, service)
+        except Exception as e:
+            self.failures += 1
+            logger.warning("Failed to read Splunk server info for %s: %s", key, e)
+            entry = self._entries.get(key) or {"info": None, "service": None, "fetched_at": 0.0}
+            entry["failed_at"] = time.monotonic()
+            self._store(key, entry)
+            previous: ServerInfo | None = entry["info"]
+            return previous
+        self.put(key, info, service)
+        logger.debug("Splunk server info for %s: %s", key, info)
+        return info
+
+
+server_info_cache = ServerInfoCache()
+
+
+async def get_server_info(ctx: Context | None, tool: BaseTool | None = None) -> ServerInfo | None:
+    """
+    Return server information for the caller's Splunk connection, or None without one.
+
+    The connection is resolved like ``BaseTool.get_splunk_service``: client configuration from
+    the request first, then the server default. No REST call is made once it is known.
+    """
+    if ctx is None:
+        return None
+    if tool is None:
+        client_config = client_config_from_context(ctx)
+        connect: Connect = partial(splunk_service_from_context, ctx)
+    else:
+        client_config = tool.get_client_config_from_context(ctx)
+        connect = partial(tool.get_splunk_service, ctx)
+    return await server_info_cache.get(connection_identity(client_config), connect)
+
+
+async def get_splunk_version(ctx: Context | None, tool: BaseTool | None = None) -> str:
+    """Version of the caller's Splunk instance, or "latest" when it cannot be determined."""
+    try:
+        info = await get_server_info(ctx, tool)
+    except Exception as e:
+        logger.warning("Failed to detect Splunk version: %s", e)
+        return "latest"
+    return info.version if info else "latest"
@@ -0,0 +1,57 @@
+"""
+Namespace-scoped views over a shared Splunk service connection.
+
+splunklib resolves relative REST paths (and every SDK collection such as ``service.kvstore``,
+``service.saved_searches`` or ``service.confs``) against ``service.namespace``. Switching that
+attribute on a connection shared by concurrent requests lets one request run in another's
+app/owner context. A view is a shallow copy of the service with its own namespace: it reuses
+the connection's authenticated session, cookies and HTTP handler, so no extra login happens,
+while URL building stays private to the request that created it.
+"""
+
+import copy
+from typing import Any
+
+try:
+    from splunklib import binding
+except Exception:  # splunklib may not be available in some test contexts
+    binding = None  # type: ignore
+
+
+def service_view(
+    service: Any,
+    owner: str | None = None,
+    app: str | None = None,
+    sharing: str | None = None,
+) -> Any:
+    """
+    Return a view of ``service`` scoped to the given namespace.
+
+    Namespace parts left as ``None`` are inherited from the service's own namespace. The
+    shared service is never modified, including by SDK properties such as ``kvstore`` that
+    rewrite ``namespace.owner``. Objects that are not splunklib connections (for example test
+    doubles) are returned unchanged.
+
+    Args:
+        service: Shared splunklib ``Service``
+        owner: Namespace owner (``-`` = any)
+        app: Namespace app (``-`` = any)
+        sharing: ``user``, ``app``, ``global`` or ``system``
+
+    Example:
+        kvstore = service_view(service, owner="nobody", app="search", sharing="app").kvstore
+        collection = kvstore["assets"]
+    """
+    if binding is None or not isinstance(service, binding.Context):
+        return service
+    scope = dict(service.namespace)
+    scope.update(
+        {
+            key: value
+            for key, value in (("owner", owner), ("app", app), ("sharing", sharing))
+            if value is not None
+        }
+    )
+    view = copy.copy(service)
+    view.namespace = binding.namespace(**scope)
+    return view
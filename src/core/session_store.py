@@ -0,0 +1,436 @@
+"""
+Per-session client configuration, optionally shared between replicas.
+
+Streamable HTTP clients send their Splunk connection headers (``X-Splunk-*``) and later
+requests of the same session may only carry the session id, so the client configuration is kept
+per session. With a single process a dict is enough. Behind a load balancer without session
+affinity, any replica may receive the next request of a session, so replicas must share this
+state. The backend is selected with MCP_SESSION_STORE:
+
+- ``memory`` (default): per process, as before
+- ``sqlite:///data/sessions.sqlite3`` (relative) or ``sqlite:////abs/sessions.sqlite3``: a SQLite file shared by replicas on one host or on a
+  shared volume
+- ``redis://host:6379/0`` or ``rediss://...``: any Redis-protocol server (Redis, Valkey,
+  KeyDB); requires the ``redis`` package (``pip install "mcp-server-for-splunk[redis]"``)
+
+Entries expire MCP_SESSION_TTL_SECONDS after they were last written. Writing the config a
+session already holds only extends its expiry, and only once less than half the TTL remains,
+so active sessions stay alive without a write per request. Expired entries read as missing
+and are deleted every SWEEP_INTERVAL_SECONDS by ``run_sweeper``, which the HTTP app runs for
+its lifetime. The async ``read``, ``write`` and ``delete`` methods run I/O of shared backends
+in a worker thread so the event loop is not blocked by SQLite locks or Redis round trips.
+Shared backends keep credentials outside the process, so their values are encrypted with
+Fernet using MCP_SESSION_ENCRYPTION_KEY, which every replica must share. Generate one with::
+
+    python -c "from cryptography.fernet import Fernet; print(Fernet.generate_key().decode())"
+
+A shared backend without a key is a configuration error.
+
+Environment variables:
+- MCP_SESSION_STORE (default: memory)
+- MCP_SESSION_TTL_SECONDS (default: 86400)
+- MCP_SESSION_ENCRYPTION_KEY (required for sqlite and redis stores)
+"""
+
+import abc
+import asyncio
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Iterator, MutableMapping
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL_SECONDS = 86400.0
+REDIS_KEY_PREFIX = "mcp:session:"
+SWEEP_INTERVAL_SECONDS = 300.0
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, default))
+    except ValueError:
+        logger.warning("Ignoring invalid %s=%r", name, os.getenv(name))
+        return default
+
+
+class SessionCipher:
+    """Fernet encryption of serialized session values."""
+
+    def __init__(self, key: str | bytes):
+        try:
+            from cryptography.fernet import Fernet
+        except ImportError as e:
+            raise ValueError("Encrypted session stores require the cryptography package") from e
+        self._fernet = Fernet(key)
+
+    def encrypt(self, data: bytes) -> bytes:
+        return self._fernet.encrypt(data)
+
+    def decrypt(self, token: bytes) -> bytes:
+        return self._fernet.decrypt(token)
+
+
+class SessionStore(MutableMapping[str, dict[str, Any]]):
+    """
+    Mapping of session id to client configuration whose entries expire after ``ttl``.
+
+    Backends whose I/O may block set ``blocking``; ``read``, ``write`` and ``delete`` then
+    run it in a worker thread. Subclasses implement the mapping methods plus ``_entry``,
+    ``_touch`` and ``purge_expired``.
+    """
+
+    backend = "memory"
+    blocking = False
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+
+    def stats(self) -> dict[str, Any]:
+        return {"backend": self.backend, "sessions": len(self), "ttl_seconds": self.ttl}
+
+    def close(self) -> None:
+        pass
+
+    def put_if_changed(self, key: str, value: dict[str, Any]) -> bool:
+        """
+        Store value unless the session already holds an equal one; True if written.
+
+        An equal value has its expiry extended instead, once less than half the TTL remains.
+        """
+        entry = self._entry(key)
+        if entry is None or entry[0] != value:
+            self[key] = value
+            return True
+        if entry[1] - time.time() < self.ttl / 2:
+            self._touch(key, time.time() + self.ttl)
+        return False
+
+    def discard(self, key: str) -> bool:
+        """Remove key if present; True if it was."""
+        try:
+            del self[key]
+        except KeyError:
+            return False
+        return True
+
+    @abc.abstractmethod
+    def purge_expired(self) -> int:
+        """Delete expired entries and return how many were removed (if known)."""
+
+    @abc.abstractmethod
+    def _entry(self, key: str) -> tuple[dict[str, Any], float] | None:
+        """The unexpired value of key and its expiry (epoch seconds), or None."""
+
+    @abc.abstractmethod
+    def _touch(self, key: str, expires_at: float) -> None:
+        """Move the expiry of key to expires_at without rewriting its value."""
+
+    async def read(self, key: str) -> dict[str, Any] | None:
+        if not self.blocking:
+            return self.get(key)
+        return await asyncio.to_thread(self.get, key)
+
+    async def write(self, key: str, value: dict[str, Any]) -> bool:
+        if not self.blocking:
+            return self.put_if_changed(key, value)
+        return await asyncio.to_thread(self.put_if_changed, key, value)
+
+    async def delete(self, key: str) -> bool:
+        if not self.blocking:
+            return self.discard(key)
+        return await asyncio.to_thread(self.discard, key)
+
+
+class MemorySessionStore(SessionStore):
+    """Per-process store; values stay in memory and are not serialized."""
+
+    def __init__(self, ttl: float = DEFAULT_TTL_SECONDS):
+        super().__init__(ttl)
+        self._entries: dict[str, tuple[dict[str, Any], float]] = {}
+
+    def __getitem__(self, key: str) -> dict[str, Any]:
+        entry = self._entry(key)
+        if entry is None:
+            raise KeyError(key)
+        return entry[0]
+
+    def __setitem__(self, key: str, value: dict[str, Any]) -> None:
+        self._entries[key] = (value, time.time() + self.ttl)
+
+    def __delitem__(self, key: str) -> None:
+        del self._entries[key]
+
+    def __iter__(self) -> Iterator[str]:
+        self.purge_expired()
+        return iter(list(self._entries))
+
+    def __len__(self) -> int:
+        self.purge_expired()
+        return len(self._entries)
+
+    def purge_expired(self) -> int:
+        now = time.time()
+        expired = [key for key, (_, expires_at) in self._entries.items() if expires_at <= now]
+        for key in expired:
+            self._entries.pop(key, None)
+        return len(expired)
+
+    def _entry(self, key: str) -> tuple[dict[str, Any], float] | None:
+        entry = self._entries.get(key)
+        if entry is not None and entry[1] <= time.time():
+            self._entries.pop(key, None)
+            return None
+        return entry
+
+    def _touch(self, key: str, expires_at: float) -> None:
+        if key in self._entries:
+            self._entries[key] = (self._entries[key][0], expires_at)
+
+
+class EncryptedSessionStore(SessionStore):
+    """
+    Store shared between processes, holding Fernet-encrypted JSON.
+
+    Subclasses implement ``_load``, ``_save``, ``_remove``, ``_keys``, ``_touch`` and
+    ``purge_expired``. Values that cannot be decrypted (e.g. written with another key) read
+    as missing.
+    """
+
+    blocking = True
+
+    def __init__(self, ttl: float, cipher: SessionCipher):
+        super().__init__(ttl)
+        self.cipher = cipher
+
+    def __getitem__(self, key: str) -> dict[str, Any]:
+        entry = self._entry(key)
+        if entry is None:
+            raise KeyError(key)
+        return entry[0]
+
+    def __setitem__(self, key: str, value: dict[str, Any]) -> None:
+        raw = self.cipher.encrypt(json.dumps(value).encode("utf-8"))
+        self._save(key, raw, time.time() + self.ttl)
+
+    def __delitem__(self, key: str) -> None:
+        if not self._remove(key):
+            raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys())
+
+    def __len__(self) -> int:
+        return len(self._keys())
+
+    def _entry(self, key: str) -> tuple[dict[str, Any], float] | None:
+        loaded = self._load(key)
+        if loaded is None:
+            return None
+        raw, expires_at = loaded
+        try:
+            value: dict[str, Any] = json.loads(self.cipher.decrypt(raw))
+        except Exception as e:
+            logger.warning("Discarding unreadable session state for %s: %s", key, e)
+            return None
+        return value, expires_at
+
+    @abc.abstractmethod
+    def _load(self, key: str) -> tuple[bytes, float] | None:
+        """The stored value of key and its expiry, or None when missing or expired."""
+
+    @abc.abstractmethod
+    def _save(self, key: str, raw: bytes, expires_at: float) -> None: ...
+
+    @abc.abstractmethod
+    def _remove(self, key: str) -> bool: ...
+
+    @abc.abstractmethod
+    def _keys(self) -> list[str]: ...
+
+
+class SQLiteSessionStore(EncryptedSessionStore):
+    """Store in a SQLite file that several processes can open (WAL mode)."""
+
+    backend = "sqlite"
+
+    def __init__(self, path: str | os.PathLike, ttl: float, cipher: SessionCipher):
+        super().__init__(ttl, cipher)
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self._pid = os.getpid()
+        # Fail at startup rather than on the first request
+        self._connection()
+
+    def stats(self) -> dict[str, Any]:
+        return {**super().stats(), "path": str(self.path)}
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _connection(self) -> sqlite3.Connection:
+        # SQLite connections must not be used across fork(); worker processes reopen the file
+        if self._conn is not None and self._pid == os.getpid():
+            return self._conn
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(
+            str(self.path), timeout=5.0, isolation_level=None, check_same_thread=False
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS sessions "
+            "(key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL NOT NULL)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS sessions_expires_at ON sessions (expires_at)")
+        self._conn, self._pid = conn, os.getpid()
+        return conn
+
+    def _load(self, key: str) -> tuple[bytes, float] | None:
+        with self._lock:
+            row = (
+                self._connection()
+                .execute(
+                    "SELECT value, expires_at FROM sessions WHERE key = ? AND expires_at > ?",
+                    (key, time.time()),
+                )
+                .fetchone()
+            )
+        return (row[0], row[1]) if row else None
+
+    def _save(self, key: str, raw: bytes, expires_at: float) -> None:
+        with self._lock:
+            conn = self._connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO sessions (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, raw, expires_at),
+            )
+
+    def _touch(self, key: str, expires_at: float) -> None:
+        with self._lock:
+            self._connection().execute(
+                "UPDATE sessions SET expires_at = ? WHERE key = ?", (expires_at, key)
+            )
+
+    def _remove(self, key: str) -> bool:
+        with self._lock:
+            return (
+                self._connection().execute("DELETE FROM sessions WHERE key = ?", (key,)).rowcount
+                > 0
+            )
+
+    def _keys(self) -> list[str]:
+        with self._lock:
+            rows = (
+                self._connection()
+                .execute("SELECT key FROM sessions WHERE expires_at > ?", (time.time(),))
+                .fetchall()
+            )
+        return [row[0] for row in rows]
+
+    def purge_expired(self) -> int:
+        with self._lock:
+            return (
+                self._connection()
+                .execute("DELETE FROM sessions WHERE expires_at <= ?", (time.time(),))
+                .rowcount
+            )
+
+
+class RedisSessionStore(EncryptedSessionStore):
+    """Store on a Redis-protocol server; expiry is delegated to the server."""
+
+    backend = "redis"
+
+    def __init__(self, url: str, ttl: float, cipher: SessionCipher, client: Any = None):
+        super().__init__(ttl, cipher)
+        if client is None:
+            try:
+                import redis
+            except ImportError as e:
+                raise ValueError(
+                    "MCP_SESSION_STORE=redis requires the redis package "
+                    '(pip install "mcp-server-for-splunk[redis]")'
+                ) from e
+            client = redis.Redis.from_url(url, socket_timeout=2.0)
+        self.client = client
+
+    def close(self) -> None:
+        self.client.close()
+
+    def purge_expired(self) -> int:
+        # Keys are written with an expiry; the server deletes them
+        return 0
+
+    def _load(self, key: str) -> tuple[bytes, float] | None:
+        # One round trip for the value and its remaining lifetime
+        pipe = self.client.pipeline(transaction=False)
+        pipe.get(REDIS_KEY_PREFIX + key)
+        pipe.ttl(REDIS_KEY_PREFIX + key)
+        raw, ttl = pipe.execute()
+        if raw is None:
+            return None
+        # ttl is -1 for a key without expiry
+        return raw, time.time() + ttl if ttl >= 0 else float("inf")
+
+    def _touch(self, key: str, expires_at: float) -> None:
+        self.client.expire(REDIS_KEY_PREFIX + key, max(1, round(expires_at - time.time())))
+
+    def _save(self, key: str, raw: bytes, expires_at: float) -> None:
+        self.client.set(REDIS_KEY_PREFIX + key, raw, ex=max(1, int(self.ttl)))
+
+    def _remove(self, key: str) -> bool:
+        return bool(self.client.delete(REDIS_KEY_PREFIX + key))
+
+    def _keys(self) -> list[str]:
+        keys = []
+        for key in self.client.scan_iter(match=REDIS_KEY_PREFIX + "*"):
+            key = key.decode("utf-8") if isinstance(key, bytes) else key
+            keys.append(key[len(REDIS_KEY_PREFIX) :])
+        return keys
+
+
+async def run_sweeper(store: SessionStore, interval: float = SWEEP_INTERVAL_SECONDS) -> None:
+    """Delete expired entries of store every interval seconds until cancelled."""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            removed = await asyncio.to_thread(store.purge_expired)
+        except Exception as e:
+            logger.warning("Expired session sweep failed: %s", e)
+            continue
+        if removed:
+            logger.debug("Removed %d expired sessions", removed)
+
+
+def create_session_store(
+    url: str | None = None, ttl: float | None = None, key: str | None = None
+) -> SessionStore:
+    """Create the store selected by MCP_SESSION_STORE (or url); raises ValueError if misconfigured."""
+    url = (url if url is not None else os.getenv("MCP_SESSION_STORE") or "memory").strip()
+    ttl = _env_float("MCP_SESSION_TTL_SECONDS", DEFAULT_TTL_SECONDS) if ttl is None else ttl
+    if url == "memory":
+        return MemorySessionStore(ttl)
+
+    scheme = url.partition("://")[0]
+    if scheme not in ("sqlite", "redis", "rediss") or url == "sqlite:///":
+        raise ValueError(f"Unsupported MCP_SESSION_STORE: {url!r}")
+    key = key if key is not None else os.getenv("MCP_SESSION_ENCRYPTION_KEY")
+    if not key:
+        raise ValueError(
+            f"MCP_SESSION_STORE={scheme} stores credentials outside the process and requires "
+            "MCP_SESSION_ENCRYPTION_KEY (a Fernet key shared by all replicas)"
+        )
+    cipher = SessionCipher(key)
+    if scheme == "sqlite":
+        # sqlite:///relative/path or sqlite:////absolute/path
+        return SQLiteSessionStore(url[len("sqlite:///") :], ttl, cipher)
+    return RedisSessionStore(url, ttl, cipher)
@@ -5,8 +5,34 @@ This module contains context variables that need to be shared across modules
 to avoid circular import issues.
 """
 
+from collections.abc import Iterable, MutableMapping
 from contextvars import ContextVar
+from typing import Any
 
 # Context variable to store HTTP headers for MCP middleware access
 # Avoid mutable default for ContextVar (ruff B039)
 http_headers_context: ContextVar[dict | None] = ContextVar("http_headers", default=None)
+
+
+# Headers captured from each HTTP request: Splunk connection settings and session ids
+SPLUNK_HEADER_PREFIX = b"x-splunk-"
+SESSION_HEADERS = (b"mcp-session-id", b"x-session-id")
+
+
+def scope_headers(
+    scope: MutableMapping[str, Any],
+    names: Iterable[bytes] = SESSION_HEADERS,
+    prefix: bytes | None = SPLUNK_HEADER_PREFIX,
+) -> dict[str, str]:
+    """
+    Read selected headers straight from an ASGI scope, keyed by lowercase name.
+
+    Only headers listed in ``names`` or starting with ``prefix`` are decoded; the first value
+    of a repeated header wins, as with ``starlette.datastructures.Headers``.
+    """
+    wanted = frozenset(names)
+    headers: dict[str, str] = {}
+    for name, value in scope.get("headers") or ():
+        if name in wanted or (prefix is not None and name.startswith(prefix)):
+            headers.setdefault(name.decode("latin-1"), value.decode("latin-1"))
+    return headers
@@ -0,0 +1,176 @@
+"""
+Pre-fork worker processes for the HTTP transport.
+
+A single uvicorn process runs every tool call on one event loop and one GIL. With
+``--workers N`` (or MCP_WORKERS) the supervisor binds the listening socket and forks N worker
+processes that accept connections on it. Everything imported and loaded before the fork
+(modules, discovered tools, resources and prompts, the Starlette app) is shared with the workers
+copy-on-write, so component discovery runs once.
+
+Per-process state is reset in each worker after the fork:
+
+- the log writer thread, which does not survive fork(), is started again
+- pooled Splunk connections and the server info and resource caches, which hold services of
+  the parent, are dropped, so each worker connects on demand
+- the documentation HTTP client, warmer and processing pool are started by each worker's lifespan
+- SQLite handles (documentation cache, session store) are reopened by the worker that uses them
+
+Client configuration of Streamable HTTP sessions must be visible to every worker: use a shared
+MCP_SESSION_STORE (sqlite or redis) and MCP_STATELESS_HTTP=true, since the transport's own
+session state stays in the worker that created it.
+
+Health and statistics are per process. ``/health`` and ``/health/cache`` are answered by
+whichever worker accepts the connection and report only that worker's caches and counters;
+the ``worker`` object in each response (index, pid and worker count) identifies it. Nothing is
+aggregated across workers, so probe repeatedly, or scrape each worker's logs, for the full
+picture.
+
+The supervisor restarts workers that exit unexpectedly and forwards SIGINT/SIGTERM to them on
+shutdown. Worker mode needs ``os.fork`` (Linux, macOS); elsewhere the server runs one process.
+
+Environment variables:
+- MCP_WORKERS (default: 1)
+"""
+
+import logging
+import os
+import signal
+import time
+from collections.abc import Callable
+from typing import Any
+
+from src.core.logging_config import stop_logging
+
+logger = logging.getLogger(__name__)
+
+# Workers that exit sooner than this after starting are restarted with a delay
+MIN_WORKER_UPTIME_SECONDS = 5.0
+RESTART_DELAY_SECONDS = 1.0
+
+_worker_id = 0
+_worker_count = 1
+
+
+def worker_count_from_env(default: int = 1) -> int:
+    try:
+        return max(1, int(os.getenv("MCP_WORKERS", default)))
+    except ValueError:
+        logger.warning("Ignoring invalid MCP_WORKERS=%r", os.getenv("MCP_WORKERS"))
+        return default
+
+
+def worker_info() -> dict[str, Any]:
+    """
+    Identity of the process answering a request, for health and metrics endpoints.
+
+    Returns:
+        ``id`` (worker index, 0 in single-process mode), ``pid`` and ``workers`` (count)
+    """
+    return {"id": _worker_id, "pid": os.getpid(), "workers": _worker_count}
+
+
+def reset_worker_state() -> None:
+    """Drop state inherited from the supervisor that must not be shared between processes."""
+    from src.core.client_identity import get_client_manager
+    from src.core.logging_config import restart_logging
+    from src.core.resource_cache import splunk_resource_cache
+    from src.core.server_info import server_info_cache
+
+    restart_logging()
+    get_client_manager().discard_connections()
+    server_info_cache.invalidate()
+    splunk_resource_cache.invalidate()
+
+
+class WorkerSupervisor:
+    """Forks uvicorn workers sharing one listening socket and keeps them running."""
+
+    def __init__(
+        self,
+        config: Any,
+        workers: int,
+        on_fork: Callable[[], None] | None = reset_worker_state,
+    ):
+        # config is a uvicorn.Config; the import stays with the caller (optional dependency)
+        self.config = config
+        self.workers = workers
+        self.on_fork = on_fork
+        self._children: dict[int, tuple[int, float]] = {}
+        self._stopping = False
+
+    def run(self) -> None:
+        """Serve until SIGINT/SIGTERM, then wait for the workers to finish."""
+        global _worker_count
+        _worker_count = self.workers
+        sock = self.config.bind_socket()
+        previous = {
+            sig: signal.signal(sig, self._handle_stop) for sig in (signal.SIGINT, signal.SIGTERM)
+        }
+        try:
+            for worker_id in range(self.workers):
+                self._spawn(worker_id, sock)
+            logger.info("Started %d workers (supervisor pid %d)", self.workers, os.getpid())
+            while self._children:
+                try:
+                    pid, status = os.wait()
+                except ChildProcessError:
+                    break
+                entry = self._children.pop(pid, None)
+                if entry is None or self._stopping:
+                    continue
+                worker_id, started_at = entry
+                logger.warning(
+                    "Worker %d (pid %d) exited with status %d; restarting",
+                    worker_id,
+                    pid,
+                    os.waitstatus_to_exitcode(status),
+                )
+                if time.monotonic() - started_at < MIN_WORKER_UPTIME_SECONDS:
+                    time.sleep(RESTART_DELAY_SECONDS)
+                if not self._stopping:
+                    self._spawn(worker_id, sock)
+        finally:
+            for sig, handler in previous.items():
+                signal.signal(sig, handler)
+            sock.close()
+        logger.info("All workers stopped")
+
+    def _spawn(self, worker_id: int, sock: Any) -> None:
+        pid = os.fork()
+        if pid:
+            self._children[pid] = (worker_id, time.monotonic())
+            return
+
+        # Worker process: never return into the supervisor loop
+        global _worker_id
+        _worker_id = worker_id
+        exit_code = 0
+        try:
+            for sig in (signal.SIGINT, signal.SIGTERM):
+                signal.signal(sig, signal.SIG_DFL)
+            if self.on_fork is not None:
+                self.on_fork()
+            import uvicorn
+
+            logger.info("Worker %d serving (pid %d)", worker_id, os.getpid())
+            uvicorn.Server(self.config).run(sockets=[sock])
+        except BaseException:
+            logger.exception("Worker %d failed", worker_id)
+            exit_code = 1
+        finally:
+            # os._exit skips atexit handlers; write queued log records first
+            try:
+                stop_logging()
+            finally:
+                os._exit(exit_code)
+
+    def _handle_stop(self, signum: int, frame: Any) -> None:
+        if self._stopping:
+            return
+        self._stopping = True
+        logger.info("Stopping %d workers", len(self._children))
+        for pid in list(self._children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
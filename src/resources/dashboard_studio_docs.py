@@ -14,6 +14,9 @@ from fastmcp import Context
 from src.core.base import BaseResource, ResourceMetadata
 from src.core.registry import resource_registry
 
+from .docs_cache import doc_cache
+from .processors.html_processor import HTML_PARSER
+
 logger = logging.getLogger(__name__)
 
 
@@ -138,51 +141,16 @@ Please check the file path and permissions.
                 "Upgrade-Insecure-Requests": "1",
             }
 
-            # Fetch the content from the URL
-            async with httpx.AsyncClient(
-                timeout=30.0, follow_redirects=True, headers=headers
-            ) as client:
-                response = await client.get(url)
-                response.raise_for_status()
-
-                # Parse HTML content
-                soup = BeautifulSoup(response.text, "html.parser")
-
-                # Extract main content area (common patterns for Splunk docs)
-                main_content = None
-                for selector in [
-                    "main",
-                    "article",
-                    ".content",
-                    "#content",
-                    ".main-content",
-                    "[role='main']",
-                ]:
-                    main_content = soup.select_one(selector)
-                    if main_content:
-                        break
-
-                if not main_content:
-                    # Fallback to body if no main content found
-                    main_content = soup.find("body")
-
-                if main_content:
-                    # Remove unwanted elements
-                    for tag in main_content.select(
-                        "script, style, nav, header, footer, .navigation, .sidebar"
-                    ):
-                        tag.decompose()
-
-                    # Extract text with basic formatting
-                    content_text = main_content.get_text(separator="\n", strip=True)
-
-                    # Clean up excessive whitespace
-                    lines = [line.strip() for line in content_text.split("\n") if line.strip()]
-                    formatted_content = "\n\n".join(lines)
-                else:
-                    formatted_content = "Content extraction failed - no main content found."
-
-                return f"""# {name}
+            # Fetch the content from the URL (cached per URL, revalidated once stale)
+            formatted_content = await doc_cache.fetch_url(
+                url,
+                self._extract_text,
+                version="9.4",
+                category="dashboard-studio",
+                headers=headers,
+            )
+
+            return f"""# {name}
 
 **Topic**: `{self.topic}`
 **Description**: {description}
@@ -259,6 +227,43 @@ For offline reference, use: `dashboard-studio://cheatsheet`
 **Official URL**: {url}
 """
 
+    @staticmethod
+    def _extract_text(html: str) -> str:
+        """Extract the main documentation text from a help.splunk.com page."""
+        soup = BeautifulSoup(html, HTML_PARSER)
+
+        # Extract main content area (common patterns for Splunk docs)
+        main_content = None
+        for selector in [
+            "main",
+            "article",
+            ".content",
+            "#content",
+            ".main-content",
+            "[role='main']",
+        ]:
+            main_content = soup.select_one(selector)
+            if main_content:
+                break
+
+        if not main_content:
+            # Fallback to body if no main content found
+            main_content = soup.find("body")
+
+        if not main_content:
+            return "Content extraction failed - no main content found."
+
+        # Remove unwanted elements
+        for tag in main_content.select("script, style, nav, header, footer, .navigation, .sidebar"):
+            tag.decompose()
+
+        # Extract text with basic formatting
+        content_text = main_content.get_text(separator="\n", strip=True)
+
+        # Clean up excessive whitespace
+        lines = [line.strip() for line in content_text.split("\n") if line.strip()]
+        return "\n\n".join(lines)
+
     def _get_related_topics(self) -> str:
         """Get formatted list of related topics."""
         topics = []
@@ -301,11 +306,13 @@ Access any topic using the URI pattern: `dashboard-studio://{{topic}}`
             description = topic_data.get("description", "")
             source = "local file" if "file" in topic_data else "external link"
 
-            topics.append(f"""### {name}
+            topics.append(
+                f"""### {name}
 **URI**: `dashboard-studio://{topic_key}`
 **Description**: {description}
 **Source**: {source}
-""")
+"""
+            )
 
         return "\n".join(topics)
 
@@ -0,0 +1,193 @@
+"""
+Offline documentation bundle.
+
+Hosts without egress to help.splunk.com can serve documentation from a snapshot built ahead of
+time by ``scripts/build_docs_bundle.py``. A bundle is a ZIP archive holding one deflated
+markdown entry per documentation URL plus a ``manifest.json`` index:
+
+    {
+        "format": 1,
+        "built_at": "2026-10-18T12:00:00+00:00",
+        "versions": ["latest", "9.4"],
+        "pages": {"<url>": {"entry": "pages/<sha1>.md", "category": "spl", "version": "9.4"}},
+        "missing": ["<url that answered 404 while crawling>"]
+    }
+
+The ZIP central directory gives random access to single pages, so a lookup reads and inflates
+only the page it needs. ``DocumentationCache`` consults the bundle before the network.
+
+Environment variables:
+- MCP_DOCS_BUNDLE_PATH (default: ./data/docs_bundle.zip; "off" disables the bundle)
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import zipfile
+from collections.abc import Iterator
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+BUNDLE_FORMAT = 1
+DEFAULT_BUNDLE_PATH = "./data/docs_bundle.zip"
+MANIFEST_NAME = "manifest.json"
+_DISABLED_PATHS = {"", "off", "none", "false", "0"}
+
+
+def _entry_name(url: str) -> str:
+    return f"pages/{hashlib.sha1(url.encode('utf-8')).hexdigest()}.md"
+
+
+class DocsBundle:
+    """
+    Read-only view of a documentation bundle.
+
+    The archive is opened on first lookup. A missing file, an unreadable archive or an
+    unsupported format leaves the bundle empty, so the cache falls through to the network.
+    """
+
+    def __init__(self, path: str | os.PathLike):
+        self.path = Path(path)
+        self.hits = 0
+        self._zip: zipfile.ZipFile | None = None
+        self._manifest: dict[str, Any] | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def available(self) -> bool:
+        return bool(self._load().get("pages"))
+
+    def get(self, url: str) -> str | None:
+        """Return the processed markdown stored for url, if the bundle has it."""
+        page = self._load().get("pages", {}).get(url)
+        if page is None:
+            return None
+        content = self._read(url, page)
+        if content is not None:
+            self.hits += 1
+        return content
+
+    def pages(self) -> Iterator[tuple[str, str, str, str]]:
+        """Yield (url, category, version, content) for every page in the bundle."""
+        for url, page in self._load().get("pages", {}).items():
+            content = self._read(url, page)
+            if content is not None:
+                yield url, page.get("category", ""), page.get("version", ""), content
+
+    def is_missing(self, url: str) -> bool:
+        """Whether url answered 404 when the bundle was built."""
+        return url in self._load().get("missing_set", ())
+
+    def stats(self) -> dict[str, Any]:
+        manifest = self._load()
+        return {
+            "path": str(self.path),
+            "available": bool(manifest.get("pages")),
+            "built_at": manifest.get("built_at"),
+            "versions": manifest.get("versions", []),
+            "pages": len(manifest.get("pages", {})),
+            "missing": len(manifest.get("missing_set", ())),
+            "hits": self.hits,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            if self._zip is not None:
+                self._zip.close()
+            self._zip = None
+            self._manifest = None
+
+    def _read(self, url: str, page: dict[str, Any]) -> str | None:
+        try:
+            with self._lock:
+                return self._zip.read(page["entry"]).decode("utf-8")
+        except (KeyError, OSError, zipfile.BadZipFile) as e:
+            logger.warning("Unreadable documentation bundle entry for %s: %s", url, e)
+            return None
+
+    def _load(self) -> dict[str, Any]:
+        if self._manifest is not None:
+            return self._manifest
+        with self._lock:
+            if self._manifest is not None:
+                return self._manifest
+            self._manifest = {}
+            if not self.path.exists():
+                return self._manifest
+            try:
+                archive = zipfile.ZipFile(self.path)
+                manifest = json.loads(archive.read(MANIFEST_NAME))
+            except (OSError, KeyError, ValueError, zipfile.BadZipFile) as e:
+                logger.warning("Ignoring unreadable documentation bundle %s: %s", self.path, e)
+                return self._manifest
+            if manifest.get("format") != BUNDLE_FORMAT:
+                logger.warning(
+                    "Ignoring documentation bundle %s with unsupported format %r",
+                    self.path,
+                    manifest.get("format"),
+                )
+                archive.close()
+                return self._manifest
+            manifest["missing_set"] = frozenset(manifest.get("missing", ()))
+            self._zip = archive
+            self._manifest = manifest
+            logger.info(
+                "Loaded documentation bundle %s (%d pages, built %s)",
+                self.path,
+                len(manifest.get("pages", {})),
+                manifest.get("built_at"),
+            )
+            return self._manifest
+
+
+class DocsBundleWriter:
+    """Collects processed pages and writes them as a bundle."""
+
+    def __init__(self, versions: list[str] | None = None):
+        self.versions = list(versions or [])
+        self.pages: dict[str, tuple[str, str, str]] = {}
+        self.missing: set[str] = set()
+
+    def add(self, url: str, content: str, category: str = "", version: str = "") -> None:
+        self.pages[url] = (content, category, version)
+        self.missing.discard(url)
+
+    def add_missing(self, url: str) -> None:
+        if url not in self.pages:
+            self.missing.add(url)
+
+    def write(self, path: str | os.PathLike) -> Path:
+        """Write the bundle atomically and return its path."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        manifest = {
+            "format": BUNDLE_FORMAT,
+            "built_at": datetime.now(timezone.utc).isoformat(),
+            "versions": self.versions,
+            "pages": {},
+            "missing": sorted(self.missing),
+        }
+        tmp_path = path.with_name(path.name + ".tmp")
+        with zipfile.ZipFile(
+            tmp_path, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=9
+        ) as archive:
+            for url, (content, category, version) in sorted(self.pages.items()):
+                entry = _entry_name(url)
+                archive.writestr(entry, content.encode("utf-8"))
+                manifest["pages"][url] = {"entry": entry, "category": category, "version": version}
+            archive.writestr(MANIFEST_NAME, json.dumps(manifest, indent=1, sort_keys=True))
+        os.replace(tmp_path, path)
+        return path
+
+
+def bundle_from_env() -> DocsBundle | None:
+    """Return the bundle configured by MCP_DOCS_BUNDLE_PATH, or None when disabled."""
+    path = os.getenv("MCP_DOCS_BUNDLE_PATH", DEFAULT_BUNDLE_PATH)
+    if not path or path.strip().lower() in _DISABLED_PATHS:
+        return None
+    return DocsBundle(path)
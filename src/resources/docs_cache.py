@@ -0,0 +1,803 @@
+"""
+Two-tier cache for processed Splunk documentation.
+
+Documentation pages are fetched from help.splunk.com, converted to LLM-friendly markdown and
+kept in two tiers:
+
+- an in-process LRU bounded by a byte budget, for hot pages
+- a single-file SQLite store holding zlib-compressed markdown, shared across restarts and
+  across server processes on the same host, bounded by a maximum on-disk size
+
+Pages are stored per URL together with the ``ETag``/``Last-Modified`` validators of the
+response. Once an entry is older than the TTL it is revalidated with a conditional GET; a
+``304 Not Modified`` refreshes the entry without downloading or re-processing the page. Only
+successful responses are stored, so error pages never outlive the process that produced them.
+
+Concurrent requests for the same page or topic share one in-flight fetch, and ``404 Not Found``
+answers are remembered for a short time so unknown commands or topics do not hammer upstream.
+Pages missing from both tiers are looked up in the offline documentation bundle (see
+``docs_bundle``) before going to the network.
+
+Reads of rendered topics are counted per topic and persisted, so the cache warmer (see
+``docs_warmer``) can fetch what users read most before they ask for it.
+
+Environment variables:
+- MCP_DOCS_CACHE_PATH (default: ./data/docs_cache.sqlite3; "off" disables the disk tier)
+- MCP_DOCS_CACHE_MAX_MB (default: 256)
+- MCP_DOCS_CACHE_MEMORY_MB (default: 32)
+- MCP_DOCS_CACHE_TTL_HOURS (default: 24)
+- MCP_DOCS_CACHE_NEGATIVE_TTL_SECONDS (default: 300)
+- MCP_DOCS_BUNDLE_PATH (default: ./data/docs_bundle.zip; "off" disables the bundle)
+- MCP_DOCS_POPULARITY_PATH (default: ./data/docs_popularity.json; "off" keeps counts in memory)
+"""
+
+import asyncio
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Iterator
+from contextvars import ContextVar
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+try:
+    import httpx
+
+    from src.core.http_client import SharedHttpClient, shared_http_client
+except ImportError:  # httpx is optional for documentation resources
+    httpx = None  # type: ignore
+    SharedHttpClient = shared_http_client = None  # type: ignore
+
+from .docs_bundle import DocsBundle, bundle_from_env
+from .processors.executor import HtmlProcessingPool, html_pool
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = "./data/docs_cache.sqlite3"
+DEFAULT_POPULARITY_PATH = "./data/docs_popularity.json"
+_DISABLED_PATHS = {"", "off", "none", "false", "0"}
+_MB = 1024 * 1024
+
+# Unknown pages remembered at most, oldest dropped first
+MAX_NEGATIVE_ENTRIES = 1024
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS docs (
+    key TEXT PRIMARY KEY,
+    version TEXT NOT NULL,
+    category TEXT NOT NULL,
+    topic TEXT NOT NULL,
+    content BLOB NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    fetched_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS docs_accessed_at ON docs (accessed_at);
+CREATE INDEX IF NOT EXISTS docs_version ON docs (version);
+"""
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, default))
+    except ValueError:
+        logger.warning("Ignoring invalid %s=%r", name, os.getenv(name))
+        return default
+
+
+@dataclass
+class CachedDoc:
+    """A processed documentation page and the validators of the response it came from."""
+
+    content: str
+    fetched_at: float
+    version: str = ""
+    etag: str | None = None
+    last_modified: str | None = None
+    # Overrides the cache TTL, e.g. for topics rendered from a 404
+    ttl_seconds: float | None = None
+
+    @property
+    def size(self) -> int:
+        return len(self.content.encode("utf-8"))
+
+
+class MemoryLRU:
+    """Thread-safe LRU of CachedDoc entries bounded by total content size in bytes."""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, tuple[int, CachedDoc]] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> CachedDoc | None:
+        with self._lock:
+            record = self._entries.get(key)
+            if record is None:
+                return None
+            self._entries.move_to_end(key)
+            return record[1]
+
+    def put(self, key: str, doc: CachedDoc) -> None:
+        size = doc.size
+        with self._lock:
+            self._discard(key)
+            if size > self.max_bytes:
+                return
+            self._entries[key] = (size, doc)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, (evicted_size, _) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+
+    def discard(self, predicate: Callable[[str, CachedDoc], bool]) -> int:
+        """Remove entries for which predicate(key, doc) is true; return how many."""
+        with self._lock:
+            keys = [key for key, (_, doc) in self._entries.items() if predicate(key, doc)]
+            for key in keys:
+                self._discard(key)
+            return len(keys)
+
+    def items(self) -> list[tuple[str, CachedDoc]]:
+        """Snapshot of (key, doc) pairs, least recently used first."""
+        with self._lock:
+            return [(key, doc) for key, (_, doc) in self._entries.items()]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {"entries": len(self._entries), "bytes": self._bytes}
+
+    def _discard(self, key: str) -> None:
+        record = self._entries.pop(key, None)
+        if record is not None:
+            self._bytes -= record[0]
+
+
+class DiskDocStore:
+    """
+    SQLite store of zlib-compressed documentation pages bounded by total compressed size.
+
+    The database is opened lazily and only created on the first write, so processes that
+    never fetch documentation leave no file behind. Any SQLite failure disables the store
+    for the rest of the process; the memory tier keeps working.
+    """
+
+    def __init__(self, path: str | os.PathLike, max_bytes: int):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self._conn: sqlite3.Connection | None = None
+        self._pid = os.getpid()
+        self._failed = False
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> CachedDoc | None:
+        with self._lock:
+            conn = self._connection(create=False)
+            if conn is None:
+                return None
+            try:
+                row = conn.execute(
+                    "SELECT content, fetched_at, version, etag, last_modified FROM docs "
+                    "WHERE key = ?",
+                    (key,),
+                ).fetchone()
+                if row is None:
+                    return None
+                conn.execute("UPDATE docs SET accessed_at = ? WHERE key = ?", (time.time(), key))
+                content = zlib.decompress(row[0]).decode("utf-8")
+            except (sqlite3.Error, zlib.error) as e:
+                self._fail(e)
+                return None
+        return CachedDoc(content, row[1], row[2], row[3], row[4])
+
+    def put(self, key: str, category: str, topic: str, doc: CachedDoc) -> None:
+        blob = zlib.compress(doc.content.encode("utf-8"), 6)
+        if len(blob) > self.max_bytes:
+            return
+        with self._lock:
+            conn = self._connection(create=True)
+            if conn is None:
+                return
+            try:
+                conn.execute(
+                    "INSERT OR REPLACE INTO docs (key, version, category, topic, content, etag, "
+                    "last_modified, fetched_at, accessed_at, size) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        key,
+                        doc.version,
+                        category,
+                        topic,
+                        blob,
+                        doc.etag,
+                        doc.last_modified,
+                        doc.fetched_at,
+                        time.time(),
+                        len(blob),
+                    ),
+                )
+                self._evict(conn)
+            except sqlite3.Error as e:
+                self._fail(e)
+
+    def touch(self, key: str, fetched_at: float) -> None:
+        """Mark an entry as revalidated at fetched_at."""
+        with self._lock:
+            conn = self._connection(create=False)
+            if conn is None:
+                return
+            try:
+                conn.execute(
+                    "UPDATE docs SET fetched_at = ?, accessed_at = ? WHERE key = ?",
+                    (fetched_at, time.time(), key),
+                )
+            except sqlite3.Error as e:
+                self._fail(e)
+
+    def pages(self) -> list[tuple[str, str, str, str]]:
+        """Return (url, category, version, content) for every stored page."""
+        with self._lock:
+            conn = self._connection(create=False)
+            if conn is None:
+                return []
+            try:
+                rows = conn.execute(
+                    "SELECT topic, category, version, content FROM docs WHERE key LIKE 'url_%'"
+                ).fetchall()
+                return [
+                    (url, category, version, zlib.decompress(blob).decode("utf-8"))
+                    for url, category, version, blob in rows
+                ]
+            except (sqlite3.Error, zlib.error) as e:
+                self._fail(e)
+                return []
+
+    def delete_version(self, version: str) -> int:
+        with self._lock:
+            conn = self._connection(create=False)
+            if conn is None:
+                return 0
+            try:
+                return conn.execute("DELETE FROM docs WHERE version = ?", (version,)).rowcount
+            except sqlite3.Error as e:
+                self._fail(e)
+                return 0
+
+    def clear(self) -> None:
+        with self._lock:
+            conn = self._connection(create=False)
+            if conn is None:
+                return
+            try:
+                conn.execute("DELETE FROM docs")
+            except sqlite3.Error as e:
+                self._fail(e)
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            conn = self._connection(create=False)
+            if conn is None:
+                return {
+                    "path": str(self.path),
+                    "enabled": not self._failed,
+                    "entries": 0,
+                    "bytes": 0,
+                }
+            try:
+                entries, size = conn.execute(
+                    "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM docs"
+                ).fetchone()
+            except sqlite3.Error as e:
+                self._fail(e)
+                entries, size = 0, 0
+        return {
+            "path": str(self.path),
+            "enabled": not self._failed,
+            "entries": entries,
+            "bytes": size,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _connection(self, create: bool) -> sqlite3.Connection | None:
+        if self._failed:
+            return None
+        if self._conn is not None and self._pid == os.getpid():
+            return self._conn
+        if not create and not self.path.exists():
+            return None
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(
+                str(self.path), timeout=5.0, isolation_level=None, check_same_thread=False
+            )
+            # WAL lets several server processes share the file without blocking readers
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+        except (OSError, sqlite3.Error) as e:
+            self._fail(e)
+            return None
+        self._conn = conn
+        # SQLite connections must not be used across fork(); worker processes reopen the file
+        self._pid = os.getpid()
+        return conn
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        (total,) = conn.execute("SELECT COALESCE(SUM(size), 0) FROM docs").fetchone()
+        if total <= self.max_bytes:
+            return
+        excess = total - self.max_bytes
+        victims = []
+        for key, size in conn.execute("SELECT key, size FROM docs ORDER BY accessed_at"):
+            victims.append((key,))
+            excess -= size
+            if excess <= 0:
+                break
+        conn.executemany("DELETE FROM docs WHERE key = ?", victims)
+        logger.debug("Evicted %d documentation pages from %s", len(victims), self.path)
+
+    def _fail(self, error: Exception) -> None:
+        logger.warning("Disabling on-disk documentation cache %s: %s", self.path, error)
+        self._failed = True
+        if self._conn is not None:
+            try:
+                self._conn.close()
+            except sqlite3.Error:
+                pass
+            self._conn = None
+
+
+class TopicPopularity:
+    """
+    Request counts per rendered topic, used to decide which topics to pre-warm.
+
+    Counts are saved as JSON and halved when loaded again, so topics nobody reads any more
+    fade out over a few restarts.
+    """
+
+    def __init__(self, path: str | os.PathLike | None = None, decay: float = 0.5):
+        self.path = Path(path) if path else None
+        self.decay = decay
+        self.requests = 0
+        # Whether counts changed since they were loaded or last saved
+        self.dirty = False
+        self._counts: dict[tuple[str, str, str], float] = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    def record(self, version: str, category: str, topic: str) -> None:
+        with self._lock:
+            key = (version, category, topic)
+            self._counts[key] = self._counts.get(key, 0.0) + 1
+            self.requests += 1
+            self.dirty = True
+
+    def top(self, limit: int) -> list[tuple[str, str, str]]:
+        """The limit most requested (version, category, topic) keys, most requested first."""
+        with self._lock:
+            ranked = sorted(self._counts.items(), key=lambda item: item[1], reverse=True)
+        return [key for key, _ in ranked[:limit]]
+
+    def save(self) -> None:
+        """Write changed counts atomically; failures are logged and otherwise ignored."""
+        if self.path is None or not self.dirty:
+            return
+        with self._lock:
+            self.dirty = False
+            topics = [
+                {"version": version, "category": category, "topic": topic, "count": count}
+                for (version, category, topic), count in self._counts.items()
+            ]
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_name(self.path.name + ".tmp")
+            tmp_path.write_text(json.dumps({"topics": topics}, indent=1), "utf-8")
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            self.dirty = True
+            logger.warning("Could not save documentation popularity to %s: %s", self.path, e)
+
+    def stats(self, limit: int = 10) -> dict[str, Any]:
+        with self._lock:
+            ranked = sorted(self._counts.items(), key=lambda item: item[1], reverse=True)
+            return {
+                "path": str(self.path) if self.path else None,
+                "topics": len(self._counts),
+                "requests": self.requests,
+                "top": [
+                    {"version": v, "category": c, "topic": t, "count": round(count, 2)}
+                    for (v, c, t), count in ranked[:limit]
+                ],
+            }
+
+    def _load(self) -> None:
+        if self.path is None or not self.path.exists():
+            return
+        try:
+            topics = json.loads(self.path.read_text("utf-8")).get("topics", [])
+            for entry in topics:
+                key = (str(entry["version"]), str(entry["category"]), str(entry["topic"]))
+                count = float(entry["count"]) * self.decay
+                if count >= 0.5:
+                    self._counts[key] = count
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            logger.warning("Ignoring unreadable documentation popularity %s: %s", self.path, e)
+
+
+_FROM_ENV = object()
+
+# Called with (url, category, version, content) for every page fetched from upstream;
+# content is None when the page answered 404
+PageListener = Callable[[str, str, str, str | None], None]
+
+# Set by background work such as the cache warmer so its requests are not counted as reads
+background_fetch: ContextVar[bool] = ContextVar("docs_background_fetch", default=False)
+
+# Set while get_or_fetch renders a topic; fetch_url records what happened to the pages it used
+_render_outcome: ContextVar[dict[str, bool] | None] = ContextVar(
+    "docs_render_outcome", default=None
+)
+
+
+class DocumentationCache:
+    """
+    Version-aware caching for Splunk documentation.
+
+    ``get_or_fetch`` caches whole rendered topics in memory. ``fetch_url`` caches processed
+    pages per URL in both tiers and revalidates expired pages with conditional requests. Both
+    coalesce concurrent misses for the same key into a single fetch.
+    """
+
+    def __init__(
+        self,
+        ttl_hours: float | None = None,
+        memory_bytes: int | None = None,
+        disk_path: Any = _FROM_ENV,
+        disk_max_bytes: int | None = None,
+        negative_ttl_seconds: float | None = None,
+        http_client: "SharedHttpClient | None" = None,
+        processing_pool: HtmlProcessingPool | None = None,
+        bundle: Any = _FROM_ENV,
+        popularity_path: Any = _FROM_ENV,
+    ):
+        if ttl_hours is None:
+            ttl_hours = _env_float("MCP_DOCS_CACHE_TTL_HOURS", 24)
+        if memory_bytes is None:
+            memory_bytes = int(_env_float("MCP_DOCS_CACHE_MEMORY_MB", 32) * _MB)
+        if disk_max_bytes is None:
+            disk_max_bytes = int(_env_float("MCP_DOCS_CACHE_MAX_MB", 256) * _MB)
+        if negative_ttl_seconds is None:
+            negative_ttl_seconds = _env_float("MCP_DOCS_CACHE_NEGATIVE_TTL_SECONDS", 300)
+        if disk_path is _FROM_ENV:
+            disk_path = os.getenv("MCP_DOCS_CACHE_PATH", DEFAULT_CACHE_PATH)
+        if popularity_path is _FROM_ENV:
+            popularity_path = os.getenv("MCP_DOCS_POPULARITY_PATH", DEFAULT_POPULARITY_PATH)
+
+        self.ttl_hours = ttl_hours
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self.http_client = http_client
+        self.processing_pool = processing_pool
+        self.bundle: DocsBundle | None = bundle_from_env() if bundle is _FROM_ENV else bundle
+        self.memory = MemoryLRU(memory_bytes)
+        self.disk = (
+            DiskDocStore(disk_path, disk_max_bytes)
+            if disk_path and str(disk_path).strip().lower() not in _DISABLED_PATHS
+            else None
+        )
+        self.popularity = TopicPopularity(
+            popularity_path
+            if popularity_path and str(popularity_path).strip().lower() not in _DISABLED_PATHS
+            else None
+        )
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+        self.stale_served = 0
+        self.coalesced = 0
+        self.negative_hits = 0
+        self.negative_stored = 0
+        self._negative: OrderedDict[str, float] = OrderedDict()
+        self._inflight: dict[str, asyncio.Future] = {}
+        self._listeners: list[PageListener] = []
+
+    def add_listener(self, listener: PageListener) -> None:
+        """Register a callback for pages fetched from upstream."""
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: PageListener) -> None:
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def cached_pages(self) -> Iterator[tuple[str, str, str, str]]:
+        """Yield (url, category, version, content) for every page held in any tier."""
+        seen: set[str] = set()
+        for key, doc in self.memory.items():
+            if key.startswith("url_"):
+                seen.add(key[4:])
+                yield key[4:], "", doc.version, doc.content
+        sources = [self.disk.pages() if self.disk is not None else []]
+        if self.bundle is not None:
+            sources.append(self.bundle.pages())
+        for pages in sources:
+            for url, category, version, content in pages:
+                if url not in seen:
+                    seen.add(url)
+                    yield url, category, version, content
+
+    def cache_key(self, version: str, category: str, topic: str) -> str:
+        """Generate cache key for documentation."""
+        return f"docs_{version}_{category}_{topic}"
+
+    def is_expired(self, fetched_at: float, ttl_seconds: float | None = None) -> bool:
+        """Check if an entry fetched at the given epoch time is expired."""
+        if ttl_seconds is None:
+            ttl_seconds = self.ttl_hours * 3600
+        return time.time() - fetched_at > ttl_seconds
+
+    async def get_or_fetch(
+        self, version: str, category: str, topic: str, fetch_func: Callable[[], Awaitable[str]]
+    ) -> str:
+        """
+        Get a rendered topic from memory or build it with fetch_func.
+
+        Rendered topics may embed error pages, so they are only kept in memory; the pages
+        they are built from are persisted by ``fetch_url``. A topic rendered from a 404 is
+        kept for the negative TTL only, and one rendered from any other failure is not kept.
+        """
+        key = self.cache_key(version, category, topic)
+        if not background_fetch.get():
+            self.popularity.record(version, category, topic)
+
+        cached = self.memory.get(key)
+        if cached is not None and not self.is_expired(cached.fetched_at, cached.ttl_seconds):
+            logger.debug("Cache hit for %s", key)
+            if cached.ttl_seconds is not None:
+                self.negative_hits += 1
+            else:
+                self.hits += 1
+            return cached.content
+
+        async def render() -> str:
+            self.misses += 1
+            outcome = {"not_found": False, "failed": False}
+            _render_outcome.set(outcome)
+            content = await fetch_func()
+            if outcome["failed"]:
+                return content
+            ttl_seconds = self.negative_ttl_seconds if outcome["not_found"] else None
+            self.memory.put(key, CachedDoc(content, time.time(), version, ttl_seconds=ttl_seconds))
+            return content
+
+        logger.debug("Cache miss for %s, fetching", key)
+        return await self._single_flight(key, render)
+
+    async def fetch_url(
+        self,
+        url: str,
+        process: Callable[[str], str],
+        *,
+        version: str = "",
+        category: str = "",
+        headers: dict[str, str] | None = None,
+        timeout: float | None = None,
+    ) -> str:
+        """
+        Return the processed page at url, fetching it only when missing or stale.
+
+        Args:
+            url: Page URL
+            process: Converts the response HTML to the markdown that is cached; runs on the
+                processing pool, so pass a picklable callable to use worker processes
+            version: Documentation version, used by ``invalidate_version``
+            category: Documentation category, stored for inspection
+            headers: Request headers
+            timeout: Request timeout in seconds (default: the shared client's policy)
+
+        Raises:
+            httpx.HTTPError: when the page cannot be fetched and no stored copy exists
+        """
+        if httpx is None:
+            raise RuntimeError("httpx is required to fetch documentation")
+
+        key = f"url_{url}"
+        outcome = _render_outcome.get()
+        try:
+            if self._is_known_missing(key) or (
+                self.bundle is not None and self.bundle.is_missing(url)
+            ):
+                self.negative_hits += 1
+                request = httpx.Request("GET", url)
+                raise httpx.HTTPStatusError(
+                    f"Client error '404 Not Found' for url '{url}' (cached)",
+                    request=request,
+                    response=httpx.Response(404, request=request),
+                )
+            return await self._single_flight(
+                key, lambda: self._fetch_url(key, url, process, version, category, headers, timeout)
+            )
+        except httpx.HTTPStatusError as e:
+            if outcome is not None:
+                outcome["not_found" if e.response.status_code == 404 else "failed"] = True
+            raise
+        except Exception:
+            if outcome is not None:
+                outcome["failed"] = True
+            raise
+
+    async def _fetch_url(
+        self,
+        key: str,
+        url: str,
+        process: Callable[[str], str],
+        version: str,
+        category: str,
+        headers: dict[str, str] | None,
+        timeout: float | None,
+    ) -> str:
+        cached = self.memory.get(key)
+        if cached is None and self.disk is not None:
+            # SQLite reads, writes and eviction run on a worker thread, off the event loop
+            cached = await asyncio.to_thread(self.disk.get, key)
+            if cached is not None:
+                self.memory.put(key, cached)
+        if cached is not None and not self.is_expired(cached.fetched_at):
+            self.hits += 1
+            return cached.content
+
+        if self.bundle is not None:
+            content = self.bundle.get(url)
+            if content is not None:
+                self.memory.put(key, CachedDoc(content, time.time(), version))
+                return content
+
+        self.misses += 1
+        request_headers = dict(headers or {})
+        if cached is not None:
+            if cached.etag:
+                request_headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                request_headers["If-Modified-Since"] = cached.last_modified
+
+        try:
+            logger.debug("Fetching documentation from: %s", url)
+            http_client = self.http_client or shared_http_client
+            response = await http_client.get(url, headers=request_headers, timeout=timeout)
+        except httpx.TransportError as e:
+            if cached is None:
+                raise
+            logger.warning("Serving stale documentation for %s: %s", url, e)
+            self.stale_served += 1
+            return cached.content
+
+        now = time.time()
+        if response.status_code == 304 and cached is not None:
+            logger.debug("Documentation not modified: %s", url)
+            self.revalidated += 1
+            cached.fetched_at = now
+            if self.disk is not None:
+                await asyncio.to_thread(self.disk.touch, key, now)
+            return cached.content
+
+        if response.status_code == 404:
+            self._remember_missing(key)
+            self._notify(url, category, version, None)
+        response.raise_for_status()
+        processing_pool = self.processing_pool or html_pool
+        doc = CachedDoc(
+            await processing_pool.run(process, response.text),
+            now,
+            version,
+            response.headers.get("etag"),
+            response.headers.get("last-modified"),
+        )
+        self.memory.put(key, doc)
+        if self.disk is not None:
+            await asyncio.to_thread(self.disk.put, key, category, url, doc)
+        self._notify(url, category, version, doc.content)
+        return doc.content
+
+    def _notify(self, url: str, category: str, version: str, content: str | None) -> None:
+        for listener in list(self._listeners):
+            try:
+                listener(url, category, version, content)
+            except Exception as e:
+                logger.warning("Documentation page listener failed for %s: %s", url, e)
+
+    async def _single_flight(self, key: str, factory: Callable[[], Awaitable[str]]) -> str:
+        """Run factory() once for concurrent callers with the same key and share its result."""
+        task = self._inflight.get(key)
+        if task is None or task.done():
+            task = asyncio.ensure_future(factory())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._forget_inflight(key, done))
+        else:
+            self.coalesced += 1
+        # A cancelled caller must not cancel the fetch other callers are waiting on
+        return await asyncio.shield(task)
+
+    def _forget_inflight(self, key: str, task: asyncio.Future) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+
+    def _is_known_missing(self, key: str) -> bool:
+        expires_at = self._negative.get(key)
+        if expires_at is None:
+            return False
+        if expires_at < time.time():
+            del self._negative[key]
+            return False
+        return True
+
+    def _remember_missing(self, key: str) -> None:
+        if self.negative_ttl_seconds <= 0:
+            return
+        self.negative_stored += 1
+        self._negative.pop(key, None)
+        self._negative[key] = time.time() + self.negative_ttl_seconds
+        while len(self._negative) > MAX_NEGATIVE_ENTRIES:
+            self._negative.popitem(last=False)
+
+    def invalidate_version(self, version: str):
+        """Invalidate all cached docs for a specific version."""
+        prefix = f"docs_{version}_"
+        removed = self.memory.discard(
+            lambda key, doc: key.startswith(prefix)
+            or (key.startswith("url_") and doc.version == version)
+        )
+        if self.disk is not None:
+            removed += self.disk.delete_version(version)
+        logger.info("Invalidated %d cache entries for version %s", removed, version)
+
+    def clear(self) -> None:
+        """Drop every cached entry from both tiers."""
+        self.memory.clear()
+        self._negative.clear()
+        if self.disk is not None:
+            self.disk.clear()
+
+    def stats(self) -> dict[str, Any]:
+        negative_lookups = self.negative_hits + self.negative_stored
+        return {
+            "ttl_hours": self.ttl_hours,
+            "hits": self.hits,
+            "misses": self.misses,
+            "revalidated": self.revalidated,
+            "stale_served": self.stale_served,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._inflight),
+            "negative": {
+                "entries": len(self._negative),
+                "ttl_seconds": self.negative_ttl_seconds,
+                "hits": self.negative_hits,
+                "stored": self.negative_stored,
+                "hit_rate": round(negative_lookups and self.negative_hits / negative_lookups, 4),
+            },
+            "memory": self.memory.stats(),
+            "disk": self.disk.stats() if self.disk is not None else None,
+            "bundle": self.bundle.stats() if self.bundle is not None else None,
+            "processing": (self.processing_pool or html_pool).stats(),
+            "popularity": self.popularity.stats(),
+        }
+
+
+# Shared by splunk-docs, splunk-cim and dashboard-studio resources
+doc_cache = DocumentationCache()
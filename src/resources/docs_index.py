@@ -0,0 +1,180 @@
+"""
+In-process full-text index over documentation sections.
+
+Markdown documents are split into sections at their headings, and each section is indexed in
+an inverted index ranked with Okapi BM25. Documents are keyed by resource URI; adding a
+document again replaces its previous sections, so the index can be kept current as pages are
+fetched without rebuilding it.
+"""
+
+import heapq
+import logging
+import math
+import re
+import threading
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+_TOKEN_RE = re.compile(r"[a-z0-9_]+")
+_HEADING_RE = re.compile(r"^(#{1,4})\s+(.+?)\s*#*\s*$", re.MULTILINE)
+_STOPWORDS = frozenset(
+    "a an and are as at be by for from how in is it of on or that the this to use what when "
+    "with you your".split()
+)
+SNIPPET_CHARS = 240
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercase word tokens without stopwords."""
+    return [token for token in _TOKEN_RE.findall(text.lower()) if token not in _STOPWORDS]
+
+
+@dataclass
+class Section:
+    """One indexed section of a document."""
+
+    uri: str
+    title: str
+    heading: str
+    text: str
+    length: int
+    terms: tuple[str, ...]
+
+
+def split_sections(markdown: str) -> list[tuple[str, str]]:
+    """Split markdown into (heading, body) pairs; text before the first heading has no heading."""
+    sections = []
+    matches = list(_HEADING_RE.finditer(markdown))
+    preamble = markdown[: matches[0].start()] if matches else markdown
+    if preamble.strip():
+        sections.append(("", preamble.strip()))
+    for i, match in enumerate(matches):
+        end = matches[i + 1].start() if i + 1 < len(matches) else len(markdown)
+        sections.append((match.group(2).strip(), markdown[match.end() : end].strip()))
+    return sections
+
+
+class DocsSearchIndex:
+    """
+    BM25-ranked inverted index of documentation sections.
+
+    Headings and document titles are indexed together with the section body, so a query that
+    names a command or topic ranks the section about it first.
+    """
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self._sections: dict[int, Section] = {}
+        self._postings: dict[str, dict[int, int]] = {}
+        self._by_uri: dict[str, list[int]] = {}
+        self._total_length = 0
+        self._next_id = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._sections)
+
+    def __contains__(self, uri: str) -> bool:
+        return uri in self._by_uri
+
+    def add_document(self, uri: str, title: str, markdown: str) -> int:
+        """Index markdown under uri, replacing any earlier version; return the section count."""
+        indexed = []
+        for heading, body in split_sections(markdown):
+            terms = Counter(tokenize(f"{title} {heading} {heading} {body}"))
+            if terms:
+                indexed.append((heading, body, terms))
+
+        with self._lock:
+            self._remove(uri)
+            ids = []
+            for heading, body, terms in indexed:
+                section_id = self._next_id
+                self._next_id += 1
+                length = sum(terms.values())
+                self._sections[section_id] = Section(
+                    uri, title, heading, body, length, tuple(terms)
+                )
+                self._total_length += length
+                for term, frequency in terms.items():
+                    self._postings.setdefault(term, {})[section_id] = frequency
+                ids.append(section_id)
+            if ids:
+                self._by_uri[uri] = ids
+        return len(indexed)
+
+    def remove_document(self, uri: str) -> None:
+        with self._lock:
+            self._remove(uri)
+
+    def search(self, query: str, top_k: int = 5) -> list[dict[str, Any]]:
+        """Return the top_k sections for query, best first."""
+        terms = set(tokenize(query))
+        with self._lock:
+            count = len(self._sections)
+            if not terms or not count:
+                return []
+            average_length = self._total_length / count
+            scores: dict[int, float] = {}
+            for term in terms:
+                postings = self._postings.get(term)
+                if not postings:
+                    continue
+                idf = math.log(1 + (count - len(postings) + 0.5) / (len(postings) + 0.5))
+                for section_id, frequency in postings.items():
+                    norm = self.k1 * (
+                        1 - self.b + self.b * self._sections[section_id].length / average_length
+                    )
+                    score = idf * frequency * (self.k1 + 1) / (frequency + norm)
+                    scores[section_id] = scores.get(section_id, 0.0) + score
+            best = heapq.nlargest(top_k, scores.items(), key=lambda item: item[1])
+            hits = [(self._sections[section_id], score) for section_id, score in best]
+
+        return [
+            {
+                "uri": section.uri,
+                "title": section.title,
+                "section": section.heading,
+                "score": round(score, 4),
+                "snippet": _snippet(section.text, terms),
+            }
+            for section, score in hits
+        ]
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "documents": len(self._by_uri),
+                "sections": len(self._sections),
+                "terms": len(self._postings),
+            }
+
+    def _remove(self, uri: str) -> None:
+        for section_id in self._by_uri.pop(uri, ()):
+            section = self._sections.pop(section_id)
+            self._total_length -= section.length
+            for term in section.terms:
+                postings = self._postings[term]
+                del postings[section_id]
+                if not postings:
+                    del self._postings[term]
+
+
+def _snippet(text: str, terms: set[str]) -> str:
+    """Return about SNIPPET_CHARS characters of text around the first query term."""
+    flat = " ".join(text.split())
+    if len(flat) <= SNIPPET_CHARS:
+        return flat
+    lowered = flat.lower()
+    positions = [
+        match.start()
+        for term in terms
+        if (match := re.search(rf"\b{re.escape(term)}", lowered)) is not None
+    ]
+    start = max(0, min(positions) - SNIPPET_CHARS // 4) if positions else 0
+    snippet = flat[start : start + SNIPPET_CHARS]
+    return f"{'…' if start else ''}{snippet}{'…' if start + SNIPPET_CHARS < len(flat) else ''}"
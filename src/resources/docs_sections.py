@@ -0,0 +1,197 @@
+"""
+Section-addressable views of processed documentation pages.
+
+Processed pages are markdown. ``section_tree`` records every heading with the character offsets
+of the section it opens (up to the next heading of the same or a higher level), skipping lines
+inside fenced code blocks such as ``#`` comments in spec files. The tree of a page is built once
+and memoized, so slicing the same page again costs only the slice.
+
+``slice_document`` returns one section and/or one page of a document plus a table of contents,
+which lets tools and resource URIs answer targeted questions without sending whole pages:
+
+    splunk-spec://savedsearches.conf?section=dispatch-options&max_chars=4000&page=2
+"""
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
+
+_HEADING_RE = re.compile(r"^(#{1,6})\s+(.+?)\s*#*\s*$")
+_FENCE_RE = re.compile(r"^\s*(```|~~~)")
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+
+MIN_PAGE_CHARS = 500
+TOC_DEPTH = 3
+
+
+@dataclass(frozen=True)
+class DocSection:
+    """A heading and the character range [start, end) of its section, subsections included."""
+
+    title: str
+    anchor: str
+    level: int
+    start: int
+    end: int
+    parent: int | None
+
+    @property
+    def chars(self) -> int:
+        return self.end - self.start
+
+
+def slugify(text: str) -> str:
+    return _SLUG_RE.sub("-", text.lower()).strip("-")
+
+
+@lru_cache(maxsize=64)
+def section_tree(markdown: str) -> tuple[DocSection, ...]:
+    """Return the sections of markdown in document order."""
+    headings: list[tuple[str, int, int]] = []
+    offset = 0
+    in_fence = False
+    for line in markdown.splitlines(keepends=True):
+        if _FENCE_RE.match(line):
+            in_fence = not in_fence
+        elif not in_fence and (match := _HEADING_RE.match(line.rstrip("\r\n"))):
+            headings.append((match.group(2).strip(), len(match.group(1)), offset))
+        offset += len(line)
+
+    # [title, anchor, level, start, end, parent] per heading; ends are set when a heading of
+    # the same or a higher level closes the section
+    rows: list[list[Any]] = []
+    anchors: dict[str, int] = {}
+    open_rows: list[int] = []
+    for title, level, start in headings:
+        while open_rows and rows[open_rows[-1]][2] >= level:
+            rows[open_rows.pop()][4] = start
+        anchor = slugify(title) or "section"
+        anchors[anchor] = anchors.get(anchor, 0) + 1
+        if anchors[anchor] > 1:
+            anchor = f"{anchor}-{anchors[anchor]}"
+        rows.append(
+            [title, anchor, level, start, len(markdown), open_rows[-1] if open_rows else None]
+        )
+        open_rows.append(len(rows) - 1)
+    sections = [DocSection(*row) for row in rows]
+    return tuple(sections)
+
+
+def table_of_contents(
+    sections: tuple[DocSection, ...], depth: int = TOC_DEPTH
+) -> list[dict[str, Any]]:
+    """Headings up to ``depth`` levels below the top level, with their anchors and sizes."""
+    if not sections:
+        return []
+    top = min(section.level for section in sections)
+    return [
+        {
+            "title": section.title,
+            "anchor": section.anchor,
+            "level": section.level,
+            "chars": section.chars,
+        }
+        for section in sections
+        if section.level < top + depth
+    ]
+
+
+def find_section(sections: tuple[DocSection, ...], name: str) -> DocSection | None:
+    """Find a section by anchor, then exact heading, then the first heading containing name."""
+    wanted = name.strip().lower()
+    slug = slugify(wanted)
+    for matches in (
+        lambda s: s.anchor == wanted or s.anchor == slug,
+        lambda s: s.title.lower() == wanted,
+        lambda s: wanted in s.title.lower(),
+    ):
+        for section in sections:
+            if matches(section):
+                return section
+    return None
+
+
+def page_bounds(text: str, max_chars: int) -> list[tuple[int, int]]:
+    """Split text into pages of at most max_chars, preferring paragraph and line breaks."""
+    max_chars = max(MIN_PAGE_CHARS, max_chars)
+    bounds = []
+    start = 0
+    while len(text) - start > max_chars:
+        limit = start + max_chars
+        cut = text.rfind("\n\n", start + max_chars // 2, limit)
+        if cut == -1:
+            cut = text.rfind("\n", start + max_chars // 2, limit)
+        end = cut + 1 if cut != -1 else limit
+        bounds.append((start, end))
+        start = end
+    bounds.append((start, len(text)))
+    return bounds
+
+
+def slice_document(
+    markdown: str, section: str | None = None, max_chars: int | None = None, page: int = 1
+) -> dict[str, Any]:
+    """
+    Return the requested section and page of a document with its table of contents.
+
+    Raises ValueError for an unknown section or a page out of range.
+    """
+    sections = section_tree(markdown)
+    selected = None
+    text = markdown
+    if section:
+        selected = find_section(sections, section)
+        if selected is None:
+            available = ", ".join(entry["anchor"] for entry in table_of_contents(sections)[:30])
+            raise ValueError(
+                f"Section '{section}' not found. Available sections: {available or 'none'}"
+            )
+        text = markdown[selected.start : selected.end]
+
+    bounds = page_bounds(text, max_chars) if max_chars else [(0, len(text))]
+    if not 1 <= page <= len(bounds):
+        raise ValueError(f"Page {page} is out of range (1-{len(bounds)})")
+    start, end = bounds[page - 1]
+    return {
+        "text": text[start:end],
+        "section": selected.title if selected else None,
+        "anchor": selected.anchor if selected else None,
+        "page": page,
+        "pages": len(bounds),
+        "chars": end - start,
+        "total_chars": len(text),
+        "document_chars": len(markdown),
+        "toc": table_of_contents(sections),
+    }
+
+
+def render_slice(
+    markdown: str, section: str | None = None, max_chars: int | None = None, page: int = 1
+) -> str:
+    """
+    Markdown for a resource read with ``section``/``max_chars``/``page`` query parameters.
+
+    Without them the document is returned unchanged; otherwise the slice is followed by its
+    position and the table of contents.
+    """
+    if not section and not max_chars and page == 1:
+        return markdown
+    view = slice_document(markdown, section, max_chars, page)
+    where = f"section `{view['anchor']}`" if view["anchor"] else "document"
+    lines = [
+        view["text"].rstrip(),
+        "",
+        "---",
+        f"_Page {view['page']} of {view['pages']} of {where} "
+        f"({view['chars']} of {view['total_chars']} characters)._",
+    ]
+    if view["toc"]:
+        lines += ["", "**Sections** (use `?section=<anchor>`):"]
+        top = min(entry["level"] for entry in view["toc"])
+        lines += [
+            f"{'  ' * (entry['level'] - top)}- `{entry['anchor']}` "
+            f"{entry['title']} ({entry['chars']} chars)"
+            for entry in view["toc"]
+        ]
+    return "\n".join(lines) + "\n"
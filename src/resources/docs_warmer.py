@@ -0,0 +1,297 @@
+"""
+Background pre-warming of the documentation cache.
+
+The first read of a documentation topic pays the upstream fetch and HTML processing on the
+caller's critical path. When enabled, the warmer renders the topics users are most likely to
+read shortly after the HTTP server is ready, and again every interval so expired pages are
+revalidated before anyone asks for them:
+
+- topics listed in MCP_DOCS_WARMER_TOPICS, as resource URIs
+- the most requested topics recorded by the documentation cache, which persist across restarts
+  (see ``TopicPopularity``), so the warmed set converges toward what users actually read
+- the first commands advertised by ``list_spl_commands``
+
+Warming is bounded by a rate and a concurrency limit, runs through the normal resources so
+every cache tier is filled, and pauses while live documentation traffic is above a threshold.
+Its own reads are not counted as popularity.
+
+Environment variables:
+- MCP_DOCS_WARMER (default: false)
+- MCP_DOCS_WARMER_TOPICS (default: none; comma-separated URIs such as
+  splunk-docs://latest/spl-reference/stats,splunk-spec://props.conf)
+- MCP_DOCS_WARMER_MAX_TOPICS (default: 60)
+- MCP_DOCS_WARMER_SPL_COMMANDS (default: 10)
+- MCP_DOCS_WARMER_RATE (default: 0.5 topics per second)
+- MCP_DOCS_WARMER_CONCURRENCY (default: 2)
+- MCP_DOCS_WARMER_BUSY_RPS (default: 2 live documentation reads per second)
+- MCP_DOCS_WARMER_DELAY_SECONDS (default: 30)
+- MCP_DOCS_WARMER_INTERVAL_SECONDS (default: 3600)
+"""
+
+import asyncio
+import logging
+import os
+import re
+import time
+from collections import Counter
+from typing import Any
+
+from src.core.base import BaseResource
+
+from .docs_cache import DocumentationCache, background_fetch, doc_cache
+from .splunk_cim import CIMDataModelResource
+from .splunk_docs import (
+    AdminGuideResource,
+    SPLCommandResource,
+    SplunkSpecReferenceResource,
+    TroubleshootingResource,
+)
+
+logger = logging.getLogger(__name__)
+
+Topic = tuple[str, str, str]  # (version, category, topic) as passed to get_or_fetch
+
+# How long to wait before checking live traffic again while paused
+PAUSE_SECONDS = 5.0
+
+_DOCS_URI = re.compile(
+    r"^splunk-docs://(?P<version>[^/]+)/(?P<category>spl-reference|troubleshooting|admin)/"
+    r"(?P<topic>[^?#]+)$"
+)
+_SPEC_URI = re.compile(r"^splunk-spec://(?P<topic>[^/?#]+)$")
+_CIM_URI = re.compile(r"^splunk-cim://(?P<version>[^/]+)/(?P<topic>[^/?#]+)$")
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, default))
+    except ValueError:
+        logger.warning("Ignoring invalid %s=%r", name, os.getenv(name))
+        return default
+
+
+def topic_for_uri(uri: str) -> Topic | None:
+    """Map a documentation resource URI to the (version, category, topic) it renders."""
+    uri = uri.strip()
+    if match := _DOCS_URI.match(uri):
+        return match["version"], match["category"], match["topic"]
+    if match := _SPEC_URI.match(uri):
+        return "latest", "spec-reference", match["topic"]
+    if match := _CIM_URI.match(uri):
+        return match["version"], "cim", match["topic"]
+    return None
+
+
+def resource_for_topic(version: str, category: str, topic: str) -> BaseResource | None:
+    """Build the resource that renders a cached topic, or None if it cannot be warmed."""
+    try:
+        if category == "spl-reference":
+            return SPLCommandResource(version, topic)
+        if category == "troubleshooting":
+            return TroubleshootingResource(version, topic)
+        if category == "admin":
+            return AdminGuideResource(version, topic)
+        if category == "spec-reference":
+            return SplunkSpecReferenceResource(topic, version)
+        if category == "cim":
+            return CIMDataModelResource(version, topic)
+    except ValueError:
+        pass
+    return None
+
+
+class DocsCacheWarmer:
+    """Renders popular documentation topics in the background under a rate budget."""
+
+    def __init__(
+        self,
+        cache: DocumentationCache | None = None,
+        *,
+        enabled: bool | None = None,
+        topics: list[str] | None = None,
+        max_topics: int | None = None,
+        spl_commands: int | None = None,
+        rate: float | None = None,
+        concurrency: int | None = None,
+        busy_rps: float | None = None,
+        delay_seconds: float | None = None,
+        interval_seconds: float | None = None,
+    ):
+        self.cache = cache or doc_cache
+        if enabled is None:
+            enabled = (os.getenv("MCP_DOCS_WARMER") or "false").strip().lower() == "true"
+        if topics is None:
+            topics = [t for t in (os.getenv("MCP_DOCS_WARMER_TOPICS") or "").split(",") if t]
+        self.enabled = enabled
+        self.topics = topics
+        self.max_topics = int(
+            _env_float("MCP_DOCS_WARMER_MAX_TOPICS", 60) if max_topics is None else max_topics
+        )
+        self.spl_commands = int(
+            _env_float("MCP_DOCS_WARMER_SPL_COMMANDS", 10) if spl_commands is None else spl_commands
+        )
+        self.rate = rate or _env_float("MCP_DOCS_WARMER_RATE", 0.5)
+        self.concurrency = max(1, concurrency or int(_env_float("MCP_DOCS_WARMER_CONCURRENCY", 2)))
+        self.busy_rps = (
+            busy_rps if busy_rps is not None else _env_float("MCP_DOCS_WARMER_BUSY_RPS", 2)
+        )
+        self.delay_seconds = (
+            _env_float("MCP_DOCS_WARMER_DELAY_SECONDS", 30)
+            if delay_seconds is None
+            else delay_seconds
+        )
+        self.interval_seconds = (
+            _env_float("MCP_DOCS_WARMER_INTERVAL_SECONDS", 3600)
+            if interval_seconds is None
+            else interval_seconds
+        )
+        self._task: asyncio.Task | None = None
+        self._last_requests = 0
+        self._last_check = time.monotonic()
+        self.runs = 0
+        self.warmed = 0
+        self.fresh = 0
+        self.failed = 0
+        self.skipped = 0
+        self.paused = 0
+        self.last_run_seconds: float | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def targets(self) -> list[Topic]:
+        """Configured topics, then the most requested ones, then the top SPL commands."""
+        configured = []
+        for uri in self.topics:
+            topic = topic_for_uri(uri)
+            if topic is None:
+                logger.warning("Ignoring unsupported documentation warmer topic %r", uri)
+            else:
+                configured.append(topic)
+        learned = self.cache.popularity.top(self.max_topics)
+
+        # Seed SPL commands under the version users read most, as detected versions differ
+        versions = Counter(
+            version
+            for version, category, _ in learned
+            if category in ("spl-reference", "troubleshooting", "admin")
+        )
+        version = versions.most_common(1)[0][0] if versions else "latest"
+        # Imported here: the documentation tools depend on this package
+        from src.tools.docs.splunk_docs_tools import SPL_COMMANDS
+
+        seeded = [
+            (version, "spl-reference", entry["command"])
+            for entry in SPL_COMMANDS[: self.spl_commands]
+        ]
+        return list(dict.fromkeys(configured + learned + seeded))[: self.max_topics]
+
+    async def warm_once(self) -> dict[str, int]:
+        """Render every target once; return how many were warmed, fresh, failed or skipped."""
+        started = time.perf_counter()
+        before = {name: getattr(self, name) for name in ("warmed", "fresh", "failed", "skipped")}
+        limit = asyncio.Semaphore(self.concurrency)
+        tasks: list[asyncio.Task] = []
+        token = background_fetch.set(True)
+        try:
+            for version, category, topic in self.targets():
+                cached = self.cache.memory.get(self.cache.cache_key(version, category, topic))
+                if cached is not None and not self.cache.is_expired(
+                    cached.fetched_at, cached.ttl_seconds
+                ):
+                    self.fresh += 1
+                    continue
+                resource = resource_for_topic(version, category, topic)
+                if resource is None:
+                    self.skipped += 1
+                    continue
+                await self._wait_for_quiet()
+                await limit.acquire()
+                task = asyncio.create_task(self._warm(resource))
+                task.add_done_callback(lambda _: limit.release())
+                tasks.append(task)
+                await asyncio.sleep(1 / self.rate)
+            await asyncio.gather(*tasks)
+        finally:
+            background_fetch.reset(token)
+        self.runs += 1
+        self.last_run_seconds = round(time.perf_counter() - started, 2)
+        summary = {name: getattr(self, name) - count for name, count in before.items()}
+        logger.info(
+            "Documentation cache warm-up finished in %ss: %s", self.last_run_seconds, summary
+        )
+        return summary
+
+    async def run(self) -> None:
+        """Warm after the start-up delay, then again every interval."""
+        # Measure live reads from now on, not since the warmer was created at import time
+        self._last_requests = self.cache.popularity.requests
+        self._last_check = time.monotonic()
+        await asyncio.sleep(self.delay_seconds)
+        while True:
+            try:
+                await self.warm_once()
+            except Exception as e:
+                logger.warning("Documentation cache warm-up failed: %s", e)
+            self.cache.popularity.save()
+            await asyncio.sleep(self.interval_seconds)
+
+    def start(self) -> None:
+        """Start warming in the background if enabled; call once the server is ready."""
+        if self.enabled and not self.running:
+            logger.info("Starting documentation cache warmer (up to %d topics)", self.max_topics)
+            self._task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        """Stop warming and, when enabled, persist what users read."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self.enabled:
+            self.cache.popularity.save()
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "running": self.running,
+            "max_topics": self.max_topics,
+            "rate": self.rate,
+            "concurrency": self.concurrency,
+            "runs": self.runs,
+            "warmed": self.warmed,
+            "fresh": self.fresh,
+            "failed": self.failed,
+            "skipped": self.skipped,
+            "paused": self.paused,
+            "last_run_seconds": self.last_run_seconds,
+        }
+
+    async def _warm(self, resource: BaseResource) -> None:
+        try:
+            await resource.get_content(None)
+            self.warmed += 1
+        except Exception as e:
+            self.failed += 1
+            logger.debug("Could not warm %s: %s", resource.uri, e)
+
+    async def _wait_for_quiet(self) -> None:
+        """Wait while live documentation reads exceed busy_rps."""
+        while True:
+            now = time.monotonic()
+            requests = self.cache.popularity.requests
+            elapsed = now - self._last_check
+            rate = (requests - self._last_requests) / elapsed if elapsed > 0 else 0.0
+            self._last_requests, self._last_check = requests, now
+            if rate <= self.busy_rps:
+                return
+            self.paused += 1
+            logger.debug("Pausing documentation warm-up: %.1f live reads/s", rate)
+            await asyncio.sleep(PAUSE_SECONDS)
+
+
+docs_warmer = DocsCacheWarmer()
@@ -11,6 +11,8 @@ import hashlib
 import json
 import logging
 import mimetypes
+import mmap
+import os
 import re
 import time
 from abc import abstractmethod
@@ -24,8 +26,10 @@ from fastmcp import Context
 
 from ..core.base import BaseResource, ResourceMetadata
 from ..core.client_identity import get_client_manager
+from ..core.conditional import chunked_etag, content_etag
 from ..core.enhanced_config_extractor import EnhancedConfigExtractor
 from ..core.registry import resource_registry
+from ..core.resource_cache import resource_cache_key, splunk_resource_cache
 
 logger = logging.getLogger(__name__)
 
@@ -242,27 +246,16 @@ class EmbeddedResource(BaseResource):
         return hashlib.md5(content.encode("utf-8")).hexdigest()
 
     def _generate_etag(self) -> str | None:
-        """Generate ETag for the resource."""
+        """
+        Generate ETag for the resource: ``content_etag`` of the embedded content, else of the
+        cached content.
+        """
         if not self.etag_enabled:
             return None
-        # Prefer previously computed content hash
+        if isinstance(self.embedded_content, str | bytes):
+            return content_etag(self.embedded_content)
         if self._content_hash:
             return f'"{self._content_hash}"'
-
-        # Fall back to hashing the embedded content when available
-        if self.embedded_content is not None:
-            try:
-                if isinstance(self.embedded_content, bytes):
-                    content_hash = hashlib.md5(self.embedded_content).hexdigest()
-                else:
-                    content_hash = hashlib.md5(
-                        str(self.embedded_content).encode("utf-8")
-                    ).hexdigest()
-                self._content_hash = content_hash
-                return f'"{content_hash}"'
-            except Exception:
-                return None
-
         return None
 
     def _validate_content(self, content: str) -> ContentValidationResult:
@@ -303,8 +296,21 @@ class FileEmbeddedResource(EmbeddedResource):
 
     Supports both text and binary files with automatic MIME type detection,
     file watching, and content validation.
+
+    Content is cached with the (mtime, size) signature of the file it was read from, so a
+    repeated read costs one ``os.stat`` and the file is only read again when it changes.
+    Reads run in a worker thread. Binary files are served base64-encoded, and files larger
+    than ``MMAP_THRESHOLD`` are memory-mapped and encoded in chunks rather than loaded whole;
+    their encoded payload is not cached, so it is only held in memory while being returned.
+    With ``watch_file`` the cache is kept for as long as the file is unchanged; otherwise it
+    also expires after ``cache_ttl``.
     """
 
+    # Binary files above this size are memory-mapped instead of read into memory
+    MMAP_THRESHOLD = 1024 * 1024
+    # Multiple of 3 so the base64 of consecutive chunks concatenates without padding
+    ENCODE_CHUNK_SIZE = 3 * 256 * 1024
+
     def __init__(
         self,
         uri: str,
@@ -325,54 +331,47 @@ class FileEmbeddedResource(EmbeddedResource):
         self.encoding = encoding
         self.watch_file = watch_file
         self._file_mtime = None
+        self._file_signature: tuple[int, int] | None = None
+
+    @property
+    def is_text(self) -> bool:
+        return (
+            self.mime_type.startswith("text/")
+            or self.mime_type == "application/json"
+            or self.mime_type.endswith("+json")
+        )
 
     async def get_content(self, ctx: Context) -> str:
         """Get content from file with enhanced error handling."""
         start_time = time.time()
         try:
-            if not self.file_path.exists():
+            try:
+                stat = os.stat(self.file_path)
+            except FileNotFoundError:
+                self._invalidate_file_cache()
                 error_response = self._create_error_response(f"File not found: {self.file_path}")
                 self._update_registry_stats(start_time, error=True)
                 return error_response
 
-            # Check if file has changed (for file watching)
-            if self.watch_file and self._file_mtime:
-                current_mtime = self.file_path.stat().st_mtime
-                if current_mtime > self._file_mtime:
-                    # File changed, invalidate cache
-                    self._cached_content = None
-                    self._cache_timestamp = 0
-
-            # Read file content
-            is_text_like = (
-                self.mime_type.startswith("text/")
-                or self.mime_type == "application/json"
-                or self.mime_type.endswith("+json")
-            )
-
-            if is_text_like:
-                # Text file
-                content = self.file_path.read_text(encoding=self.encoding)
-                self._file_mtime = self.file_path.stat().st_mtime
+            signature = (stat.st_mtime_ns, stat.st_size)
+            cached = self._cached_content
+            if (
+                cached is not None
+                and signature == self._file_signature
+                and (self.watch_file or self._is_cache_valid())
+            ):
                 self._update_registry_stats(start_time, error=False)
-                return content
+                return cached
+
+            content = await asyncio.to_thread(self._read_file)
+            if self.is_text or stat.st_size <= self.MMAP_THRESHOLD:
+                self._cache_content(content)
+                self._file_signature = signature
             else:
-                # Binary file
-                binary_content = self.file_path.read_bytes()
-                encoded = base64.b64encode(binary_content).decode("utf-8")
-                self._file_mtime = self.file_path.stat().st_mtime
-                result = json.dumps(
-                    {
-                        "type": "binary",
-                        "mime_type": self.mime_type,
-                        "data": encoded,
-                        "size": len(binary_content),
-                        "filename": self.file_path.name,
-                        "etag": self._generate_etag() if self.etag_enabled else None,
-                    }
-                )
-                self._update_registry_stats(start_time, error=False)
-                return result
+                self._invalidate_file_cache()
+            self._file_mtime = stat.st_mtime
+            self._update_registry_stats(start_time, error=False)
+            return content
 
         except UnicodeDecodeError as e:
             logger.error(f"Encoding error reading file {self.file_path}: {e}")
@@ -390,6 +389,49 @@ class FileEmbeddedResource(EmbeddedResource):
             self._update_registry_stats(start_time, error=True)
             return error_response
 
+    def _invalidate_file_cache(self) -> None:
+        self._cached_content = None
+        self._cache_timestamp = 0
+        self._file_signature = None
+
+    def _read_file(self) -> str:
+        """Read and format the file; runs in a worker thread."""
+        if self.is_text:
+            return self.file_path.read_text(encoding=self.encoding)
+
+        etag = None
+        with open(self.file_path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size > self.MMAP_THRESHOLD:
+                offsets = range(0, size, self.ENCODE_CHUNK_SIZE)
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    encoded = "".join(
+                        base64.b64encode(mapped[offset : offset + self.ENCODE_CHUNK_SIZE]).decode(
+                            "ascii"
+                        )
+                        for offset in offsets
+                    )
+                    if self.etag_enabled:
+                        etag = chunked_etag(
+                            mapped[offset : offset + self.ENCODE_CHUNK_SIZE] for offset in offsets
+                        )
+            else:
+                data = f.read()
+                encoded = base64.b64encode(data).decode("ascii")
+                if self.etag_enabled:
+                    etag = content_etag(data)
+
+        return json.dumps(
+            {
+                "type": "binary",
+                "mime_type": self.mime_type,
+                "data": encoded,
+                "size": size,
+                "filename": self.file_path.name,
+                "etag": etag,
+            }
+        )
+
 
 class TemplateEmbeddedResource(EmbeddedResource):
     """
@@ -487,9 +529,12 @@ class SplunkEmbeddedResource(EmbeddedResource):
     Enhanced embedded resource with Splunk integration.
 
     Provides enhanced Splunk-specific resource functionality with client isolation,
-    connection pooling, and error recovery.
+    connection pooling, and error recovery. Generated content is cached per client
+    identity for ``CACHE_TTL_SECONDS`` (see ``src.core.resource_cache``).
     """
 
+    CACHE_TTL_SECONDS = 60.0
+
     def __init__(
         self,
         uri: str,
@@ -501,47 +546,61 @@ class SplunkEmbeddedResource(EmbeddedResource):
     ):
         super().__init__(uri, name, description, mime_type)
         self.client_manager = get_client_manager()
+        self.config_extractor = EnhancedConfigExtractor()
         self.connection_timeout = connection_timeout
         self.retry_attempts = retry_attempts
 
     async def get_content(self, ctx: Context) -> str:
         """Get content with enhanced Splunk client isolation and retry logic."""
-        last_error = None
+        try:
+            client_config = await self.config_extractor.extract_client_config(ctx)
+            if not client_config:
+                return self._create_error_response("No Splunk configuration available")
+
+            async def connect():
+                return await self._connect_with_retry(ctx, client_config)
+
+            # Renders are repeated in the background after the request ends: bind no context
+            async def render(identity, service):
+                return await self._generate_splunk_content(None, identity, service), True
+
+            return await splunk_resource_cache.get(
+                resource_cache_key(self.uri, client_config),
+                self.CACHE_TTL_SECONDS,
+                connect,
+                render,
+            )
+        except ConnectionError as e:
+            return self._create_error_response(str(e))
+        except Exception as e:
+            logger.error(f"Error getting Splunk content for {self.uri}: {e}")
+            return self._create_error_response(f"Splunk error: {str(e)}")
 
+    async def _connect_with_retry(self, ctx: Context, client_config: dict[str, Any]):
+        """Resolve the client connection, retrying with exponential backoff."""
+        last_error = None
         for attempt in range(self.retry_attempts):
             try:
-                # Extract client configuration
-                config_extractor = EnhancedConfigExtractor()
-                client_config = await config_extractor.extract_client_config(ctx)
-
-                if not client_config:
-                    return self._create_error_response("No Splunk configuration available")
-
-                # Get client connection
-                identity, service = await self.client_manager.get_client_connection(
-                    ctx, client_config
-                )
-
-                # Generate Splunk-specific content
-                content = await self._generate_splunk_content(ctx, identity, service)
-
-                return content
-
+                return await self.client_manager.get_client_connection(ctx, client_config)
             except Exception as e:
                 last_error = e
                 logger.warning(f"Splunk connection attempt {attempt + 1} failed: {e}")
                 if attempt < self.retry_attempts - 1:
-                    # Wait before retry (exponential backoff)
                     await asyncio.sleep(2**attempt)
 
         logger.error(f"All Splunk connection attempts failed for {self.uri}")
-        return self._create_error_response(
+        raise ConnectionError(
             f"Splunk error after {self.retry_attempts} attempts: {str(last_error)}"
         )
 
     @abstractmethod
-    async def _generate_splunk_content(self, ctx: Context, identity, service) -> str:
-        """Generate content using Splunk service."""
+    async def _generate_splunk_content(self, ctx: Context | None, identity, service) -> str:
+        """
+        Generate content using Splunk service.
+
+        ``ctx`` is always None: cached content is refreshed outside the request that
+        rendered it, so it may depend only on ``identity`` and ``service``.
+        """
         pass
 
 
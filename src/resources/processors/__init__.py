@@ -3,9 +3,10 @@ Content processors for converting documentation formats.
 """
 
 try:
-    from .html_processor import SplunkDocsProcessor
+    from .executor import HtmlProcessingPool, html_pool
+    from .html_processor import SplunkDocsProcessor, process_docs_html
 
-    __all__ = ["SplunkDocsProcessor"]
+    __all__ = ["HtmlProcessingPool", "SplunkDocsProcessor", "html_pool", "process_docs_html"]
 except ImportError:
     # Handle missing dependencies gracefully
     __all__ = []
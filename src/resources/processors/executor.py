@@ -0,0 +1,163 @@
+"""
+Off-loop execution of HTML-to-markdown processing.
+
+Parsing a large SPL reference page with BeautifulSoup and rendering it to markdown takes tens to
+hundreds of milliseconds of pure Python. Run inline inside an async resource handler, that work
+blocks every other MCP request on the event loop. ``HtmlProcessingPool`` hands processing
+callables to a bounded thread pool (or a process pool) instead, so the loop only waits on a
+future.
+
+Process mode needs a picklable callable, such as a module-level function or a
+``functools.partial`` of one (see ``process_docs_html``). Callables that cannot be pickled, and
+calls made while the process pool is unavailable, run on the thread pool instead.
+
+Process workers are started with ``forkserver`` (``spawn`` where it is unavailable), never by
+forking the server itself: fork() copies a threaded process with whatever locks its other threads
+hold, and the child would have no log writer thread. A fresh worker imports the ``src`` package,
+and with it the server module, before its first task, which takes seconds per worker; that is
+why threads are the default. ``_init_worker`` gives each worker its own stderr logging.
+
+Environment variables:
+- MCP_DOCS_PROCESSOR_MODE: ``thread`` (default), ``process`` or ``inline``
+- MCP_DOCS_PROCESSOR_WORKERS (default: min(4, CPU count))
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import pickle
+import time
+from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any
+
+from .html_processor import HTML_PARSER
+
+logger = logging.getLogger(__name__)
+
+MODES = ("process", "thread", "inline")
+
+WORKER_LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - [docs-worker %(process)d] %(message)s"
+
+
+def _default_workers() -> int:
+    try:
+        return max(1, int(os.getenv("MCP_DOCS_PROCESSOR_WORKERS", "")))
+    except ValueError:
+        return min(4, os.cpu_count() or 1)
+
+
+def _process_context() -> Any:
+    methods = multiprocessing.get_all_start_methods()
+    for method in ("forkserver", "spawn"):
+        if method in methods:
+            return multiprocessing.get_context(method)
+    return None
+
+
+def _init_worker(level: int) -> None:
+    """
+    Log to stderr from a processing worker.
+
+    Runs before the worker imports the server module, whose ``configure_logging`` then keeps
+    these handlers instead of opening the server log file a second time.
+    """
+    logging.basicConfig(level=level, format=WORKER_LOG_FORMAT)
+
+
+class HtmlProcessingPool:
+    """Bounded executor for CPU-bound documentation processing."""
+
+    def __init__(self, mode: str | None = None, workers: int | None = None):
+        mode = (mode or os.getenv("MCP_DOCS_PROCESSOR_MODE") or "thread").strip().lower()
+        if mode not in MODES:
+            logger.warning("Ignoring invalid MCP_DOCS_PROCESSOR_MODE=%r", mode)
+            mode = "thread"
+        if mode == "process" and _process_context() is None:
+            mode = "thread"
+        self.mode = mode
+        self.workers = workers or _default_workers()
+        self._process_pool: ProcessPoolExecutor | None = None
+        self._thread_pool: ThreadPoolExecutor | None = None
+        self.tasks = 0
+        self.thread_fallbacks = 0
+        self.processing_seconds = 0.0
+
+    async def run(self, fn: Callable[[str], str], html: str) -> str:
+        """Return fn(html), computed off the event loop unless the pool runs inline."""
+        self.tasks += 1
+        started = time.perf_counter()
+        try:
+            if self.mode == "inline":
+                return fn(html)
+            loop = asyncio.get_running_loop()
+            if self.mode == "process":
+                executor = self._process_executor() if _is_picklable(fn) else None
+                if executor is not None:
+                    try:
+                        return await loop.run_in_executor(executor, fn, html)
+                    except BrokenProcessPool:
+                        logger.warning("Documentation process pool broke; restarting it")
+                        self._discard_process_pool()
+                self.thread_fallbacks += 1
+            return await loop.run_in_executor(self._thread_executor(), fn, html)
+        finally:
+            self.processing_seconds += time.perf_counter() - started
+
+    def shutdown(self) -> None:
+        """Stop the worker pools; they are recreated on next use."""
+        self._discard_process_pool()
+        pool, self._thread_pool = self._thread_pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "mode": self.mode,
+            "workers": self.workers,
+            "parser": HTML_PARSER,
+            "tasks": self.tasks,
+            "thread_fallbacks": self.thread_fallbacks,
+            "processing_seconds": round(self.processing_seconds, 3),
+        }
+
+    def _process_executor(self) -> Executor | None:
+        if self._process_pool is None:
+            try:
+                self._process_pool = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=_process_context(),
+                    initializer=_init_worker,
+                    initargs=(logging.getLogger().getEffectiveLevel(),),
+                )
+            except (OSError, NotImplementedError) as e:
+                logger.warning("Documentation process pool unavailable, using threads: %s", e)
+                self.mode = "thread"
+                return None
+        return self._process_pool
+
+    def _thread_executor(self) -> Executor:
+        if self._thread_pool is None:
+            self._thread_pool = ThreadPoolExecutor(
+                max_workers=self.workers, thread_name_prefix="docs-html"
+            )
+        return self._thread_pool
+
+    def _discard_process_pool(self) -> None:
+        pool, self._process_pool = self._process_pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _is_picklable(fn: Callable[[str], str]) -> bool:
+    try:
+        pickle.dumps(fn)
+    except Exception:
+        return False
+    return True
+
+
+# Shared by every documentation fetcher in the process
+html_pool = HtmlProcessingPool()
@@ -2,6 +2,7 @@
 HTML to LLM-optimized content processor for Splunk documentation.
 """
 
+import os
 import re
 from datetime import datetime
 from typing import TYPE_CHECKING, Any
@@ -18,6 +19,22 @@ except ImportError:
     # Define a placeholder for type checking
     BeautifulSoup = Any
 
+try:
+    import lxml  # noqa: F401
+
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
+
+# lxml builds the tree several times faster than the pure-Python parser; MCP_DOCS_HTML_PARSER
+# overrides the choice
+HTML_PARSER = os.getenv("MCP_DOCS_HTML_PARSER") or ("lxml" if HAS_LXML else "html.parser")
+
+
+def process_docs_html(html: str, url: str) -> str:
+    """Process a documentation page; module-level so it can run in a worker process."""
+    return SplunkDocsProcessor().process_html(html, url)
+
 
 class SplunkDocsProcessor:
     """Process Splunk HTML documentation into LLM-optimized format."""
@@ -35,7 +52,7 @@ class SplunkDocsProcessor:
             # Fallback to basic text extraction if BeautifulSoup not available
             return self._basic_text_extraction(html, url)
 
-        soup = BeautifulSoup(html, "html.parser")
+        soup = BeautifulSoup(html, HTML_PARSER)
 
         # Extract main content area using URL-specific logic
         content_area = self.extract_main_content(soup, url)
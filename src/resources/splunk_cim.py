@@ -6,6 +6,7 @@ Provides access to CIM data model documentation for data normalization and onboa
 
 import logging
 from datetime import datetime
+from functools import partial
 
 from fastmcp import Context
 
@@ -19,7 +20,7 @@ except ImportError:
 from src.core.base import BaseResource, ResourceMetadata
 from src.core.registry import resource_registry
 
-from .processors.html_processor import SplunkDocsProcessor
+from .processors.html_processor import SplunkDocsProcessor, process_docs_html
 from .splunk_docs import _doc_cache
 
 logger = logging.getLogger(__name__)
@@ -299,16 +300,15 @@ pip install httpx
                 "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
             }
 
-            async with httpx.AsyncClient(
-                timeout=30.0, headers=headers, follow_redirects=True
-            ) as client:
-                logger.debug("Fetching CIM documentation from: %s", url)
-                response = await client.get(url)
-                response.raise_for_status()
-
-                content = self.processor.process_html(response.text, url)
-                logger.debug("Successfully processed CIM documentation from %s", url)
-                return content
+            content = await _doc_cache.fetch_url(
+                url,
+                partial(process_docs_html, url=url),
+                version=getattr(self, "version", ""),
+                category="cim",
+                headers=headers,
+            )
+            logger.debug("Successfully processed CIM documentation from %s", url)
+            return content
 
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 404:
@@ -2,6 +2,10 @@
 Splunk Configuration Resource Implementation.
 
 Provides access to Splunk configuration files through the MCP resource system.
+
+Rendered content is cached per client identity for each class's ``CACHE_TTL_SECONDS``
+(see ``src.core.resource_cache``), so clients polling these resources do not re-read Splunk on
+every read.
 """
 
 import json
@@ -13,11 +17,34 @@ from fastmcp.server.context import Context
 from ..core.base import BaseResource, ResourceMetadata
 from ..core.client_identity import get_client_manager
 from ..core.enhanced_config_extractor import EnhancedConfigExtractor
+from ..core.resource_cache import resource_cache_key, splunk_resource_cache
 from ..core.utils import filter_customer_indexes
 
 logger = logging.getLogger(__name__)
 
 
+async def _cached_json(resource, ctx: Context, client_config: dict[str, Any], collect) -> str:
+    """
+    Render ``collect(service, identity)`` as JSON through the per-identity resource cache.
+
+    Reports with ``"status": "error"`` are returned but not cached.
+    """
+
+    async def connect():
+        return await resource.client_manager.get_client_connection(ctx, client_config)
+
+    async def render(identity, service):
+        data = await collect(service, identity)
+        return json.dumps(data, indent=2), data.get("status") != "error"
+
+    return await splunk_resource_cache.get(
+        resource_cache_key(resource.uri, client_config),
+        resource.CACHE_TTL_SECONDS,
+        connect,
+        render,
+    )
+
+
 class SplunkConfigResource(BaseResource):
     """
     Template resource for accessing Splunk configuration files.
@@ -36,6 +63,8 @@ class SplunkConfigResource(BaseResource):
         tags=["config", "splunk", "client-scoped", "template"],
     )
 
+    CACHE_TTL_SECONDS = 300.0
+
     def __init__(self, uri: str, name: str, description: str, mime_type: str = "text/plain"):
         super().__init__(uri, name, description, mime_type)
         self.client_manager = get_client_manager()
@@ -66,9 +95,6 @@ class SplunkConfigResource(BaseResource):
                 # This should rarely happen now due to fallback, but handle gracefully
                 return self._create_error_response("No Splunk configuration available", request_uri)
 
-            # Get client identity and connection
-            identity, service = await self.client_manager.get_client_connection(ctx, client_config)
-
             # Extract config file from URI
             config_file = self._extract_config_file_from_uri(request_uri)
             if not config_file:
@@ -82,13 +108,24 @@ class SplunkConfigResource(BaseResource):
                     f"Invalid or unsupported config file: {config_file}", request_uri
                 )
 
-            # Get configuration content from Splunk
-            config_content = await self._get_config_content(
-                service, config_file, identity, request_uri
-            )
+            async def connect():
+                return await self.client_manager.get_client_connection(ctx, client_config)
 
-            self.logger.info(f"Retrieved config {config_file} for client {identity.client_id}")
-            return config_content
+            async def render(identity, service):
+                # Get configuration content from Splunk
+                config_content = await self._get_config_content(
+                    service, config_file, identity, request_uri
+                )
+                self.logger.info(f"Retrieved config {config_file} for client {identity.client_id}")
+                # The JSON fallback reports an error and is not cached
+                return config_content, config_content.startswith("# Configuration:")
+
+            return await splunk_resource_cache.get(
+                resource_cache_key(request_uri, client_config),
+                self.CACHE_TTL_SECONDS,
+                connect,
+                render,
+            )
 
         except ConnectionError as e:
             self.logger.warning(f"Splunk connection error for {request_uri}: {e}")
@@ -233,6 +270,8 @@ class SplunkHealthResource(BaseResource):
         tags=["health", "monitoring", "splunk"],
     )
 
+    CACHE_TTL_SECONDS = 15.0
+
     def __init__(self, uri: str, name: str, description: str, mime_type: str = "application/json"):
         super().__init__(uri, name, description, mime_type)
         self.client_manager = get_client_manager()
@@ -247,13 +286,7 @@ class SplunkHealthResource(BaseResource):
                 # Fallback to error response with helpful info
                 return self._create_health_error_response("No Splunk configuration available")
 
-            # Get client identity and connection
-            identity, service = await self.client_manager.get_client_connection(ctx, client_config)
-
-            # Get health information
-            health_data = await self._get_health_data(service, identity)
-
-            return json.dumps(health_data, indent=2)
+            return await _cached_json(self, ctx, client_config, self._get_health_data)
 
         except ConnectionError as e:
             self.logger.warning(f"Splunk connection error for health check: {e}")
@@ -354,6 +387,8 @@ class SplunkAppsResource(BaseResource):
         tags=["apps", "applications", "splunk", "capabilities"],
     )
 
+    CACHE_TTL_SECONDS = 300.0
+
     def __init__(self, uri: str, name: str, description: str, mime_type: str = "application/json"):
         super().__init__(uri, name, description, mime_type)
         self.client_manager = get_client_manager()
@@ -368,13 +403,7 @@ class SplunkAppsResource(BaseResource):
                 # Fallback to error response with helpful info
                 return self._create_apps_error_response("No Splunk configuration available")
 
-            # Get client identity and connection
-            identity, service = await self.client_manager.get_client_connection(ctx, client_config)
-
-            # Get comprehensive apps information
-            apps_data = await self._get_comprehensive_apps_data(service, identity)
-
-            return json.dumps(apps_data, indent=2)
+            return await _cached_json(self, ctx, client_config, self._get_comprehensive_apps_data)
 
         except ConnectionError as e:
             self.logger.warning(f"Splunk connection error for apps: {e}")
@@ -728,6 +757,8 @@ class SplunkSearchResultsResource(BaseResource):
         tags=["search", "results", "client-scoped"],
     )
 
+    CACHE_TTL_SECONDS = 30.0
+
     def __init__(self, uri: str, name: str, description: str, mime_type: str = "application/json"):
         super().__init__(uri, name, description, mime_type)
         self.client_manager = get_client_manager()
@@ -742,12 +773,7 @@ class SplunkSearchResultsResource(BaseResource):
                 # Fallback to error response with helpful info
                 return self._create_search_error_response("No Splunk configuration available")
 
-            # Get client identity and connection
-            identity, service = await self.client_manager.get_client_connection(ctx, client_config)
-            # Get search results
-            search_data = await self._get_search_results(service, identity)
-
-            return json.dumps(search_data, indent=2)
+            return await _cached_json(self, ctx, client_config, self._get_search_results)
 
         except ConnectionError as e:
             self.logger.warning(f"Splunk connection error for search results: {e}")
@@ -963,6 +989,8 @@ class SplunkIndexesResource(BaseResource):
         tags=["indexes", "metadata", "client-scoped"],
     )
 
+    CACHE_TTL_SECONDS = 300.0
+
     def __init__(self, uri: str, name: str, description: str, mime_type: str = "application/json"):
         super().__init__(uri, name, description, mime_type)
         self.client_manager = get_client_manager()
@@ -977,13 +1005,7 @@ class SplunkIndexesResource(BaseResource):
                 # Fallback to error response with helpful info
                 return self._create_indexes_error_response("No Splunk configuration available")
 
-            # Get client identity and connection
-            identity, service = await self.client_manager.get_client_connection(ctx, client_config)
-
-            # Get indexes information
-            indexes_data = await self._get_indexes_data(service, identity)
-
-            return json.dumps(indexes_data, indent=2)
+            return await _cached_json(self, ctx, client_config, self._get_indexes_data)
 
         except ConnectionError as e:
             self.logger.warning(f"Splunk connection error for indexes: {e}")
@@ -1092,6 +1114,8 @@ class SplunkSavedSearchesResource(BaseResource):
         tags=["saved_searches", "search", "client-scoped"],
     )
 
+    CACHE_TTL_SECONDS = 120.0
+
     def __init__(self, uri: str, name: str, description: str, mime_type: str = "application/json"):
         super().__init__(uri, name, description, mime_type)
         self.client_manager = get_client_manager()
@@ -1108,13 +1132,7 @@ class SplunkSavedSearchesResource(BaseResource):
                     "No Splunk configuration available"
                 )
 
-            # Get client identity and connection
-            identity, service = await self.client_manager.get_client_connection(ctx, client_config)
-
-            # Get saved searches information
-            saved_searches_data = await self._get_saved_searches_data(service, identity)
-
-            return json.dumps(saved_searches_data, indent=2)
+            return await _cached_json(self, ctx, client_config, self._get_saved_searches_data)
 
         except ConnectionError as e:
             self.logger.warning(f"Splunk connection error for saved searches: {e}")
@@ -5,8 +5,8 @@ Provides version-aware access to Splunk documentation, optimized for LLM consump
 """
 
 import logging
-from datetime import datetime, timedelta
-from typing import Any
+from datetime import datetime
+from functools import partial
 
 from fastmcp import Context
 
@@ -19,54 +19,16 @@ except ImportError:
 
 from src.core.base import BaseResource, ResourceMetadata
 from src.core.registry import resource_registry
+from src.core.server_info import get_splunk_version
 
-from .processors.html_processor import SplunkDocsProcessor
+from .docs_cache import DocumentationCache, doc_cache  # noqa: F401
+from .processors.html_processor import SplunkDocsProcessor, process_docs_html
 
 logger = logging.getLogger(__name__)
 
 
-class DocumentationCache:
-    """Version-aware caching for Splunk documentation."""
-
-    def __init__(self, ttl_hours: int = 24):
-        self.cache: dict[str, dict[str, Any]] = {}
-        self.ttl_hours = ttl_hours
-
-    def cache_key(self, version: str, category: str, topic: str) -> str:
-        """Generate cache key for documentation."""
-        return f"docs_{version}_{category}_{topic}"
-
-    def is_expired(self, timestamp: datetime) -> bool:
-        """Check if cached item is expired."""
-        return datetime.now() - timestamp > timedelta(hours=self.ttl_hours)
-
-    async def get_or_fetch(self, version: str, category: str, topic: str, fetch_func) -> str:
-        """Get from cache or fetch if expired/missing."""
-        key = self.cache_key(version, category, topic)
-
-        if key in self.cache:
-            cached_item = self.cache[key]
-            if not self.is_expired(cached_item["timestamp"]):
-                logger.debug(f"Cache hit for {key}")
-                return cached_item["content"]
-
-        # Fetch fresh content
-        logger.debug(f"Cache miss for {key}, fetching")
-        content = await fetch_func()
-        self.cache[key] = {"content": content, "timestamp": datetime.now(), "version": version}
-
-        return content
-
-    def invalidate_version(self, version: str):
-        """Invalidate all cached docs for a specific version."""
-        keys_to_remove = [k for k in self.cache.keys() if k.startswith(f"docs_{version}_")]
-        for key in keys_to_remove:
-            del self.cache[key]
-        logger.info(f"Invalidated {len(keys_to_remove)} cache entries for version {version}")
-
-
 # Global documentation cache
-_doc_cache = DocumentationCache()
+_doc_cache = doc_cache
 
 
 class SplunkDocsResource(BaseResource):
@@ -88,22 +50,8 @@ class SplunkDocsResource(BaseResource):
         self.processor = SplunkDocsProcessor()
 
     async def get_splunk_version(self, ctx: Context) -> str:
-        """Detect Splunk version from connected instance."""
-        try:
-            # Import here to avoid circular imports
-            from src.tools.health.status import GetSplunkHealth
-
-            health_tool = GetSplunkHealth("get_splunk_health", "Get Splunk health status")
-            health_result = await health_tool.execute(ctx)
-
-            if health_result.get("status") == "connected":
-                version = health_result.get("version", "latest")
-                logger.debug(f"Detected Splunk version: {version}")
-                return version
-        except Exception as e:
-            logger.warning(f"Failed to detect Splunk version: {e}")
-
-        return "latest"
+        """Version of the connected Splunk instance, from the per-connection server-info cache."""
+        return await get_splunk_version(ctx)
 
     def normalize_version(self, version: str) -> str:
         """Convert version to docs URL format."""
@@ -152,17 +100,15 @@ pip install httpx
                 "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
             }
 
-            async with httpx.AsyncClient(
-                timeout=30.0, headers=headers, follow_redirects=True
-            ) as client:
-                logger.debug(f"Fetching documentation from: {url}")
-                response = await client.get(url)
-                response.raise_for_status()
-
-                # Process HTML to LLM-friendly format
-                content = self.processor.process_html(response.text, url)
-                logger.debug(f"Successfully processed documentation from {url}")
-                return content
+            content = await _doc_cache.fetch_url(
+                url,
+                partial(process_docs_html, url=url),
+                version=getattr(self, "version", None) or "",
+                category="docs",
+                headers=headers,
+            )
+            logger.debug(f"Successfully processed documentation from {url}")
+            return content
 
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 404:
@@ -562,10 +508,10 @@ class SplunkSpecReferenceResource(SplunkDocsResource):
         tags=["spec", "configuration", "reference", "admin"],
     )
 
-    def __init__(self, config: str):
+    def __init__(self, config: str, version: str | None = None):
         self.config = config
-        # Version will be detected dynamically in get_content()
-        self._cached_version = None
+        # Detected from the connected instance in get_content() unless given
+        self.version = version
 
         uri = f"splunk-spec://{config}"
         # Normalize config name for display
@@ -629,7 +575,7 @@ class SplunkSpecReferenceResource(SplunkDocsResource):
         """Get configuration specification documentation for specific file."""
 
         # Detect version once before caching
-        version = await self.get_splunk_version(ctx)
+        version = self.version or await self.get_splunk_version(ctx)
         logger.info(f"Auto-detected Splunk version: {version}")
 
         async def fetch_spec_docs():
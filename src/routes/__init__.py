@@ -5,5 +5,6 @@ This package contains route handlers for different server endpoints.
 """
 
 from .health import setup_health_routes
+from .resources import setup_resource_routes
 
-__all__ = ["setup_health_routes"]
+__all__ = ["setup_health_routes", "setup_resource_routes"]
@@ -1,7 +1,7 @@
 """
 Health dashboard routes for MCP Server for Splunk
 
-This module provides health check endpoints for monitoring server status,
+This module provides health check endpoints for monitoring server status, cache statistics,
 component loading, and Splunk connectivity.
 """
 
@@ -17,6 +17,8 @@ from fastmcp import FastMCP
 from starlette.requests import Request
 from starlette.responses import HTMLResponse, JSONResponse
 
+from src.core.workers import worker_info
+
 from .templates import load_css, load_template, render_template
 
 logger = logging.getLogger(__name__)
@@ -183,7 +185,12 @@ def setup_health_routes(mcp: FastMCP):
 
     @mcp.custom_route("/health", methods=["GET"])
     async def health_api(request: Request) -> JSONResponse:
-        """API endpoint for health checks with real data"""
+        """
+        API endpoint for health checks with real data.
+
+        With MCP_WORKERS > 1 the answer covers only the worker that accepted the connection,
+        identified by ``worker`` (index and pid).
+        """
         try:
             # Get real version from pyproject.toml
             version = get_version()
@@ -251,6 +258,7 @@ def setup_health_routes(mcp: FastMCP):
                     "server": server_info_data,
                     "splunk_connection": splunk_status,
                     "splunk_info": splunk_info,
+                    "worker": worker_info(),
                     "timestamp": time.time(),
                 }
             )
@@ -259,3 +267,31 @@ def setup_health_routes(mcp: FastMCP):
             return JSONResponse(
                 {"status": "error", "error": str(e), "timestamp": time.time()}, status_code=500
             )
+
+    @mcp.custom_route("/health/cache", methods=["GET"])
+    async def cache_stats_api(request: Request) -> JSONResponse:
+        """
+        Documentation cache statistics and connection reuse of the shared HTTP client.
+
+        Caches and counters are per process: with MCP_WORKERS > 1 each response reports only
+        the worker named in ``worker`` (index and pid), not totals across workers.
+        """
+        from src.core.conditional import conditional_reads
+        from src.core.http_client import shared_http_client
+        from src.core.resource_cache import splunk_resource_cache
+        from src.core.server_info import server_info_cache
+        from src.resources.docs_cache import doc_cache
+        from src.resources.docs_warmer import docs_warmer
+
+        return JSONResponse(
+            {
+                "docs": doc_cache.stats(),
+                "conditional_reads": conditional_reads.stats(),
+                "http": shared_http_client.stats(),
+                "server_info": server_info_cache.stats(),
+                "splunk_resources": splunk_resource_cache.stats(),
+                "warmer": docs_warmer.stats(),
+                "worker": worker_info(),
+                "timestamp": time.time(),
+            }
+        )
@@ -0,0 +1,77 @@
+"""
+Documentation resource routes for MCP Server for Splunk
+
+Serves documentation resources over plain HTTP for clients and tools that poll them outside
+an MCP session, with ``ETag``/``If-None-Match`` support so unchanged content costs a 304.
+Only documentation schemes are served; Splunk data resources stay behind the MCP endpoint.
+
+The ``ETag`` header is specific to this route: MCP ``resources/read`` results carry no
+metadata for it, so MCP clients derive it from the content they hold (see
+``src.core.conditional``).
+"""
+
+import logging
+
+from fastmcp import Context, FastMCP
+from fastmcp.exceptions import NotFoundError
+from fastmcp.resources import Resource
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+
+from src.core.conditional import conditional_response
+
+logger = logging.getLogger(__name__)
+
+DOCUMENTATION_SCHEMES = ("splunk-docs", "splunk-spec", "splunk-cim", "dashboard-studio")
+
+
+async def read_documentation_resource(mcp: FastMCP, uri: str) -> tuple[str | bytes, str]:
+    """
+    Resolve uri against the server's resources and templates and read it.
+
+    Uses FastMCP's public resource API only. MCP middleware does not run for these reads.
+
+    Returns:
+        (content, mime type)
+
+    Raises:
+        NotFoundError: no enabled resource or template matches uri
+    """
+    async with Context(fastmcp=mcp):
+        resource: Resource | None = (await mcp.get_resources()).get(uri)
+        if resource is None:
+            for template in (await mcp.get_resource_templates()).values():
+                params = template.matches(uri)
+                if params is not None and template.enabled:
+                    resource = await template.create_resource(uri, params)
+                    break
+        if resource is None or not resource.enabled:
+            raise NotFoundError(f"Unknown resource: {uri}")
+        return await resource.read(), resource.mime_type or "text/plain"
+
+
+def setup_resource_routes(mcp: FastMCP):
+    """Setup documentation resource routes for the MCP server"""
+
+    @mcp.custom_route("/resources/read", methods=["GET"])
+    async def read_resource(request: Request) -> Response:
+        """Read a documentation resource, e.g. /resources/read?uri=splunk-docs://cheat-sheet"""
+        uri = request.query_params.get("uri", "")
+        scheme = uri.partition("://")[0]
+        if scheme not in DOCUMENTATION_SCHEMES:
+            return JSONResponse(
+                {
+                    "error": "uri must be a documentation resource",
+                    "schemes": list(DOCUMENTATION_SCHEMES),
+                },
+                status_code=400,
+            )
+        try:
+            content, mime_type = await read_documentation_resource(mcp, uri)
+        except NotFoundError:
+            return JSONResponse({"error": f"Unknown resource: {uri}"}, status_code=404)
+        except Exception as e:
+            logger.error(f"Error reading resource {uri} over HTTP: {e}")
+            return JSONResponse({"error": str(e)}, status_code=500)
+
+        return conditional_response(request, content, mime_type)
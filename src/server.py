@@ -15,24 +15,30 @@ import sys
 import time
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
-from contextvars import ContextVar
 from importlib.metadata import entry_points
 
 from fastmcp import Context, FastMCP
-from fastmcp.server.dependencies import get_context, get_http_headers, get_http_request
+from fastmcp.server.dependencies import get_http_headers, get_http_request
 from fastmcp.server.middleware import Middleware, MiddlewareContext
 from starlette.applications import Starlette
-from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
 from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from src.core.base import SplunkContext
+from src.core.conditional import conditional_reads
+from src.core.http_client import shared_http_client
 from src.core.loader import ComponentLoader
+from src.core.logging_config import configure_logging, current_session_id
 
 # Initialize Sentry monitoring (must be early in startup)
 from src.core.sentry import init_sentry
-from src.core.shared_context import http_headers_context
-from src.routes import setup_health_routes
+from src.core.session_store import SessionStore, create_session_store, run_sweeper
+from src.core.shared_context import http_headers_context, scope_headers
+from src.core.workers import WorkerSupervisor, worker_count_from_env
+from src.resources.docs_warmer import docs_warmer
+from src.resources.processors.executor import html_pool
+from src.routes import setup_health_routes, setup_resource_routes
 
 _sentry_enabled = init_sentry()
 if _sentry_enabled:
@@ -52,14 +58,9 @@ os.makedirs(log_dir, exist_ok=True)
 LOG_LEVEL_NAME = os.getenv("MCP_LOG_LEVEL", "INFO").upper()
 LOG_LEVEL = getattr(logging, LOG_LEVEL_NAME, logging.INFO)
 
-logging.basicConfig(
-    level=LOG_LEVEL,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[
-        logging.FileHandler(os.path.join(log_dir, "mcp_splunk_server.log")),
-        logging.StreamHandler(),
-    ],
-)
+# Records are written by a background thread; see src/core/logging_config.py for
+# MCP_LOG_FORMAT (text/json) and MCP_LOG_SAMPLING
+configure_logging(LOG_LEVEL, os.path.join(log_dir, "mcp_splunk_server.log"))
 
 # Map Python logging level to uvicorn's expected string level
 _UVICORN_LEVEL_MAP = {
@@ -87,40 +88,9 @@ except Exception:
     pass
 
 # Global cache to persist client config per session across Streamable HTTP requests
-# Keyed by a caller-provided "X-Session-ID" header value
-HEADER_CLIENT_CONFIG_CACHE: dict[str, dict] = {}
-
-# Session correlation for logs
-current_session_id: ContextVar[str] = ContextVar("current_session_id", default="-")
-
-# Ensure every LogRecord has a 'session' attribute to avoid formatting errors
-_old_record_factory = logging.getLogRecordFactory()
-
-
-def _record_factory(*args, **kwargs):
-    record = _old_record_factory(*args, **kwargs)
-    if not hasattr(record, "session"):
-        # Prefer session id from MCP ctx state if available
-        try:
-            ctx = get_context()
-            try:
-                sess = ctx.get_state("session_id")  # type: ignore[attr-defined]
-            except Exception:
-                sess = None
-            if isinstance(sess, str) and sess:
-                record.session = sess
-            else:
-                record.session = current_session_id.get()
-        except Exception:
-            # Fallback to ContextVar or '-'
-            try:
-                record.session = current_session_id.get()
-            except Exception:
-                record.session = "-"
-    return record
-
-
-logging.setLogRecordFactory(_record_factory)
+# Keyed by a caller-provided "X-Session-ID" header value; shared between replicas when
+# MCP_SESSION_STORE selects a sqlite or redis backend
+HEADER_CLIENT_CONFIG_CACHE: SessionStore = create_session_store()
 
 
 # ------------------------------
@@ -200,104 +170,56 @@ def load_plugins(mcp: FastMCP, root_app: Starlette | None = None) -> int:
     return loaded
 
 
-def _cache_summary(include_values: bool = True) -> dict:
-    """Return a sanitized summary of the header client-config cache.
-
-    When include_values=True, includes key/value pairs with sensitive values masked.
-    Sensitive keys: '*password*', 'authorization', 'token'.
-    """
-    try:
-        summary: dict[str, dict | list[str]] = {}
-        for session_key, cfg in HEADER_CLIENT_CONFIG_CACHE.items():
-            if not include_values:
-                summary[session_key] = list(cfg.keys())
-                continue
-
-            sanitized: dict[str, object] = {}
-            for k, v in cfg.items():
-                k_lower = k.lower()
-                if any(s in k_lower for s in ["password", "authorization", "token"]):
-                    sanitized[k] = "***"
-                else:
-                    sanitized[k] = v
-            summary[session_key] = sanitized
-        return summary
-    except Exception:
-        return {"error": "unavailable"}
-
-
 # ASGI Middleware to capture HTTP headers
-class HeaderCaptureMiddleware(BaseHTTPMiddleware):
+class HeaderCaptureMiddleware:
     """
-    ASGI middleware that captures HTTP headers and stores them in a context variable
-    so they can be accessed by MCP middleware downstream.
-    """
-
-    async def dispatch(self, request: Request, call_next):
-        """Capture headers and store in context variable before processing request."""
-        token = None
-        try:
-            # Convert headers to dict (case-insensitive)
-            headers = dict(request.headers)
-            logger.debug(f"Captured headers: {list(headers.keys())}")
+    ASGI middleware that captures the Splunk and session headers of each HTTP request and
+    stores them in a context variable so they can be accessed by MCP middleware downstream.
 
-            # Set session correlation id as early as possible for all downstream logs
-            session_key = _extract_session_id_from_headers(headers) or "-"
-            token = current_session_id.set(session_key)
+    Only ``X-Splunk-*``, ``MCP-Session-ID`` and ``X-Session-ID`` are read from the scope (keyed
+    by lowercase name). The middleware wraps the app directly rather than through
+    ``BaseHTTPMiddleware``, so responses, including Streamable HTTP/SSE streams, pass through
+    without an extra task or memory stream per request.
+    """
 
-            logger.info("HeaderCaptureMiddleware: Processing request to %s", request.url.path)
+    def __init__(self, app: ASGIApp):
+        self.app = app
 
-            # Store headers in context variable
-            http_headers_context.set(headers)
-            logger.debug(f"Captured headers: {list(headers.keys())}")
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-            # Log header extraction for debugging
-            splunk_headers = {k: v for k, v in headers.items() if k.lower().startswith("x-splunk-")}
-            if splunk_headers:
-                logger.debug("Captured Splunk headers: %s", list(splunk_headers.keys()))
-            else:
-                logger.debug("No Splunk headers found. Available headers: %s", list(headers.keys()))
+        headers = scope_headers(scope)
+        session_key = _extract_session_id_from_headers(headers)
+        # Set session correlation id as early as possible for all downstream logs
+        session_token = current_session_id.set(session_key or "-")
+        headers_token = http_headers_context.set(headers)
+        logger.debug("Captured headers: %s", list(headers))
 
-            # Extract and attach client config to the Starlette request state for tools to use
-            try:
-                client_config = extract_client_config_from_headers(headers)
-                if client_config:
-                    # Attach to request.state so BaseTool can retrieve it
-                    request.state.client_config = client_config
+        # Extract and attach client config to the request state for tools to use
+        try:
+            client_config = extract_client_config_from_headers(headers)
+            if client_config:
+                # request.state is backed by scope["state"]; BaseTool reads it from there
+                scope.setdefault("state", {})["client_config"] = client_config
+                # Persist per-session for subsequent Streamable HTTP requests
+                if session_key and await HEADER_CLIENT_CONFIG_CACHE.write(
+                    session_key, client_config
+                ):
                     logger.debug(
-                        "HeaderCaptureMiddleware: attached client_config to request.state (keys=%s)",
-                        list(client_config.keys()),
+                        "HeaderCaptureMiddleware: cached client_config for session %s (keys=%s)",
+                        session_key,
+                        list(client_config),
                     )
-
-                    # Persist per-session for subsequent Streamable HTTP requests
-                    session_key = _extract_session_id_from_headers(headers)
-                    # Always cache under provided session id if available
-                    if session_key:
-                        HEADER_CLIENT_CONFIG_CACHE[session_key] = client_config
-                        logger.debug(
-                            "HeaderCaptureMiddleware: cached client_config for session %s (keys=%s)",
-                            session_key,
-                            list(client_config.keys()),
-                        )
-            except Exception as e:
-                logger.warning(f"Failed to attach client_config to request.state: {e}")
-
         except Exception as e:
-            logger.error(f"Error capturing HTTP headers: {e}")
-            # Set empty dict as fallback
-            http_headers_context.set({})
+            logger.warning("Failed to attach client_config to request.state: %s", e)
 
-        # Continue processing the request
         try:
-            response = await call_next(request)
-            return response
+            await self.app(scope, receive, send)
         finally:
-            # Reset session correlation id for this request
-            if token is not None:
-                try:
-                    current_session_id.reset(token)
-                except Exception:
-                    pass
+            http_headers_context.reset(headers_token)
+            current_session_id.reset(session_token)
 
 
 def extract_client_config_from_headers(headers: dict) -> dict | None:
@@ -599,8 +521,9 @@ JSON_RESPONSE = os.getenv("MCP_JSON_RESPONSE", "false").strip().lower() == "true
 
 mcp = FastMCP(name="MCP Server for Splunk", auth=auth_verifier, stateless_http=STATELESS_HTTP)
 
-# Import and setup health routes
+# Import and setup health and documentation resource routes
 setup_health_routes(mcp)
+setup_resource_routes(mcp)
 
 # NOTE: Plugins are loaded once after the Starlette app is created so plugins can
 # register both MCP-level and HTTP-level integrations in a single call.
@@ -667,7 +590,8 @@ class ClientConfigMiddleware(Middleware):
 
     def __init__(self):
         super().__init__()
-        self.client_config_cache = {}
+        # Same store as HeaderCaptureMiddleware so any replica can resume a session
+        self.client_config_cache = HEADER_CLIENT_CONFIG_CACHE
         logger.info("ClientConfigMiddleware initialized")
 
     async def on_request(self, context: MiddlewareContext, call_next):
@@ -675,7 +599,7 @@ class ClientConfigMiddleware(Middleware):
 
         # Log context information for debugging
         session_id_val = getattr(context, "session_id", None)
-        logger.info(
+        logger.debug(
             "ClientConfigMiddleware: processing %s (session_id=%s)", context.method, session_id_val
         )
 
@@ -705,7 +629,7 @@ class ClientConfigMiddleware(Middleware):
             )
 
             if headers:
-                logger.info(
+                logger.debug(
                     "ClientConfigMiddleware: found HTTP headers (keys=%s)",
                     list(headers.keys()),
                 )
@@ -714,7 +638,7 @@ class ClientConfigMiddleware(Middleware):
                 client_config = extract_client_config_from_headers(headers)
 
                 if client_config:
-                    logger.info(
+                    logger.debug(
                         "ClientConfigMiddleware: extracted client_config from headers (keys=%s, session_key=%s)",
                         list(client_config.keys()),
                         session_key,
@@ -722,7 +646,7 @@ class ClientConfigMiddleware(Middleware):
 
                     # Cache the config for this session (avoid cross-session leakage)
                     if session_key:
-                        self.client_config_cache[session_key] = client_config
+                        await self.client_config_cache.write(session_key, client_config)
                 else:
                     logger.debug("No Splunk headers found in HTTP request")
             else:
@@ -730,11 +654,9 @@ class ClientConfigMiddleware(Middleware):
 
             # If we didn't extract config from headers, check per-session cache only (no global fallback)
             if not client_config and session_key:
-                client_config = self.client_config_cache.get(
-                    session_key
-                ) or HEADER_CLIENT_CONFIG_CACHE.get(session_key)
+                client_config = await self.client_config_cache.read(session_key)
                 if client_config:
-                    logger.info(
+                    logger.debug(
                         "ClientConfigMiddleware: using cached client_config for session %s",
                         session_key,
                     )
@@ -750,14 +672,10 @@ class ClientConfigMiddleware(Middleware):
                     context.fastmcp_context.set_state("client_config", client_config)
                     if effective_session:
                         context.fastmcp_context.set_state("session_id", effective_session)
-                    logger.info(
-                        "ClientConfigMiddleware: wrote client_config to context state (keys=%s, session=%s, config=%s)",
+                    logger.debug(
+                        "ClientConfigMiddleware: wrote client_config to context state (keys=%s, session=%s)",
                         list(client_config.keys()),
                         effective_session,
-                        {
-                            k: v if k not in ["splunk_password"] else "***"
-                            for k, v in client_config.items()
-                        },
                     )
                 elif client_config:
                     logger.warning(
@@ -786,18 +704,11 @@ class ClientConfigMiddleware(Middleware):
                     session_key = getattr(
                         context, "session_id", None
                     ) or _extract_session_id_from_headers(headers)
-                    if session_key and session_key in self.client_config_cache:
-                        self.client_config_cache.pop(session_key, None)
+                    if session_key and await self.client_config_cache.delete(session_key):
                         logger.info(
                             "ClientConfigMiddleware: cleared cached client_config for session %s",
                             session_key,
                         )
-                    if session_key and session_key in HEADER_CLIENT_CONFIG_CACHE:
-                        HEADER_CLIENT_CONFIG_CACHE.pop(session_key, None)
-                        logger.info(
-                            "ClientConfigMiddleware: cleared global cached client_config for session %s",
-                            session_key,
-                        )
         except Exception:
             pass
 
@@ -815,6 +726,7 @@ class ClientConfigMiddleware(Middleware):
 
 # Add the middleware to the server
 mcp.add_middleware(ClientConfigMiddleware())
+mcp.add_middleware(conditional_reads)
 
 # Add Sentry MCP middleware if enabled
 if _sentry_enabled:
@@ -1165,6 +1077,9 @@ def create_root_app(server: FastMCP) -> Starlette:
     """Create the Starlette root app hosting the MCP HTTP app and middleware.
 
     - Builds the MCP app with path "/mcp"
+    - Opens the shared documentation HTTP client for the lifetime of the app and stops the
+      documentation processing workers on shutdown
+    - Deletes expired entries of the session store in the background while it runs
     - Applies `HeaderCaptureMiddleware` at the root level
     - Loads plugins once with both `mcp` and `root_app` available
     - Mounts the MCP app at "/"
@@ -1178,8 +1093,25 @@ def create_root_app(server: FastMCP) -> Starlette:
         json_response=JSON_RESPONSE,
     )
 
+    @asynccontextmanager
+    async def root_lifespan(app: Starlette) -> AsyncIterator[None]:
+        # Pooled client for documentation fetches lives as long as the HTTP server
+        await shared_http_client.start()
+        # Expired sessions are deleted in the background rather than on each write
+        sweeper = asyncio.create_task(run_sweeper(HEADER_CLIENT_CONFIG_CACHE))
+        try:
+            async with mcp_app.lifespan(app):
+                # Pre-warm popular documentation once the server is ready (MCP_DOCS_WARMER)
+                docs_warmer.start()
+                yield
+        finally:
+            sweeper.cancel()
+            await docs_warmer.stop()
+            await shared_http_client.aclose()
+            html_pool.shutdown()
+
     # Parent Starlette application that applies middleware to the initial HTTP handshake
-    root_app = Starlette(lifespan=mcp_app.lifespan)
+    root_app = Starlette(lifespan=root_lifespan)
     root_app.add_middleware(HeaderCaptureMiddleware)
 
     # Add Sentry HTTP middleware if enabled (must be added after HeaderCaptureMiddleware)
@@ -1237,6 +1169,45 @@ async def main(host: str | None = None, port: int | None = None):
         raise
 
 
+def run_workers(host: str | None = None, port: int | None = None, workers: int = 2) -> None:
+    """Run the HTTP transport in pre-forked worker processes sharing one listening socket.
+
+    Components are loaded and the root app is built once, before forking, so workers share them
+    copy-on-write. Falls back to a single process where ``os.fork`` is unavailable.
+    """
+    port = port or int(os.environ.get("MCP_SERVER_PORT", 8001))
+    host = host or os.environ.get("MCP_SERVER_HOST", "0.0.0.0")
+    if not hasattr(os, "fork"):
+        logger.warning("Worker processes need os.fork; serving from a single process")
+        asyncio.run(main(host=host, port=port))
+        return
+
+    import uvicorn
+
+    logger.info(f"Starting modular MCP server on {host}:{port} with {workers} workers")
+    if HEADER_CLIENT_CONFIG_CACHE.backend == "memory":
+        logger.warning(
+            "MCP_SESSION_STORE=memory keeps session client config per worker; "
+            "use a sqlite or redis store so every worker sees it"
+        )
+    if not STATELESS_HTTP:
+        logger.warning(
+            "Streamable HTTP sessions are bound to the worker that created them; "
+            "set MCP_STATELESS_HTTP=true when running several workers"
+        )
+
+    asyncio.run(ensure_components_loaded(mcp))
+    root_app = create_root_app(mcp)
+    config = uvicorn.Config(
+        root_app,
+        host=host,
+        port=port,
+        log_level=UVICORN_LOG_LEVEL,
+        ws="wsproto",
+    )
+    WorkerSupervisor(config, workers).run()
+
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Modular MCP Server for Splunk")
     parser.add_argument(
@@ -1254,6 +1225,12 @@ if __name__ == "__main__":
         default=8001,
         help="Port to bind the HTTP server (only for http transport, default 8001 to avoid conflict with Splunk)",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=worker_count_from_env(),
+        help="Worker processes for the HTTP transport (default: MCP_WORKERS or 1)",
+    )
 
     args = parser.parse_args()
 
@@ -1272,7 +1249,10 @@ if __name__ == "__main__":
             # mcp.run(transport="http", host=args.host, port=args.port, path="/mcp/")
 
             # Option 2: Use custom uvicorn setup for advanced middleware (current approach)
-            asyncio.run(main(host=args.host, port=args.port))
+            if args.workers > 1:
+                run_workers(host=args.host, port=args.port, workers=args.workers)
+            else:
+                asyncio.run(main(host=args.host, port=args.port))
     except KeyboardInterrupt:
         logger.info("Server stopped by user")
     except Exception as e:
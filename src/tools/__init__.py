@@ -44,10 +44,12 @@ __all__ = [
     # KV Store tools
     "ListKvstoreCollections",
     "GetKvstoreData",
+    "PutKvstoreDocuments",
     "CreateKvstoreCollection",
     # Lookup tools
     "ListLookupFiles",
     "ListLookupDefinitions",
+    "ReadLookup",
     # Dashboard tools
     "ListDashboards",
     "GetDashboardDefinition",
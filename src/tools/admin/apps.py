@@ -7,6 +7,7 @@ from typing import Any
 from fastmcp import Context
 
 from src.core.base import BaseTool, ToolMetadata
+from src.core.rest_listing import RestEntityListing
 from src.core.utils import log_tool_execution
 
 
@@ -22,7 +23,12 @@ class ListApps(BaseTool):
             "(name, label, version, description, author, visibility status). "
             "Use this tool when you need to list all apps in the Splunk environment, such as for "
             "auditing, management, or troubleshooting compatibility. "
-            "This tool requires no arguments.\n\n"
+            "All arguments are optional; filtering, sorting and paging run on the Splunk server.\n\n"
+            "Args:\n"
+            "    count (int, optional): Max results to return. 0=all (default: 0)\n"
+            "    offset (int, optional): Result offset for pagination (default: 0)\n"
+            "    search_filter (str, optional): REST search filter (e.g., 'name=Splunk_TA_*')\n"
+            "    sort_key (str, optional): Field to sort by (default: 'name')\n\n"
             "Returns detailed app catalog with 54+ apps typically found in enterprise environments, "
             "including core Splunk apps, add-ons (TAs), custom applications, and third-party integrations."
         ),
@@ -31,7 +37,16 @@ class ListApps(BaseTool):
         requires_connection=True,
     )
 
-    async def execute(self, ctx: Context) -> dict[str, Any]:
+    LIST_FIELDS = ["label", "version", "description", "author", "visible"]
+
+    async def execute(
+        self,
+        ctx: Context,
+        count: int = 0,
+        offset: int = 0,
+        search_filter: str = "",
+        sort_key: str = "name",
+    ) -> dict[str, Any]:
         """
         Retrieve comprehensive inventory of all Splunk applications.
 
@@ -43,11 +58,18 @@ class ListApps(BaseTool):
         - author: App developer/vendor
         - visible: UI visibility ("1" = visible, "0" = hidden)
 
+        Args:
+            count: Maximum results (default: 0 for all)
+            offset: Pagination offset
+            search_filter: Optional REST search filter like 'name=*pattern*'
+            sort_key: Field to sort by on the server (default: name)
+
         Returns:
             Dict containing:
                 - status: "success" or "error"
-                - count: Total number of apps found
+                - count: Number of apps returned
                 - apps: List of app objects with detailed metadata
+                - total, offset, has_more, next_offset: Paging information
 
         Typical enterprise environments contain 50+ apps including:
         - Core Splunk apps (search, launcher, dmc)
@@ -66,21 +88,33 @@ class ListApps(BaseTool):
         await ctx.info("Retrieving list of Splunk apps")
 
         try:
+            listing = RestEntityListing(
+                service,
+                "/services/apps/local",
+                count=count,
+                offset=offset,
+                search=search_filter,
+                sort_key=sort_key,
+                fields=self.LIST_FIELDS,
+            )
             apps = []
-            for app in service.apps:
+            for entry in listing:
+                content = entry.get("content", {})
                 apps.append(
                     {
-                        "name": app.name,
-                        "label": app.content.get("label"),
-                        "version": app.content.get("version"),
-                        "description": app.content.get("description"),
-                        "author": app.content.get("author"),
-                        "visible": app.content.get("visible"),
+                        "name": entry.get("name"),
+                        "label": content.get("label"),
+                        "version": content.get("version"),
+                        "description": content.get("description"),
+                        "author": content.get("author"),
+                        "visible": content.get("visible"),
                     }
                 )
 
             await ctx.info(f"Found {len(apps)} apps")
-            return self.format_success_response({"count": len(apps), "apps": apps})
+            return self.format_success_response(
+                {"count": len(apps), "apps": apps, **listing.paging()}
+            )
         except Exception as e:
             self.logger.error(f"Failed to list apps: {str(e)}")
             await ctx.error(f"Failed to list apps: {str(e)}")
@@ -2,6 +2,9 @@
 Tool for retrieving Splunk configurations.
 """
 
+import asyncio
+import json
+from collections.abc import Callable
 from typing import Any
 
 try:
@@ -12,7 +15,36 @@ except Exception:  # splunklib may not be available in some test contexts
 from fastmcp import Context
 
 from src.core.base import BaseTool, ToolMetadata
+from src.core.service_views import service_view
 from src.core.utils import log_tool_execution
+from src.tools.admin.config_cache import (
+    Namespace,
+    build_effective_view,
+    config_cache_for,
+    referenced_transforms,
+    stanzas_fingerprint,
+)
+
+
+def parse_stanzas_from_json(json_bytes: bytes) -> tuple[dict[str, dict[str, Any]], str]:
+    """Parse a conf REST response into stanzas and an ``updated`` fingerprint."""
+    stanzas: dict[str, dict[str, Any]] = {}
+    try:
+        data = json.loads(json_bytes.decode("utf-8"))
+    except Exception:
+        return stanzas, ""
+    entries = data.get("entry", []) if isinstance(data, dict) else []
+    entries = [entry for entry in entries if entry.get("name")]
+    for entry in entries:
+        content = entry.get("content", {}) or {}
+        acl = entry.get("acl", {}) or {}
+        # Keep values as-is from Splunk JSON
+        stanzas[entry["name"]] = {
+            "settings": dict(content),
+            "app": acl.get("app"),
+            "owner": acl.get("owner"),
+        }
+    return stanzas, stanzas_fingerprint(entries)
 
 
 class GetConfigurations(BaseTool):
@@ -35,7 +67,10 @@ class GetConfigurations(BaseTool):
             "    stanza (str, optional): Specific stanza name within the conf file to retrieve. "
             "If not provided, returns all stanzas in the file.\n"
             "    app (str, optional): Filter results to stanzas owned by this app (namespace).\n"
-            "    owner (str, optional): Filter results to stanzas owned by this owner (user)."
+            "    owner (str, optional): Filter results to stanzas owned by this owner (user).\n"
+            "    effective (bool, optional): Also return the merged effective view, with [default] "
+            "settings layered under each stanza. For props, referenced TRANSFORMS-*/REPORT-* "
+            "stanzas from transforms.conf are included. Defaults to False."
         ),
         category="admin",
         tags=["configuration", "settings", "administration"],
@@ -43,7 +78,13 @@ class GetConfigurations(BaseTool):
     )
 
     async def execute(
-        self, ctx: Context, conf_file: str, stanza: str = "", app: str = "", owner: str = ""
+        self,
+        ctx: Context,
+        conf_file: str,
+        stanza: str = "",
+        app: str = "",
+        owner: str = "",
+        effective: bool = False,
     ) -> dict[str, Any]:
         """
         Get Splunk configurations from specific configuration files.
@@ -53,12 +94,18 @@ class GetConfigurations(BaseTool):
                            (e.g., 'props', 'transforms', 'inputs', 'outputs', 'server', 'web')
             stanza (str, optional): Specific stanza name within the conf file to retrieve.
                                   If not provided, returns all stanzas in the file.
+            effective (bool, optional): Include the merged effective configuration view
 
         Returns:
             Dict containing configuration settings with status, file name, and configuration data
         """
         log_tool_execution(
-            "get_configurations", conf_file=conf_file, stanza=stanza, app=app, owner=owner
+            "get_configurations",
+            conf_file=conf_file,
+            stanza=stanza,
+            app=app,
+            owner=owner,
+            effective=effective,
         )
 
         is_available, service, error_msg = self.check_splunk_available(ctx)
@@ -98,94 +145,75 @@ class GetConfigurations(BaseTool):
         await ctx.info(f"Retrieving configurations from {normalized_conf}")
 
         try:
-            # Use REST API endpoint first to avoid url-encoding issues with certain configs
-            import json
-
-            def parse_stanzas_from_json(json_bytes: bytes) -> dict[str, dict[str, Any]]:
-                stanzas: dict[str, dict[str, Any]] = {}
-                try:
-                    data = json.loads(json_bytes.decode("utf-8"))
-                except Exception:
-                    return stanzas
-                entries = data.get("entry", []) if isinstance(data, dict) else []
-                for entry in entries:
-                    stanza_name = entry.get("name")
-                    if not stanza_name:
-                        continue
-                    content = entry.get("content", {}) or {}
-                    acl = entry.get("acl", {}) or {}
-                    # Keep values as-is from Splunk JSON
-                    stanza_settings: dict[str, Any] = {k: v for k, v in content.items()}
-                    stanzas[stanza_name] = {
-                        "settings": stanza_settings,
-                        "app": acl.get("app"),
-                        "owner": acl.get("owner"),
-                    }
-                return stanzas
-
-            endpoint = f"/services/configs/conf-{normalized_conf}"
             # Build namespace attempts, prioritizing provided filters if set
-            attempts: list[tuple[str | None, str | None]] = []
+            attempts: list[Namespace] = []
             if normalized_app or normalized_owner:
                 attempts.append((normalized_owner or None, normalized_app or None))
             # Default fallbacks
             attempts.extend([(None, None), ("nobody", "search"), ("nobody", "system")])
             # Deduplicate while preserving order
-            seen = set()
-            dedup_attempts: list[tuple[str | None, str | None]] = []
-            for t in attempts:
-                if t not in seen:
-                    dedup_attempts.append(t)
-                    seen.add(t)
-            attempts = dedup_attempts
+            attempts = list(dict.fromkeys(attempts))
+
+            def matches_filters(info: dict[str, Any]) -> bool:
+                if normalized_app and info.get("app") != normalized_app:
+                    return False
+                if normalized_owner and info.get("owner") != normalized_owner:
+                    return False
+                return True
+
+            # Resolved namespaces are remembered per (conf file, user, app filter)
+            user_key = normalized_owner or str(getattr(service, "username", "") or "")
 
             if normalized_stanza:
                 self.logger.info("Retrieving configuration for stanza: %s", normalized_stanza)
                 await ctx.info(f"Retrieving configuration for stanza: {normalized_stanza}")
-                for ns_owner, ns_app in attempts:
-                    try:
-                        stanza_endpoint = f"{endpoint}/{normalized_stanza}"
+
+                def accept_stanza(parsed: dict[str, dict[str, Any]]) -> dict[str, Any]:
+                    stanza_info = parsed.get(normalized_stanza, next(iter(parsed.values()), {}))
+                    if not matches_filters(stanza_info):
                         self.logger.debug(
-                            "REST GET %s (owner=%s, app=%s)", stanza_endpoint, ns_owner, ns_app
+                            "Stanza found but filtered out by app/user (app=%s, owner=%s)",
+                            stanza_info.get("app"),
+                            stanza_info.get("owner"),
                         )
-                        resp = service.get(
-                            stanza_endpoint, owner=ns_owner, app=ns_app, output_mode="json"
+                        return {}
+                    return {normalized_stanza: stanza_info}
+
+                found = await self._read_conf(
+                    service,
+                    normalized_conf,
+                    normalized_stanza,
+                    attempts,
+                    accept_stanza,
+                    user_key,
+                    normalized_app,
+                )
+                if found:
+                    accepted, record, cache_hit = found
+                    stanza_info = accepted[normalized_stanza]
+                    result = {
+                        "stanza": normalized_stanza,
+                        "app": stanza_info.get("app"),
+                        "owner": stanza_info.get("owner"),
+                        "settings": stanza_info.get("settings", {}),
+                        "cache": self._cache_info(record, cache_hit),
+                    }
+                    if effective:
+                        view = await self._effective_view(
+                            service,
+                            normalized_conf,
+                            attempts,
+                            matches_filters,
+                            user_key,
+                            normalized_app,
+                            normalized_owner,
                         )
-                        parsed = parse_stanzas_from_json(resp.body.read())
-                        if parsed:
-                            stanza_info = parsed.get(
-                                normalized_stanza, next(iter(parsed.values()), {})
+                        if view is not None:
+                            result["effective_settings"] = view["stanzas"].get(
+                                normalized_stanza, view["default"]
                             )
-                            # Apply optional filters on app/owner
-                            acl_app = stanza_info.get("app")
-                            acl_owner = stanza_info.get("owner")
-                            if (normalized_app and acl_app != normalized_app) or (
-                                normalized_owner and acl_owner != normalized_owner
-                            ):
-                                self.logger.debug(
-                                    "Stanza found but filtered out by app/user (app=%s, owner=%s)",
-                                    acl_app,
-                                    acl_owner,
-                                )
-                                # continue searching
-                                continue
-                            result = {
-                                "stanza": normalized_stanza,
-                                "app": stanza_info.get("app"),
-                                "owner": stanza_info.get("owner"),
-                                "settings": stanza_info.get("settings", {}),
-                            }
-                            await ctx.info(
-                                f"Retrieved configuration for stanza: {normalized_stanza}"
-                            )
-                            return self.format_success_response(result)
-                    except Exception as rest_err:
-                        self.logger.debug(
-                            "REST stanza attempt failed (owner=%s, app=%s): %s",
-                            ns_owner,
-                            ns_app,
-                            repr(rest_err),
-                        )
+                    await ctx.info(f"Retrieved configuration for stanza: {normalized_stanza}")
+                    return self.format_success_response(result)
 
                 # Fallback to SDK confs access with namespace fallbacks
                 try:
@@ -198,14 +226,8 @@ class GetConfigurations(BaseTool):
                     if splunk_client is not None:
                         for fb_owner, fb_app in attempts[1:]:
                             try:
-                                fb_service = splunk_client.Service(
-                                    scheme=getattr(service, "scheme", "https"),
-                                    host=getattr(service, "host", "localhost"),
-                                    port=getattr(service, "port", 8089),
-                                    token=getattr(service, "token", None),
-                                    owner=fb_owner,
-                                    app=fb_app,
-                                )
+                                # Same session, different namespace; no new login
+                                fb_service = service_view(service, owner=fb_owner, app=fb_app)
                                 stanza_obj = fb_service.confs[normalized_conf][normalized_stanza]
                                 result = {
                                     "stanza": normalized_stanza,
@@ -224,36 +246,20 @@ class GetConfigurations(BaseTool):
 
             # All stanzas via REST first
             all_stanzas: dict[str, dict[str, Any]] = {}
-            for ns_owner, ns_app in attempts:
-                try:
-                    self.logger.debug("REST GET %s (owner=%s, app=%s)", endpoint, ns_owner, ns_app)
-                    resp = service.get(
-                        endpoint, owner=ns_owner, app=ns_app, output_mode="json", count=0
-                    )
-                    stanzas = parse_stanzas_from_json(resp.body.read())
-                    if stanzas:
-                        # Apply optional filters by app/owner
-                        if normalized_app or normalized_owner:
-                            filtered: dict[str, dict[str, Any]] = {}
-                            for name, info in stanzas.items():
-                                acl_app = info.get("app")
-                                acl_owner = info.get("owner")
-                                if normalized_app and acl_app != normalized_app:
-                                    continue
-                                if normalized_owner and acl_owner != normalized_owner:
-                                    continue
-                                filtered[name] = info
-                            stanzas = filtered
-                        if stanzas:
-                            all_stanzas.update(stanzas)
-                        break
-                except Exception as rest_err:
-                    self.logger.debug(
-                        "REST list attempt failed (owner=%s, app=%s): %s",
-                        ns_owner,
-                        ns_app,
-                        repr(rest_err),
-                    )
+            cache_info: dict[str, Any] | None = None
+            found = await self._read_conf(
+                service,
+                normalized_conf,
+                "",
+                attempts,
+                lambda parsed: {n: i for n, i in parsed.items() if matches_filters(i)},
+                user_key,
+                normalized_app,
+            )
+            if found:
+                accepted, record, cache_hit = found
+                all_stanzas.update(accepted)
+                cache_info = self._cache_info(record, cache_hit)
 
             if not all_stanzas:
                 # Fallback to SDK confs iteration with namespace fallback
@@ -265,14 +271,8 @@ class GetConfigurations(BaseTool):
                     if splunk_client is not None:
                         for fb_owner, fb_app in attempts[1:]:
                             try:
-                                fb_service = splunk_client.Service(
-                                    scheme=getattr(service, "scheme", "https"),
-                                    host=getattr(service, "host", "localhost"),
-                                    port=getattr(service, "port", 8089),
-                                    token=getattr(service, "token", None),
-                                    owner=fb_owner,
-                                    app=fb_app,
-                                )
+                                # Same session, different namespace; no new login
+                                fb_service = service_view(service, owner=fb_owner, app=fb_app)
                                 confs = fb_service.confs[normalized_conf]
                                 for stanza_obj in confs:
                                     all_stanzas[stanza_obj.name] = dict(stanza_obj.content)
@@ -285,13 +285,167 @@ class GetConfigurations(BaseTool):
                 "Collected %d stanzas: %s", len(all_stanzas), list(all_stanzas.keys())[:10]
             )
             await ctx.info(f"Retrieved {len(all_stanzas)} stanzas from {normalized_conf}")
-            return self.format_success_response({"file": normalized_conf, "stanzas": all_stanzas})
+            response: dict[str, Any] = {"file": normalized_conf, "stanzas": all_stanzas}
+            if cache_info is not None:
+                response["cache"] = cache_info
+                if effective:
+                    view = await self._effective_view(
+                        service,
+                        normalized_conf,
+                        attempts,
+                        matches_filters,
+                        user_key,
+                        normalized_app,
+                        normalized_owner,
+                    )
+                    if view is not None:
+                        response["effective"] = view
+            return self.format_success_response(response)
         except Exception as e:
             # Log full stack trace for diagnostics
             self.logger.exception("Failed to get configurations")
             await ctx.error(f"Failed to get configurations: {str(e)}")
             return self.format_error_response(str(e))
 
+    def _fetch_namespace(
+        self, service: Any, endpoint: str, namespace: Namespace, params: dict[str, Any]
+    ) -> tuple[Namespace, dict[str, dict[str, Any]], str] | None:
+        """Blocking REST read of a conf endpoint in one namespace; None on failure."""
+        ns_owner, ns_app = namespace
+        try:
+            self.logger.debug("REST GET %s (owner=%s, app=%s)", endpoint, ns_owner, ns_app)
+            resp = service.get(endpoint, owner=ns_owner, app=ns_app, output_mode="json", **params)
+            stanzas, fingerprint = parse_stanzas_from_json(resp.body.read())
+        except Exception as rest_err:
+            self.logger.debug(
+                "REST attempt failed (owner=%s, app=%s): %s", ns_owner, ns_app, repr(rest_err)
+            )
+            return None
+        return namespace, stanzas, fingerprint
+
+    async def _read_conf(
+        self,
+        service: Any,
+        conf: str,
+        stanza: str,
+        attempts: list[Namespace],
+        accept: Callable[[dict[str, dict[str, Any]]], dict[str, Any]],
+        user_key: str,
+        app_filter: str,
+    ) -> tuple[dict[str, Any], dict[str, Any], bool] | None:
+        """
+        Read a conf file (or one stanza) via REST, trying namespaces concurrently.
+
+        A previously resolved namespace is tried alone first (served from the payload cache
+        while fresh). Otherwise every attempt is issued at once and the highest-priority
+        non-empty response that ``accept`` keeps wins; that namespace is remembered for next
+        time.
+
+        Returns:
+            (accepted stanzas, cache record, served from cache) or None if nothing matched
+        """
+        cache = config_cache_for(service)
+        endpoint = f"/services/configs/conf-{conf}"
+        params: dict[str, Any] = {}
+        if stanza:
+            endpoint = f"{endpoint}/{stanza}"
+        else:
+            params["count"] = 0
+
+        resolved = cache.resolved_namespace(conf, user_key, app_filter)
+        if resolved is not None:
+            record = cache.get_payload(conf, stanza, resolved)
+            cache_hit = record is not None
+            if record is None:
+                fetched = await asyncio.to_thread(
+                    self._fetch_namespace, service, endpoint, resolved, params
+                )
+                if fetched and fetched[1]:
+                    record = cache.put_payload(conf, stanza, resolved, fetched[1], fetched[2])
+            if record is not None:
+                accepted = accept(record["stanzas"])
+                if accepted:
+                    return accepted, record, cache_hit
+            # The namespace no longer answers for this conf; rediscover it
+            cache.forget_namespace(conf, user_key, app_filter)
+
+        # Every namespace is queried at once, but responses are taken in priority order, so an
+        # explicitly requested namespace still wins over a fallback that happens to answer
+        # sooner. Threads cannot be cancelled: lower-priority reads still running when a
+        # namespace wins finish in the background and their results are discarded.
+        tasks = [
+            asyncio.ensure_future(
+                asyncio.to_thread(self._fetch_namespace, service, endpoint, namespace, params)
+            )
+            for namespace in attempts
+        ]
+        for task in tasks:
+            fetched = await task
+            if not fetched or not fetched[1]:
+                continue
+            namespace, stanzas, fingerprint = fetched
+            record = cache.put_payload(conf, stanza, namespace, stanzas, fingerprint)
+            accepted = accept(record["stanzas"])
+            if accepted:
+                cache.remember_namespace(conf, user_key, app_filter, namespace)
+                return accepted, record, False
+        return None
+
+    async def _effective_view(
+        self,
+        service: Any,
+        conf: str,
+        attempts: list[Namespace],
+        matches_filters: Callable[[dict[str, Any]], bool],
+        user_key: str,
+        app_filter: str,
+        owner_filter: str,
+    ) -> dict[str, Any] | None:
+        """Build (or reuse) the merged effective view for a conf file."""
+
+        def accept(parsed: dict[str, dict[str, Any]]) -> dict[str, Any]:
+            return {n: i for n, i in parsed.items() if matches_filters(i)}
+
+        found = await self._read_conf(service, conf, "", attempts, accept, user_key, app_filter)
+        if not found:
+            return None
+        stanzas, record, _ = found
+
+        transforms: tuple[dict[str, Any], dict[str, Any], bool] | None = None
+        if conf == "props":
+            # Referenced transforms are resolved in the same view to avoid a second round trip
+            transforms = await self._read_conf(
+                service, "transforms", "", attempts, accept, user_key, app_filter
+            )
+
+        key: tuple = (
+            (conf, "transforms") if conf == "props" else (conf,),
+            record["namespace"],
+            record["fingerprint"],
+            transforms[1]["fingerprint"] if transforms else "",
+            app_filter,
+            owner_filter,
+        )
+
+        def build() -> dict[str, Any]:
+            view = build_effective_view(stanzas)
+            if transforms:
+                transform_view = build_effective_view(transforms[0])["stanzas"]
+                view["transforms"] = {
+                    name: transform_view[name]
+                    for name in sorted(referenced_transforms(view))
+                    if name in transform_view
+                }
+            return view
+
+        view, _ = config_cache_for(service).effective_view(key, build)
+        return view
+
+    @staticmethod
+    def _cache_info(record: dict[str, Any], cache_hit: bool) -> dict[str, Any]:
+        ns_owner, ns_app = record["namespace"]
+        return {"hit": cache_hit, "namespace": {"owner": ns_owner, "app": ns_app}}
+
 
 class CreateConfig(BaseTool):
     """
@@ -351,6 +505,34 @@ class CreateConfig(BaseTool):
             return self.format_error_response("stanza is required")
         provided_settings = settings or {}
 
+        response = await self._write_stanza(
+            ctx,
+            service,
+            normalized_conf,
+            normalized_stanza,
+            provided_settings,
+            app,
+            owner,
+            overwrite,
+        )
+        # Drop cached reads only once the write has been made, so a concurrent read cannot
+        # cache the old stanza again. Failed attempts may have applied part of the change.
+        if response.get("action") != "skipped":
+            config_cache_for(service).invalidate(normalized_conf)
+        return response
+
+    async def _write_stanza(
+        self,
+        ctx: Context,
+        service: Any,
+        normalized_conf: str,
+        normalized_stanza: str,
+        provided_settings: dict[str, Any],
+        app: str,
+        owner: str,
+        overwrite: bool,
+    ) -> dict[str, Any]:
+        """Create or update one stanza via REST, falling back to the SDK."""
         # Determine default namespace per spec: owner from session, app 'search'
         default_owner = getattr(service, "username", None) or None
         ns_owner = owner or default_owner
@@ -475,9 +657,11 @@ class CreateConfig(BaseTool):
                     }
                 )
             except Exception:
-                # Fallback to SDK operations
+                # Fallback to SDK operations, scoped to the target namespace
                 try:
-                    confs = service.confs[normalized_conf]
+                    confs = service_view(service, owner=ns_owner or "nobody", app=ns_app).confs[
+                        normalized_conf
+                    ]
                     # Try to read existing stanza
                     try:
                         stanza_obj = confs[normalized_stanza]
@@ -0,0 +1,169 @@
+"""
+Namespace resolution and payload caching for Splunk .conf reads.
+
+GetConfigurations probes several ``(owner, app)`` namespaces to find one that exposes a conf
+file. The namespace that answered is remembered per (conf file, user) so later calls go straight
+to it, and parsed stanza payloads are kept for a short TTL. When a payload is re-read after the
+TTL and its ``updated`` fingerprint is unchanged, the previously parsed stanzas (and any merged
+effective view built from them) are reused instead of being rebuilt.
+
+Caches are held per Splunk service object, so separate connections never share results.
+"""
+
+import threading
+import time
+import weakref
+from collections.abc import Callable
+from typing import Any
+
+# Seconds a parsed conf payload is served without re-reading it from Splunk
+CONFIG_CACHE_TTL = 30.0
+
+Namespace = tuple[str | None, str | None]
+
+
+def stanzas_fingerprint(entries: list[dict[str, Any]]) -> str:
+    """Fingerprint a conf listing from its entries' ``updated`` values and entry count."""
+    latest = max((str(entry.get("updated") or "") for entry in entries), default="")
+    return f"{len(entries)}:{latest}"
+
+
+def build_effective_view(stanzas: dict[str, dict[str, Any]]) -> dict[str, Any]:
+    """
+    Merge ``[default]`` settings underneath every other stanza, as Splunk does at runtime.
+
+    Internal ``eai:*`` attributes are dropped; stanza-level values win over defaults.
+    """
+
+    def _settings(info: dict[str, Any]) -> dict[str, Any]:
+        return {k: v for k, v in (info.get("settings") or {}).items() if not k.startswith("eai:")}
+
+    defaults = _settings(stanzas.get("default", {}))
+    effective = {
+        name: {**defaults, **_settings(info)} for name, info in stanzas.items() if name != "default"
+    }
+    return {"default": defaults, "stanzas": effective}
+
+
+def referenced_transforms(effective: dict[str, Any]) -> set[str]:
+    """Names of transforms stanzas referenced by TRANSFORMS-*/REPORT-* keys in a props view."""
+    names: set[str] = set()
+    for settings in effective.get("stanzas", {}).values():
+        for key, value in settings.items():
+            if key.startswith(("TRANSFORMS-", "REPORT-")) and isinstance(value, str):
+                names.update(part.strip() for part in value.split(",") if part.strip())
+    return names
+
+
+class ConfigCache:
+    """Thread-safe resolved-namespace, payload and effective-view cache for one connection."""
+
+    def __init__(self, ttl: float = CONFIG_CACHE_TTL):
+        self.ttl = ttl
+        self._namespaces: dict[tuple[str, str, str], Namespace] = {}
+        self._payloads: dict[tuple[str, str, Namespace], dict[str, Any]] = {}
+        self._effective: dict[tuple, dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+
+    def resolved_namespace(self, conf: str, user: str, app: str) -> Namespace | None:
+        with self._lock:
+            return self._namespaces.get((conf, user, app))
+
+    def remember_namespace(self, conf: str, user: str, app: str, namespace: Namespace) -> None:
+        with self._lock:
+            self._namespaces[(conf, user, app)] = namespace
+
+    def forget_namespace(self, conf: str, user: str, app: str) -> None:
+        with self._lock:
+            self._namespaces.pop((conf, user, app), None)
+
+    def get_payload(self, conf: str, stanza: str, namespace: Namespace) -> dict[str, Any] | None:
+        """Return the parsed payload for a namespace if it is still within the TTL."""
+        with self._lock:
+            record = self._payloads.get((conf, stanza, namespace))
+            if record is None or time.monotonic() - record["fetched_at"] > self.ttl:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return record
+
+    def put_payload(
+        self,
+        conf: str,
+        stanza: str,
+        namespace: Namespace,
+        stanzas: dict[str, dict[str, Any]],
+        fingerprint: str,
+    ) -> dict[str, Any]:
+        """
+        Store a freshly read payload and return the cached record.
+
+        If the previous record for this namespace has the same fingerprint, its parsed stanzas
+        are kept so identity-keyed derived views stay valid.
+        """
+        key = (conf, stanza, namespace)
+        with self._lock:
+            previous = self._payloads.get(key)
+            if previous is not None and previous["fingerprint"] == fingerprint:
+                self.revalidated += 1
+                stanzas = previous["stanzas"]
+            record = {
+                "stanzas": stanzas,
+                "fingerprint": fingerprint,
+                "namespace": namespace,
+                "fetched_at": time.monotonic(),
+            }
+            self._payloads[key] = record
+            return record
+
+    def effective_view(
+        self, key: tuple, build: Callable[[], dict[str, Any]]
+    ) -> tuple[dict[str, Any], bool]:
+        """Return the effective view cached under key, building it once. Returns (view, cached)."""
+        with self._lock:
+            view = self._effective.get(key)
+        if view is not None:
+            return view, True
+        view = build()
+        with self._lock:
+            # Views built from older fingerprints of the same conf/namespace are now stale
+            for stale in [k for k in self._effective if k[:2] == key[:2]]:
+                del self._effective[stale]
+            self._effective[key] = view
+        return view, False
+
+    def invalidate(self, conf: str) -> None:
+        """Drop payloads and effective views for a conf file (e.g. after a write)."""
+        with self._lock:
+            for key in [k for k in self._payloads if k[0] == conf]:
+                del self._payloads[key]
+            for key in [k for k in self._effective if conf in k[0]]:
+                del self._effective[key]
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "namespaces": len(self._namespaces),
+                "payloads": len(self._payloads),
+                "effective_views": len(self._effective),
+                "hits": self.hits,
+                "misses": self.misses,
+                "revalidated": self.revalidated,
+            }
+
+
+_caches: "weakref.WeakKeyDictionary[Any, ConfigCache]" = weakref.WeakKeyDictionary()
+_caches_lock = threading.Lock()
+
+
+def config_cache_for(service: Any) -> ConfigCache:
+    """Return the ConfigCache bound to a Splunk service object, creating it on first use."""
+    with _caches_lock:
+        cache = _caches.get(service)
+        if cache is None:
+            cache = ConfigCache()
+            _caches[service] = cache
+        return cache
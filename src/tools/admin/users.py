@@ -7,6 +7,7 @@ from typing import Any
 from fastmcp import Context
 
 from src.core.base import BaseTool, ToolMetadata
+from src.core.rest_listing import RestEntityListing
 from src.core.utils import log_tool_execution
 
 
@@ -21,21 +22,42 @@ class ListUsers(BaseTool):
             "Retrieve comprehensive inventory of all Splunk users and their properties. "
             "Use this tool when you need to list all users in the Splunk environment, such as for "
             "security audits, user management, or understanding access patterns. "
-            "This tool requires no arguments.\n\n"
+            "All arguments are optional; filtering, sorting and paging run on the Splunk server.\n\n"
+            "Args:\n"
+            "    count (int, optional): Max results to return. 0=all (default: 0)\n"
+            "    offset (int, optional): Result offset for pagination (default: 0)\n"
+            "    search_filter (str, optional): REST search filter (e.g., 'roles=admin')\n"
+            "    sort_key (str, optional): Field to sort by (default: 'name')\n\n"
             "Response Format:\n"
             "Returns a dictionary with 'status' field indicating success/error and 'data' containing:\n"
-            "- count: Total number of users found\n"
-            "- users: Array of user objects with username, realname, email, roles, type, and defaultApp"
+            "- count: Number of users returned\n"
+            "- users: Array of user objects with username, realname, email, roles, type, and defaultApp\n"
+            "- total, offset, has_more, next_offset: Paging information"
         ),
         category="admin",
         tags=["users", "administration", "management"],
         requires_connection=True,
     )
 
-    async def execute(self, ctx: Context) -> dict[str, Any]:
+    LIST_FIELDS = ["realname", "email", "roles", "type", "defaultApp"]
+
+    async def execute(
+        self,
+        ctx: Context,
+        count: int = 0,
+        offset: int = 0,
+        search_filter: str = "",
+        sort_key: str = "name",
+    ) -> dict[str, Any]:
         """
         List all Splunk users.
 
+        Args:
+            count: Maximum results (default: 0 for all)
+            offset: Pagination offset
+            search_filter: Optional REST search filter like 'roles=admin'
+            sort_key: Field to sort by on the server (default: name)
+
         Returns:
             Dict containing list of users and their properties
         """
@@ -50,21 +72,33 @@ class ListUsers(BaseTool):
         await ctx.info("Retrieving list of Splunk users")
 
         try:
+            listing = RestEntityListing(
+                service,
+                "/services/authentication/users",
+                count=count,
+                offset=offset,
+                search=search_filter,
+                sort_key=sort_key,
+                fields=self.LIST_FIELDS,
+            )
             users = []
-            for user in service.users:
+            for entry in listing:
+                content = entry.get("content", {})
                 users.append(
                     {
-                        "username": user.name,
-                        "realname": user.content.get("realname"),
-                        "email": user.content.get("email"),
-                        "roles": user.content.get("roles", []),
-                        "type": user.content.get("type"),
-                        "defaultApp": user.content.get("defaultApp"),
+                        "username": entry.get("name"),
+                        "realname": content.get("realname"),
+                        "email": content.get("email"),
+                        "roles": content.get("roles", []),
+                        "type": content.get("type"),
+                        "defaultApp": content.get("defaultApp"),
                     }
                 )
 
             await ctx.info(f"Found {len(users)} users")
-            return self.format_success_response({"count": len(users), "users": users})
+            return self.format_success_response(
+                {"count": len(users), "users": users, **listing.paging()}
+            )
         except Exception as e:
             self.logger.error(f"Failed to list users: {str(e)}")
             await ctx.error(f"Failed to list users: {str(e)}")
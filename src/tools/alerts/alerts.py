@@ -4,11 +4,13 @@ Alerts management tools for Splunk MCP Server.
 This module provides tools for managing and querying Splunk alerts.
 """
 
+import json
 from typing import Any
 
 from fastmcp import Context
 
 from src.core.base import BaseTool, ToolMetadata
+from src.core.rest_listing import RestEntityListing
 from src.core.utils import log_tool_execution
 
 
@@ -19,15 +21,19 @@ class ListTriggeredAlerts(BaseTool):
         name="list_triggered_alerts",
         description=(
             "List fired alerts and their details. Use this to review recent triggered alerts, including "
-            "saved search name, trigger time, owner/app, and trigger reason. Supports a name filter and a "
-            "max results cap. Note: Splunk's fired alerts feed may not strictly filter by time; earliest/"
-            "latest are advisory.\n\n"
+            "saved search name, trigger time, owner/app, and severity. The name filter, newest-first "
+            "ordering and paging are applied by Splunk in a single paged REST query; the time window "
+            "is resolved by Splunk's time parser and applied to the returned pages, which stop "
+            "once an alert older than the window is reached.\n\n"
             "Args:\n"
             "    count (int, optional): Maximum number of alert groups to return (default: 50)\n"
-            "    earliest_time (str, optional): Advisory filter for earliest trigger time (default: '-24h@h')\n"
-            "    latest_time (str, optional): Advisory filter for latest trigger time (default: 'now')\n"
-            "    search (str, optional): Case-insensitive substring filter applied to alert group name\n\n"
-            "Outputs: 'triggered_alerts' array, total counts, and the applied parameters.\n"
+            "    earliest_time (str, optional): Earliest trigger time, Splunk time modifier (default: '-24h@h')\n"
+            "    latest_time (str, optional): Latest trigger time, Splunk time modifier (default: 'now')\n"
+            "    search (str, optional): Case-insensitive substring filter applied to the saved search name\n"
+            "    max_alerts (int, optional): Hard cap on individual alerts read (default: 500, max: 5000)\n\n"
+            "Outputs: 'triggered_alerts' array grouped by saved search (newest first), total counts of "
+            "the alerts read, 'truncated' when a cap stopped the scan (more matching alerts may "
+            "exist), and the applied parameters.\n"
             "Security: results are constrained by the authenticated user's permissions."
         ),
         category="alerts",
@@ -35,6 +41,23 @@ class ListTriggeredAlerts(BaseTool):
         requires_connection=True,
     )
 
+    # All individual fired alerts across groups; the '-' group is a wildcard
+    FIRED_ALERTS_ENDPOINT = "/servicesNS/-/-/alerts/fired_alerts/-"
+    ALERT_FIELDS = [
+        "savedsearch_name",
+        "sid",
+        "trigger_time",
+        "trigger_time_rendered",
+        "severity",
+        "digest_mode",
+        "alert_type",
+        "triggered_alerts",
+        "expiration_time_rendered",
+        "actions",
+    ]
+    MAX_ALERT_ROWS = 5000
+    PAGE_SIZE = 100
+
     async def execute(
         self,
         ctx: Context,
@@ -42,16 +65,24 @@ class ListTriggeredAlerts(BaseTool):
         earliest_time: str = "-24h@h",
         latest_time: str = "now",
         search: str = "",
+        max_alerts: int = 500,
     ) -> dict[str, Any]:
         """
         Execute the list triggered alerts tool.
 
+        The REST listing filters by name and sorts by trigger time on the server. The
+        fired_alerts endpoint cannot filter by time, so the window is applied here while
+        reading pages newest first, stopping at the first alert before ``earliest_time``.
+        The totals and ``truncated`` only describe the pages read: alerts past ``max_alerts``
+        or beyond ``count`` groups are not counted.
+
         Args:
             ctx: MCP context containing client connection
-            count: Maximum number of alerts to return (default: 50, max: 1000)
+            count: Maximum number of alert groups to return (default: 50)
             earliest_time: Filter alerts triggered after this time (default: "-24h@h")
             latest_time: Filter alerts triggered before this time (default: "now")
-            search: Search filter to apply to alert names or saved search names
+            search: Search filter to apply to saved search names
+            max_alerts: Hard cap on individual alerts read (default: 500, max: 5000)
 
         Returns:
             Dict containing list of triggered alerts with their details
@@ -73,123 +104,101 @@ class ListTriggeredAlerts(BaseTool):
         await ctx.info("Retrieving list of triggered alerts")
 
         try:
-            # Validate and use the provided parameters
             search_filter = search
+            row_cap = max(1, min(int(max_alerts), self.MAX_ALERT_ROWS))
 
-            # Get Splunk service (already retrieved from check_splunk_available)
-
-            # Get fired alerts from Splunk (fired_alerts is a collection, not a method)
-            fired_alerts = service.fired_alerts
-
-            alerts_data = []
-            processed_count = 0
+            # Resolve the time window with Splunk's own time parser (one small request)
+            earliest_epoch, latest_epoch = self._resolve_time_window(
+                service, earliest_time, latest_time
+            )
 
-            for alert_group in fired_alerts:
-                # Stop if we've reached the count limit
-                if processed_count >= count:
-                    break
+            rest_search = []
+            if search_filter:
+                rest_search.append(f"savedsearch_name=*{search_filter}*")
+
+            # Newest first, so paging can stop as soon as the window is passed; the window
+            # itself is checked below, per entry, not by the REST query
+            listing = RestEntityListing(
+                service,
+                self.FIRED_ALERTS_ENDPOINT,
+                count=row_cap,
+                search=rest_search,
+                sort_key="trigger_time",
+                sort_dir="desc",
+                sort_mode="num",
+                fields=self.ALERT_FIELDS,
+                page_size=self.PAGE_SIZE,
+            )
 
-                try:
-                    # Get alert group properties
-                    alert_name = getattr(alert_group, "name", "Unknown")
-                    alert_count = getattr(alert_group, "count", 0)
+            groups: dict[str, dict[str, Any]] = {}
+            rows_read = 0
+            truncated = False
+            for entry in listing:
+                rows_read += 1
+                content = entry.get("content", {})
+                trigger_epoch = self._to_float(content.get("trigger_time"))
 
-                    # Apply search filter if provided
-                    if search_filter and search_filter.lower() not in alert_name.lower():
+                if trigger_epoch is not None:
+                    if latest_epoch is not None and trigger_epoch > latest_epoch:
                         continue
+                    if earliest_epoch is not None and trigger_epoch < earliest_epoch:
+                        break
 
-                    # Get individual alerts in this group
-                    group_alerts = []
-                    if hasattr(alert_group, "alerts"):
-                        for alert in alert_group.alerts:
-                            try:
-                                alert_info = {
-                                    "trigger_time": getattr(alert, "trigger_time", ""),
-                                    "sid": getattr(alert, "sid", ""),
-                                    "saved_search_name": getattr(alert, "saved_search_name", ""),
-                                    "app": getattr(alert, "app", ""),
-                                    "owner": getattr(alert, "owner", ""),
-                                    "trigger_reason": getattr(alert, "trigger_reason", ""),
-                                    "digest_mode": getattr(alert, "digest_mode", False),
-                                }
-                                # Add any additional alert properties
-                                try:
-                                    alert_info.update(
-                                        {
-                                            "result_count": getattr(alert, "result_count", 0),
-                                            "server_host": getattr(alert, "server_host", ""),
-                                            "server_uri": getattr(alert, "server_uri", ""),
-                                        }
-                                    )
-                                except Exception:
-                                    # Some properties might not be available
-                                    pass
-
-                                group_alerts.append(alert_info)
-                            except Exception as alert_error:
-                                # Log individual alert errors but continue
-                                self.logger.warning(
-                                    f"Error processing individual alert: {alert_error}"
-                                )
-                                continue
-
-                    alert_group_data = {
-                        "alert_name": alert_name,
-                        "alert_count": alert_count,
-                        "alerts": group_alerts,
-                    }
-
-                    # Add any additional group properties
-                    try:
-                        alert_group_data.update(
-                            {
-                                "content": getattr(alert_group, "content", {}),
-                                "state": getattr(alert_group, "state", {}),
-                                "access": getattr(alert_group, "access", {}),
-                            }
-                        )
-                    except Exception:
-                        # Some properties might not be available
-                        pass
-
-                    alerts_data.append(alert_group_data)
-                    processed_count += 1
-
-                except Exception as e:
-                    # Log individual alert processing errors but continue
-                    self.logger.warning(
-                        f"Error processing alert group {getattr(alert_group, 'name', 'Unknown')}: {e}"
-                    )
+                name = content.get("savedsearch_name") or entry.get("name", "Unknown")
+                if search_filter and search_filter.lower() not in name.lower():
                     continue
 
-            # Sort alerts by most recent trigger time if available
-            try:
-                alerts_data.sort(
-                    key=lambda x: max(
-                        (alert.get("trigger_time", "") for alert in x.get("alerts", [])), default=""
-                    ),
-                    reverse=True,
+                group = groups.get(name)
+                if group is None:
+                    if len(groups) >= count:
+                        truncated = True
+                        break
+                    group = groups[name] = {"alert_name": name, "alert_count": 0, "alerts": []}
+
+                acl = entry.get("acl", {})
+                group["alerts"].append(
+                    {
+                        "trigger_time": content.get("trigger_time_rendered")
+                        or content.get("trigger_time", ""),
+                        "trigger_time_epoch": trigger_epoch,
+                        "sid": content.get("sid", ""),
+                        "saved_search_name": name,
+                        "app": acl.get("app", ""),
+                        "owner": acl.get("owner", ""),
+                        "severity": content.get("severity", ""),
+                        "alert_type": content.get("alert_type", ""),
+                        "digest_mode": content.get("digest_mode", False),
+                        "triggered_alerts": content.get("triggered_alerts", ""),
+                        "actions": content.get("actions", ""),
+                        "expiration_time": content.get("expiration_time_rendered", ""),
+                    }
                 )
-            except Exception:
-                # If sorting fails, continue with unsorted data
-                pass
+                group["alert_count"] += 1
+            else:
+                truncated = truncated or (rows_read >= row_cap and listing.has_more)
+
+            alerts_data = list(groups.values())
+            total_alerts = sum(len(group["alerts"]) for group in alerts_data)
 
             await ctx.info(
-                f"Found {len(alerts_data)} alert groups with {sum(len(group.get('alerts', [])) for group in alerts_data)} total alerts"
+                f"Found {len(alerts_data)} alert groups with {total_alerts} total alerts"
             )
 
             return self.format_success_response(
                 {
                     "triggered_alerts": alerts_data,
                     "total_alert_groups": len(alerts_data),
-                    "total_individual_alerts": sum(
-                        len(group.get("alerts", [])) for group in alerts_data
-                    ),
+                    "total_individual_alerts": total_alerts,
+                    "rows_read": rows_read,
+                    "truncated": truncated,
                     "search_parameters": {
                         "count": count,
                         "earliest_time": earliest_time,
                         "latest_time": latest_time,
                         "search_filter": search_filter or None,
+                        "max_alerts": row_cap,
+                        "time_window_applied": earliest_epoch is not None
+                        or latest_epoch is not None,
                     },
                 }
             )
@@ -198,3 +207,36 @@ class ListTriggeredAlerts(BaseTool):
             self.logger.error(f"Failed to retrieve triggered alerts: {str(e)}")
             await ctx.error(f"Failed to retrieve triggered alerts: {str(e)}")
             return self.format_error_response(f"Failed to retrieve triggered alerts: {str(e)}")
+
+    def _resolve_time_window(
+        self, service, earliest_time: str, latest_time: str
+    ) -> tuple[float | None, float | None]:
+        """
+        Convert Splunk time modifiers to epochs via /search/timeparser.
+
+        Returns (None, None) for any bound that cannot be resolved, in which case that side
+        of the window is not applied.
+        """
+        times = [t for t in (earliest_time, latest_time) if t]
+        if not times:
+            return None, None
+        try:
+            response = service.get(
+                "/services/search/timeparser",
+                time=times,
+                output_time_format="%s",
+                output_mode="json",
+            )
+            body = response.body.read()
+            parsed = json.loads(body) if body else {}
+        except Exception as e:
+            self.logger.warning(f"Could not resolve alert time window: {e}")
+            return None, None
+        return self._to_float(parsed.get(earliest_time)), self._to_float(parsed.get(latest_time))
+
+    @staticmethod
+    def _to_float(value: Any) -> float | None:
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return None
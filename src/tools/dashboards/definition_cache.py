@@ -0,0 +1,152 @@
+"""
+Dashboard type classification and a shared definition cache.
+
+Classic (Simple XML) vs Dashboard Studio is decided from lightweight view metadata where
+possible, falling back to a bounded prefix of ``eai:data``. Results are cached per dashboard
+keyed by the entry's ``updated`` timestamp so unchanged definitions are never re-downloaded
+or re-parsed by ListDashboards and GetDashboardDefinition.
+"""
+
+import json
+import re
+import threading
+from collections import OrderedDict
+from typing import Any
+
+# Only this many leading characters of eai:data are inspected for root attributes
+CLASSIFY_PREFIX_CHARS = 2048
+
+_STUDIO_ROOT = re.compile(r"<dashboard\b[^>]*\bversion\s*=\s*[\"']2", re.IGNORECASE)
+
+# Metadata-only fields requested from /data/ui/views when listing
+VIEW_METADATA_FIELDS = [
+    "label",
+    "description",
+    "version",
+    "eai:type",
+    "rootNode",
+    "isDashboard",
+]
+
+
+def classify_from_metadata(content: dict[str, Any]) -> str | None:
+    """
+    Classify a dashboard from view metadata without its definition.
+
+    Returns:
+        'studio', 'classic', or None when the metadata is not conclusive
+    """
+    version = str(content.get("version") or "").strip()
+    if version:
+        return "studio" if version.split(".")[0] == "2" else "classic"
+    if content.get("eai:type") == "html" or content.get("rootNode") == "form":
+        return "classic"
+    return None
+
+
+def classify_definition(eai_data: str | None) -> str:
+    """Classify a dashboard from its eai:data, inspecting only a bounded prefix."""
+    if not eai_data:
+        return "classic"
+    prefix = eai_data[:CLASSIFY_PREFIX_CHARS].lstrip()
+    # Pure Studio JSON, or hybrid XML whose root declares version="2"
+    if prefix.startswith("{") or _STUDIO_ROOT.search(prefix):
+        return "studio"
+    # Hybrid XML with a <definition> block; substring scan, no parsing
+    if "<definition>" in eai_data:
+        return "studio"
+    return "classic"
+
+
+def parse_definition(eai_data: str | None, dashboard_type: str) -> Any:
+    """Return the definition as exposed to clients: parsed JSON for pure Studio JSON."""
+    if not eai_data or dashboard_type != "studio" or not eai_data.lstrip().startswith("{"):
+        return eai_data or ""
+    try:
+        return json.loads(eai_data)
+    except (json.JSONDecodeError, TypeError):
+        return eai_data
+
+
+class DashboardDefinitionCache:
+    """
+    Thread-safe LRU of dashboard classifications and parsed definitions.
+
+    Entries are keyed by the view's REST id and are only valid for the ``updated``
+    timestamp they were stored with.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str, updated: str) -> dict[str, Any] | None:
+        """Return the cached record for key if it matches updated, else None."""
+        with self._lock:
+            record = self._entries.get(key)
+            if record is None or record["updated"] != updated:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return record
+
+    def put(
+        self,
+        key: str,
+        updated: str,
+        dashboard_type: str,
+        definition: Any = None,
+        has_definition: bool = False,
+    ) -> None:
+        """Store a classification (and optionally the parsed definition)."""
+        with self._lock:
+            existing = self._entries.get(key)
+            if (
+                not has_definition
+                and existing is not None
+                and existing["updated"] == updated
+                and existing["has_definition"]
+            ):
+                # Keep the richer record
+                return
+            self._entries[key] = {
+                "updated": updated,
+                "type": dashboard_type,
+                "definition": definition,
+                "has_definition": has_definition,
+            }
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def has_definition_for(self, name: str) -> bool:
+        """Whether any cached record holds a parsed definition for a view with this name."""
+        suffix = f"/data/ui/views/{name}"
+        with self._lock:
+            return any(
+                key.endswith(suffix) and record["has_definition"]
+                for key, record in self._entries.items()
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+# Shared by ListDashboards and GetDashboardDefinition
+dashboard_definition_cache = DashboardDefinitionCache()
+
+
+def entry_updated(entry: dict[str, Any]) -> str:
+    """The modification timestamp of a REST view entry."""
+    return str(entry.get("updated") or entry.get("content", {}).get("updated") or "")
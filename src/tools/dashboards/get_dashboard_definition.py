@@ -9,6 +9,13 @@ from fastmcp import Context
 
 from src.core.base import BaseTool, ToolMetadata
 from src.core.utils import log_tool_execution
+from src.tools.dashboards.definition_cache import (
+    VIEW_METADATA_FIELDS,
+    classify_definition,
+    dashboard_definition_cache,
+    entry_updated,
+    parse_definition,
+)
 
 
 class GetDashboardDefinition(BaseTool):
@@ -70,11 +77,6 @@ class GetDashboardDefinition(BaseTool):
         try:
             await ctx.info(f"Retrieving dashboard '{name}' from Splunk (owner={owner}, app={app})")
 
-            # Build request parameters
-            params = {
-                "output_mode": "json",
-            }
-
             # Get Splunk Web base URL from service
             splunk_host = service.host
             # Use HTTPS by default for web UI (typically port 8000)
@@ -84,48 +86,46 @@ class GetDashboardDefinition(BaseTool):
 
             # Call the REST endpoint for specific dashboard
             endpoint = f"/servicesNS/{owner}/{app}/data/ui/views/{name}"
-            response = service.get(endpoint, **params)
-
-            # Parse JSON response
-            response_body = response.body.read()
-            data = json.loads(response_body)
-
-            # Extract entry (should be single dashboard)
-            entries = data.get("entry", [])
 
-            if not entries:
+            entry = None
+            cached = None
+            if dashboard_definition_cache.has_definition_for(name):
+                # Metadata-only probe: reuse the cached definition if it is unchanged
+                entry = self._get_entry(service, endpoint, f=VIEW_METADATA_FIELDS)
+                if entry is not None:
+                    cached = dashboard_definition_cache.get(
+                        entry.get("id") or endpoint, entry_updated(entry)
+                    )
+                    if cached is not None and not cached["has_definition"]:
+                        cached = None
+
+            if cached is None:
+                entry = self._get_entry(service, endpoint)
+
+            if entry is None:
                 error_msg = f"Dashboard '{name}' not found (owner={owner}, app={app})"
                 await ctx.error(error_msg)
                 return self.format_error_response(error_msg)
 
-            entry = entries[0]
             content = entry.get("content", {})
             acl = entry.get("acl", {})
 
-            # Get dashboard definition from eai:data
-            eai_data = content.get("eai:data", "")
-            dashboard_type = "classic"
-            definition = eai_data
-
-            if eai_data:
-                # Dashboard Studio can be in two formats:
-                # 1. Pure JSON (direct Studio format)
-                # 2. Hybrid XML with <definition> tag containing JSON in CDATA
-
-                # Check for hybrid format: <definition> tag (Dashboard Studio specific)
-                if "<definition>" in eai_data:
-                    dashboard_type = "studio"
-                    definition = eai_data  # Keep as XML string (hybrid format)
-                else:
-                    # Try to parse as pure JSON (Dashboard Studio format)
-                    try:
-                        parsed_json = json.loads(eai_data)
-                        dashboard_type = "studio"
-                        definition = parsed_json  # Return as parsed JSON object
-                    except (json.JSONDecodeError, TypeError):
-                        # Falls back to classic XML string
-                        dashboard_type = "classic"
-                        definition = eai_data
+            if cached is not None:
+                dashboard_type = cached["type"]
+                definition = cached["definition"]
+            else:
+                # Dashboard Studio can be pure JSON (returned parsed) or hybrid XML with a
+                # <definition> tag containing JSON in CDATA (returned as the XML string)
+                eai_data = content.get("eai:data", "")
+                dashboard_type = classify_definition(eai_data)
+                definition = parse_definition(eai_data, dashboard_type)
+                dashboard_definition_cache.put(
+                    entry.get("id") or endpoint,
+                    entry_updated(entry),
+                    dashboard_type,
+                    definition=definition,
+                    has_definition=True,
+                )
 
             # Build Splunk Web URL
             dashboard_app = acl.get("app", app)
@@ -143,7 +143,7 @@ class GetDashboardDefinition(BaseTool):
                     "owner": acl.get("owner", ""),
                     "sharing": acl.get("sharing", ""),
                     "description": content.get("description", ""),
-                    "updated": content.get("updated", ""),
+                    "updated": entry_updated(entry),
                     "version": content.get("version", ""),
                     "definition": definition,
                     "permissions": {
@@ -170,3 +170,9 @@ class GetDashboardDefinition(BaseTool):
                 error_detail += " (Authentication failed - check credentials)"
 
             return self.format_error_response(error_detail)
+
+    def _get_entry(self, service, endpoint: str, **params) -> dict[str, Any] | None:
+        """GET a single view entry as JSON, or None if the response has no entry."""
+        response = service.get(endpoint, output_mode="json", **params)
+        entries = json.loads(response.body.read()).get("entry", [])
+        return entries[0] if entries else None
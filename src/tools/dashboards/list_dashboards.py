@@ -2,13 +2,23 @@
 List dashboards from Splunk (Simple XML and Dashboard Studio).
 """
 
-import json
 from typing import Any
 
 from fastmcp import Context
 
 from src.core.base import BaseTool, ToolMetadata
+from src.core.rest_listing import RestEntityListing
 from src.core.utils import log_tool_execution
+from src.tools.dashboards.definition_cache import (
+    VIEW_METADATA_FIELDS,
+    classify_definition,
+    classify_from_metadata,
+    dashboard_definition_cache,
+    entry_updated,
+)
+
+# Views whose definitions are requested together when metadata does not settle their type
+DEFINITION_BATCH_SIZE = 50
 
 
 class ListDashboards(BaseTool):
@@ -36,7 +46,11 @@ class ListDashboards(BaseTool):
             "    my_dashboards_only (bool, optional): If True, only return dashboards owned by the "
             "current user. Overrides 'owner' parameter. Default: False\n"
             "    private_only (bool, optional): If True, only return private dashboards (sharing='user'). "
-            "Works with any owner filter. Default: False"
+            "Works with any owner filter. Default: False\n"
+            "    lightweight (bool, optional): Request only view metadata and classify type from it, "
+            "downloading the definitions of uncached views with inconclusive metadata in batched "
+            "requests. "
+            "Default: True"
         ),
         category="dashboards",
         tags=["dashboards", "visualization", "ui", "list"],
@@ -54,6 +68,7 @@ class ListDashboards(BaseTool):
         type_filter: str = "any",
         my_dashboards_only: bool = False,
         private_only: bool = False,
+        lightweight: bool = True,
     ) -> dict[str, Any]:
         """
         List dashboards from Splunk.
@@ -67,6 +82,7 @@ class ListDashboards(BaseTool):
             type_filter: Filter by dashboard type (classic/studio/any)
             my_dashboards_only: If True, only return current user's dashboards
             private_only: If True, only return private dashboards (sharing='user')
+            lightweight: If True, skip eai:data in the listing and classify from metadata
 
         Returns:
             Dict with status and list of dashboard metadata, includes total_available
@@ -82,6 +98,7 @@ class ListDashboards(BaseTool):
             type_filter=type_filter,
             my_dashboards_only=my_dashboards_only,
             private_only=private_only,
+            lightweight=lightweight,
         )
 
         is_available, service, error_msg = self.check_splunk_available(ctx)
@@ -107,19 +124,9 @@ class ListDashboards(BaseTool):
 
             await ctx.info(f"Retrieving dashboards from Splunk (owner={owner}, app={app})")
 
-            # Build request parameters
-            params = {
-                "output_mode": "json",
-                "count": count,
-                "offset": offset,
-            }
-
             # Filter for dashboards only
             base_filter = "isDashboard=1"
-            if search_filter:
-                params["search"] = f"{base_filter} {search_filter}"
-            else:
-                params["search"] = base_filter
+            search = f"{base_filter} {search_filter}" if search_filter else base_filter
 
             # Get Splunk Web base URL from service
             splunk_host = service.host
@@ -128,16 +135,17 @@ class ListDashboards(BaseTool):
             web_scheme = "https"
             web_base = f"{web_scheme}://{splunk_host}:{web_port}"
 
-            # Call the REST endpoint
-            endpoint = f"/servicesNS/{owner}/{app}/data/ui/views"
-            response = service.get(endpoint, **params)
-
-            # Parse JSON response
-            response_body = response.body.read()
-            data = json.loads(response_body)
-
-            # Extract and format entries
-            entries = data.get("entry", [])
+            fields = VIEW_METADATA_FIELDS if lightweight else VIEW_METADATA_FIELDS + ["eai:data"]
+            listing = RestEntityListing(
+                service,
+                f"/servicesNS/{owner}/{app}/data/ui/views",
+                count=count,
+                offset=offset,
+                search=search,
+                fields=fields,
+            )
+            entries = list(listing)
+            types = self._resolve_types(service, f"/servicesNS/{owner}/{app}", entries)
             dashboards = []
 
             for entry in entries:
@@ -146,26 +154,7 @@ class ListDashboards(BaseTool):
                 dashboard_name = entry.get("name", "")
                 dashboard_app = acl.get("app", "")
 
-                # Detect dashboard type by checking eai:data
-                eai_data = content.get("eai:data", "")
-                dashboard_type = "classic"  # Default to classic Simple XML
-
-                if eai_data:
-                    # Dashboard Studio can be in two formats:
-                    # 1. Pure JSON (direct Studio format)
-                    # 2. Hybrid XML with <definition> tag containing JSON in CDATA
-
-                    # Check for hybrid format: <definition> tag (Dashboard Studio specific)
-                    if "<definition>" in eai_data:
-                        dashboard_type = "studio"
-                    else:
-                        # Try to parse as pure JSON (Dashboard Studio format)
-                        try:
-                            json.loads(eai_data)
-                            dashboard_type = "studio"
-                        except (json.JSONDecodeError, TypeError):
-                            # Falls back to classic XML
-                            dashboard_type = "classic"
+                dashboard_type = types[self._entry_key(entry)]
 
                 # Apply type filter
                 if type_filter != "any":
@@ -193,7 +182,7 @@ class ListDashboards(BaseTool):
                     "owner": acl.get("owner", ""),
                     "sharing": sharing,
                     "description": content.get("description", ""),
-                    "updated": content.get("updated", ""),
+                    "updated": entry_updated(entry),
                     "version": content.get("version", ""),
                     "permissions": {
                         "read": perms.get("read", []),
@@ -211,11 +200,12 @@ class ListDashboards(BaseTool):
                 {
                     "dashboards": dashboards,
                     "count": len(dashboards),
-                    "total_available": data.get("paging", {}).get("total", len(dashboards)),
-                    "offset": offset,
+                    "total_available": listing.total,
+                    **listing.paging(),
                     "type_filter": type_filter,
                     "private_only": private_only,
                     "owner_filter": owner,
+                    "lightweight": lightweight,
                 }
             )
 
@@ -232,3 +222,76 @@ class ListDashboards(BaseTool):
                 error_detail += " (Authentication failed - check credentials)"
 
             return self.format_error_response(error_detail)
+
+    @staticmethod
+    def _entry_key(entry: dict[str, Any]) -> str:
+        return entry.get("id") or entry.get("name", "")
+
+    def _resolve_types(
+        self, service, namespace: str, entries: list[dict[str, Any]]
+    ) -> dict[str, str]:
+        """
+        Classify listed dashboards as 'classic' or 'studio', keyed by entry id.
+
+        Uses the shared cache (keyed by the entry's updated timestamp), then view metadata,
+        then the definition. Definitions the listing did not include are fetched for all
+        remaining views together, DEFINITION_BATCH_SIZE views per request.
+        """
+        types: dict[str, str] = {}
+        undecided = []
+        for entry in entries:
+            key = self._entry_key(entry)
+            updated = entry_updated(entry)
+            cached = dashboard_definition_cache.get(key, updated)
+            if cached is not None:
+                types[key] = cached["type"]
+                continue
+            content = entry.get("content", {})
+            dashboard_type = classify_from_metadata(content)
+            if dashboard_type is None and "eai:data" in content:
+                dashboard_type = classify_definition(content.get("eai:data"))
+            if dashboard_type is None:
+                undecided.append(entry)
+                continue
+            dashboard_definition_cache.put(key, updated, dashboard_type)
+            types[key] = dashboard_type
+
+        definitions = self._fetch_definitions(service, namespace, undecided)
+        for entry in undecided:
+            key = self._entry_key(entry)
+            eai_data = definitions.get(key)
+            if eai_data is None:
+                # Transient failure: classify for this response only, retry next time
+                types[key] = classify_definition("")
+                continue
+            types[key] = classify_definition(eai_data)
+            dashboard_definition_cache.put(key, entry_updated(entry), types[key])
+        return types
+
+    def _fetch_definitions(
+        self, service, namespace: str, entries: list[dict[str, Any]]
+    ) -> dict[str, str]:
+        """Fetch only eai:data of the given views by name; views that failed are missing."""
+        definitions: dict[str, str] = {}
+        for start in range(0, len(entries), DEFINITION_BATCH_SIZE):
+            batch = entries[start : start + DEFINITION_BATCH_SIZE]
+            names = " OR ".join(f'name="{entry.get("name", "")}"' for entry in batch)
+            try:
+                listing = RestEntityListing(
+                    service,
+                    f"{namespace}/data/ui/views",
+                    search=f"({names})",
+                    fields=["eai:data"],
+                )
+                fetched = {
+                    self._entry_key(view): view.get("content", {}).get("eai:data", "")
+                    for view in listing
+                }
+            except Exception as e:  # pylint: disable=broad-except
+                self.logger.debug("Could not fetch definitions of %d views: %s", len(batch), e)
+                continue
+            # A view missing from the response has no definition we can read
+            for entry in batch:
+                key = self._entry_key(entry)
+                definitions[key] = fetched.get(key, "")
+        return definitions
@@ -5,6 +5,7 @@ These tools wrap existing resources and return embedded resources with actual co
 making them compatible with agentic frameworks that don't support MCP resources natively.
 """
 
+from .search_docs import SearchSplunkDocs
 from .splunk_docs_tools import (
     DiscoverSplunkDocs,
     GetAdminGuide,
@@ -33,4 +34,6 @@ __all__ = [
     "GetSPLReference",
     "GetTroubleshootingGuide",
     "GetAdminGuide",
+    # Full-text search
+    "SearchSplunkDocs",
 ]
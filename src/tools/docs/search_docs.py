@@ -0,0 +1,275 @@
+"""
+Full-text search over Splunk documentation.
+
+Agents often guess topic names for get_spl_reference, get_admin_guide and similar tools. This
+tool ranks documentation sections for a free-text query instead, over:
+
+- the topic catalogues behind the list_* documentation tools
+- embedded Splunk documentation and local Dashboard Studio reference files
+- every page held by the documentation cache (memory, disk and offline bundle)
+
+The index is built on first use and then kept current: pages fetched later are tokenized on a
+worker thread and added as soon as the documentation cache stores them.
+"""
+
+import asyncio
+import logging
+import re
+import time
+from pathlib import Path
+from typing import Any
+
+from fastmcp import Context
+
+from src.core.base import BaseTool, ToolMetadata
+from src.core.utils import log_tool_execution
+from src.resources.dashboard_studio_docs import DASHBOARD_STUDIO_TOPICS
+from src.resources.docs_cache import doc_cache
+from src.resources.docs_index import DocsSearchIndex
+from src.resources.embedded_splunk_docs import embedded_splunk_docs_registry
+from src.resources.splunk_cim import SplunkCIMResource
+from src.resources.splunk_docs import TroubleshootingResource
+
+from .splunk_docs_tools import ADMIN_TOPICS, COMMON_CONFIG_FILES, SPL_COMMANDS
+
+logger = logging.getLogger(__name__)
+
+MAX_TOP_K = 50
+REFERENCE_DIR = Path(__file__).resolve().parents[3] / "docs" / "reference"
+
+_SPL_URL = re.compile(
+    r"/spl-search-reference/(?P<version>[^/]+)/search-commands/(?P<command>[^/?#]+)"
+)
+_TROUBLESHOOT_URL = re.compile(r"/administer/troubleshoot/(?P<version>[^/]+)/(?P<path>[^?#]+)")
+_SPEC_URL = re.compile(r"/configuration-file-reference/[^/]+/(?P<config>[^/?#]+\.conf)$")
+_ADMIN_URL = re.compile(r"/en/splunk-enterprise/administer/(?P<topic>[^/?#]+)$")
+_CIM_URL = re.compile(r"/common-information-model/(?P<version>[^/]+)/data-models/(?P<slug>[^/?#]+)")
+
+_index: DocsSearchIndex | None = None
+_index_lock = asyncio.Lock()
+# Pages fetched while the index is being built, by URL; added once the build finishes
+_pending_pages: dict[str, str] = {}
+_index_tasks: set[asyncio.Future] = set()
+
+
+def resource_uri_for_url(url: str) -> str:
+    """Map a documentation page URL to the resource URI that renders it, if there is one."""
+    if match := _SPL_URL.search(url):
+        return f"splunk-docs://{match['version']}/spl-reference/{match['command']}"
+    if match := _TROUBLESHOOT_URL.search(url):
+        for topic, info in TroubleshootingResource.TROUBLESHOOTING_TOPICS.items():
+            if info["url_path"] == match["path"]:
+                return f"splunk-docs://{match['version']}/troubleshooting/{topic}"
+    if match := _SPEC_URL.search(url):
+        return f"splunk-spec://{match['config']}"
+    if match := _ADMIN_URL.search(url):
+        return f"splunk-docs://latest/admin/{match['topic']}"
+    if match := _CIM_URL.search(url):
+        for model, info in SplunkCIMResource.CIM_DATA_MODELS.items():
+            if match["slug"] in (info["url_slug"], info.get("url_slug_alt")):
+                return f"splunk-cim://{match['version']}/{model}"
+    for topic, info in DASHBOARD_STUDIO_TOPICS.items():
+        if info.get("url") == url:
+            return f"dashboard-studio://{topic}"
+    return url
+
+
+def _page_title(content: str, default: str) -> str:
+    for line in content.splitlines():
+        if line.startswith("# "):
+            return line[2:].strip()
+    return default
+
+
+def _catalog_documents() -> list[tuple[str, str, str]]:
+    """(uri, title, markdown) for every topic the list_* documentation tools advertise."""
+    documents = []
+    for cmd in SPL_COMMANDS:
+        documents.append(
+            (
+                f"splunk-docs://latest/spl-reference/{cmd['command']}",
+                f"SPL command: {cmd['command']}",
+                f'{cmd["description"]}. Use get_spl_reference("{cmd["command"]}").',
+            )
+        )
+    for topic in ADMIN_TOPICS:
+        documents.append(
+            (
+                f"splunk-docs://latest/admin/{topic['topic']}",
+                f"Admin guide: {topic['topic'].replace('-', ' ')}",
+                f'{topic["description"]}. Use get_admin_guide("{topic["topic"]}").',
+            )
+        )
+    for key, info in TroubleshootingResource.TROUBLESHOOTING_TOPICS.items():
+        documents.append(
+            (
+                f"splunk-docs://latest/troubleshooting/{key}",
+                f"Troubleshooting: {info['title']}",
+                f'{info["description"]}. Use get_troubleshooting_guide("{key}").',
+            )
+        )
+    for model, info in SplunkCIMResource.CIM_DATA_MODELS.items():
+        documents.append(
+            (
+                f"splunk-cim://latest/{model}",
+                f"CIM data model: {info['name']}",
+                f"{info['description']}. {info.get('use_case', '')} "
+                f'Tags: {", ".join(info.get("tags", []))}. Use get_cim_reference("{model}").',
+            )
+        )
+    for config, description in COMMON_CONFIG_FILES.items():
+        documents.append(
+            (
+                f"splunk-spec://{config}",
+                f"Configuration spec: {config}",
+                f'{description}. Use get_config_spec("{config}").',
+            )
+        )
+    for topic, info in DASHBOARD_STUDIO_TOPICS.items():
+        documents.append(
+            (
+                f"dashboard-studio://{topic}",
+                f"Dashboard Studio: {info['name']}",
+                f"{info['description']}. Tags: {', '.join(info.get('tags', []))}. "
+                f'Use get_studio_topic("{topic}").',
+            )
+        )
+    return documents
+
+
+def _local_documents() -> list[tuple[str, str, str]]:
+    """(uri, title, markdown) for embedded documentation and local reference files."""
+    documents = [
+        (resource.uri, resource.name, resource.embedded_content)
+        for resource in embedded_splunk_docs_registry.values()
+        if isinstance(resource.embedded_content, str)
+    ]
+    for topic, info in DASHBOARD_STUDIO_TOPICS.items():
+        path = REFERENCE_DIR / info.get("file", "")
+        if "file" in info and path.is_file():
+            # Replaces the shorter catalogue entry for the same topic
+            documents.append(
+                (
+                    f"dashboard-studio://{topic}",
+                    info["name"],
+                    f"{info['description']}\n\n{path.read_text('utf-8')}",
+                )
+            )
+    return documents
+
+
+def _add_pages(index: DocsSearchIndex, pages: dict[str, str]) -> None:
+    for url, content in pages.items():
+        uri = resource_uri_for_url(url)
+        index.add_document(uri, _page_title(content, uri), content)
+
+
+def _index_page(url: str, category: str, version: str, content: str | None) -> None:
+    """Documentation cache listener: add a fetched page to the index off the event loop."""
+    if content is None:
+        return
+    if _index is None:
+        _pending_pages[url] = content
+        return
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        # Not on the event loop (page stored from a worker thread); tokenize here
+        _add_pages(_index, {url: content})
+        return
+    task = loop.create_task(asyncio.to_thread(_add_pages, _index, {url: content}))
+    _index_tasks.add(task)
+    task.add_done_callback(_index_tasks.discard)
+
+
+def _build_index() -> DocsSearchIndex:
+    index = DocsSearchIndex()
+    for uri, title, markdown in _catalog_documents() + _local_documents():
+        index.add_document(uri, title, markdown)
+    _add_pages(
+        index, {url: content for url, _category, _version, content in doc_cache.cached_pages()}
+    )
+    return index
+
+
+async def get_docs_index() -> DocsSearchIndex:
+    """Return the shared documentation index, building it off the event loop on first use."""
+    global _index
+    if _index is not None:
+        return _index
+    async with _index_lock:
+        if _index is None:
+            started = time.perf_counter()
+            # Listen before taking the snapshot so pages fetched during the build are not lost
+            doc_cache.add_listener(_index_page)
+            try:
+                index = await asyncio.to_thread(_build_index)
+                while _pending_pages:
+                    pages = dict(_pending_pages)
+                    _pending_pages.clear()
+                    await asyncio.to_thread(_add_pages, index, pages)
+            except BaseException:
+                doc_cache.remove_listener(_index_page)
+                _pending_pages.clear()
+                raise
+            _index = index
+            logger.info(
+                "Built documentation search index in %.0f ms (%s)",
+                (time.perf_counter() - started) * 1000,
+                index.stats(),
+            )
+    return _index
+
+
+class SearchSplunkDocs(BaseTool):
+    """
+    Search Splunk documentation by free text.
+
+    Returns ranked documentation sections with the resource URI to read in full, so agents
+    can find the right command or topic without guessing exact names.
+    """
+
+    METADATA = ToolMetadata(
+        name="search_splunk_docs",
+        description=(
+            "Search Splunk documentation with a free-text query and get the best matching "
+            "sections, ranked by relevance (BM25). Covers SPL commands, admin, troubleshooting, "
+            "CIM data models, configuration spec files, Dashboard Studio and every page "
+            "fetched so far. Use this before get_spl_reference, get_admin_guide and similar "
+            "tools when you are unsure of the exact topic name.\n\n"
+            "Args:\n"
+            "    query (str): What you are looking for, e.g. 'count events per host over time'\n"
+            "    top_k (int, optional): Number of sections to return (1-50, default: 5)\n\n"
+            "Response: results with uri, title, section, score and snippet; pass the uri to "
+            "get_splunk_documentation to read the full page."
+        ),
+        category="documentation",
+        tags=["documentation", "search", "discovery"],
+        requires_connection=False,
+    )
+
+    async def execute(self, ctx: Context, query: str, top_k: int = 5) -> dict[str, Any]:
+        """Search the documentation index."""
+        log_tool_execution(self.name, query=query, top_k=top_k)
+
+        if not query or not query.strip():
+            return self.format_error_response("query must not be empty")
+        top_k = max(1, min(int(top_k), MAX_TOP_K))
+
+        try:
+            index = await get_docs_index()
+            started = time.perf_counter()
+            results = index.search(query, top_k)
+            return self.format_success_response(
+                {
+                    "query": query,
+                    "results": results,
+                    "result_count": len(results),
+                    "index": index.stats(),
+                    "took_ms": round((time.perf_counter() - started) * 1000, 2),
+                }
+            )
+        except Exception as e:
+            error_msg = f"Failed to search documentation: {str(e)}"
+            self.logger.error(error_msg)
+            return self.format_error_response(error_msg)
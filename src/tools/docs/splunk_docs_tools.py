@@ -8,16 +8,19 @@ with agentic frameworks that don't yet support MCP resources natively.
 
 import logging
 from typing import Any
+from urllib.parse import parse_qs, urlencode
 
 from fastmcp import Context
 
 from src.core.base import BaseTool, ToolMetadata
+from src.core.server_info import get_splunk_version
 from src.core.utils import log_tool_execution
 from src.resources.dashboard_studio_docs import (
     DASHBOARD_STUDIO_TOPICS,
     DashboardStudioDiscoveryResource,
     DashboardStudioDocsResource,
 )
+from src.resources.docs_sections import slice_document
 from src.resources.splunk_cim import (
     CIMDataModelResource,
     CIMDiscoveryResource,
@@ -34,6 +37,66 @@ from src.resources.splunk_docs import (
 
 logger = logging.getLogger(__name__)
 
+# Argument help shared by the tools that return a documentation page
+SLICE_ARGS_HELP = (
+    "    section (str, optional): Return only this section, by heading text or by anchor from "
+    "the 'toc' of an earlier response (e.g. 'examples')\n"
+    "    max_chars (int, optional): Split the page (or section) into pages of at most this "
+    "many characters\n"
+    "    page (int, optional): Page to return when max_chars is set (default: 1)\n"
+)
+
+
+def embedded_doc_response(
+    uri: str,
+    title: str,
+    content: str,
+    section: str | None = None,
+    max_chars: int | None = None,
+    page: int = 1,
+) -> dict[str, Any]:
+    """
+    Wrap documentation content as an embedded resource.
+
+    With section, max_chars or page the resource holds only that slice, and the response adds
+    the page's table of contents and the slice's position so the caller can ask for more.
+    """
+    sliced = bool(section or max_chars or page != 1)
+    view = slice_document(content, section, max_chars, page) if sliced else None
+    if view is not None:
+        query = urlencode(
+            {
+                key: value
+                for key, value in (
+                    ("section", view["anchor"]),
+                    ("max_chars", max_chars),
+                    ("page", page if page != 1 else None),
+                )
+                if value
+            }
+        )
+        uri = f"{uri}?{query}" if query else uri
+    response: dict[str, Any] = {
+        "content": [
+            {
+                "type": "resource",
+                "resource": {
+                    "uri": uri,
+                    "title": title,
+                    "mimeType": "text/markdown",
+                    "text": view["text"] if view else content,
+                },
+            }
+        ]
+    }
+    if view is not None:
+        response["section"] = view["section"]
+        response["pagination"] = {
+            key: view[key] for key in ("page", "pages", "chars", "total_chars", "document_chars")
+        }
+        response["toc"] = view["toc"]
+    return response
+
 
 # Common Splunk configuration files
 COMMON_CONFIG_FILES = {
@@ -59,6 +122,49 @@ COMMON_CONFIG_FILES = {
     "workflow_actions.conf": "Workflow action configurations",
 }
 
+# Common SPL commands listed by list_spl_commands
+SPL_COMMANDS = [
+    {"command": "stats", "description": "Statistical aggregation and analysis"},
+    {"command": "eval", "description": "Field calculation and manipulation"},
+    {"command": "search", "description": "Search filtering and field extraction"},
+    {"command": "timechart", "description": "Time-based charting and visualization"},
+    {"command": "chart", "description": "Chart creation and data visualization"},
+    {"command": "table", "description": "Table formatting and field display"},
+    {"command": "sort", "description": "Sort events by field values"},
+    {"command": "head", "description": "Return first N events"},
+    {"command": "tail", "description": "Return last N events"},
+    {"command": "rex", "description": "Regular expression field extraction"},
+    {"command": "lookup", "description": "Data enrichment from lookup tables"},
+    {"command": "join", "description": "Join events from multiple sources"},
+    {"command": "append", "description": "Append search results"},
+    {"command": "dedup", "description": "Remove duplicate events"},
+    {"command": "where", "description": "Filter events with boolean expressions"},
+    {"command": "bucket", "description": "Group events into time buckets"},
+    {"command": "top", "description": "Find most common field values"},
+    {"command": "rare", "description": "Find least common field values"},
+    {"command": "transaction", "description": "Group events into transactions"},
+    {"command": "subsearch", "description": "Use subsearch results in main search"},
+]
+
+# Admin guide topics listed by list_admin_topics
+ADMIN_TOPICS = [
+    {"topic": "indexes", "description": "Index management and configuration"},
+    {"topic": "authentication", "description": "Authentication and user management"},
+    {"topic": "deployment", "description": "Deployment and installation guides"},
+    {"topic": "apps", "description": "Application management and configuration"},
+    {"topic": "users", "description": "User and role management"},
+    {"topic": "roles", "description": "Role-based access control"},
+    {"topic": "monitoring", "description": "System monitoring and health checks"},
+    {"topic": "performance", "description": "Performance tuning and optimization"},
+    {"topic": "clustering", "description": "Clustering and high availability"},
+    {"topic": "distributed-search", "description": "Distributed search configuration"},
+    {"topic": "forwarders", "description": "Universal and heavy forwarder setup"},
+    {"topic": "inputs", "description": "Data input configuration"},
+    {"topic": "outputs", "description": "Data output configuration"},
+    {"topic": "licensing", "description": "License management"},
+    {"topic": "security", "description": "Security configuration and best practices"},
+]
+
 
 class ListAvailableTopics(BaseTool):
     """
@@ -447,23 +553,7 @@ class ListAdminTopics(BaseTool):
         log_tool_execution(self.name)
 
         try:
-            topics = [
-                {"topic": "indexes", "description": "Index management and configuration"},
-                {"topic": "authentication", "description": "Authentication and user management"},
-                {"topic": "deployment", "description": "Deployment and installation guides"},
-                {"topic": "apps", "description": "Application management and configuration"},
-                {"topic": "users", "description": "User and role management"},
-                {"topic": "roles", "description": "Role-based access control"},
-                {"topic": "monitoring", "description": "System monitoring and health checks"},
-                {"topic": "performance", "description": "Performance tuning and optimization"},
-                {"topic": "clustering", "description": "Clustering and high availability"},
-                {"topic": "distributed-search", "description": "Distributed search configuration"},
-                {"topic": "forwarders", "description": "Universal and heavy forwarder setup"},
-                {"topic": "inputs", "description": "Data input configuration"},
-                {"topic": "outputs", "description": "Data output configuration"},
-                {"topic": "licensing", "description": "License management"},
-                {"topic": "security", "description": "Security configuration and best practices"},
-            ]
+            topics = ADMIN_TOPICS
 
             content = f"""# Available Admin Guide Topics
 
@@ -547,28 +637,7 @@ class ListSPLCommands(BaseTool):
         log_tool_execution(self.name)
 
         try:
-            commands = [
-                {"command": "stats", "description": "Statistical aggregation and analysis"},
-                {"command": "eval", "description": "Field calculation and manipulation"},
-                {"command": "search", "description": "Search filtering and field extraction"},
-                {"command": "timechart", "description": "Time-based charting and visualization"},
-                {"command": "chart", "description": "Chart creation and data visualization"},
-                {"command": "table", "description": "Table formatting and field display"},
-                {"command": "sort", "description": "Sort events by field values"},
-                {"command": "head", "description": "Return first N events"},
-                {"command": "tail", "description": "Return last N events"},
-                {"command": "rex", "description": "Regular expression field extraction"},
-                {"command": "lookup", "description": "Data enrichment from lookup tables"},
-                {"command": "join", "description": "Join events from multiple sources"},
-                {"command": "append", "description": "Append search results"},
-                {"command": "dedup", "description": "Remove duplicate events"},
-                {"command": "where", "description": "Filter events with boolean expressions"},
-                {"command": "bucket", "description": "Group events into time buckets"},
-                {"command": "top", "description": "Find most common field values"},
-                {"command": "rare", "description": "Find least common field values"},
-                {"command": "transaction", "description": "Group events into transactions"},
-                {"command": "subsearch", "description": "Use subsearch results in main search"},
-            ]
+            commands = SPL_COMMANDS
 
             content = f"""# Common SPL Commands
 
@@ -657,8 +726,11 @@ class GetSplunkDocumentation(BaseTool):
             "        - 'dashboard-studio://discovery' - Dashboard Studio discovery\n"
             "        - 'splunk-spec://props.conf' - Config file specification\n"
             "    auto_detect_version (bool, optional): Whether to auto-detect Splunk version "
-            "for dynamic resources. Defaults to True.\n\n"
-            "Returns embedded resource with actual documentation content in markdown format.\n\n"
+            "for dynamic resources. Defaults to True.\n"
+            + SLICE_ARGS_HELP
+            + "\nReturns embedded resource with actual documentation content in markdown format. "
+            "With section, max_chars or page, only that slice is returned together with the "
+            "page's table of contents ('toc') and 'pagination'.\n\n"
             "💡 Tip: Use list_available_topics() to discover all available URI patterns and topics."
         ),
         category="documentation",
@@ -667,30 +739,40 @@ class GetSplunkDocumentation(BaseTool):
     )
 
     async def execute(
-        self, ctx: Context, doc_uri: str, auto_detect_version: bool = True
+        self,
+        ctx: Context,
+        doc_uri: str,
+        auto_detect_version: bool = True,
+        section: str | None = None,
+        max_chars: int | None = None,
+        page: int = 1,
     ) -> dict[str, Any]:
         """Execute documentation retrieval and return embedded resource."""
-        log_tool_execution(self.name, doc_uri=doc_uri, auto_detect_version=auto_detect_version)
+        log_tool_execution(
+            self.name,
+            doc_uri=doc_uri,
+            auto_detect_version=auto_detect_version,
+            section=section,
+            max_chars=max_chars,
+            page=page,
+        )
 
         try:
+            # Slicing may also be given as a query string: splunk-spec://props.conf?section=x
+            doc_uri, _, query = doc_uri.partition("?")
+            params = {key: values[0] for key, values in parse_qs(query).items()}
+            section = section or params.get("section")
+            max_chars = max_chars or int(params.get("max_chars") or 0) or None
+            page = page if page != 1 else int(params.get("page") or 1)
+
             # Parse the URI to determine resource type
             content = await self._get_documentation_content(ctx, doc_uri, auto_detect_version)
 
             # Return as embedded resource according to MCP specification
             return self.format_success_response(
-                {
-                    "content": [
-                        {
-                            "type": "resource",
-                            "resource": {
-                                "uri": doc_uri,
-                                "title": self._get_doc_title(doc_uri),
-                                "mimeType": "text/markdown",
-                                "text": content,
-                            },
-                        }
-                    ]
-                }
+                embedded_doc_response(
+                    doc_uri, self._get_doc_title(doc_uri), content, section, max_chars, page
+                )
             )
 
         except Exception as e:
@@ -723,7 +805,7 @@ class GetSplunkDocumentation(BaseTool):
 
                 # Auto-detect version if requested
                 if auto_detect_version and version in ["auto", "latest"]:
-                    version = await self._detect_splunk_version(ctx)
+                    version = await get_splunk_version(ctx, self)
 
                 # Route to appropriate resource
                 if doc_type == "spl-reference":
@@ -771,24 +853,6 @@ class GetSplunkDocumentation(BaseTool):
 
         raise ValueError(f"Unsupported documentation URI: {doc_uri}")
 
-    async def _detect_splunk_version(self, ctx: Context) -> str:
-        """Detect Splunk version from connected instance."""
-        try:
-            from src.tools.health.status import GetSplunkHealth
-
-            health_tool = GetSplunkHealth("get_splunk_health", "Get Splunk health status")
-            health_result = await health_tool.execute(ctx)
-
-            if (
-                health_result.get("status") == "success"
-                and health_result.get("data", {}).get("status") == "connected"
-            ):
-                return health_result["data"].get("version", "latest")
-        except Exception as e:
-            logger.warning(f"Failed to detect Splunk version: {e}")
-
-        return "latest"
-
     def _get_doc_title(self, doc_uri: str) -> str:
         """Generate appropriate title for documentation resource."""
         if doc_uri == "splunk-docs://cheat-sheet":
@@ -961,7 +1025,7 @@ class GetSPLReference(BaseTool):
             "        - '9.3' - Splunk 9.3 documentation\n"
             "        - 'latest' - Latest version (default)\n"
             "    auto_detect_version (bool, optional): Whether to auto-detect Splunk version "
-            "from connected instance. Defaults to True.\n\n"
+            "from connected instance. Defaults to True.\n" + SLICE_ARGS_HELP + "\n"
             "Returns embedded resource with detailed SPL command documentation.\n\n"
             "💡 Tip: Use list_spl_commands() to see common commands, but this tool supports "
             "many more SPL commands beyond the common ones listed."
@@ -972,17 +1036,30 @@ class GetSPLReference(BaseTool):
     )
 
     async def execute(
-        self, ctx: Context, command: str, version: str = "latest", auto_detect_version: bool = True
+        self,
+        ctx: Context,
+        command: str,
+        version: str = "latest",
+        auto_detect_version: bool = True,
+        section: str | None = None,
+        max_chars: int | None = None,
+        page: int = 1,
     ) -> dict[str, Any]:
         """Execute SPL reference retrieval and return embedded resource."""
         log_tool_execution(
-            self.name, command=command, version=version, auto_detect_version=auto_detect_version
+            self.name,
+            command=command,
+            version=version,
+            auto_detect_version=auto_detect_version,
+            section=section,
+            max_chars=max_chars,
+            page=page,
         )
 
         try:
             # Auto-detect version if requested
             if auto_detect_version and version in ["auto", "latest"]:
-                version = await self._detect_splunk_version(ctx)
+                version = await get_splunk_version(ctx, self)
 
             resource = SPLCommandResource(version, command)
             content = await resource.get_content(ctx)
@@ -990,19 +1067,9 @@ class GetSPLReference(BaseTool):
             uri = f"splunk-docs://{version}/spl-reference/{command}"
 
             return self.format_success_response(
-                {
-                    "content": [
-                        {
-                            "type": "resource",
-                            "resource": {
-                                "uri": uri,
-                                "title": f"SPL Reference: {command}",
-                                "mimeType": "text/markdown",
-                                "text": content,
-                            },
-                        }
-                    ]
-                }
+                embedded_doc_response(
+                    uri, f"SPL Reference: {command}", content, section, max_chars, page
+                )
             )
 
         except Exception as e:
@@ -1010,24 +1077,6 @@ class GetSPLReference(BaseTool):
             self.logger.error(error_msg)
             return self.format_error_response(error_msg)
 
-    async def _detect_splunk_version(self, ctx: Context) -> str:
-        """Detect Splunk version from connected instance."""
-        try:
-            from src.tools.health.status import GetSplunkHealth
-
-            health_tool = GetSplunkHealth("get_splunk_health", "Get Splunk health status")
-            health_result = await health_tool.execute(ctx)
-
-            if (
-                health_result.get("status") == "success"
-                and health_result.get("data", {}).get("status") == "connected"
-            ):
-                return health_result["data"].get("version", "latest")
-        except Exception as e:
-            logger.warning(f"Failed to detect Splunk version: {e}")
-
-        return "latest"
-
 
 class GetTroubleshootingGuide(BaseTool):
     """
@@ -1057,7 +1106,7 @@ class GetTroubleshootingGuide(BaseTool):
             "        - '9.3' - Splunk 9.3 documentation\n"
             "        - 'latest' - Latest version (default)\n"
             "    auto_detect_version (bool, optional): Whether to auto-detect Splunk version "
-            "from connected instance. Defaults to True.\n\n"
+            "from connected instance. Defaults to True.\n" + SLICE_ARGS_HELP + "\n"
             "Returns embedded resource with detailed troubleshooting guide.\n\n"
             "💡 Tip: Use list_troubleshooting_topics() to discover all available topics."
         ),
@@ -1067,17 +1116,30 @@ class GetTroubleshootingGuide(BaseTool):
     )
 
     async def execute(
-        self, ctx: Context, topic: str, version: str = "latest", auto_detect_version: bool = True
+        self,
+        ctx: Context,
+        topic: str,
+        version: str = "latest",
+        auto_detect_version: bool = True,
+        section: str | None = None,
+        max_chars: int | None = None,
+        page: int = 1,
     ) -> dict[str, Any]:
         """Execute troubleshooting guide retrieval and return embedded resource."""
         log_tool_execution(
-            self.name, topic=topic, version=version, auto_detect_version=auto_detect_version
+            self.name,
+            topic=topic,
+            version=version,
+            auto_detect_version=auto_detect_version,
+            section=section,
+            max_chars=max_chars,
+            page=page,
         )
 
         try:
             # Auto-detect version if requested
             if auto_detect_version and version in ["auto", "latest"]:
-                version = await self._detect_splunk_version(ctx)
+                version = await get_splunk_version(ctx, self)
 
             resource = TroubleshootingResource(version, topic)
             content = await resource.get_content(ctx)
@@ -1085,19 +1147,9 @@ class GetTroubleshootingGuide(BaseTool):
             uri = f"splunk-docs://{version}/troubleshooting/{topic}"
 
             return self.format_success_response(
-                {
-                    "content": [
-                        {
-                            "type": "resource",
-                            "resource": {
-                                "uri": uri,
-                                "title": f"Troubleshooting: {topic}",
-                                "mimeType": "text/markdown",
-                                "text": content,
-                            },
-                        }
-                    ]
-                }
+                embedded_doc_response(
+                    uri, f"Troubleshooting: {topic}", content, section, max_chars, page
+                )
             )
 
         except Exception as e:
@@ -1105,24 +1157,6 @@ class GetTroubleshootingGuide(BaseTool):
             self.logger.error(error_msg)
             return self.format_error_response(error_msg)
 
-    async def _detect_splunk_version(self, ctx: Context) -> str:
-        """Detect Splunk version from connected instance."""
-        try:
-            from src.tools.health.status import GetSplunkHealth
-
-            health_tool = GetSplunkHealth("get_splunk_health", "Get Splunk health status")
-            health_result = await health_tool.execute(ctx)
-
-            if (
-                health_result.get("status") == "success"
-                and health_result.get("data", {}).get("status") == "connected"
-            ):
-                return health_result["data"].get("version", "latest")
-        except Exception as e:
-            logger.warning(f"Failed to detect Splunk version: {e}")
-
-        return "latest"
-
 
 class GetAdminGuide(BaseTool):
     """
@@ -1155,7 +1189,7 @@ class GetAdminGuide(BaseTool):
             "        - '9.3' - Splunk 9.3 documentation\n"
             "        - 'latest' - Latest version (default)\n"
             "    auto_detect_version (bool, optional): Whether to auto-detect Splunk version "
-            "from connected instance. Defaults to True.\n\n"
+            "from connected instance. Defaults to True.\n" + SLICE_ARGS_HELP + "\n"
             "Returns embedded resource with detailed administration guide.\n\n"
             "💡 Tip: Use list_admin_topics() to discover all available topics."
         ),
@@ -1165,17 +1199,30 @@ class GetAdminGuide(BaseTool):
     )
 
     async def execute(
-        self, ctx: Context, topic: str, version: str = "latest", auto_detect_version: bool = True
+        self,
+        ctx: Context,
+        topic: str,
+        version: str = "latest",
+        auto_detect_version: bool = True,
+        section: str | None = None,
+        max_chars: int | None = None,
+        page: int = 1,
     ) -> dict[str, Any]:
         """Execute admin guide retrieval and return embedded resource."""
         log_tool_execution(
-            self.name, topic=topic, version=version, auto_detect_version=auto_detect_version
+            self.name,
+            topic=topic,
+            version=version,
+            auto_detect_version=auto_detect_version,
+            section=section,
+            max_chars=max_chars,
+            page=page,
         )
 
         try:
             # Auto-detect version if requested
             if auto_detect_version and version in ["auto", "latest"]:
-                version = await self._detect_splunk_version(ctx)
+                version = await get_splunk_version(ctx, self)
 
             resource = AdminGuideResource(version, topic)
             content = await resource.get_content(ctx)
@@ -1183,19 +1230,9 @@ class GetAdminGuide(BaseTool):
             uri = f"splunk-docs://{version}/admin/{topic}"
 
             return self.format_success_response(
-                {
-                    "content": [
-                        {
-                            "type": "resource",
-                            "resource": {
-                                "uri": uri,
-                                "title": f"Admin Guide: {topic}",
-                                "mimeType": "text/markdown",
-                                "text": content,
-                            },
-                        }
-                    ]
-                }
+                embedded_doc_response(
+                    uri, f"Admin Guide: {topic}", content, section, max_chars, page
+                )
             )
 
         except Exception as e:
@@ -1203,24 +1240,6 @@ class GetAdminGuide(BaseTool):
             self.logger.error(error_msg)
             return self.format_error_response(error_msg)
 
-    async def _detect_splunk_version(self, ctx: Context) -> str:
-        """Detect Splunk version from connected instance."""
-        try:
-            from src.tools.health.status import GetSplunkHealth
-
-            health_tool = GetSplunkHealth("get_splunk_health", "Get Splunk health status")
-            health_result = await health_tool.execute(ctx)
-
-            if (
-                health_result.get("status") == "success"
-                and health_result.get("data", {}).get("status") == "connected"
-            ):
-                return health_result["data"].get("version", "latest")
-        except Exception as e:
-            logger.warning(f"Failed to detect Splunk version: {e}")
-
-        return "latest"
-
 
 class ListCIMDataModels(BaseTool):
     """
@@ -1479,16 +1498,26 @@ class GetCIMReference(BaseTool):
             "    model (str): CIM data model name. Use list_cim_data_models() to see all "
             "available models. Examples: 'authentication', 'network-traffic', 'malware'\n"
             "    version (str, optional): CIM version (default: 'latest'). Options: "
-            "'6.1', '6.0', '5.3', '5.2', '5.1', 'latest'"
+            "'6.1', '6.0', '5.3', '5.2', '5.1', 'latest'\n" + SLICE_ARGS_HELP
         ),
         category="documentation",
         tags=["cim", "data-model", "reference", "embedded-resource"],
         requires_connection=False,
     )
 
-    async def execute(self, ctx: Context, model: str, version: str = "latest") -> dict[str, Any]:
+    async def execute(
+        self,
+        ctx: Context,
+        model: str,
+        version: str = "latest",
+        section: str | None = None,
+        max_chars: int | None = None,
+        page: int = 1,
+    ) -> dict[str, Any]:
         """Execute CIM reference retrieval and return embedded resource."""
-        log_tool_execution(self.name, model=model, version=version)
+        log_tool_execution(
+            self.name, model=model, version=version, section=section, max_chars=max_chars, page=page
+        )
 
         try:
             resource = CIMDataModelResource(version, model)
@@ -1497,19 +1526,9 @@ class GetCIMReference(BaseTool):
             uri = f"splunk-cim://{version}/{model}"
 
             return self.format_success_response(
-                {
-                    "content": [
-                        {
-                            "type": "resource",
-                            "resource": {
-                                "uri": uri,
-                                "title": f"CIM Data Model: {model}",
-                                "mimeType": "text/markdown",
-                                "text": content,
-                            },
-                        }
-                    ]
-                }
+                embedded_doc_response(
+                    uri, f"CIM Data Model: {model}", content, section, max_chars, page
+                )
             )
 
         except Exception as e:
@@ -1669,16 +1688,23 @@ class GetStudioTopic(BaseTool):
             "Args:\n"
             "    topic (str): Documentation topic. Use list_dashboard_studio_topics() to see "
             "available topics. Examples: 'cheatsheet', 'definition', 'visualizations', "
-            "'configuration', 'datasources', 'framework'"
+            "'configuration', 'datasources', 'framework'\n" + SLICE_ARGS_HELP
         ),
         category="documentation",
         tags=["dashboard-studio", "documentation", "embedded-resource"],
         requires_connection=False,
     )
 
-    async def execute(self, ctx: Context, topic: str) -> dict[str, Any]:
+    async def execute(
+        self,
+        ctx: Context,
+        topic: str,
+        section: str | None = None,
+        max_chars: int | None = None,
+        page: int = 1,
+    ) -> dict[str, Any]:
         """Execute Dashboard Studio topic retrieval and return embedded resource."""
-        log_tool_execution(self.name, topic=topic)
+        log_tool_execution(self.name, topic=topic, section=section, max_chars=max_chars, page=page)
 
         try:
             resource = DashboardStudioDocsResource(topic)
@@ -1687,19 +1713,9 @@ class GetStudioTopic(BaseTool):
             uri = f"dashboard-studio://{topic}"
 
             return self.format_success_response(
-                {
-                    "content": [
-                        {
-                            "type": "resource",
-                            "resource": {
-                                "uri": uri,
-                                "title": f"Dashboard Studio: {topic}",
-                                "mimeType": "text/markdown",
-                                "text": content,
-                            },
-                        }
-                    ]
-                }
+                embedded_doc_response(
+                    uri, f"Dashboard Studio: {topic}", content, section, max_chars, page
+                )
             )
 
         except Exception as e:
@@ -1846,16 +1862,25 @@ class GetConfigSpec(BaseTool):
             "Args:\n"
             "    config (str): Configuration file name (with or without .conf extension). "
             "Use list_config_files() to see common files. Examples: 'props.conf', "
-            "'transforms', 'indexes.conf'"
+            "'transforms', 'indexes.conf'\n" + SLICE_ARGS_HELP
         ),
         category="documentation",
         tags=["config", "spec", "reference", "embedded-resource"],
         requires_connection=False,
     )
 
-    async def execute(self, ctx: Context, config: str) -> dict[str, Any]:
+    async def execute(
+        self,
+        ctx: Context,
+        config: str,
+        section: str | None = None,
+        max_chars: int | None = None,
+        page: int = 1,
+    ) -> dict[str, Any]:
         """Execute config spec retrieval and return embedded resource."""
-        log_tool_execution(self.name, config=config)
+        log_tool_execution(
+            self.name, config=config, section=section, max_chars=max_chars, page=page
+        )
 
         try:
             resource = SplunkSpecReferenceResource(config)
@@ -1864,19 +1889,9 @@ class GetConfigSpec(BaseTool):
             uri = f"splunk-spec://{config}"
 
             return self.format_success_response(
-                {
-                    "content": [
-                        {
-                            "type": "resource",
-                            "resource": {
-                                "uri": uri,
-                                "title": f"Config Spec: {config}",
-                                "mimeType": "text/markdown",
-                                "text": content,
-                            },
-                        }
-                    ]
-                }
+                embedded_doc_response(
+                    uri, f"Config Spec: {config}", content, section, max_chars, page
+                )
             )
 
         except Exception as e:
@@ -7,6 +7,7 @@ from typing import Any
 from fastmcp import Context
 
 from src.core.base import BaseTool, ToolMetadata
+from src.core.server_info import connection_identity, parse_server_info, server_info_cache
 from src.core.utils import log_tool_execution
 
 
@@ -90,12 +91,19 @@ class GetSplunkHealth(BaseTool):
             service = await self.get_splunk_service(ctx, client_config)
 
             # If we got here, we have a working connection
+            server_info = service.info
             info = {
                 "status": "connected",
-                "version": service.info["version"],
-                "server_name": service.info.get("host", "unknown"),
+                "version": server_info["version"],
+                "server_name": server_info.get("host", "unknown"),
                 "connection_source": "client_config" if client_config else "server_config",
             }
+            # Documentation tools resolve their version from this cache
+            server_info_cache.put(
+                connection_identity(client_config or self.get_client_config_from_context(ctx)),
+                parse_server_info(server_info),
+                service,
+            )
 
             # splunklib.client.Service.get is synchronous and returns a Record object
             host_wide = service.get("/services/server/status/resource-usage/hostwide")
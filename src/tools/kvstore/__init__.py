@@ -3,6 +3,11 @@ KV Store tools for Splunk MCP server.
 """
 
 from .collections import CreateKvstoreCollection, ListKvstoreCollections
-from .data import GetKvstoreData
+from .data import GetKvstoreData, PutKvstoreDocuments
 
-__all__ = ["ListKvstoreCollections", "GetKvstoreData", "CreateKvstoreCollection"]
+__all__ = [
+    "ListKvstoreCollections",
+    "GetKvstoreData",
+    "PutKvstoreDocuments",
+    "CreateKvstoreCollection",
+]
@@ -5,10 +5,11 @@ Tools for managing Splunk KV Store collections.
 from typing import Any
 
 from fastmcp import Context
-from splunklib import client as spl_client
 from splunklib.binding import HTTPError
 
 from src.core.base import BaseTool, ToolMetadata
+from src.core.rest_listing import RestEntityListing, acl_filters
+from src.core.service_views import service_view
 from src.core.utils import log_tool_execution
 
 
@@ -22,22 +23,36 @@ class ListKvstoreCollections(BaseTool):
         description=(
             "List KV Store collections with basic schema details. Use this to discover available KV stores "
             "for lookups, configuration, or caching, optionally filtering by app.\n\n"
-            "Outputs: array of collections with name, fields, accelerated_fields, replicated; and total count.\n"
+            "Outputs: array of collections with name, app, fields, accelerated_fields, replicated; "
+            "count plus total/has_more/next_offset for paging.\n"
             "Security: results are constrained by the authenticated user's permissions."
             "Args:\n"
-            "    app (str, optional): Optional app name to filter collections\n\n"
+            "    app (str, optional): Optional app name to filter collections\n"
+            "    count (int, optional): Max results to return. 0=all (default: 0)\n"
+            "    offset (int, optional): Result offset for pagination (default: 0)\n"
+            "    search_filter (str, optional): REST search filter (e.g., 'name=*asset*')\n\n"
         ),
         category="kvstore",
         tags=["kvstore", "collections", "storage"],
         requires_connection=True,
     )
 
-    async def execute(self, ctx: Context, app: str | None = None) -> dict[str, Any]:
+    async def execute(
+        self,
+        ctx: Context,
+        app: str | None = None,
+        count: int = 0,
+        offset: int = 0,
+        search_filter: str = "",
+    ) -> dict[str, Any]:
         """
         List KV Store collections, optionally filtered by app.
 
         Args:
             app: Optional app name to filter collections
+            count: Maximum results (default: 0 for all)
+            offset: Pagination offset
+            search_filter: Optional REST search filter like 'name=*pattern*'
 
         Returns:
             Dict containing collections and their properties
@@ -53,38 +68,50 @@ class ListKvstoreCollections(BaseTool):
         await ctx.info(f"Retrieving KV Store collections for app: {app if app else 'all apps'}")
 
         try:
+            search = acl_filters(app=app)
+            if search_filter:
+                search.append(search_filter)
+            listing = RestEntityListing(
+                service,
+                f"/servicesNS/nobody/{app or '-'}/storage/collections/config",
+                count=count,
+                offset=offset,
+                search=search,
+                sort_key="name",
+            )
+
             collections = []
-            original_namespace = getattr(service, "namespace", None)
-            if app:
-                service.namespace = spl_client.namespace(app=app, owner="nobody", sharing="app")
-
-            try:
-                kvstore = service.kvstore
-                for collection in kvstore:
-                    # Derive fields from either 'fields' dict or 'field.<name>' entries
-                    content = collection.content or {}
-                    fields_dict = content.get("fields")
-                    if not fields_dict:
-                        fp = {
-                            k.split(".", 1)[1]: v
-                            for k, v in content.items()
-                            if isinstance(k, str) and k.startswith("field.")
-                        }
-                        fields_dict = fp if fp else {}
-                    collections.append(
-                        {
-                            "name": collection.name,
-                            "fields": fields_dict,
-                            "accelerated_fields": content.get("accelerated_fields", {}),
-                            "replicated": content.get("replicated", False),
-                        }
-                    )
-            finally:
-                service.namespace = original_namespace
+            for entry in listing:
+                # Derive fields from either 'fields' dict or 'field.<name>' entries
+                content = entry.get("content") or {}
+                fields_dict = content.get("fields")
+                if not fields_dict:
+                    fp = {
+                        k.split(".", 1)[1]: v
+                        for k, v in content.items()
+                        if isinstance(k, str) and k.startswith("field.")
+                    }
+                    fields_dict = fp if fp else {}
+                accelerated = content.get("accelerated_fields")
+                if not accelerated:
+                    accelerated = {
+                        k.split(".", 1)[1]: v
+                        for k, v in content.items()
+                        if isinstance(k, str) and k.startswith("accelerated_fields.")
+                    }
+                collections.append(
+                    {
+                        "name": entry.get("name"),
+                        "app": entry.get("acl", {}).get("app", ""),
+                        "fields": fields_dict,
+                        "accelerated_fields": accelerated,
+                        "replicated": content.get("replicate", content.get("replicated", False)),
+                    }
+                )
 
             await ctx.info(f"Found {len(collections)} collections")
             return self.format_success_response(
-                {"count": len(collections), "collections": collections}
+                {"count": len(collections), "collections": collections, **listing.paging()}
             )
         except Exception as e:
             self.logger.error(f"Failed to list KV Store collections: {str(e)}")
@@ -195,84 +222,77 @@ class CreateKvstoreCollection(BaseTool):
             if accelerated_fields:
                 collection_config["accelerated_fields"] = accelerated_fields
 
-            # Switch namespace to the target app (owner=nobody, sharing=app) for creation
-            original_namespace = getattr(service, "namespace", None)
-            service.namespace = spl_client.namespace(app=app, owner="nobody", sharing="app")
-            try:
-                # Create collection with robust handling (skip create if it already exists)
-                if collection in service.kvstore:
-                    new_collection = service.kvstore[collection]
-                else:
-                    try:
-                        # First try positional signature
-                        new_collection = service.kvstore.create(collection, **collection_config)
-                    except (TypeError, KeyError):
-                        # Retry using keyword name
-                        new_collection = service.kvstore.create(
-                            name=collection, **collection_config
-                        )
-                    except HTTPError as e:
-                        # Retry with 'fields' dict if REST-style params were not accepted
-                        if field_params and e.status == 400:
-                            fallback_config = {
-                                k: v
-                                for k, v in collection_config.items()
-                                if not k.startswith("field.")
-                            }
-                            fallback_config["fields"] = {
-                                k.split(".", 1)[1]: v for k, v in field_params.items()
-                            }
-                            try:
-                                new_collection = service.kvstore.create(
-                                    collection, **fallback_config
-                                )
-                            except (TypeError, KeyError):
-                                new_collection = service.kvstore.create(
-                                    name=collection, **fallback_config
-                                )
-                        elif e.status == 409:
-                            # Already exists - treat as idempotent success by returning existing collection
-                            new_collection = service.kvstore[collection]
-                        else:
-                            raise
-
-                # Ensure schema via update_field for each normalized field (best-effort)
-                if normalized_fields:
-                    for fname, ftype in normalized_fields.items():
+            # App-scoped view (owner=nobody, sharing=app); the shared service is left untouched
+            app_service = service_view(service, owner="nobody", app=app, sharing="app")
+            # Create collection with robust handling (skip create if it already exists)
+            if collection in app_service.kvstore:
+                new_collection = app_service.kvstore[collection]
+            else:
+                try:
+                    # First try positional signature
+                    new_collection = app_service.kvstore.create(collection, **collection_config)
+                except (TypeError, KeyError):
+                    # Retry using keyword name
+                    new_collection = app_service.kvstore.create(
+                        name=collection, **collection_config
+                    )
+                except HTTPError as e:
+                    # Retry with 'fields' dict if REST-style params were not accepted
+                    if field_params and e.status == 400:
+                        fallback_config = {
+                            k: v for k, v in collection_config.items() if not k.startswith("field.")
+                        }
+                        fallback_config["fields"] = {
+                            k.split(".", 1)[1]: v for k, v in field_params.items()
+                        }
                         try:
-                            new_collection.update_field(fname, ftype)
-                        except Exception:
-                            # Ignore schema update errors; surface only creation failures
-                            pass
-
-                # Optionally create a transforms.conf lookup definition in this app
-                lookup_info: dict[str, Any] | None = None
-                if create_lookup_definition:
-                    try:
-                        transforms = service.confs["transforms"]
-                        lookup_name = collection
-                        fields_list = (
-                            ", ".join(["_key"] + list(normalized_fields.keys()))
-                            if normalized_fields
-                            else "_key"
-                        )
-                        if lookup_name not in transforms:
-                            transforms.create(
-                                lookup_name,
-                                **{
-                                    "external_type": "kvstore",
-                                    "collection": collection,
-                                    "fields_list": fields_list,
-                                    "case_sensitive_match": "false",
-                                },
+                            new_collection = app_service.kvstore.create(
+                                collection, **fallback_config
+                            )
+                        except (TypeError, KeyError):
+                            new_collection = app_service.kvstore.create(
+                                name=collection, **fallback_config
                             )
-                        lookup_info = {"name": lookup_name, "fields_list": fields_list}
+                    elif e.status == 409:
+                        # Already exists - treat as idempotent success by returning existing collection
+                        new_collection = app_service.kvstore[collection]
+                    else:
+                        raise
+
+            # Ensure schema via update_field for each normalized field (best-effort)
+            if normalized_fields:
+                for fname, ftype in normalized_fields.items():
+                    try:
+                        new_collection.update_field(fname, ftype)
                     except Exception:
-                        # Non-fatal; continue without lookup creation data
-                        lookup_info = {"name": collection, "created": False}
-            finally:
-                # Restore original namespace
-                service.namespace = original_namespace
+                        # Ignore schema update errors; surface only creation failures
+                        pass
+
+            # Optionally create a transforms.conf lookup definition in this app
+            lookup_info: dict[str, Any] | None = None
+            if create_lookup_definition:
+                try:
+                    transforms = app_service.confs["transforms"]
+                    lookup_name = collection
+                    fields_list = (
+                        ", ".join(["_key"] + list(normalized_fields.keys()))
+                        if normalized_fields
+                        else "_key"
+                    )
+                    if lookup_name not in transforms:
+                        transforms.create(
+                            lookup_name,
+                            **{
+                                "external_type": "kvstore",
+                                "collection": collection,
+                                "fields_list": fields_list,
+                                "case_sensitive_match": "false",
+                            },
+                        )
+                    lookup_info = {"name": lookup_name, "fields_list": fields_list}
+                except Exception:
+                    # Non-fatal; continue without lookup creation data
+                    lookup_info = {"name": collection, "created": False}
 
             await ctx.info(f"Collection {collection} created successfully")
             return self.format_success_response(
@@ -1,14 +1,101 @@
 """
-Tool for retrieving data from Splunk KV Store collections.
+Tools for reading and writing data in Splunk KV Store collections.
+
+Environment variables:
+- MCP_KVSTORE_IMPORT_DIR (default: unset): directory that put_kvstore_documents may read
+  NDJSON files from; file imports are disabled when unset
 """
 
+import asyncio
+import json
+import os
+import time
+from collections.abc import Iterable, Iterator
+from pathlib import Path
 from typing import Any
 
 from fastmcp import Context
+from splunklib.binding import HTTPError
 
 from src.core.base import BaseTool, ToolMetadata
+from src.core.service_views import service_view
 from src.core.utils import log_tool_execution
 
+# Documents requested from the KV Store per round trip
+KVSTORE_PAGE_SIZE = 1000
+
+# Server-side cap on documents returned (or counted) by a single call
+MAX_KVSTORE_DOCUMENTS = 10000
+
+# limits.conf [kvstore] defaults, used when the server limits cannot be read
+DEFAULT_MAX_DOCUMENTS_PER_BATCH_SAVE = 1000
+DEFAULT_MAX_SIZE_PER_BATCH_SAVE_MB = 50
+
+# HTTP statuses worth retrying for a batch_save chunk
+TRANSIENT_HTTP_STATUSES = {429, 500, 502, 503, 504}
+
+NDJSON_SUFFIXES = (".ndjson", ".jsonl")
+
+
+def resolve_import_path(file_path: str) -> Path:
+    """
+    Resolve an NDJSON import path inside MCP_KVSTORE_IMPORT_DIR.
+
+    Relative paths are taken from the import directory. Raises ValueError when imports are
+    disabled or the path leaves the directory, is not an NDJSON file or does not exist.
+    """
+    import_dir = os.getenv("MCP_KVSTORE_IMPORT_DIR", "").strip()
+    if not import_dir:
+        raise ValueError(
+            "file_path imports are disabled; set MCP_KVSTORE_IMPORT_DIR to enable them"
+        )
+    base = Path(import_dir).expanduser().resolve()
+    path = (base / file_path).resolve()
+    if not path.is_relative_to(base):
+        raise ValueError("file_path must be inside MCP_KVSTORE_IMPORT_DIR")
+    if path.suffix.lower() not in NDJSON_SUFFIXES or not path.is_file():
+        raise ValueError(f"file_path must be an existing {' or '.join(NDJSON_SUFFIXES)} file")
+    return path
+
+
+def resolve_collection(service: Any, collection: str, app: str | None = None) -> Any:
+    """Return the splunklib KV Store collection object for a collection name, scoped to app."""
+    # A private view: Service.kvstore rewrites namespace.owner on whatever service it is read from
+    return service_view(service, owner="nobody", app=app or None).kvstore[collection]
+
+
+def _fields_param(fields: list[str] | str | None) -> str | None:
+    """KV Store ``fields`` projection: comma-separated names, ``name:0`` to exclude."""
+    if not fields:
+        return None
+    if isinstance(fields, str):
+        return fields
+    return ",".join(f for f in fields if f)
+
+
+def _sort_param(sort: list[str] | str | None) -> str | None:
+    """
+    KV Store ``sort`` expression.
+
+    Accepts the native ``field:1,other:-1`` syntax, or a list of names where a leading
+    ``-`` means descending (e.g. ``["-updated", "name"]``).
+    """
+    if not sort:
+        return None
+    if isinstance(sort, str):
+        return sort
+    keys = []
+    for key in sort:
+        if not key:
+            continue
+        if ":" in key:
+            keys.append(key)
+        elif key.startswith("-"):
+            keys.append(f"{key[1:]}:-1")
+        else:
+            keys.append(f"{key}:1")
+    return ",".join(keys) or None
+
 
 class GetKvstoreData(BaseTool):
     """
@@ -19,12 +106,21 @@ class GetKvstoreData(BaseTool):
         name="get_kvstore_data",
         description=(
             "Get documents from a KV Store collection with optional MongoDB-style query filtering. Use this "
-            "to fetch lookup/configuration data or narrow results by field values.\n\n"
+            "to fetch lookup/configuration data or narrow results by field values. Filtering, projection, "
+            "sorting and paging are applied by the KV Store, so only the requested page is transferred.\n\n"
             "Args:\n"
             "    collection (str): Collection name\n"
             "    app (str, optional): App where the collection resides (defaults to current/app context)\n"
-            '    query (object, optional): MongoDB-style filter object (e.g., {"status": "active"})\n\n'
-            "Outputs: 'documents' array and 'count'.\n"
+            '    query (object, optional): MongoDB-style filter object (e.g., {"status": "active"})\n'
+            "    limit (int, optional): Maximum documents to return (default: 100, capped at 10000; "
+            "0 = up to the cap)\n"
+            "    skip (int, optional): Documents to skip before the first one returned (default: 0). "
+            "Pass the previous response's next_skip to continue.\n"
+            '    fields (list[str], optional): Fields to return (e.g., ["_key", "user"]); use "name:0" to '
+            "exclude a field\n"
+            '    sort (list[str], optional): Sort keys, "-" prefix for descending (e.g., ["-updated", "user"])\n'
+            "    count_only (bool, optional): Only count matching documents (up to the cap) (default: False)\n\n"
+            "Outputs: 'documents' array, 'count', 'has_more' and 'next_skip'.\n"
             "Security: access and results are constrained by the authenticated user's permissions."
         ),
         category="kvstore",
@@ -33,7 +129,16 @@ class GetKvstoreData(BaseTool):
     )
 
     async def execute(
-        self, ctx: Context, collection: str, app: str | None = None, query: dict | None = None
+        self,
+        ctx: Context,
+        collection: str,
+        app: str | None = None,
+        query: dict | None = None,
+        limit: int = 100,
+        skip: int = 0,
+        fields: list[str] | None = None,
+        sort: list[str] | None = None,
+        count_only: bool = False,
     ) -> dict[str, Any]:
         """
         Retrieve data from a KV Store collection.
@@ -42,11 +147,26 @@ class GetKvstoreData(BaseTool):
             collection: Name of the collection to retrieve data from
             app: Optional app name where the collection resides
             query: Optional MongoDB-style query filter
+            limit: Maximum number of documents to return (0 = up to the server-side cap)
+            skip: Number of matching documents to skip
+            fields: Optional field projection
+            sort: Optional sort keys ("-" prefix for descending)
+            count_only: Return only the number of matching documents
 
         Returns:
-            Dict containing retrieved documents
+            Dict containing retrieved documents and the continuation cursor
         """
-        log_tool_execution("get_kvstore_data", collection=collection, app=app, query=query)
+        log_tool_execution(
+            "get_kvstore_data",
+            collection=collection,
+            app=app,
+            query=query,
+            limit=limit,
+            skip=skip,
+            fields=fields,
+            sort=sort,
+            count_only=count_only,
+        )
 
         is_available, service, error_msg = self.check_splunk_available(ctx)
 
@@ -57,27 +177,388 @@ class GetKvstoreData(BaseTool):
         await ctx.info(f"Retrieving data from KV Store collection: {collection}")
 
         try:
-            # Get the collection from the appropriate app context
-            if app:
-                kvstore = service.kvstore[app]
-            else:
-                kvstore = service.kvstore
+            collection_obj = resolve_collection(service, collection, app)
 
-            collection_obj = kvstore[collection]
+            skip = max(0, int(skip or 0))
+            limit = int(limit or 0)
+            if limit <= 0 or limit > MAX_KVSTORE_DOCUMENTS:
+                limit = MAX_KVSTORE_DOCUMENTS
 
-            # Retrieve data with optional query filter
+            params: dict[str, Any] = {}
             if query:
-                documents = collection_obj.data.query(**query)
+                # The SDK JSON-encodes dict values, so the filter is sent as query={...}
+                params["query"] = query
+            if count_only:
+                # Only keys are transferred when counting
+                params["fields"] = "_key"
             else:
-                documents = collection_obj.data.query()
+                projection = _fields_param(fields)
+                if projection:
+                    params["fields"] = projection
+            sort_expr = _sort_param(sort)
+            if sort_expr and not count_only:
+                params["sort"] = sort_expr
 
-            # Convert to list for response
-            doc_list = list(documents)
+            documents, has_more = self._read_pages(collection_obj, params, skip, limit)
 
-            await ctx.info(f"Retrieved {len(doc_list)} documents from collection {collection}")
-            return self.format_success_response({"count": len(doc_list), "documents": doc_list})
+            if count_only:
+                await ctx.info(f"Counted {len(documents)} documents in collection {collection}")
+                return self.format_success_response(
+                    {
+                        "count": len(documents),
+                        "count_only": True,
+                        "capped": has_more,
+                        "skip": skip,
+                    }
+                )
+
+            next_skip = skip + len(documents) if has_more else None
+            await ctx.info(f"Retrieved {len(documents)} documents from collection {collection}")
+            return self.format_success_response(
+                {
+                    "count": len(documents),
+                    "documents": documents,
+                    "skip": skip,
+                    "limit": limit,
+                    "has_more": has_more,
+                    "next_skip": next_skip,
+                }
+            )
 
         except Exception as e:
             self.logger.error(f"Failed to retrieve KV Store data: {str(e)}")
             await ctx.error(f"Failed to retrieve KV Store data: {str(e)}")
             return self.format_error_response(str(e))
+
+    def _read_pages(
+        self, collection_obj: Any, params: dict[str, Any], skip: int, limit: int
+    ) -> tuple[list[dict[str, Any]], bool]:
+        """
+        Read up to ``limit`` documents starting at ``skip``, one KV Store page at a time.
+
+        The last page asks for one extra document so ``has_more`` is exact without a
+        separate count request.
+
+        Returns:
+            (documents, has_more)
+        """
+        documents: list[dict[str, Any]] = []
+        position = skip
+        while len(documents) < limit:
+            remaining = limit - len(documents)
+            request = min(KVSTORE_PAGE_SIZE, remaining)
+            lookahead = 1 if request == remaining else 0
+            page = list(
+                collection_obj.data.query(limit=request + lookahead, skip=position, **params)
+            )
+            if len(page) > request:
+                documents.extend(page[:request])
+                return documents, True
+            documents.extend(page)
+            position += len(page)
+            if len(page) < request:
+                return documents, False
+        return documents, False
+
+
+class InvalidLineError(ValueError):
+    """A line of an NDJSON import file that is not a JSON object."""
+
+    def __init__(self, message: str, line_number: int):
+        super().__init__(message)
+        self.line_number = line_number
+
+
+def iter_ndjson_documents(path: Path) -> Iterator[dict[str, Any]]:
+    """Yield documents from an NDJSON file, skipping blank lines."""
+    with path.open("r", encoding="utf-8") as handle:
+        for line_number, line in enumerate(handle, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                document = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise InvalidLineError(
+                    f"Invalid JSON on line {line_number} of {path.name}: {e}", line_number
+                ) from e
+            if not isinstance(document, dict):
+                raise InvalidLineError(
+                    f"Line {line_number} of {path.name} is not a JSON object", line_number
+                )
+            yield document
+
+
+def chunk_documents(
+    documents: Iterable[dict[str, Any]], max_documents: int, max_bytes: int
+) -> Iterator[tuple[int, list[dict[str, Any]]]]:
+    """
+    Split documents into batch_save chunks bounded by document count and JSON size.
+
+    Yields:
+        (offset of the chunk's first document, chunk)
+    """
+    chunk: list[dict[str, Any]] = []
+    chunk_bytes = 2  # enclosing []
+    offset = 0
+    for document in documents:
+        size = len(json.dumps(document, separators=(",", ":"))) + 1
+        if chunk and (len(chunk) >= max_documents or chunk_bytes + size > max_bytes):
+            yield offset, chunk
+            offset += len(chunk)
+            chunk, chunk_bytes = [], 2
+        chunk.append(document)
+        chunk_bytes += size
+    if chunk:
+        yield offset, chunk
+
+
+def _is_transient(error: Exception) -> bool:
+    if isinstance(error, HTTPError):
+        return error.status in TRANSIENT_HTTP_STATUSES
+    # ConnectionError and TimeoutError are both OSError subclasses
+    return isinstance(error, OSError)
+
+
+class PutKvstoreDocuments(BaseTool):
+    """
+    Bulk insert or update documents in a KV Store collection.
+    """
+
+    METADATA = ToolMetadata(
+        name="put_kvstore_documents",
+        description=(
+            "Bulk insert or update documents in a KV Store collection using batch_save. Documents are split "
+            "into chunks sized to the server's limits.conf [kvstore] max_documents_per_batch_save and "
+            "max_size_per_batch_save_mb and submitted with bounded concurrency. "
+            "Documents with an existing _key are updated; others are inserted. A chunk is retried on transient "
+            "errors only when every document in it has a _key, since a retried insert could duplicate "
+            "documents.\n\n"
+            "Args:\n"
+            "    collection (str): Collection name\n"
+            "    app (str, optional): App where the collection resides (defaults to current/app context)\n"
+            "    documents (list[object], optional): Documents to save\n"
+            "    file_path (str, optional): Path to a .ndjson/.jsonl file, one JSON document per line, inside "
+            "the server's MCP_KVSTORE_IMPORT_DIR (used instead of documents)\n"
+            "    batch_size (int, optional): Documents per chunk; 0 uses the server limit (default: 0)\n"
+            "    concurrency (int, optional): Chunks in flight at once, 1-16 (default: 4)\n"
+            "    max_retries (int, optional): Retries per keyed chunk on transient errors (default: 3)\n\n"
+            "Outputs: documents_saved, chunk counts, failed_chunks with offsets and errors, and throughput. "
+            "A malformed file line stops the import with an error that reports invalid_line and what "
+            "was saved before it.\n"
+            "Security: writes are constrained by the authenticated user's permissions."
+        ),
+        category="kvstore",
+        tags=["kvstore", "data", "write", "bulk", "storage"],
+        requires_connection=True,
+    )
+
+    async def execute(
+        self,
+        ctx: Context,
+        collection: str,
+        app: str | None = None,
+        documents: list[dict[str, Any]] | None = None,
+        file_path: str = "",
+        batch_size: int = 0,
+        concurrency: int = 4,
+        max_retries: int = 3,
+    ) -> dict[str, Any]:
+        """
+        Save documents to a KV Store collection in concurrent batch_save chunks.
+
+        Args:
+            collection: Name of the target collection
+            app: Optional app name where the collection resides
+            documents: Documents to save
+            file_path: NDJSON file in MCP_KVSTORE_IMPORT_DIR to read documents from instead
+            batch_size: Documents per chunk (0 = server limit)
+            concurrency: Maximum chunks submitted at once
+            max_retries: Retries per chunk for transient failures
+
+        Returns:
+            Dict with saved counts, per-chunk failures and throughput
+        """
+        log_tool_execution(
+            "put_kvstore_documents",
+            collection=collection,
+            app=app,
+            documents=len(documents or []),
+            file_path=file_path,
+            batch_size=batch_size,
+            concurrency=concurrency,
+        )
+
+        is_available, service, error_msg = self.check_splunk_available(ctx)
+
+        if not is_available:
+            return self.format_error_response(error_msg)
+
+        if documents and file_path:
+            return self.format_error_response("Provide either documents or file_path, not both")
+        if not documents and not file_path:
+            return self.format_error_response("documents or file_path is required")
+
+        source: Iterable[dict[str, Any]]
+        if file_path:
+            try:
+                path = resolve_import_path(file_path)
+            except ValueError as e:
+                return self.format_error_response(str(e))
+            source = iter_ndjson_documents(path)
+        else:
+            if not all(isinstance(document, dict) for document in documents or []):
+                return self.format_error_response("Every document must be a JSON object")
+            source = documents or []
+
+        self.logger.info(f"Saving documents to KV Store collection: {collection}")
+        await ctx.info(f"Saving documents to KV Store collection: {collection}")
+
+        try:
+            collection_obj = resolve_collection(service, collection, app)
+
+            server_max_documents, server_max_bytes = self._batch_save_limits(service)
+            max_documents = server_max_documents
+            if batch_size and batch_size > 0:
+                max_documents = min(int(batch_size), server_max_documents)
+            concurrency = min(max(1, int(concurrency or 1)), 16)
+
+            semaphore = asyncio.Semaphore(concurrency)
+            pending: set[asyncio.Task] = set()
+            outcomes: list[dict[str, Any]] = []
+            started = time.perf_counter()
+
+            async def submit(index: int, offset: int, chunk: list[dict[str, Any]]) -> None:
+                try:
+                    outcomes.append(
+                        await self._save_chunk(collection_obj, index, offset, chunk, max_retries)
+                    )
+                finally:
+                    semaphore.release()
+
+            # Chunks are produced lazily so a large NDJSON file is never fully in memory; reading
+            # and parsing each chunk happens on a worker thread, off the event loop
+            chunks = chunk_documents(source, max_documents, server_max_bytes)
+            index = 0
+            invalid_line: InvalidLineError | None = None
+            try:
+                while (next_chunk := await asyncio.to_thread(next, chunks, None)) is not None:
+                    offset, chunk = next_chunk
+                    await semaphore.acquire()
+                    task = asyncio.create_task(submit(index, offset, chunk))
+                    pending.add(task)
+                    task.add_done_callback(pending.discard)
+                    index += 1
+            except InvalidLineError as e:
+                # Submit nothing past the bad line; chunks already sent still complete below
+                invalid_line = e
+            finally:
+                # Never leave batch_save calls running after the response
+                if pending:
+                    await asyncio.gather(*pending)
+
+            elapsed = time.perf_counter() - started
+            outcomes.sort(key=lambda outcome: outcome["index"])
+            submitted = sum(outcome["size"] for outcome in outcomes)
+            saved = sum(outcome["saved"] for outcome in outcomes)
+            failed_chunks = [
+                {k: outcome[k] for k in ("index", "offset", "size", "attempts", "error")}
+                for outcome in outcomes
+                if outcome["error"]
+            ]
+
+            summary = {
+                "collection": collection,
+                "documents_submitted": submitted,
+                "documents_saved": saved,
+                "chunks": len(outcomes),
+                "chunk_size": max_documents,
+                "concurrency": concurrency,
+                "retries": sum(outcome["attempts"] - 1 for outcome in outcomes),
+                "failed_chunks": failed_chunks,
+                "elapsed_seconds": round(elapsed, 3),
+                "documents_per_second": round(saved / elapsed, 1) if elapsed > 0 else None,
+            }
+
+            if invalid_line is not None:
+                await ctx.error(
+                    f"Stopped at {invalid_line}; saved {saved}/{submitted} documents before it"
+                )
+                return self.format_error_response(
+                    str(invalid_line), invalid_line=invalid_line.line_number, **summary
+                )
+
+            await ctx.info(
+                f"Saved {saved}/{submitted} documents to {collection} in {len(outcomes)} chunks"
+            )
+            return self.format_success_response(summary)
+
+        except Exception as e:
+            self.logger.error(f"Failed to save KV Store documents: {str(e)}")
+            await ctx.error(f"Failed to save KV Store documents: {str(e)}")
+            return self.format_error_response(str(e))
+
+    async def _save_chunk(
+        self,
+        collection_obj: Any,
+        index: int,
+        offset: int,
+        chunk: list[dict[str, Any]],
+        max_retries: int,
+    ) -> dict[str, Any]:
+        """
+        Submit one chunk via batch_save, retrying transient failures with backoff.
+
+        Only chunks whose documents all carry a ``_key`` are retried: a failed request may
+        still have been applied, and retrying keyless inserts would store them twice.
+        """
+        retryable = all("_key" in document for document in chunk)
+        attempts = 0
+        while True:
+            attempts += 1
+            try:
+                keys = await asyncio.to_thread(collection_obj.data.batch_save, *chunk)
+                saved = len(keys) if isinstance(keys, list) else len(chunk)
+                return {
+                    "index": index,
+                    "offset": offset,
+                    "size": len(chunk),
+                    "saved": saved,
+                    "attempts": attempts,
+                    "error": None,
+                }
+            except Exception as e:
+                if retryable and attempts <= max_retries and _is_transient(e):
+                    delay = min(0.5 * 2 ** (attempts - 1), 8.0)
+                    self.logger.warning(
+                        "batch_save chunk %d failed (attempt %d), retrying in %.1fs: %s",
+                        index,
+                        attempts,
+                        delay,
+                        e,
+                    )
+                    await asyncio.sleep(delay)
+                    continue
+                self.logger.error("batch_save chunk %d failed: %s", index, e)
+                return {
+                    "index": index,
+                    "offset": offset,
+                    "size": len(chunk),
+                    "saved": 0,
+                    "attempts": attempts,
+                    "error": str(e),
+                }
+
+    def _batch_save_limits(self, service: Any) -> tuple[int, int]:
+        """Read max documents and bytes per batch_save from limits.conf [kvstore]."""
+        max_documents = DEFAULT_MAX_DOCUMENTS_PER_BATCH_SAVE
+        max_mb = DEFAULT_MAX_SIZE_PER_BATCH_SAVE_MB
+        try:
+            response = service.get("/services/configs/conf-limits/kvstore", output_mode="json")
+            entries = json.loads(response.body.read() or b"{}").get("entry", [])
+            content = entries[0].get("content", {}) if entries else {}
+            max_documents = int(content.get("max_documents_per_batch_save") or max_documents)
+            max_mb = int(content.get("max_size_per_batch_save_mb") or max_mb)
+        except Exception as e:
+            self.logger.debug("Using default batch_save limits: %s", e)
+        return max(1, max_documents), max(1, max_mb) * 1024 * 1024
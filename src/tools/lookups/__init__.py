@@ -4,5 +4,6 @@ Splunk lookup tools for managing CSV lookup files and definitions.
 
 from src.tools.lookups.list_lookup_definitions import ListLookupDefinitions
 from src.tools.lookups.list_lookup_files import ListLookupFiles
+from src.tools.lookups.read_lookup import ReadLookup
 
-__all__ = ["ListLookupFiles", "ListLookupDefinitions"]
+__all__ = ["ListLookupFiles", "ListLookupDefinitions", "ReadLookup"]
@@ -2,12 +2,12 @@
 List lookup definitions (transforms) from Splunk.
 """
 
-import json
 from typing import Any
 
 from fastmcp import Context
 
 from src.core.base import BaseTool, ToolMetadata
+from src.core.rest_listing import RestEntityListing
 from src.core.utils import log_tool_execution
 
 
@@ -31,13 +31,28 @@ class ListLookupDefinitions(BaseTool):
             "    app (str, optional): Filter by app context. Default: '-' (all apps)\n"
             "    count (int, optional): Max results to return. 0=all, default: 50 for performance\n"
             "    offset (int, optional): Result offset for pagination. Default: 0\n"
-            "    search_filter (str, optional): Filter results (e.g., 'filename=*.csv')"
+            "    search_filter (str, optional): Filter results (e.g., 'filename=*.csv')\n"
+            "    sort_key (str, optional): Field to sort by. Default: 'name'\n\n"
+            "Response includes total, has_more and next_offset for paging."
         ),
         category="lookups",
         tags=["lookups", "transforms", "knowledge", "list"],
         requires_connection=True,
     )
 
+    LIST_FIELDS = [
+        "filename",
+        "type",
+        "match_type",
+        "fields_list",
+        "external_cmd",
+        "external_type",
+        "min_matches",
+        "max_matches",
+        "default_match",
+        "case_sensitive_match",
+    ]
+
     async def execute(
         self,
         ctx: Context,
@@ -46,6 +61,7 @@ class ListLookupDefinitions(BaseTool):
         count: int = 50,
         offset: int = 0,
         search_filter: str = "",
+        sort_key: str = "name",
     ) -> dict[str, Any]:
         """
         List lookup definitions from Splunk.
@@ -56,10 +72,11 @@ class ListLookupDefinitions(BaseTool):
             count: Maximum results (default: 50 for performance, 0 for all)
             offset: Pagination offset
             search_filter: Optional search filter
+            sort_key: Field to sort by on the server (default: name)
 
         Returns:
-            Dict with status and list of lookup definition metadata, includes total_available
-            for pagination info
+            Dict with status and list of lookup definition metadata, includes total_available,
+            has_more and next_offset for pagination info
         """
         log_tool_execution(
             "list_lookup_definitions",
@@ -68,6 +85,7 @@ class ListLookupDefinitions(BaseTool):
             count=count,
             offset=offset,
             search_filter=search_filter,
+            sort_key=sort_key,
         )
 
         is_available, service, error_msg = self.check_splunk_available(ctx)
@@ -79,29 +97,18 @@ class ListLookupDefinitions(BaseTool):
         try:
             await ctx.info(f"Retrieving lookup definitions from Splunk (owner={owner}, app={app})")
 
-            # Build request parameters
-            params = {
-                "output_mode": "json",
-                "count": count,
-                "offset": offset,
-            }
-
-            if search_filter:
-                params["search"] = search_filter
-
-            # Call the REST endpoint
-            endpoint = f"/servicesNS/{owner}/{app}/data/transforms/lookups"
-            response = service.get(endpoint, **params)
-
-            # Parse JSON response
-            response_body = response.body.read()
-            data = json.loads(response_body)
-
-            # Extract and format entries
-            entries = data.get("entry", [])
+            listing = RestEntityListing(
+                service,
+                f"/servicesNS/{owner}/{app}/data/transforms/lookups",
+                count=count,
+                offset=offset,
+                search=search_filter,
+                sort_key=sort_key,
+                fields=self.LIST_FIELDS,
+            )
             definitions = []
 
-            for entry in entries:
+            for entry in listing:
                 content = entry.get("content", {})
                 acl = entry.get("acl", {})
 
@@ -120,7 +127,7 @@ class ListLookupDefinitions(BaseTool):
                     "app": acl.get("app", ""),
                     "owner": acl.get("owner", ""),
                     "sharing": acl.get("sharing", ""),
-                    "updated": content.get("updated", ""),
+                    "updated": entry.get("updated", content.get("updated", "")),
                     "permissions": {
                         "read": acl.get("perms", {}).get("read", []),
                         "write": acl.get("perms", {}).get("write", []),
@@ -136,8 +143,8 @@ class ListLookupDefinitions(BaseTool):
                 {
                     "lookup_definitions": definitions,
                     "count": len(definitions),
-                    "total_available": data.get("paging", {}).get("total", len(definitions)),
-                    "offset": offset,
+                    "total_available": listing.total,
+                    **listing.paging(),
                 }
             )
 
@@ -2,12 +2,12 @@
 List lookup CSV files from Splunk.
 """
 
-import json
 from typing import Any
 
 from fastmcp import Context
 
 from src.core.base import BaseTool, ToolMetadata
+from src.core.rest_listing import RestEntityListing
 from src.core.utils import log_tool_execution
 
 
@@ -17,7 +17,7 @@ class ListLookupFiles(BaseTool):
 
     Retrieves metadata about lookup table files including name, filename, app context,
     owner, permissions, and last updated time. Use this to discover available lookup
-    files before querying their contents with the run_splunk_search tool.
+    files before reading their contents with the read_lookup tool.
     """
 
     METADATA = ToolMetadata(
@@ -25,20 +25,23 @@ class ListLookupFiles(BaseTool):
         description=(
             "List CSV lookup table files in Splunk. Returns metadata including name, filename, "
             "app, owner, sharing/permissions, and last updated time. Use this to discover available "
-            "lookup files. To view the actual CSV content, use run_splunk_search with "
-            "'| inputlookup <filename>'.\n\n"
+            "lookup files. To view the actual CSV content, use read_lookup with the file name.\n\n"
             "Args:\n"
             "    owner (str, optional): Filter by owner. Default: 'nobody' (all users)\n"
             "    app (str, optional): Filter by app context. Default: '-' (all apps)\n"
             "    count (int, optional): Max results to return. 0=all, default: 50 for performance\n"
             "    offset (int, optional): Result offset for pagination. Default: 0\n"
-            "    search_filter (str, optional): Filter results (e.g., 'name=*geo*')"
+            "    search_filter (str, optional): Filter results (e.g., 'name=*geo*')\n"
+            "    sort_key (str, optional): Field to sort by. Default: 'name'\n\n"
+            "Response includes total, has_more and next_offset for paging."
         ),
         category="lookups",
         tags=["lookups", "csv", "knowledge", "list"],
         requires_connection=True,
     )
 
+    LIST_FIELDS = ["filename", "size"]
+
     async def execute(
         self,
         ctx: Context,
@@ -47,6 +50,7 @@ class ListLookupFiles(BaseTool):
         count: int = 50,
         offset: int = 0,
         search_filter: str = "",
+        sort_key: str = "name",
     ) -> dict[str, Any]:
         """
         List lookup CSV files from Splunk.
@@ -57,10 +61,11 @@ class ListLookupFiles(BaseTool):
             count: Maximum results (default: 50 for performance, 0 for all)
             offset: Pagination offset
             search_filter: Optional search filter like 'name=*pattern*'
+            sort_key: Field to sort by on the server (default: name)
 
         Returns:
-            Dict with status and list of lookup file metadata, includes total_available
-            for pagination info
+            Dict with status and list of lookup file metadata, includes total_available,
+            has_more and next_offset for pagination info
         """
         log_tool_execution(
             "list_lookup_files",
@@ -69,6 +74,7 @@ class ListLookupFiles(BaseTool):
             count=count,
             offset=offset,
             search_filter=search_filter,
+            sort_key=sort_key,
         )
 
         is_available, service, error_msg = self.check_splunk_available(ctx)
@@ -80,29 +86,18 @@ class ListLookupFiles(BaseTool):
         try:
             await ctx.info(f"Retrieving lookup files from Splunk (owner={owner}, app={app})")
 
-            # Build request parameters
-            params = {
-                "output_mode": "json",
-                "count": count,
-                "offset": offset,
-            }
-
-            if search_filter:
-                params["search"] = search_filter
-
-            # Call the REST endpoint
-            endpoint = f"/servicesNS/{owner}/{app}/data/lookup-table-files"
-            response = service.get(endpoint, **params)
-
-            # Parse JSON response
-            response_body = response.body.read()
-            data = json.loads(response_body)
-
-            # Extract and format entries
-            entries = data.get("entry", [])
+            listing = RestEntityListing(
+                service,
+                f"/servicesNS/{owner}/{app}/data/lookup-table-files",
+                count=count,
+                offset=offset,
+                search=search_filter,
+                sort_key=sort_key,
+                fields=self.LIST_FIELDS,
+            )
             lookup_files = []
 
-            for entry in entries:
+            for entry in listing:
                 content = entry.get("content", {})
                 acl = entry.get("acl", {})
 
@@ -112,7 +107,7 @@ class ListLookupFiles(BaseTool):
                     "app": acl.get("app", ""),
                     "owner": acl.get("owner", ""),
                     "sharing": acl.get("sharing", ""),
-                    "updated": content.get("updated", ""),
+                    "updated": entry.get("updated", content.get("updated", "")),
                     "size": content.get("size", 0),
                     "permissions": {
                         "read": acl.get("perms", {}).get("read", []),
@@ -129,8 +124,8 @@ class ListLookupFiles(BaseTool):
                 {
                     "lookup_files": lookup_files,
                     "count": len(lookup_files),
-                    "total_available": data.get("paging", {}).get("total", len(lookup_files)),
-                    "offset": offset,
+                    "total_available": listing.total,
+                    **listing.paging(),
                 }
             )
 
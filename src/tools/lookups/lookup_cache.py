@@ -0,0 +1,173 @@
+"""
+Columnar cache of lookup table contents and the row filter used by ReadLookup.
+
+A lookup's rows are fetched once (with ``| inputlookup``) and stored column by column,
+keyed by the lookup file's REST id and only valid for the ``updated`` timestamp reported by
+``/data/lookup-table-files``. Reads of an unchanged lookup are paged, projected and filtered
+locally without dispatching a search.
+"""
+
+import fnmatch
+import re
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any
+
+# Rows read from Splunk per lookup; larger lookups are cached truncated
+MAX_LOOKUP_ROWS = 50000
+
+# Total cells (rows x columns) held across all cached lookups
+MAX_CACHED_CELLS = 5_000_000
+
+
+class LookupTable:
+    """Lookup rows stored as one list per column."""
+
+    __slots__ = ("columns", "data", "row_count", "truncated")
+
+    def __init__(self, rows: list[dict[str, Any]], truncated: bool = False):
+        columns: dict[str, None] = {}
+        for row in rows:
+            for column in row:
+                if not column.startswith("_"):
+                    columns.setdefault(column)
+        self.columns = list(columns)
+        self.data = {column: [row.get(column) for row in rows] for column in self.columns}
+        self.row_count = len(rows)
+        self.truncated = truncated
+
+    @property
+    def cells(self) -> int:
+        return self.row_count * max(1, len(self.columns))
+
+    def row(self, index: int, columns: list[str]) -> dict[str, Any]:
+        return {column: self.data[column][index] for column in columns}
+
+
+class LookupTableCache:
+    """
+    Thread-safe LRU of LookupTable objects bounded by total cell count.
+
+    Entries are keyed by the lookup file's REST id and are only valid for the ``updated``
+    timestamp they were stored with.
+    """
+
+    def __init__(self, max_cells: int = MAX_CACHED_CELLS):
+        self.max_cells = max_cells
+        self._entries: OrderedDict[str, tuple[str, LookupTable]] = OrderedDict()
+        self._cells = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str, updated: str) -> LookupTable | None:
+        """Return the cached table for key if it matches updated, else None."""
+        with self._lock:
+            record = self._entries.get(key)
+            if record is None or record[0] != updated:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return record[1]
+
+    def put(self, key: str, updated: str, table: LookupTable) -> None:
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._cells -= previous[1].cells
+            if table.cells > self.max_cells:
+                return
+            self._entries[key] = (updated, table)
+            self._cells += table.cells
+            while self._cells > self.max_cells:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._cells -= evicted.cells
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._cells = 0
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "cells": self._cells,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+# Shared by all ReadLookup calls
+lookup_table_cache = LookupTableCache()
+
+
+_CONDITION = re.compile(
+    r"""^\s*(?P<field>[^\s=!<>]+)\s*(?P<op>!=|>=|<=|=|>|<)\s*(?P<value>"[^"]*"|'[^']*'|\S*)\s*$"""
+)
+_AND = re.compile(r"\s+AND\s+", re.IGNORECASE)
+
+
+def _as_number(value: Any) -> float | None:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _compile_condition(op: str, value: str) -> Callable[[Any], bool]:
+    def matcher(cell: Any) -> bool:
+        cell_text = "" if cell is None else str(cell)
+        if op in ("=", "!="):
+            if "*" in value:
+                matched = fnmatch.fnmatchcase(cell_text.lower(), value.lower())
+            else:
+                matched = cell_text.lower() == value.lower()
+            return matched if op == "=" else not matched
+        left, right = _as_number(cell_text), _as_number(value)
+        if left is None or right is None:
+            left, right = cell_text, value  # type: ignore[assignment]
+        if op == ">":
+            return left > right
+        if op == ">=":
+            return left >= right
+        if op == "<":
+            return left < right
+        return left <= right
+
+    return matcher
+
+
+def compile_where(where: str) -> Callable[[LookupTable, int], bool]:
+    """
+    Compile a simple row filter.
+
+    Supports ``field<op>value`` conditions joined with ``AND``, where ``<op>`` is one of
+    ``= != > >= < <=``. ``=``/``!=`` compare case-insensitively and accept ``*`` wildcards;
+    the ordering operators compare numerically when both sides are numbers.
+
+    Raises:
+        ValueError: if the expression cannot be parsed
+    """
+    conditions = []
+    for part in _AND.split(where.strip()):
+        match = _CONDITION.match(part)
+        if not match:
+            raise ValueError(f"Unsupported where condition: {part!r}")
+        value = match["value"]
+        if len(value) >= 2 and value[0] == value[-1] and value[0] in "\"'":
+            value = value[1:-1]
+        conditions.append((match["field"], _compile_condition(match["op"], value)))
+
+    def predicate(table: LookupTable, index: int) -> bool:
+        for field, matcher in conditions:
+            column = table.data.get(field)
+            if not matcher(column[index] if column is not None else None):
+                return False
+        return True
+
+    return predicate
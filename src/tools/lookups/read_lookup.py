@@ -0,0 +1,197 @@
+"""
+Read rows from a Splunk CSV lookup file.
+"""
+
+import json
+from typing import Any
+
+from fastmcp import Context
+from splunklib.results import JSONResultsReader
+
+from src.core.base import BaseTool, ToolMetadata
+from src.core.service_views import service_view
+from src.core.utils import log_tool_execution
+from src.tools.lookups.lookup_cache import (
+    MAX_LOOKUP_ROWS,
+    LookupTable,
+    compile_where,
+    lookup_table_cache,
+)
+
+# Maximum rows returned by a single call
+MAX_PAGE_ROWS = 10000
+
+
+class ReadLookup(BaseTool):
+    """
+    Read the rows of a CSV lookup file with paging, projection and simple filtering.
+
+    Lookup contents are fetched once with ``| inputlookup`` and cached in columnar form,
+    keyed by the file's ``updated`` timestamp. Later reads of an unchanged lookup cost one
+    metadata request and no search dispatch.
+    """
+
+    METADATA = ToolMetadata(
+        name="read_lookup",
+        description=(
+            "Read rows from a CSV lookup table file with paging, field selection and simple filtering. "
+            "Use this instead of writing '| inputlookup' searches by hand. Contents are cached per lookup "
+            "and reused until the file's updated timestamp changes, so repeated reads do not dispatch "
+            "searches.\n\n"
+            "Args:\n"
+            "    lookup (str): Lookup file name as returned by list_lookup_files (e.g., 'geo_attr_countries.csv')\n"
+            "    owner (str, optional): Owner namespace. Default: 'nobody'\n"
+            "    app (str, optional): App namespace. Default: '-' (any app)\n"
+            "    offset (int, optional): Index of the first matching row to return. Default: 0\n"
+            "    limit (int, optional): Max rows to return (max 10000). Default: 100\n"
+            '    fields (list[str], optional): Columns to return (e.g., ["country", "iso2"]). Default: all\n'
+            "    where (str, optional): Row filter of field<op>value conditions joined with AND; ops are "
+            "= != > >= < <=, '*' wildcards with = and != (e.g., 'country=Fr* AND population>1000000')\n\n"
+            "Response includes columns, rows, total_matching, has_more and next_offset for paging."
+        ),
+        category="lookups",
+        tags=["lookups", "csv", "knowledge", "read"],
+        requires_connection=True,
+    )
+
+    async def execute(
+        self,
+        ctx: Context,
+        lookup: str,
+        owner: str = "nobody",
+        app: str = "-",
+        offset: int = 0,
+        limit: int = 100,
+        fields: list[str] | None = None,
+        where: str = "",
+    ) -> dict[str, Any]:
+        """
+        Read rows from a lookup file.
+
+        Args:
+            lookup: Lookup file name
+            owner: Owner namespace (default: nobody)
+            app: App namespace (default: - for any)
+            offset: Index of the first matching row to return
+            limit: Maximum rows to return
+            fields: Columns to return (default: all)
+            where: Simple row filter, e.g. "status=active AND score>=50"
+
+        Returns:
+            Dict with the requested rows and paging information
+        """
+        log_tool_execution(
+            "read_lookup",
+            lookup=lookup,
+            owner=owner,
+            app=app,
+            offset=offset,
+            limit=limit,
+            fields=fields,
+            where=where,
+        )
+
+        is_available, service, error_msg = self.check_splunk_available(ctx)
+
+        if not is_available:
+            await ctx.error(f"Read lookup failed: {error_msg}")
+            return self.format_error_response(error_msg)
+
+        lookup = (lookup or "").strip()
+        if not lookup:
+            return self.format_error_response("lookup is required")
+
+        try:
+            predicate = compile_where(where) if where and where.strip() else None
+        except ValueError as e:
+            return self.format_error_response(str(e))
+
+        offset = max(0, int(offset or 0))
+        limit = int(limit or 0)
+        if limit <= 0 or limit > MAX_PAGE_ROWS:
+            limit = MAX_PAGE_ROWS
+
+        try:
+            entry = self._lookup_entry(service, owner, app, lookup)
+            if entry is None:
+                error_msg = f"Lookup file '{lookup}' not found (owner={owner}, app={app})"
+                await ctx.error(error_msg)
+                return self.format_error_response(error_msg)
+
+            acl = entry.get("acl", {}) or {}
+            key = entry.get("id") or f"{acl.get('owner')}/{acl.get('app')}/{lookup}"
+            updated = str(entry.get("updated") or entry.get("content", {}).get("updated") or "")
+
+            table = lookup_table_cache.get(key, updated)
+            cache_hit = table is not None
+            if table is None:
+                await ctx.info(f"Loading lookup '{lookup}' from Splunk")
+                table = self._load_table(service, entry, lookup)
+                lookup_table_cache.put(key, updated, table)
+
+            columns = table.columns
+            if fields:
+                unknown = [f for f in fields if f not in table.data]
+                if unknown:
+                    return self.format_error_response(
+                        f"Unknown lookup fields: {', '.join(unknown)}", columns=table.columns
+                    )
+                columns = list(fields)
+
+            if predicate is None:
+                matching = range(table.row_count)
+            else:
+                matching = [i for i in range(table.row_count) if predicate(table, i)]
+            page = matching[offset : offset + limit]
+            rows = [table.row(index, columns) for index in page]
+            next_offset = offset + len(rows)
+            has_more = next_offset < len(matching)
+
+            await ctx.info(f"Read {len(rows)} rows from lookup '{lookup}'")
+            return self.format_success_response(
+                {
+                    "lookup": lookup,
+                    "app": acl.get("app", ""),
+                    "owner": acl.get("owner", ""),
+                    "updated": updated,
+                    "columns": columns,
+                    "rows": rows,
+                    "count": len(rows),
+                    "total_rows": table.row_count,
+                    "total_matching": len(matching),
+                    "offset": offset,
+                    "has_more": has_more,
+                    "next_offset": next_offset if has_more else None,
+                    "truncated": table.truncated,
+                    "cache": {"hit": cache_hit},
+                }
+            )
+
+        except Exception as e:  # pylint: disable=broad-except
+            self.logger.error("Failed to read lookup: %s", str(e), exc_info=True)
+            await ctx.error(f"Failed to read lookup: {str(e)}")
+            return self.format_error_response(str(e))
+
+    def _lookup_entry(
+        self, service: Any, owner: str, app: str, lookup: str
+    ) -> dict[str, Any] | None:
+        """Fetch the lookup file's REST entry (metadata only) to learn its namespace and updated."""
+        response = service.get(
+            f"/servicesNS/{owner}/{app}/data/lookup-table-files/{lookup}",
+            output_mode="json",
+            f=["filename", "size"],
+        )
+        body = response.body.read()
+        entries = (json.loads(body) if body else {}).get("entry", []) or []
+        return entries[0] if entries else None
+
+    def _load_table(self, service: Any, entry: dict[str, Any], lookup: str) -> LookupTable:
+        """Read all rows (up to MAX_LOOKUP_ROWS) with one inputlookup in the file's namespace."""
+        acl = entry.get("acl", {}) or {}
+        scoped = service_view(service, owner=acl.get("owner") or None, app=acl.get("app") or None)
+        filename = entry.get("name") or lookup
+        query = f'| inputlookup max={MAX_LOOKUP_ROWS + 1} "{filename}"'
+        stream = scoped.jobs.oneshot(query, output_mode="json", count=0)
+        rows = [row for row in JSONResultsReader(stream) if isinstance(row, dict)]
+        truncated = len(rows) > MAX_LOOKUP_ROWS
+        return LookupTable(rows[:MAX_LOOKUP_ROWS], truncated=truncated)
@@ -5,16 +5,51 @@ Provides comprehensive functionality for managing and executing Splunk saved sea
 including listing, executing, creating, updating, and deleting saved searches.
 """
 
+import re
 import time
+from datetime import datetime
 from typing import Any, Literal
 
 from fastmcp import Context
 from splunklib.results import JSONResultsReader
 
 from src.core.base import BaseTool, ToolMetadata
+from src.core.rest_listing import RestEntityListing, acl_filters
+from src.core.service_views import service_view
 from src.core.utils import log_tool_execution, sanitize_search_query
 
 
+def find_saved_search(
+    service: Any, name: str, app: str | None = None, owner: str | None = None
+) -> Any | None:
+    """
+    Look up a saved search by name, optionally constrained to an app and/or owner.
+
+    With app/owner the lookup runs against a namespace view of the service, so only that one
+    entity is fetched and the shared connection's namespace is never switched. Falls back to
+    scanning all saved searches when the name is not found (or is ambiguous) in that view.
+    """
+
+    def acl_matches(saved_search: Any) -> bool:
+        acl = saved_search.content.get("eai:acl", {}) or {}
+        if app and acl.get("app") != app:
+            return False
+        if owner and acl.get("owner") != owner:
+            return False
+        return True
+
+    scoped = service_view(service, owner=owner or "-", app=app or "-") if app or owner else service
+    try:
+        saved_search = scoped.saved_searches[name]
+    except (KeyError, ValueError):
+        # ValueError: the name exists in more than one namespace visible to the view
+        for saved_search in service.saved_searches:
+            if saved_search.name == name and acl_matches(saved_search):
+                return saved_search
+        return None
+    return saved_search if acl_matches(saved_search) else None
+
+
 class ListSavedSearches(BaseTool):
     """
     List saved searches available in the Splunk environment with filtering options.
@@ -26,18 +61,36 @@ class ListSavedSearches(BaseTool):
         description=(
             "List saved searches with ownership, schedule, visibility, and permission metadata. "
             "Use this to discover available reports/automations and to filter by owner/app/sharing. "
+            "Filtering, sorting and paging run on the Splunk server. "
             "Results reflect only saved searches the current user can access.\n\n"
             "Args:\n"
             "    owner (str, optional): Filter by owner name (optional)\n"
             "    app (str, optional): Filter by application name (optional)\n"
             "    sharing (str, optional): Filter by sharing level (optional)\n"
-            "    include_disabled (bool, optional): Include disabled saved searches (default: False)\n\n"
+            "    include_disabled (bool, optional): Include disabled saved searches (default: False)\n"
+            "    count (int, optional): Max results to return. 0=all (default: 0)\n"
+            "    offset (int, optional): Result offset for pagination (default: 0)\n"
+            "    search_filter (str, optional): REST search filter (e.g., 'name=*error*')\n"
+            "    sort_key (str, optional): Field to sort by (default: 'name')\n\n"
         ),
         category="search",
         tags=["saved_searches", "list", "metadata"],
         requires_connection=True,
     )
 
+    # Content fields requested from the server (f= projection)
+    LIST_FIELDS = [
+        "search",
+        "description",
+        "disabled",
+        "is_scheduled",
+        "is_visible",
+        "cron_schedule",
+        "next_scheduled_time",
+        "dispatch.earliest_time",
+        "dispatch.latest_time",
+    ]
+
     async def execute(
         self,
         ctx: Context,
@@ -45,6 +98,10 @@ class ListSavedSearches(BaseTool):
         app: str | None = None,
         sharing: Literal["user", "app", "global", "system"] | None = None,
         include_disabled: bool = False,
+        count: int = 0,
+        offset: int = 0,
+        search_filter: str = "",
+        sort_key: str = "name",
     ) -> dict[str, Any]:
         """
         List saved searches with optional filtering.
@@ -54,12 +111,17 @@ class ListSavedSearches(BaseTool):
             app: Filter by application name (optional)
             sharing: Filter by sharing level (optional)
             include_disabled: Include disabled saved searches (default: False)
+            count: Maximum results (default: 0 for all)
+            offset: Pagination offset
+            search_filter: Optional REST search filter like 'name=*pattern*'
+            sort_key: Field to sort by on the server (default: name)
 
         Returns:
             Dict containing:
                 - saved_searches: List of saved search metadata
-                - total_count: Total number of saved searches found
-                - filtered_count: Number after applying filters
+                - total_count: Total number of saved searches matching the filters
+                - filtered_count: Number returned in this page
+                - total, offset, has_more, next_offset: Paging information
 
         Example:
             list_saved_searches(owner="admin", app="search", include_disabled=True)
@@ -73,69 +135,64 @@ class ListSavedSearches(BaseTool):
 
         try:
             await ctx.info("Retrieving saved searches list")
-            saved_searches_list = []
-            total_count = 0
-
-            for saved_search in service.saved_searches:
-                total_count += 1
-
-                # Extract saved search metadata
-                search_info = {
-                    "name": saved_search.name,
-                    "search": saved_search.content.get("search", ""),
-                    "description": saved_search.content.get("description", ""),
-                    "owner": saved_search.content.get("eai:acl", {}).get("owner", ""),
-                    "app": saved_search.content.get("eai:acl", {}).get("app", ""),
-                    "sharing": saved_search.content.get("eai:acl", {}).get("sharing", ""),
-                    "disabled": self._convert_splunk_boolean(
-                        saved_search.content.get("disabled"), False
-                    ),
-                    "is_scheduled": self._convert_splunk_boolean(
-                        saved_search.content.get("is_scheduled"), False
-                    ),
-                    "is_visible": self._convert_splunk_boolean(
-                        saved_search.content.get("is_visible"), True
-                    ),
-                    "cron_schedule": saved_search.content.get("cron_schedule", ""),
-                    "next_scheduled_time": saved_search.content.get("next_scheduled_time", ""),
-                    "earliest_time": saved_search.content.get("dispatch.earliest_time", ""),
-                    "latest_time": saved_search.content.get("dispatch.latest_time", ""),
-                    "updated": saved_search.content.get("updated", ""),
-                    "permissions": {
-                        "read": saved_search.content.get("eai:acl", {})
-                        .get("perms", {})
-                        .get("read", []),
-                        "write": saved_search.content.get("eai:acl", {})
-                        .get("perms", {})
-                        .get("write", []),
-                    },
-                }
-
-                # Apply filters
-                if owner and search_info["owner"] != owner:
-                    continue
-                if app and search_info["app"] != app:
-                    continue
-                if sharing and search_info["sharing"] != sharing:
-                    continue
-                if not include_disabled and search_info["disabled"]:
-                    continue
 
-                saved_searches_list.append(search_info)
+            search = acl_filters(owner=owner, app=app, sharing=sharing)
+            if not include_disabled:
+                search.append("disabled=0")
+            if search_filter:
+                search.append(search_filter)
+
+            listing = RestEntityListing(
+                service,
+                "/servicesNS/-/-/saved/searches",
+                count=count,
+                offset=offset,
+                search=search,
+                sort_key=sort_key,
+                fields=self.LIST_FIELDS,
+            )
 
-            # Sort by name for consistent output
-            saved_searches_list.sort(key=lambda x: x["name"])
+            saved_searches_list = []
+            for entry in listing:
+                content = entry.get("content", {})
+                acl = entry.get("acl", {})
+                saved_searches_list.append(
+                    {
+                        "name": entry.get("name", ""),
+                        "search": content.get("search", ""),
+                        "description": content.get("description", ""),
+                        "owner": acl.get("owner", ""),
+                        "app": acl.get("app", ""),
+                        "sharing": acl.get("sharing", ""),
+                        "disabled": self._convert_splunk_boolean(content.get("disabled"), False),
+                        "is_scheduled": self._convert_splunk_boolean(
+                            content.get("is_scheduled"), False
+                        ),
+                        "is_visible": self._convert_splunk_boolean(content.get("is_visible"), True),
+                        "cron_schedule": content.get("cron_schedule", ""),
+                        "next_scheduled_time": content.get("next_scheduled_time", ""),
+                        "earliest_time": content.get("dispatch.earliest_time", ""),
+                        "latest_time": content.get("dispatch.latest_time", ""),
+                        "updated": entry.get("updated", content.get("updated", "")),
+                        "permissions": {
+                            "read": acl.get("perms", {}).get("read", []),
+                            "write": acl.get("perms", {}).get("write", []),
+                        },
+                    }
+                )
 
             return self.format_success_response(
                 {
                     "saved_searches": saved_searches_list,
-                    "total_count": total_count,
+                    "total_count": listing.total,
                     "filtered_count": len(saved_searches_list),
+                    **listing.paging(),
                     "filters_applied": {
                         "owner": owner,
                         "app": app,
                         "sharing": sharing,
                         "include_disabled": include_disabled,
+                        "search_filter": search_filter or None,
                     },
                 }
             )
@@ -169,6 +226,10 @@ class ExecuteSavedSearch(BaseTool):
             "execute existing reports/automations quickly. Choose 'oneshot' for immediate results or "
             "'job' for progress tracking and large result sets.\\n\\n"
             "Outputs: results list (capped by max_results), mode used, timing, and job id (if job).\\n"
+            "Set prefer_cached=True to reuse the most recent successful scheduled run of the report "
+            "when it is younger than max_age seconds; results are then read from that artifact "
+            "(page with offset) instead of dispatching a new search. The response reports the "
+            "artifact sid and age.\\n"
             "Security: execution and results are constrained by the authenticated user's permissions."
         ),
         category="search",
@@ -186,6 +247,9 @@ class ExecuteSavedSearch(BaseTool):
         max_results: int = 100,
         app: str | None = None,
         owner: str | None = None,
+        prefer_cached: bool = False,
+        max_age: int = 3600,
+        offset: int = 0,
     ) -> dict[str, Any]:
         """
         Execute a saved search by name.
@@ -198,15 +262,20 @@ class ExecuteSavedSearch(BaseTool):
             max_results: Maximum number of results to return (default: 100)
             app: Application context for the saved search (optional)
             owner: Owner context for the saved search (optional)
+            prefer_cached: Reuse the latest successful scheduled artifact when fresh enough
+                instead of dispatching (default: False). Ignored when time overrides are given.
+            max_age: Maximum artifact age in seconds accepted by prefer_cached (default: 3600)
+            offset: Result offset for paging through a cached artifact (default: 0)
 
         Returns:
             Dict containing:
                 - saved_search_name: Name of the executed saved search
                 - results: List of search results
                 - results_count: Number of results returned
-                - execution_mode: Mode used for execution
-                - job_id: Search job ID (if job mode)
+                - execution_mode: Mode used for execution ('cached' when an artifact was reused)
+                - job_id: Search job ID (if job or cached mode)
                 - duration: Execution time in seconds
+                - cache: Artifact lookup outcome when prefer_cached=True (sid, age, reason)
 
         Example:
             execute_saved_search(
@@ -216,7 +285,11 @@ class ExecuteSavedSearch(BaseTool):
             )
         """
         log_tool_execution(
-            "execute_saved_search", name=name, mode=mode, earliest_time=earliest_time
+            "execute_saved_search",
+            name=name,
+            mode=mode,
+            earliest_time=earliest_time,
+            prefer_cached=prefer_cached,
         )
 
         is_available, service, error_msg = self.check_splunk_available(ctx)
@@ -228,34 +301,7 @@ class ExecuteSavedSearch(BaseTool):
             # Find the saved search
             await ctx.info(f"Looking for saved search: {name}")
 
-            # Build search criteria
-            search_kwargs = {}
-            if app:
-                search_kwargs["app"] = app
-            if owner:
-                search_kwargs["owner"] = owner
-
-            saved_search = None
-            try:
-                if search_kwargs:
-                    # Search with specific criteria
-                    for ss in service.saved_searches(**search_kwargs):
-                        if ss.name == name:
-                            saved_search = ss
-                            break
-                else:
-                    # Direct access
-                    saved_search = service.saved_searches[name]
-            except KeyError:
-                # Try to find it by iterating through all saved searches
-                for ss in service.saved_searches:
-                    if ss.name == name:
-                        if app and ss.content.get("eai:acl", {}).get("app") != app:
-                            continue
-                        if owner and ss.content.get("eai:acl", {}).get("owner") != owner:
-                            continue
-                        saved_search = ss
-                        break
+            saved_search = find_saved_search(service, name, app=app, owner=owner)
 
             if not saved_search:
                 error_msg = f"Saved search '{name}' not found"
@@ -270,6 +316,24 @@ class ExecuteSavedSearch(BaseTool):
                 await ctx.error(error_msg)
                 return self.format_error_response(error_msg, saved_search_name=name)
 
+            cache_info = None
+            if prefer_cached:
+                if earliest_time is not None or latest_time is not None:
+                    # A scheduled artifact covers the report's own time range only
+                    cache_info = {"hit": False, "reason": "time range overridden"}
+                else:
+                    start_time = time.time()
+                    artifact, cache_info = self._find_cached_artifact(saved_search, max_age)
+                    if artifact is not None:
+                        await ctx.info(
+                            f"Reusing scheduled artifact {artifact.sid} for '{name}' "
+                            f"(age {cache_info['artifact_age_seconds']}s)"
+                        )
+                        return await self._read_cached_artifact(
+                            ctx, saved_search, artifact, cache_info, max_results, offset, start_time
+                        )
+                await ctx.info(f"No reusable artifact for '{name}': {cache_info['reason']}")
+
             # Prepare execution parameters
             dispatch_kwargs = {}
 
@@ -290,19 +354,144 @@ class ExecuteSavedSearch(BaseTool):
             start_time = time.time()
 
             if mode == "oneshot":
-                return await self._execute_oneshot(
+                response = await self._execute_oneshot(
                     ctx, saved_search, dispatch_kwargs, max_results, start_time
                 )
             else:
-                return await self._execute_job(
+                response = await self._execute_job(
                     ctx, saved_search, dispatch_kwargs, max_results, start_time
                 )
+            if cache_info is not None:
+                response["cache"] = cache_info
+            return response
 
         except Exception as e:
             self.logger.error(f"Failed to execute saved search '{name}': {str(e)}")
             await ctx.error(f"Failed to execute saved search '{name}': {str(e)}")
             return self.format_error_response(str(e), saved_search_name=name)
 
+    # Scheduler sids embed the dispatch epoch: scheduler__<owner>__<app>__<name>_at_<epoch>_<n>
+    _SCHEDULER_SID_TIME = re.compile(r"_at_(\d{9,11})_")
+    _MAX_HISTORY_CANDIDATES = 5
+
+    def _find_cached_artifact(self, saved_search, max_age: int) -> tuple[Any, dict[str, Any]]:
+        """
+        Find the most recent successful scheduled artifact younger than max_age seconds.
+
+        Jobs are ordered by the dispatch time encoded in their sid so only the newest few
+        candidates are refreshed, keeping the lookup to a handful of REST calls.
+
+        Returns:
+            Tuple of (job or None, cache_info dict)
+        """
+        now = time.time()
+        candidates = []
+        for job in saved_search.history():
+            dispatched_at = self._sid_dispatch_time(job.sid)
+            if dispatched_at is not None and now - dispatched_at > max_age:
+                continue
+            candidates.append((dispatched_at or 0.0, job))
+
+        if not candidates:
+            return None, {"hit": False, "reason": "no scheduled run within max_age"}
+
+        candidates.sort(key=lambda item: item[0], reverse=True)
+        for dispatched_at, job in candidates[: self._MAX_HISTORY_CANDIDATES]:
+            job.refresh()
+            content = job.content
+            if not self._convert_splunk_boolean(content.get("isScheduled"), False):
+                continue
+            if not self._convert_splunk_boolean(content.get("isDone"), False):
+                continue
+            if self._convert_splunk_boolean(
+                content.get("isFailed"), False
+            ) or self._convert_splunk_boolean(content.get("isZombie"), False):
+                continue
+
+            if not dispatched_at:
+                dispatched_at = self._parse_splunk_time(
+                    content.get("published") or job.state.get("updated")
+                )
+                if dispatched_at is None:
+                    continue
+            age = max(0.0, now - dispatched_at)
+            if age > max_age:
+                continue
+
+            return job, {
+                "hit": True,
+                "artifact_sid": job.sid,
+                "artifact_age_seconds": round(age, 1),
+                "artifact_dispatched_at": dispatched_at,
+                "max_age": max_age,
+            }
+
+        return None, {"hit": False, "reason": "no successful scheduled run within max_age"}
+
+    async def _read_cached_artifact(
+        self,
+        ctx: Context,
+        saved_search,
+        job,
+        cache_info: dict[str, Any],
+        max_results: int,
+        offset: int,
+        start_time: float,
+    ) -> dict[str, Any]:
+        """Stream one page of results from an existing scheduled artifact"""
+        stats = job.content
+        total_results = int(float(stats.get("resultCount", 0) or 0))
+
+        results = []
+        reader = JSONResultsReader(
+            job.results(count=max_results, offset=offset, output_mode="json")
+        )
+        for result in reader:
+            if isinstance(result, dict):
+                results.append(result)
+                if len(results) >= max_results:
+                    break
+
+        duration = time.time() - start_time
+        next_offset = offset + len(results)
+
+        return self.format_success_response(
+            {
+                "saved_search_name": saved_search.name,
+                "job_id": job.sid,
+                "results": results,
+                "results_count": len(results),
+                "total_results": total_results,
+                "offset": offset,
+                "has_more": next_offset < total_results,
+                "next_offset": next_offset if next_offset < total_results else None,
+                "execution_mode": "cached",
+                "event_count": int(float(stats.get("eventCount", 0) or 0)),
+                "duration": round(duration, 3),
+                "search_query": saved_search.content.get("search", ""),
+                "artifact_time_range": {
+                    "earliest_time": stats.get("earliestTime", ""),
+                    "latest_time": stats.get("latestTime", ""),
+                },
+                "cache": cache_info,
+            }
+        )
+
+    def _sid_dispatch_time(self, sid: str) -> float | None:
+        """Extract the dispatch epoch from a scheduler sid, if present"""
+        match = self._SCHEDULER_SID_TIME.search(sid or "")
+        return float(match.group(1)) if match else None
+
+    @staticmethod
+    def _parse_splunk_time(value: str | None) -> float | None:
+        """Parse an ISO-8601 timestamp as returned by Splunk REST into an epoch"""
+        if not value:
+            return None
+        try:
+            return datetime.fromisoformat(str(value).replace("Z", "+00:00")).timestamp()
+        except ValueError:
+            return None
+
     async def _execute_oneshot(
         self, ctx: Context, saved_search, dispatch_kwargs: dict, max_results: int, start_time: float
     ) -> dict[str, Any]:
@@ -644,27 +833,7 @@ class UpdateSavedSearch(BaseTool):
             # Find the saved search
             await ctx.info(f"Looking for saved search to update: {name}")
 
-            saved_search = None
-            try:
-                # Try direct access first
-                saved_search = service.saved_searches[name]
-
-                # Check app/owner constraints if specified
-                if app and saved_search.content.get("eai:acl", {}).get("app") != app:
-                    saved_search = None
-                if owner and saved_search.content.get("eai:acl", {}).get("owner") != owner:
-                    saved_search = None
-
-            except KeyError:
-                # Search by iterating if direct access fails
-                for ss in service.saved_searches:
-                    if ss.name == name:
-                        if app and ss.content.get("eai:acl", {}).get("app") != app:
-                            continue
-                        if owner and ss.content.get("eai:acl", {}).get("owner") != owner:
-                            continue
-                        saved_search = ss
-                        break
+            saved_search = find_saved_search(service, name, app=app, owner=owner)
 
             if not saved_search:
                 error_msg = f"Saved search '{name}' not found"
@@ -805,27 +974,7 @@ class DeleteSavedSearch(BaseTool):
             # Find the saved search
             await ctx.info(f"Looking for saved search to delete: {name}")
 
-            saved_search = None
-            try:
-                # Try direct access first
-                saved_search = service.saved_searches[name]
-
-                # Check app/owner constraints if specified
-                if app and saved_search.content.get("eai:acl", {}).get("app") != app:
-                    saved_search = None
-                if owner and saved_search.content.get("eai:acl", {}).get("owner") != owner:
-                    saved_search = None
-
-            except KeyError:
-                # Search by iterating if direct access fails
-                for ss in service.saved_searches:
-                    if ss.name == name:
-                        if app and ss.content.get("eai:acl", {}).get("app") != app:
-                            continue
-                        if owner and ss.content.get("eai:acl", {}).get("owner") != owner:
-                            continue
-                        saved_search = ss
-                        break
+            saved_search = find_saved_search(service, name, app=app, owner=owner)
 
             if not saved_search:
                 error_msg = f"Saved search '{name}' not found"
@@ -942,27 +1091,7 @@ class GetSavedSearchDetails(BaseTool):
             # Find the saved search
             await ctx.info(f"Retrieving details for saved search: {name}")
 
-            saved_search = None
-            try:
-                # Try direct access first
-                saved_search = service.saved_searches[name]
-
-                # Check app/owner constraints if specified
-                if app and saved_search.content.get("eai:acl", {}).get("app") != app:
-                    saved_search = None
-                if owner and saved_search.content.get("eai:acl", {}).get("owner") != owner:
-                    saved_search = None
-
-            except KeyError:
-                # Search by iterating if direct access fails
-                for ss in service.saved_searches:
-                    if ss.name == name:
-                        if app and ss.content.get("eai:acl", {}).get("app") != app:
-                            continue
-                        if owner and ss.content.get("eai:acl", {}).get("owner") != owner:
-                            continue
-                        saved_search = ss
-                        break
+            saved_search = find_saved_search(service, name, app=app, owner=owner)
 
             if not saved_search:
                 error_msg = f"Saved search '{name}' not found"
@@ -484,6 +484,7 @@ You are performing additional analysis as part of the workflow.
             "list_triggered_alerts": "List all triggered alerts in Splunk",
             # KV Store Tools
             "get_kvstore_data": "Retrieve data from KV Store collections",
+            "put_kvstore_documents": "Bulk insert or update KV Store documents",
             "list_kvstore_collections": "List all KV Store collections",
             "create_kvstore_collection": "Create new KV Store collections",
             # Workflow Tools
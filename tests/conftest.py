@@ -2,9 +2,12 @@
 Test configuration and fixtures for MCP Server for Splunk tests.
 """
 
+import atexit
 import json
 import os
+import shutil
 import sys
+import tempfile
 from typing import Any
 from unittest.mock import AsyncMock, Mock, patch
 
@@ -13,6 +16,16 @@ import pytest
 # Add src to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 
+# Runtime state written by module-level singletons goes to a temporary directory, not data/
+_STATE_DIR = tempfile.mkdtemp(prefix="mcp-splunk-tests-")
+atexit.register(shutil.rmtree, _STATE_DIR, ignore_errors=True)
+for _name, _file in (
+    ("MCP_DOCS_CACHE_PATH", "docs_cache.sqlite3"),
+    ("MCP_DOCS_POPULARITY_PATH", "docs_popularity.json"),
+    ("EXECUTED_WORKFLOWS_DIR", "executed_workflows"),
+):
+    os.environ.setdefault(_name, os.path.join(_STATE_DIR, _file))
+
 # Import FastMCP for proper testing
 try:
     from fastmcp import Client, Context
@@ -708,6 +721,16 @@ def setup_test_environment(sample_env_vars):
         yield
 
 
+@pytest.fixture(autouse=True)
+def clear_splunk_resource_cache():
+    """Keep rendered Splunk resources from leaking between tests"""
+    from src.core.resource_cache import splunk_resource_cache
+
+    splunk_resource_cache.invalidate()
+    yield
+    splunk_resource_cache.invalidate()
+
+
 @pytest.fixture(autouse=True)
 def mock_splunk_get_service(mock_splunk_service):
     """Autouse fixture to mock Splunk service access for all tools.
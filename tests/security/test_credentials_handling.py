@@ -272,45 +272,6 @@ class TestSessionTerminationCleanup:
             pytest.skip("ASGI lifespan not available")
 
 
-@pytest.mark.unit
-@pytest.mark.security
-class TestCredentialMaskingInLogs:
-    """Test that credentials are masked in log output."""
-
-    def test_cache_summary_masks_sensitive_values(self):
-        """Cache summary should mask sensitive values."""
-        from src.server import HEADER_CLIENT_CONFIG_CACHE, _cache_summary
-
-        # Add test data to cache
-        test_session = "log-test-session"
-        HEADER_CLIENT_CONFIG_CACHE[test_session] = {
-            "splunk_host": "test.example.com",
-            "splunk_password": "super_secret_password",  # gitleaks:allow (test data)
-            "splunk_username": "testuser",
-            "authorization": "Bearer secret_token",  # gitleaks:allow (test data)
-        }
-
-        try:
-            summary = _cache_summary(include_values=True)
-
-            # Sensitive values should be masked
-            if test_session in summary:
-                session_data = summary[test_session]
-                if isinstance(session_data, dict):
-                    # Password should be masked
-                    if "splunk_password" in session_data:
-                        assert session_data["splunk_password"] == "***"
-                    # Authorization should be masked
-                    if "authorization" in session_data:
-                        assert session_data["authorization"] == "***"
-                    # Non-sensitive values can be shown
-                    if "splunk_host" in session_data:
-                        assert session_data["splunk_host"] == "test.example.com"
-        finally:
-            # Clean up
-            HEADER_CLIENT_CONFIG_CACHE.pop(test_session, None)
-
-
 @pytest.mark.unit
 @pytest.mark.security
 class TestEnvironmentVariableCredentials:
@@ -0,0 +1,164 @@
+"""
+Tests for the GetConfigurations admin tool namespace probing and caching.
+"""
+
+import json
+import threading
+import time
+from unittest.mock import AsyncMock, MagicMock, Mock
+
+import pytest
+from fastmcp import Context
+
+from src.tools.admin.config import CreateConfig, GetConfigurations
+from src.tools.admin.config_cache import config_cache_for
+
+CONFS = {
+    "props": {
+        "default": {"SHOULD_LINEMERGE": "true", "TRUNCATE": "10000"},
+        "access_combined": {"TRUNCATE": "0", "REPORT-access": "access-extractions"},
+    },
+    "transforms": {
+        "access-extractions": {"REGEX": "^(?<clientip>\\S+)"},
+        "unused": {"REGEX": "x"},
+    },
+}
+
+
+class NamespaceService:
+    """Fake service that only answers conf reads in the nobody/search namespace."""
+
+    def __init__(self, slow_seconds: float = 0.05):
+        self.slow_seconds = slow_seconds
+        self.calls: list[tuple[str, str | None, str | None]] = []
+        self._lock = threading.Lock()
+
+    def get(self, endpoint, owner=None, app=None, **params):
+        with self._lock:
+            self.calls.append((endpoint, owner, app))
+        if owner is None:
+            raise RuntimeError("HTTP 403 Forbidden")
+        entries = []
+        if app == "search":
+            # The winning namespace is also the slowest; probes must not be sequential
+            time.sleep(self.slow_seconds)
+            conf = endpoint.split("/configs/conf-")[1].split("/")[0]
+            entries = [
+                {
+                    "name": name,
+                    "updated": "2024-05-01T00:00:00+00:00",
+                    "content": content,
+                    "acl": {"app": "search", "owner": "nobody"},
+                }
+                for name, content in CONFS.get(conf, {}).items()
+            ]
+        response = Mock()
+        response.body.read.return_value = json.dumps({"entry": entries}).encode("utf-8")
+        return response
+
+
+class TestGetConfigurationsNamespaces:
+    @pytest.fixture
+    def service(self):
+        return NamespaceService()
+
+    @pytest.fixture
+    def tool(self, service):
+        tool = GetConfigurations("get_configurations", "test")
+        tool.check_splunk_available = MagicMock(return_value=(True, service, ""))
+        return tool
+
+    async def test_probes_concurrently_and_caches_namespace(self, tool, service):
+        ctx = AsyncMock(spec=Context)
+
+        result = await tool.execute(ctx, conf_file="props")
+
+        assert result["status"] == "success"
+        assert set(result["stanzas"]) == {"default", "access_combined"}
+        assert result["cache"] == {
+            "hit": False,
+            "namespace": {"owner": "nobody", "app": "search"},
+        }
+        assert {(owner, app) for _, owner, app in service.calls} == {
+            (None, None),
+            ("nobody", "search"),
+            ("nobody", "system"),
+        }
+
+        service.calls.clear()
+        cached = await tool.execute(ctx, conf_file="props")
+        assert cached["cache"]["hit"] is True
+        assert service.calls == []
+
+        # Once the TTL lapses only the resolved namespace is re-read
+        config_cache_for(service).ttl = 0
+        await tool.execute(ctx, conf_file="props")
+        assert service.calls == [("/services/configs/conf-props", "nobody", "search")]
+        assert config_cache_for(service).stats()["revalidated"] == 1
+
+    async def test_higher_priority_namespace_wins_over_faster_one(self, tool, service):
+        ctx = AsyncMock(spec=Context)
+        answer = service.get
+
+        def get(endpoint, owner=None, app=None, **params):
+            if app != "system":
+                return answer(endpoint, owner=owner, app=app, **params)
+            # The lower-priority system namespace answers first
+            response = Mock()
+            response.body.read.return_value = json.dumps(
+                {"entry": [{"name": "default", "content": {}, "acl": {"app": "system"}}]}
+            ).encode("utf-8")
+            return response
+
+        service.get = get
+        result = await tool.execute(ctx, conf_file="props")
+
+        assert result["cache"]["namespace"] == {"owner": "nobody", "app": "search"}
+        assert set(result["stanzas"]) == {"default", "access_combined"}
+
+    async def test_effective_view_merges_defaults_and_transforms(self, tool, service):
+        ctx = AsyncMock(spec=Context)
+
+        result = await tool.execute(ctx, conf_file="props", effective=True)
+
+        view = result["effective"]
+        assert view["stanzas"]["access_combined"] == {
+            "SHOULD_LINEMERGE": "true",
+            "TRUNCATE": "0",
+            "REPORT-access": "access-extractions",
+        }
+        assert list(view["transforms"]) == ["access-extractions"]
+
+        service.calls.clear()
+        again = await tool.execute(ctx, conf_file="props", stanza="access_combined", effective=True)
+        assert again["effective_settings"]["SHOULD_LINEMERGE"] == "true"
+        assert config_cache_for(service).stats()["effective_views"] == 1
+        # Only the single-stanza read is new; the merged view came from cache
+        assert all("/access_combined" in endpoint for endpoint, _, _ in service.calls)
+
+    async def test_create_config_invalidates_cached_reads(self, tool, service):
+        ctx = AsyncMock(spec=Context)
+        await tool.execute(ctx, conf_file="props")
+        assert config_cache_for(service).stats()["payloads"] == 1
+
+        service.post = Mock()
+        creator = CreateConfig("create_config", "test")
+        creator.check_splunk_available = MagicMock(return_value=(True, service, ""))
+        await creator.execute(ctx, conf_file="props", stanza="new", settings={"A": "1"})
+
+        assert config_cache_for(service).stats()["payloads"] == 0
+
+    async def test_create_config_invalidates_after_the_write(self, tool, service):
+        ctx = AsyncMock(spec=Context)
+        await tool.execute(ctx, conf_file="props")
+        cache = config_cache_for(service)
+        payloads_at_write = []
+        service.post = Mock(
+            side_effect=lambda *a, **kw: payloads_at_write.append(cache.stats()["payloads"])
+        )
+        creator = CreateConfig("create_config", "test")
+        creator.check_splunk_available = MagicMock(return_value=(True, service, ""))
+        await creator.execute(ctx, conf_file="props", stanza="new", settings={"A": "1"})
+
+        assert payloads_at_write == [1]
+        assert cache.stats()["payloads"] == 0
@@ -4,7 +4,8 @@ Tests for alerts tools.
 Tests the ListTriggeredAlerts tool using FastMCP patterns with minimal mocking.
 """
 
-from unittest.mock import Mock, patch
+import json
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
@@ -170,3 +171,82 @@ class TestListTriggeredAlerts:
             assert alerts_tool.description is not None
             assert "alert" in alerts_tool.description.lower()
             assert alerts_tool.inputSchema is not None
+
+
+class TestListTriggeredAlertsRest:
+    """Test the single paged REST query implementation directly."""
+
+    @pytest.fixture
+    def rest_service(self):
+        """Service serving fired alerts newest-first plus a fixed time parser."""
+        alerts = [
+            ("High CPU Alert", 1_700_000_900),
+            ("Disk Space Alert", 1_700_000_800),
+            ("High CPU Alert", 1_700_000_700),
+            ("High CPU Alert", 1_699_000_000),  # outside the window
+        ]
+        entries = [
+            {
+                "name": f"scheduler__admin__search__x_at_{t}_1",
+                "content": {
+                    "savedsearch_name": name,
+                    "sid": f"scheduler__admin__search__x_at_{t}_1",
+                    "trigger_time": t,
+                    "severity": 3,
+                },
+                "acl": {"app": "search", "owner": "admin"},
+            }
+            for name, t in alerts
+        ]
+        service = Mock()
+        service.calls = []
+
+        def _get(endpoint, **params):
+            service.calls.append((endpoint, params))
+            if endpoint.endswith("/search/timeparser"):
+                payload = {"-24h@h": "1700000000", "now": "1700001000"}
+            else:
+                offset, count = params["offset"], params["count"]
+                payload = {
+                    "entry": entries[offset : offset + count],
+                    "paging": {"total": len(entries)},
+                }
+            response = Mock()
+            response.body.read.return_value = json.dumps(payload).encode("utf-8")
+            return response
+
+        service.get.side_effect = _get
+        return service
+
+    async def test_single_query_groups_and_applies_window(self, rest_service):
+        from src.tools.alerts.alerts import ListTriggeredAlerts
+
+        tool = ListTriggeredAlerts("list_triggered_alerts", "test")
+        tool.check_splunk_available = Mock(return_value=(True, rest_service, ""))
+
+        data = await tool.execute(AsyncMock())
+
+        assert data["status"] == "success"
+        groups = {g["alert_name"]: g["alert_count"] for g in data["triggered_alerts"]}
+        assert groups == {"High CPU Alert": 2, "Disk Space Alert": 1}
+        assert data["search_parameters"]["time_window_applied"] is True
+        endpoints = [call[0] for call in rest_service.calls]
+        assert endpoints == [
+            "/services/search/timeparser",
+            "/servicesNS/-/-/alerts/fired_alerts/-",
+        ]
+        params = rest_service.calls[1][1]
+        assert params["sort_key"] == "trigger_time"
+        assert params["sort_dir"] == "desc"
+
+    async def test_name_filter_and_caps(self, rest_service):
+        from src.tools.alerts.alerts import ListTriggeredAlerts
+
+        tool = ListTriggeredAlerts("list_triggered_alerts", "test")
+        tool.check_splunk_available = Mock(return_value=(True, rest_service, ""))
+
+        data = await tool.execute(AsyncMock(), search="cpu", max_alerts=1)
+
+        assert data["total_individual_alerts"] == 1
+        assert data["truncated"] is True
+        assert rest_service.calls[1][1]["search"] == "savedsearch_name=*cpu*"
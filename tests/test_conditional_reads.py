@@ -0,0 +1,120 @@
+"""
+Tests for ETag-based conditional resource reads over MCP and HTTP.
+"""
+
+import json
+
+import httpx
+import mcp.types as mt
+
+from src.core.conditional import (
+    conditional_reads,
+    content_etag,
+    etag_matches,
+    split_if_none_match,
+)
+
+CHEATSHEET = "dashboard-studio://cheatsheet"
+
+
+class TestHelpers:
+    def test_etag_matching_accepts_lists_weak_and_unquoted_tags(self):
+        etag = content_etag("hello")
+
+        assert etag.startswith('"') and etag.endswith('"')
+        assert etag_matches(etag, etag)
+        assert etag_matches(etag, etag.strip('"'))
+        assert etag_matches(etag, f'"other", W/{etag}')
+        assert etag_matches(etag, "*")
+        assert not etag_matches(etag, '"other"')
+        assert not etag_matches(etag, None)
+
+    def test_split_if_none_match_keeps_other_parameters(self):
+        assert split_if_none_match("splunk-spec://props.conf?section=x&if_none_match=%22ab%22") == (
+            "splunk-spec://props.conf?section=x",
+            '"ab"',
+        )
+        assert split_if_none_match("splunk-docs://cheat-sheet?if_none_match=ab") == (
+            "splunk-docs://cheat-sheet",
+            "ab",
+        )
+        assert split_if_none_match("splunk-spec://props.conf?section=x") == (
+            "splunk-spec://props.conf?section=x",
+            None,
+        )
+
+
+class TestResourceReads:
+    async def test_unchanged_resource_returns_not_modified_marker(self, fastmcp_client):
+        async with fastmcp_client as client:
+            full = (await client.read_resource(CHEATSHEET))[0].text
+            etag = content_etag(full)
+
+            unchanged = await client.read_resource(f"{CHEATSHEET}?if_none_match={etag}")
+            changed = await client.read_resource(f"{CHEATSHEET}?if_none_match=%22stale%22")
+
+        assert json.loads(unchanged[0].text) == {"status": "not_modified", "etag": etag}
+        assert unchanged[0].mimeType == "application/json"
+        assert changed[0].text == full
+
+    async def test_works_with_slice_parameters(self, fastmcp_client):
+        uri = f"{CHEATSHEET}?section=layout"
+        async with fastmcp_client as client:
+            section = (await client.read_resource(uri))[0].text
+            unquoted = content_etag(section).strip('"')
+            result = await client.read_resource(f"{uri}&if_none_match={unquoted}")
+
+        assert json.loads(result[0].text)["status"] == "not_modified"
+
+    async def test_etag_in_request_metadata(self, fastmcp_client):
+        before = conditional_reads.stats()["not_modified"]
+        async with fastmcp_client as client:
+            full = (await client.read_resource(CHEATSHEET))[0].text
+            request = mt.ClientRequest(
+                mt.ReadResourceRequest(
+                    method="resources/read",
+                    params=mt.ReadResourceRequestParams(
+                        uri=CHEATSHEET, _meta={"ifNoneMatch": content_etag(full)}
+                    ),
+                )
+            )
+            result = await client.session.send_request(request, mt.ReadResourceResult)
+
+        assert json.loads(result.contents[0].text)["status"] == "not_modified"
+        assert conditional_reads.stats()["not_modified"] == before + 1
+
+
+async def test_http_route_honors_if_none_match():
+    from src.server import mcp
+
+    transport = httpx.ASGITransport(app=mcp.http_app())
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as http:
+        first = await http.get("/resources/read", params={"uri": CHEATSHEET})
+        etag = first.headers["etag"]
+        second = await http.get(
+            "/resources/read", params={"uri": CHEATSHEET}, headers={"If-None-Match": etag}
+        )
+        refused = await http.get("/resources/read", params={"uri": "splunk://indexes"})
+
+    assert first.status_code == 200
+    assert etag == content_etag(first.text)
+    assert second.status_code == 304
+    assert second.content == b""
+    assert refused.status_code == 400
+
+
+async def test_http_route_matches_templates_like_mcp_reads(fastmcp_client):
+    from src.server import mcp
+
+    uri = f"{CHEATSHEET}?section=layout"
+    async with fastmcp_client as client:
+        over_mcp = (await client.read_resource(uri))[0].text
+
+    transport = httpx.ASGITransport(app=mcp.http_app())
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as http:
+        section = await http.get("/resources/read", params={"uri": uri})
+        missing = await http.get("/resources/read", params={"uri": "splunk-docs://no/such/doc"})
+
+    assert section.status_code == 200
+    assert section.text == over_mcp
+    assert missing.status_code == 404
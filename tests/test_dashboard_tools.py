@@ -5,7 +5,7 @@ Tests the ListDashboards and GetDashboardDefinition tools.
 """
 
 import json
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 
@@ -403,3 +403,157 @@ class TestCreateDashboard:
                 assert data["name"] == "acl_demo"
                 # The mock service sets ACL; we simply assert success contract
                 assert "permissions" in data
+
+
+class TestDashboardDefinitionCache:
+    """Test lightweight classification and the shared definition cache."""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        from src.tools.dashboards.definition_cache import dashboard_definition_cache
+
+        dashboard_definition_cache.clear()
+        yield
+        dashboard_definition_cache.clear()
+
+    @pytest.fixture
+    def views_service(self):
+        """Service serving a classic and a studio view, recording every GET."""
+        studio_json = json.dumps({"title": "Perf", "dataSources": {}, "visualizations": {}})
+        views = {
+            "classic_view": {
+                "version": "1.1",
+                "eai:data": "<dashboard><label>C</label></dashboard>",
+            },
+            "studio_view": {"version": "", "eai:data": studio_json},
+        }
+        service = Mock()
+        service.host = "localhost"
+        service.calls = []
+
+        def _entry(name, params):
+            content = {"label": name, "version": views[name]["version"]}
+            fields = params.get("f")
+            if fields is None or "eai:data" in fields:
+                content["eai:data"] = views[name]["eai:data"]
+            return {
+                "name": name,
+                "id": f"https://localhost:8089/servicesNS/nobody/search/data/ui/views/{name}",
+                "updated": "2024-01-15T10:30:00",
+                "content": content,
+                "acl": {"app": "search", "owner": "nobody", "sharing": "app", "perms": {}},
+            }
+
+        def _get(endpoint, **params):
+            service.calls.append((endpoint, params))
+            if "/data/ui/views/" in endpoint:
+                entries = [_entry(endpoint.rsplit("/", 1)[-1], params)]
+            else:
+                entries = [_entry(name, params) for name in views]
+            response = Mock()
+            response.body.read.return_value = json.dumps({"entry": entries}).encode("utf-8")
+            return response
+
+        service.get.side_effect = _get
+        return service
+
+    def test_classify_definition_prefix(self):
+        from src.tools.dashboards.definition_cache import classify_definition
+
+        assert classify_definition('{"title": "x"}') == "studio"
+        assert classify_definition('<dashboard version="2" theme="dark"><label/>') == "studio"
+        assert classify_definition("<form><label>x</label></form>") == "classic"
+        assert classify_definition("") == "classic"
+
+    async def test_lightweight_listing_skips_definitions(self, views_service):
+        from src.tools.dashboards.list_dashboards import ListDashboards
+
+        tool = ListDashboards("list_dashboards", "test")
+        tool.check_splunk_available = Mock(return_value=(True, views_service, ""))
+
+        result = await tool.execute(AsyncMock(), count=0)
+        types = {d["name"]: d["type"] for d in result["dashboards"]}
+        assert types == {"classic_view": "classic", "studio_view": "studio"}
+        listing_params = views_service.calls[0][1]
+        assert "eai:data" not in listing_params["f"]
+        # Only the view with inconclusive metadata needed its definition
+        assert len(views_service.calls) == 2
+        endpoint, params = views_service.calls[1]
+        assert endpoint == "/servicesNS/nobody/-/data/ui/views"
+        assert params["f"] == ["eai:data"]
+        assert params["search"] == '(name="studio_view")'
+
+        views_service.calls.clear()
+        await tool.execute(AsyncMock(), count=0)
+        assert len(views_service.calls) == 1  # classification served from cache
+
+    async def test_failed_definition_fetch_is_not_cached(self, views_service):
+        from src.tools.dashboards.list_dashboards import ListDashboards
+
+        tool = ListDashboards("list_dashboards", "test")
+        tool.check_splunk_available = Mock(return_value=(True, views_service, ""))
+        serve = views_service.get.side_effect
+
+        def _flaky(endpoint, **params):
+            if params.get("f") == ["eai:data"]:
+                raise ConnectionError("splunkd timed out")
+            return serve(endpoint, **params)
+
+        views_service.get.side_effect = _flaky
+        await tool.execute(AsyncMock(), count=0)
+
+        views_service.get.side_effect = serve
+        result = await tool.execute(AsyncMock(), count=0)
+        types = {d["name"]: d["type"] for d in result["dashboards"]}
+        assert types["studio_view"] == "studio"
+
+    async def test_definitions_are_fetched_in_batches(self, views_service, monkeypatch):
+        from src.tools.dashboards import list_dashboards
+        from src.tools.dashboards.list_dashboards import ListDashboards
+
+        monkeypatch.setattr(list_dashboards, "DEFINITION_BATCH_SIZE", 2)
+        entries = [
+            {"name": f"view_{i}", "id": f"id_{i}", "updated": "t", "content": {}} for i in range(5)
+        ]
+        service = Mock()
+        service.calls = []
+
+        def _get(endpoint, **params):
+            service.calls.append(params["search"])
+            names = params["search"].split('"')[1::2]
+            body = {
+                "entry": [
+                    {"id": name.replace("view_", "id_"), "content": {"eai:data": "{}"}}
+                    for name in names
+                ]
+            }
+            response = Mock()
+            response.body.read.return_value = json.dumps(body).encode("utf-8")
+            return response
+
+        service.get.side_effect = _get
+        tool = ListDashboards("list_dashboards", "test")
+        types = tool._resolve_types(service, "/servicesNS/nobody/-", entries)
+
+        assert set(types.values()) == {"studio"}
+        assert service.calls == [
+            '(name="view_0" OR name="view_1")',
+            '(name="view_2" OR name="view_3")',
+            '(name="view_4")',
+        ]
+
+    async def test_get_definition_reuses_cached_parse(self, views_service):
+        from src.tools.dashboards.get_dashboard_definition import GetDashboardDefinition
+
+        tool = GetDashboardDefinition("get_dashboard_definition", "test")
+        tool.check_splunk_available = Mock(return_value=(True, views_service, ""))
+
+        first = await tool.execute(AsyncMock(), name="studio_view")
+        second = await tool.execute(AsyncMock(), name="studio_view")
+
+        assert first["type"] == second["type"] == "studio"
+        assert second["definition"] == {"title": "Perf", "dataSources": {}, "visualizations": {}}
+        # Second read only issues a metadata probe without eai:data
+        assert "f" not in views_service.calls[0][1]
+        assert "eai:data" not in views_service.calls[1][1]["f"]
+        assert len(views_service.calls) == 2
@@ -0,0 +1,284 @@
+"""
+Tests for the two-tier documentation cache.
+"""
+
+import asyncio
+import os
+import time
+import zipfile
+
+import httpx
+import pytest
+
+from src.core.http_client import SharedHttpClient
+from src.resources import docs_cache
+from src.resources.docs_bundle import DocsBundle, DocsBundleWriter
+from src.resources.docs_cache import CachedDoc, DocumentationCache, MemoryLRU
+from src.resources.processors.executor import HtmlProcessingPool
+
+URL = "https://help.splunk.com/en/splunk-enterprise/search/spl-search-reference/9.4/stats"
+
+
+class FakeDocsSite:
+    """Serves one page with an ETag and answers conditional requests with 304."""
+
+    def __init__(self, status: int = 200):
+        self.status = status
+        self.requests: list[httpx.Request] = []
+        self.offline = False
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if self.offline:
+            raise httpx.ConnectError("offline", request=request)
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(self.status, text="<h1>stats</h1>", headers={"ETag": '"v1"'})
+
+
+@pytest.fixture
+def site(monkeypatch):
+    site = FakeDocsSite()
+    client = SharedHttpClient(transport=httpx.MockTransport(site.handler))
+    monkeypatch.setattr(docs_cache, "shared_http_client", client)
+    # Counting processors must run in this process
+    monkeypatch.setattr(docs_cache, "html_pool", HtmlProcessingPool(mode="inline"))
+    return site
+
+
+class Processor:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, html: str) -> str:
+        self.calls += 1
+        return f"# processed\n{html}"
+
+
+def _cache(tmp_path, **kwargs) -> DocumentationCache:
+    kwargs.setdefault("bundle", None)
+    kwargs.setdefault("popularity_path", None)
+    return DocumentationCache(ttl_hours=1, disk_path=tmp_path / "docs.sqlite3", **kwargs)
+
+
+class TestMemoryLRU:
+    def test_evicts_least_recently_used_over_byte_budget(self):
+        lru = MemoryLRU(max_bytes=10)
+        lru.put("a", CachedDoc("aaaa", 0))
+        lru.put("b", CachedDoc("bbbb", 0))
+        lru.get("a")
+
+        lru.put("c", CachedDoc("cccc", 0))
+
+        assert lru.get("b") is None
+        assert lru.get("a") is not None
+        assert lru.stats() == {"entries": 2, "bytes": 8}
+
+
+class TestDocumentationCache:
+    async def test_pages_survive_restart_via_disk(self, tmp_path, site):
+        process = Processor()
+        first = _cache(tmp_path)
+        content = await first.fetch_url(URL, process, version="9.4", category="spl")
+
+        restarted = _cache(tmp_path)
+        again = await restarted.fetch_url(URL, process, version="9.4", category="spl")
+
+        assert again == content == "# processed\n<h1>stats</h1>"
+        assert len(site.requests) == 1
+        assert process.calls == 1
+        assert restarted.stats()["disk"]["entries"] == 1
+
+    async def test_expired_page_is_revalidated_without_reprocessing(self, tmp_path, site):
+        process = Processor()
+        cache = _cache(tmp_path)
+        await cache.fetch_url(URL, process)
+        cache.memory.get(f"url_{URL}").fetched_at = time.time() - 7200
+
+        content = await cache.fetch_url(URL, process)
+
+        assert content == "# processed\n<h1>stats</h1>"
+        assert site.requests[-1].headers["if-none-match"] == '"v1"'
+        assert process.calls == 1
+        assert cache.revalidated == 1
+        assert not cache.is_expired(_cache(tmp_path).disk.get(f"url_{URL}").fetched_at)
+
+    async def test_stale_page_is_served_when_offline(self, tmp_path, site):
+        cache = _cache(tmp_path)
+        await cache.fetch_url(URL, Processor())
+        cache.memory.get(f"url_{URL}").fetched_at = 0
+        site.offline = True
+
+        content = await cache.fetch_url(URL, Processor())
+
+        assert content == "# processed\n<h1>stats</h1>"
+        assert cache.stale_served == 1
+
+    async def test_errors_are_not_stored(self, tmp_path, site):
+        site.status = 404
+        cache = _cache(tmp_path)
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await cache.fetch_url(URL, Processor())
+
+        assert cache.memory.stats()["entries"] == 0
+        assert not (tmp_path / "docs.sqlite3").exists()
+
+    async def test_disk_store_is_bounded(self, tmp_path):
+        cache = _cache(tmp_path, disk_max_bytes=200)
+        for i in range(10):
+            doc = CachedDoc(os.urandom(60).hex(), time.time(), "9.4")
+            cache.disk.put(f"url_{i}", "spl", str(i), doc)
+
+        stats = cache.disk.stats()
+        assert stats["bytes"] <= 200
+        assert cache.disk.get("url_9") is not None
+        assert cache.disk.get("url_0") is None
+
+    async def test_invalidate_version_clears_both_tiers(self, tmp_path, site):
+        cache = _cache(tmp_path)
+        await cache.fetch_url(URL, Processor(), version="9.4")
+
+        async def render():
+            return "rendered"
+
+        await cache.get_or_fetch("9.4", "spl", "stats", render)
+
+        cache.invalidate_version("9.4")
+
+        assert cache.memory.stats()["entries"] == 0
+        assert cache.disk.stats()["entries"] == 0
+
+    def test_disk_tier_can_be_disabled(self, monkeypatch):
+        monkeypatch.setenv("MCP_DOCS_CACHE_PATH", "off")
+
+        assert DocumentationCache().disk is None
+
+
+class TestCoalescingAndNegativeCache:
+    async def test_concurrent_misses_share_one_fetch(self, tmp_path):
+        cache = _cache(tmp_path)
+        release = asyncio.Event()
+        calls = 0
+
+        async def render():
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return "rendered"
+
+        waiters = [
+            asyncio.create_task(cache.get_or_fetch("9.4", "spl", "stats", render)) for _ in range(5)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await asyncio.gather(*waiters) == ["rendered"] * 5
+        assert calls == 1
+        assert cache.stats()["coalesced"] == 4
+        assert cache.stats()["in_flight"] == 0
+
+    async def test_cancelled_caller_does_not_cancel_shared_fetch(self, tmp_path):
+        cache = _cache(tmp_path)
+        release = asyncio.Event()
+
+        async def render():
+            await release.wait()
+            return "rendered"
+
+        first = asyncio.create_task(cache.get_or_fetch("9.4", "spl", "stats", render))
+        second = asyncio.create_task(cache.get_or_fetch("9.4", "spl", "stats", render))
+        await asyncio.sleep(0)
+        first.cancel()
+        release.set()
+
+        assert await second == "rendered"
+
+    async def test_not_found_pages_are_cached_briefly(self, tmp_path, site):
+        site.status = 404
+        cache = _cache(tmp_path, negative_ttl_seconds=60)
+
+        async def render():
+            try:
+                return await cache.fetch_url(URL, Processor())
+            except httpx.HTTPStatusError as e:
+                return f"# Not Found ({e.response.status_code})"
+
+        assert await cache.get_or_fetch("9.4", "spl", "nosuch", render) == "# Not Found (404)"
+        # Same page from another topic is answered from the negative cache
+        assert await cache.get_or_fetch("9.4", "spl", "other", render) == "# Not Found (404)"
+        assert await cache.get_or_fetch("9.4", "spl", "nosuch", render) == "# Not Found (404)"
+
+        stats = cache.stats()
+        assert len(site.requests) == 1
+        assert stats["negative"]["stored"] == 1
+        assert stats["negative"]["hits"] == 2
+        assert stats["negative"]["hit_rate"] == pytest.approx(2 / 3, abs=1e-4)
+        assert cache.memory.get(cache.cache_key("9.4", "spl", "nosuch")).ttl_seconds == 60
+
+    async def test_topics_rendered_from_failures_are_not_cached(self, tmp_path, site):
+        site.status = 503
+        cache = _cache(tmp_path)
+
+        async def render():
+            try:
+                return await cache.fetch_url(URL, Processor())
+            except httpx.HTTPStatusError:
+                return "# Documentation Error"
+
+        await cache.get_or_fetch("9.4", "spl", "stats", render)
+        await cache.get_or_fetch("9.4", "spl", "stats", render)
+
+        assert len(site.requests) == 2
+
+
+class TestDocsBundle:
+    def _bundle(self, tmp_path) -> DocsBundle:
+        writer = DocsBundleWriter(["9.4"])
+        writer.add(URL, "# stats from bundle", "spl", "9.4")
+        writer.add_missing(URL + "-missing")
+        return DocsBundle(writer.write(tmp_path / "bundle.zip"))
+
+    async def test_bundle_is_served_before_the_network(self, tmp_path, site):
+        cache = _cache(tmp_path, bundle=self._bundle(tmp_path))
+
+        content = await cache.fetch_url(URL, Processor())
+
+        assert content == "# stats from bundle"
+        assert site.requests == []
+        assert cache.stats()["bundle"]["hits"] == 1
+
+    async def test_pages_missing_from_the_bundle_fail_fast(self, tmp_path, site):
+        cache = _cache(tmp_path, bundle=self._bundle(tmp_path))
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await cache.fetch_url(URL + "-missing", Processor())
+
+        assert site.requests == []
+
+    async def test_unknown_pages_still_go_to_the_network(self, tmp_path, site):
+        cache = _cache(tmp_path, bundle=self._bundle(tmp_path))
+
+        content = await cache.fetch_url(URL + "/other", Processor())
+
+        assert content == "# processed\n<h1>stats</h1>"
+        assert len(site.requests) == 1
+
+    async def test_fetched_pages_are_reported_to_listeners(self, tmp_path, site):
+        pages = []
+        cache = _cache(tmp_path)
+        cache.add_listener(lambda *page: pages.append(page))
+
+        await cache.fetch_url(URL, Processor(), version="9.4", category="spl")
+
+        assert pages == [(URL, "spl", "9.4", "# processed\n<h1>stats</h1>")]
+
+    def test_unsupported_bundle_format_is_ignored(self, tmp_path):
+        path = tmp_path / "bundle.zip"
+        with zipfile.ZipFile(path, "w") as archive:
+            archive.writestr("manifest.json", '{"format": 99, "pages": {}}')
+
+        bundle = DocsBundle(path)
+
+        assert bundle.get(URL) is None
+        assert bundle.stats()["available"] is False
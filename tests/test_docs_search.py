@@ -0,0 +1,148 @@
+"""
+Tests for the documentation search index and the search_splunk_docs tool.
+"""
+
+import asyncio
+
+import pytest
+
+from src.resources.docs_cache import DocumentationCache
+from src.resources.docs_index import DocsSearchIndex, split_sections
+from src.tools.docs import search_docs
+from src.tools.docs.search_docs import SearchSplunkDocs, resource_uri_for_url
+
+STATS_PAGE = """# stats
+
+Calculates aggregate statistics over the results set.
+
+## Syntax
+
+stats count BY host
+
+## Functions
+
+avg, count, distinct_count, sum and other aggregation functions.
+"""
+
+
+class TestDocsSearchIndex:
+    def test_sections_are_split_at_headings(self):
+        assert split_sections(STATS_PAGE) == [
+            ("stats", "Calculates aggregate statistics over the results set."),
+            ("Syntax", "stats count BY host"),
+            ("Functions", "avg, count, distinct_count, sum and other aggregation functions."),
+        ]
+
+    def test_ranks_the_matching_section_first(self):
+        index = DocsSearchIndex()
+        index.add_document("splunk-docs://latest/spl-reference/stats", "stats", STATS_PAGE)
+        index.add_document(
+            "splunk-docs://latest/spl-reference/rex", "rex", "# rex\n\nRegex field extraction."
+        )
+
+        results = index.search("aggregation functions", top_k=2)
+
+        assert results[0]["uri"] == "splunk-docs://latest/spl-reference/stats"
+        assert results[0]["section"] == "Functions"
+        assert len(results) == 1
+
+    def test_adding_a_document_again_replaces_it(self):
+        index = DocsSearchIndex()
+        index.add_document("doc://a", "a", "# a\n\nold wording")
+        index.add_document("doc://a", "a", "# a\n\nnew wording")
+
+        assert index.search("old") == []
+        assert index.search("new")[0]["uri"] == "doc://a"
+        assert index.stats() == {"documents": 1, "sections": 1, "terms": 2}
+
+    def test_removed_documents_leave_no_postings(self):
+        index = DocsSearchIndex()
+        index.add_document("doc://a", "a", STATS_PAGE)
+        index.remove_document("doc://a")
+
+        assert index.stats() == {"documents": 0, "sections": 0, "terms": 0}
+        assert index.search("stats") == []
+
+
+class TestResourceUriForUrl:
+    @pytest.mark.parametrize(
+        ("url", "uri"),
+        [
+            (
+                "https://help.splunk.com/en/splunk-enterprise/search/spl-search-reference/9.4/search-commands/stats",
+                "splunk-docs://9.4/spl-reference/stats",
+            ),
+            (
+                "https://help.splunk.com/en/data-management/common-information-model/6.0/data-models/authentication",
+                "splunk-cim://6.0/authentication",
+            ),
+            (
+                "https://help.splunk.com/en/splunk-enterprise/administer/admin-manual/9.4/configuration-file-reference/9.4.0-configuration-file-reference/props.conf",
+                "splunk-spec://props.conf",
+            ),
+            ("https://example.com/page", "https://example.com/page"),
+        ],
+    )
+    def test_maps_page_urls_to_resource_uris(self, url, uri):
+        assert resource_uri_for_url(url) == uri
+
+
+class TestSearchSplunkDocs:
+    @pytest.fixture
+    def cache(self, monkeypatch):
+        cache = DocumentationCache(disk_path=None, bundle=None)
+        monkeypatch.setattr(search_docs, "doc_cache", cache)
+        monkeypatch.setattr(search_docs, "_index", None)
+        return cache
+
+    async def test_finds_topics_without_exact_names(self, cache):
+        tool = SearchSplunkDocs("search_splunk_docs", "Search docs")
+
+        result = await tool.execute(None, query="regular expression field extraction", top_k=3)
+
+        assert result["status"] == "success"
+        assert result["results"][0]["uri"] == "splunk-docs://latest/spl-reference/rex"
+        assert result["result_count"] == 3
+
+    async def test_newly_fetched_pages_are_searchable(self, cache):
+        tool = SearchSplunkDocs("search_splunk_docs", "Search docs")
+        await tool.execute(None, query="stats")
+
+        cache._notify(
+            "https://help.splunk.com/en/splunk-enterprise/search/spl-search-reference/9.4/search-commands/stats",
+            "docs",
+            "9.4",
+            STATS_PAGE.replace("aggregation", "zyxaggregation"),
+        )
+        await asyncio.gather(*search_docs._index_tasks)
+        result = await tool.execute(None, query="zyxaggregation")
+
+        assert result["results"][0]["uri"] == "splunk-docs://9.4/spl-reference/stats"
+        assert result["results"][0]["section"] == "Functions"
+
+    async def test_pages_fetched_during_the_build_are_indexed(self, cache, monkeypatch):
+        build = search_docs._build_index
+
+        def build_while_fetching():
+            cache._notify(
+                "https://help.splunk.com/en/splunk-enterprise/search/spl-search-reference/9.4/search-commands/stats",
+                "docs",
+                "9.4",
+                STATS_PAGE.replace("aggregation", "qwxaggregation"),
+            )
+            return build()
+
+        monkeypatch.setattr(search_docs, "_build_index", build_while_fetching)
+        tool = SearchSplunkDocs("search_splunk_docs", "Search docs")
+
+        result = await tool.execute(None, query="qwxaggregation")
+
+        assert result["results"][0]["uri"] == "splunk-docs://9.4/spl-reference/stats"
+        assert search_docs._pending_pages == {}
+
+    async def test_empty_query_is_rejected(self, cache):
+        tool = SearchSplunkDocs("search_splunk_docs", "Search docs")
+
+        result = await tool.execute(None, query="  ")
+
+        assert result["status"] == "error"
@@ -0,0 +1,155 @@
+"""
+Tests for section-addressable, paged documentation responses.
+"""
+
+import pytest
+
+from src.resources.docs_sections import (
+    page_bounds,
+    render_slice,
+    section_tree,
+    slice_document,
+)
+from src.tools.docs.splunk_docs_tools import GetStudioTopic, embedded_doc_response
+
+PAGE = """# stats
+
+Calculates aggregate statistics.
+
+## Syntax
+
+stats <stats-agg-term>... [BY <field-list>]
+
+```
+# a comment inside a code block, not a heading
+| stats count BY host
+```
+
+### Required arguments
+
+stats-agg-term
+
+## Examples
+
+### Example 1
+
+Count events per host.
+
+## Examples
+
+A second section with the same heading.
+"""
+
+
+class TestSectionTree:
+    def test_headings_with_offsets_and_parents(self):
+        sections = section_tree(PAGE)
+
+        assert [(s.title, s.level) for s in sections] == [
+            ("stats", 1),
+            ("Syntax", 2),
+            ("Required arguments", 3),
+            ("Examples", 2),
+            ("Example 1", 3),
+            ("Examples", 2),
+        ]
+        syntax = sections[1]
+        assert PAGE[syntax.start : syntax.end].startswith("## Syntax")
+        assert "stats-agg-term\n" in PAGE[syntax.start : syntax.end]
+        assert "## Examples" not in PAGE[syntax.start : syntax.end]
+        assert sections[2].parent == 1
+        assert sections[0].end == len(PAGE)
+
+    def test_duplicate_headings_get_distinct_anchors(self):
+        anchors = [s.anchor for s in section_tree(PAGE)]
+        assert anchors == [
+            "stats",
+            "syntax",
+            "required-arguments",
+            "examples",
+            "example-1",
+            "examples-2",
+        ]
+
+
+class TestSliceDocument:
+    def test_section_by_anchor_or_heading(self):
+        by_anchor = slice_document(PAGE, section="required-arguments")
+        by_heading = slice_document(PAGE, section="Required Arguments")
+
+        assert by_anchor["text"] == by_heading["text"]
+        assert by_anchor["text"].startswith("### Required arguments")
+        assert by_anchor["pages"] == 1
+        assert by_anchor["document_chars"] == len(PAGE)
+        assert [entry["anchor"] for entry in by_anchor["toc"]][:2] == ["stats", "syntax"]
+
+    def test_unknown_section_lists_available_anchors(self):
+        with pytest.raises(ValueError, match="Available sections: stats, syntax"):
+            slice_document(PAGE, section="nonexistent")
+
+    def test_pages_cover_the_text_without_gaps(self):
+        text = "\n\n".join(f"Paragraph {i} " + "x" * 120 for i in range(60))
+        bounds = page_bounds(text, 1000)
+
+        assert len(bounds) > 1
+        assert bounds[0][0] == 0 and bounds[-1][1] == len(text)
+        assert all(
+            end == next_start for (_, end), (next_start, _) in zip(bounds, bounds[1:], strict=False)
+        )
+        assert all(end - start <= 1000 for start, end in bounds)
+
+        second = slice_document(text, max_chars=1000, page=2)
+        assert second["page"] == 2 and second["pages"] == len(bounds)
+        assert second["text"] == text[bounds[1][0] : bounds[1][1]]
+        with pytest.raises(ValueError, match="out of range"):
+            slice_document(text, max_chars=1000, page=len(bounds) + 1)
+
+    def test_render_slice_without_parameters_is_unchanged(self):
+        assert render_slice(PAGE) == PAGE
+        rendered = render_slice(PAGE, section="syntax")
+        assert rendered.startswith("## Syntax")
+        assert "`examples-2` Examples" in rendered
+
+
+class TestEmbeddedDocResponse:
+    def test_full_page_by_default(self):
+        response = embedded_doc_response("splunk-docs://9.4/spl-reference/stats", "SPL", PAGE)
+
+        assert response["content"][0]["resource"]["text"] == PAGE
+        assert "toc" not in response
+
+    def test_slice_with_toc_and_pagination(self):
+        response = embedded_doc_response(
+            "splunk-docs://9.4/spl-reference/stats", "SPL", PAGE, section="Example 1"
+        )
+        resource = response["content"][0]["resource"]
+
+        assert resource["uri"] == "splunk-docs://9.4/spl-reference/stats?section=example-1"
+        assert resource["text"].startswith("### Example 1")
+        assert response["section"] == "Example 1"
+        assert response["pagination"]["pages"] == 1
+        assert len(response["toc"]) == 6
+
+    async def test_studio_topic_tool_returns_requested_section(self):
+        tool = GetStudioTopic("get_studio_topic", "Dashboard Studio topic")
+
+        full = await tool.execute(None, "cheatsheet")
+        sliced = await tool.execute(None, "cheatsheet", section="layout")
+
+        assert sliced["status"] == "success"
+        text = sliced["content"][0]["resource"]["text"]
+        assert text.startswith("## Layout")
+        assert len(text) < len(full["content"][0]["resource"]["text"]) / 5
+        assert any(entry["anchor"] == "data-sources" for entry in sliced["toc"])
+
+
+async def test_resource_uri_accepts_slice_parameters(fastmcp_client):
+    async with fastmcp_client as client:
+        result = await client.read_resource(
+            "dashboard-studio://cheatsheet?section=data-sources&max_chars=1000&page=2"
+        )
+
+    text = result[0].text
+    assert "of section `data-sources`" in text
+    assert "_Page 2 of" in text
+    assert "**Sections**" in text
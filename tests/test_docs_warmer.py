@@ -0,0 +1,197 @@
+"""
+Tests for topic popularity tracking and the documentation cache warmer.
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from src.resources import docs_warmer
+from src.resources.docs_cache import DocumentationCache, TopicPopularity, background_fetch
+from src.resources.docs_warmer import DocsCacheWarmer, topic_for_uri
+from src.resources.splunk_docs import SplunkSpecReferenceResource
+from src.tools.docs.splunk_docs_tools import SPL_COMMANDS
+
+
+def _cache(tmp_path, **kwargs) -> DocumentationCache:
+    kwargs.setdefault("popularity_path", tmp_path / "popularity.json")
+    return DocumentationCache(ttl_hours=1, disk_path=None, bundle=None, **kwargs)
+
+
+class FakeResource:
+    """Renders a topic through the cache the way documentation resources do."""
+
+    uri = "fake://topic"
+    active = 0
+    peak = 0
+    background = []
+
+    def __init__(self, cache, version, category, topic):
+        self.cache = cache
+        self.key = (version, category, topic)
+
+    async def get_content(self, ctx):
+        async def render():
+            FakeResource.active += 1
+            FakeResource.peak = max(FakeResource.peak, FakeResource.active)
+            FakeResource.background.append(background_fetch.get())
+            await asyncio.sleep(0.01)
+            FakeResource.active -= 1
+            return f"# {self.key[2]}"
+
+        return await self.cache.get_or_fetch(*self.key, render)
+
+
+class TestTopicPopularity:
+    def test_counts_persist_and_decay_across_restarts(self, tmp_path):
+        path = tmp_path / "popularity.json"
+        popularity = TopicPopularity(path)
+        for _ in range(4):
+            popularity.record("9.4", "spl-reference", "stats")
+        popularity.record("9.4", "admin", "indexes")
+        popularity.save()
+
+        reloaded = TopicPopularity(path)
+        assert reloaded.top(5) == [("9.4", "spl-reference", "stats"), ("9.4", "admin", "indexes")]
+        counts = {entry["topic"]: entry["count"] for entry in reloaded.stats()["top"]}
+        assert counts == {"stats": 2.0, "indexes": 0.5}
+
+    def test_unreadable_file_is_ignored(self, tmp_path):
+        path = tmp_path / "popularity.json"
+        path.write_text("not json")
+        assert TopicPopularity(path).top(5) == []
+
+    async def test_reads_are_counted_but_background_fetches_are_not(self, tmp_path):
+        cache = _cache(tmp_path)
+
+        async def render():
+            return "# stats"
+
+        await cache.get_or_fetch("9.4", "spl-reference", "stats", render)
+        await cache.get_or_fetch("9.4", "spl-reference", "stats", render)
+        token = background_fetch.set(True)
+        try:
+            await cache.get_or_fetch("9.4", "admin", "indexes", render)
+        finally:
+            background_fetch.reset(token)
+
+        assert cache.popularity.requests == 2
+        assert cache.popularity.top(5) == [("9.4", "spl-reference", "stats")]
+
+
+class TestDocsCacheWarmer:
+    @pytest.fixture(autouse=True)
+    def fake_resources(self, monkeypatch):
+        FakeResource.active = FakeResource.peak = 0
+        FakeResource.background = []
+
+    def _warmer(self, cache, monkeypatch, **kwargs):
+        monkeypatch.setattr(
+            docs_warmer,
+            "resource_for_topic",
+            lambda version, category, topic: FakeResource(cache, version, category, topic),
+        )
+        kwargs.setdefault("enabled", True)
+        kwargs.setdefault("topics", [])
+        kwargs.setdefault("rate", 1000)
+        return DocsCacheWarmer(cache, **kwargs)
+
+    def test_topic_for_uri(self):
+        assert topic_for_uri("splunk-docs://9.4/spl-reference/stats") == (
+            "9.4",
+            "spl-reference",
+            "stats",
+        )
+        assert topic_for_uri("splunk-spec://props.conf") == (
+            "latest",
+            "spec-reference",
+            "props.conf",
+        )
+        assert topic_for_uri("splunk-cim://6.1/authentication") == ("6.1", "cim", "authentication")
+        assert topic_for_uri("dashboard-studio://cheatsheet") is None
+
+    def test_targets_combine_configured_learned_and_spl_commands(self, tmp_path, monkeypatch):
+        cache = _cache(tmp_path)
+        for _ in range(3):
+            cache.popularity.record("9.4.2", "admin", "indexes")
+        cache.popularity.record("9.4.2", "spl-reference", SPL_COMMANDS[0]["command"])
+        warmer = self._warmer(
+            cache,
+            monkeypatch,
+            topics=["splunk-spec://props.conf", "bogus://uri"],
+            spl_commands=3,
+            max_topics=10,
+        )
+
+        targets = warmer.targets()
+
+        assert targets[:3] == [
+            ("latest", "spec-reference", "props.conf"),
+            ("9.4.2", "admin", "indexes"),
+            ("9.4.2", "spl-reference", SPL_COMMANDS[0]["command"]),
+        ]
+        # Seeded commands use the version users read, and are not repeated
+        assert targets[3:] == [
+            ("9.4.2", "spl-reference", entry["command"]) for entry in SPL_COMMANDS[1:3]
+        ]
+        assert len(self._warmer(cache, monkeypatch, max_topics=2).targets()) == 2
+
+    async def test_warm_once_respects_concurrency_and_skips_fresh_topics(
+        self, tmp_path, monkeypatch
+    ):
+        cache = _cache(tmp_path)
+        warmer = self._warmer(cache, monkeypatch, spl_commands=6, concurrency=2)
+
+        first = await warmer.warm_once()
+        second = await warmer.warm_once()
+
+        assert first == {"warmed": 6, "fresh": 0, "failed": 0, "skipped": 0}
+        assert second == {"warmed": 0, "fresh": 6, "failed": 0, "skipped": 0}
+        assert FakeResource.peak <= 2
+        assert FakeResource.background and all(FakeResource.background)
+        # Warming is not mistaken for users reading the topics
+        assert cache.popularity.requests == 0
+
+    async def test_pauses_while_live_traffic_is_high(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(docs_warmer, "PAUSE_SECONDS", 0.01)
+        cache = _cache(tmp_path)
+        warmer = self._warmer(cache, monkeypatch, busy_rps=1)
+        for _ in range(1000):
+            cache.popularity.record("latest", "spl-reference", "stats")
+
+        await warmer._wait_for_quiet()
+
+        assert warmer.paused == 1
+
+    async def test_stop_persists_popularity(self, tmp_path, monkeypatch):
+        cache = _cache(tmp_path)
+        warmer = self._warmer(cache, monkeypatch, delay_seconds=3600)
+        cache.popularity.record("9.4", "admin", "indexes")
+
+        warmer.start()
+        assert warmer.running
+        await warmer.stop()
+
+        assert not warmer.running
+        saved = json.loads((tmp_path / "popularity.json").read_text())
+        assert saved["topics"][0]["topic"] == "indexes"
+
+    async def test_stop_saves_only_changed_counts_when_enabled(self, tmp_path, monkeypatch):
+        cache = _cache(tmp_path)
+        path = tmp_path / "popularity.json"
+        cache.popularity.record("9.4", "admin", "indexes")
+
+        await self._warmer(cache, monkeypatch, enabled=False).stop()
+        assert not path.exists()
+
+        warmer = self._warmer(cache, monkeypatch)
+        await warmer.stop()
+        path.unlink()
+        await warmer.stop()
+        assert not path.exists()
+
+
+def test_spec_resource_uses_given_version():
+    assert SplunkSpecReferenceResource("props.conf", "9.3.1").version == "9.3.1"
+    assert SplunkSpecReferenceResource("props.conf").version is None
@@ -10,6 +10,7 @@ Tests all aspects of the embedded resources system including:
 - Splunk integration
 """
 
+import base64
 import json
 import os
 import tempfile
@@ -19,6 +20,7 @@ from unittest.mock import AsyncMock, Mock, patch
 import pytest
 
 from src.core.base import ResourceMetadata
+from src.core.conditional import content_etag
 from src.resources.embedded import (
     ContentValidator,
     EmbeddedResource,
@@ -241,6 +243,7 @@ class TestEmbeddedResource:
         assert etag is not None
         assert etag.startswith('"')
         assert etag.endswith('"')
+        assert etag == content_etag("Test content")
 
     def test_generate_etag_disabled(self):
         """Test ETag generation when disabled."""
@@ -467,6 +470,56 @@ class TestFileEmbeddedResource:
         content = await resource.get_content(mock_context)
         assert "éñü" in content
 
+    @pytest.mark.asyncio
+    async def test_repeated_reads_cost_one_stat(self, temp_file, mock_context):
+        """Unchanged files are served from the cache after a single stat."""
+        resource = FileEmbeddedResource(
+            uri="embedded://file/cached",
+            name="Cached File Resource",
+            description="A cached file resource",
+            file_path=temp_file,
+        )
+        await resource.get_content(mock_context)
+
+        with (
+            patch("src.resources.embedded.os.stat", wraps=os.stat) as stat,
+            patch.object(resource, "_read_file", wraps=resource._read_file) as read,
+        ):
+            for _ in range(3):
+                assert await resource.get_content(mock_context) == "Test file content"
+
+        assert stat.call_count == 3
+        read.assert_not_called()
+
+        # A new signature (here a different size) is read again
+        with open(temp_file, "w") as f:
+            f.write("Rewritten")
+        assert await resource.get_content(mock_context) == "Rewritten"
+
+    @pytest.mark.asyncio
+    async def test_large_binary_file_is_encoded_in_chunks(self, mock_context, tmp_path):
+        """Memory-mapped chunked encoding matches encoding the whole file."""
+        data = os.urandom(FileEmbeddedResource.ENCODE_CHUNK_SIZE * 2 + 7)
+        path = tmp_path / "blob.bin"
+        path.write_bytes(data)
+        resource = FileEmbeddedResource(
+            uri="embedded://file/blob",
+            name="Binary Resource",
+            description="A large binary resource",
+            file_path=str(path),
+        )
+        resource.MMAP_THRESHOLD = 1024
+
+        payload = json.loads(await resource.get_content(mock_context))
+
+        assert payload["type"] == "binary"
+        assert payload["size"] == len(data)
+        assert base64.b64decode(payload["data"]) == data
+        assert payload["etag"] == content_etag(data)
+        # Payloads of memory-mapped files are rebuilt on each read instead of being cached
+        assert resource._cached_content is None
+        assert json.loads(await resource.get_content(mock_context)) == payload
+
 
 class TestTemplateEmbeddedResource:
     """Test the TemplateEmbeddedResource class."""
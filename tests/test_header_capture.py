@@ -0,0 +1,114 @@
+"""
+Tests for the raw ASGI header capture middleware.
+"""
+
+import asyncio
+
+import httpx
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, StreamingResponse
+from starlette.routing import Route
+
+from src.core.logging_config import current_session_id
+from src.core.shared_context import http_headers_context, scope_headers
+from src.server import HEADER_CLIENT_CONFIG_CACHE, HeaderCaptureMiddleware
+
+
+async def whoami(request: Request) -> JSONResponse:
+    return JSONResponse(
+        {
+            "client_config": getattr(request.state, "client_config", None),
+            "headers": http_headers_context.get(),
+            "session": current_session_id.get(),
+        }
+    )
+
+
+async def events(request: Request) -> StreamingResponse:
+    async def stream():
+        yield b"data: first\n\n"
+        await asyncio.sleep(0.2)
+        yield b"data: second\n\n"
+
+    return StreamingResponse(stream(), media_type="text/event-stream")
+
+
+def _app() -> HeaderCaptureMiddleware:
+    return HeaderCaptureMiddleware(
+        Starlette(routes=[Route("/whoami", whoami), Route("/events", events)])
+    )
+
+
+def test_scope_headers_reads_only_selected_headers():
+    scope = {
+        "headers": [
+            (b"x-splunk-host", b"sh1"),
+            (b"x-splunk-host", b"sh2"),
+            (b"mcp-session-id", b"abc"),
+            (b"authorization", b"Bearer secret"),
+        ]
+    }
+
+    assert scope_headers(scope) == {"x-splunk-host": "sh1", "mcp-session-id": "abc"}
+
+
+async def test_config_reaches_request_state_and_session_store():
+    transport = httpx.ASGITransport(app=_app())
+    headers = {
+        "X-Splunk-Host": "sh1",
+        "X-Splunk-Port": "8089",
+        "X-Session-ID": "capture-test",
+        "User-Agent": "pytest",
+    }
+    try:
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as http:
+            body = (await http.get("/whoami", headers=headers)).json()
+
+        assert body["client_config"] == {"splunk_host": "sh1", "splunk_port": 8089}
+        assert body["session"] == "capture-test"
+        assert set(body["headers"]) == {"x-splunk-host", "x-splunk-port", "x-session-id"}
+        assert HEADER_CLIENT_CONFIG_CACHE["capture-test"] == body["client_config"]
+    finally:
+        HEADER_CLIENT_CONFIG_CACHE.pop("capture-test", None)
+
+
+async def test_streamed_events_are_not_buffered():
+    app = _app()
+    first_body_at = None
+    done_at = None
+    started = asyncio.get_running_loop().time()
+
+    async def receive():
+        await asyncio.sleep(1)
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        nonlocal first_body_at, done_at
+        if message["type"] == "http.response.body":
+            now = asyncio.get_running_loop().time()
+            if first_body_at is None and message.get("body"):
+                first_body_at = now
+            if not message.get("more_body"):
+                done_at = now
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/events",
+        "raw_path": b"/events",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"mcp-session-id", b"stream-test")],
+        "server": ("test", 80),
+        "client": ("127.0.0.1", 1234),
+    }
+    await app(scope, receive, send)
+
+    assert first_body_at - started < 0.1
+    assert done_at - first_body_at >= 0.15
+    # Context is restored once the response is complete
+    assert current_session_id.get() == "-"
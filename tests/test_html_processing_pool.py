@@ -0,0 +1,66 @@
+"""
+Tests for off-loop documentation HTML processing.
+"""
+
+import os
+from functools import partial
+
+import pytest
+
+from src.resources.processors.executor import HtmlProcessingPool
+from src.resources.processors.html_processor import process_docs_html
+
+URL = "https://help.splunk.com/en/splunk-enterprise/search/spl-search-reference/9.4/stats"
+PAGE = """
+<html><body><nav>Skip me</nav><main>
+<h1>stats</h1><p>Calculates aggregate statistics.</p>
+<h2>Syntax</h2><pre>stats count BY host</pre>
+<table><thead><tr><th>Argument</th><th>Type</th></tr></thead>
+<tbody><tr><td>by-clause</td><td>field list</td></tr></tbody></table>
+</main></body></html>
+"""
+
+
+def _worker_pid(html: str) -> str:
+    return str(os.getpid())
+
+
+def _without_timestamp(markdown: str) -> str:
+    return "\n".join(line for line in markdown.splitlines() if not line.startswith("**Processed**"))
+
+
+class TestHtmlProcessingPool:
+    @pytest.mark.parametrize("mode", ["process", "thread", "inline"])
+    async def test_modes_render_the_same_markdown(self, mode):
+        pool = HtmlProcessingPool(mode=mode, workers=1)
+        try:
+            rendered = await pool.run(partial(process_docs_html, url=URL), PAGE)
+        finally:
+            pool.shutdown()
+
+        expected = process_docs_html(PAGE, URL)
+        assert _without_timestamp(rendered) == _without_timestamp(expected)
+        assert "| by-clause | field list |" in rendered
+        assert pool.stats()["tasks"] == 1
+
+    async def test_process_mode_runs_in_a_worker(self):
+        pool = HtmlProcessingPool(mode="process", workers=1)
+        try:
+            pid = await pool.run(_worker_pid, PAGE)
+        finally:
+            pool.shutdown()
+
+        assert pid != str(os.getpid())
+        assert pool.stats()["thread_fallbacks"] == 0
+
+    async def test_unpicklable_callables_fall_back_to_threads(self):
+        calls = []
+        pool = HtmlProcessingPool(mode="process", workers=1)
+        try:
+            result = await pool.run(lambda html: calls.append(html) or "done", PAGE)
+        finally:
+            pool.shutdown()
+
+        assert result == "done"
+        assert calls == [PAGE]
+        assert pool.stats()["thread_fallbacks"] == 1
@@ -0,0 +1,78 @@
+"""
+Tests for the shared pooled HTTP client used by documentation fetchers.
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from src.core.http_client import SharedHttpClient
+
+
+async def _serve_keepalive(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+    """Answer every request on the connection with a small keep-alive response."""
+    try:
+        while True:
+            head = await reader.readuntil(b"\r\n\r\n")
+            if not head:
+                break
+            writer.write(
+                b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\nConnection: keep-alive\r\n\r\nok"
+            )
+            await writer.drain()
+    except (asyncio.IncompleteReadError, ConnectionResetError):
+        pass
+    finally:
+        writer.close()
+
+
+class TestSharedHttpClient:
+    async def test_connections_are_reused_across_requests(self):
+        server = await asyncio.start_server(_serve_keepalive, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        client = SharedHttpClient(http2=False)
+        try:
+            for _ in range(3):
+                response = await client.get(f"http://127.0.0.1:{port}/page")
+                assert response.text == "ok"
+        finally:
+            await client.aclose()
+            server.close()
+            await server.wait_closed()
+
+        stats = client.stats()
+        assert stats["requests"] == 3
+        assert stats["connections_opened"] == 1
+        assert stats["connections_reused"] == 2
+        assert stats["open"] is False
+
+    async def test_concurrency_is_capped_per_host(self):
+        active = {"a.example": 0, "b.example": 0}
+        peak = {"a.example": 0, "b.example": 0}
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            host = request.url.host
+            active[host] += 1
+            peak[host] = max(peak[host], active[host])
+            await asyncio.sleep(0.01)
+            active[host] -= 1
+            return httpx.Response(200)
+
+        client = SharedHttpClient(max_per_host=2, transport=httpx.MockTransport(handler))
+        urls = [f"https://{host}/{i}" for host in active for i in range(6)]
+        await asyncio.gather(*(client.get(url) for url in urls))
+        await client.aclose()
+
+        assert peak == {"a.example": 2, "b.example": 2}
+
+    async def test_transport_errors_are_counted(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("refused", request=request)
+
+        client = SharedHttpClient(transport=httpx.MockTransport(handler))
+        with pytest.raises(httpx.ConnectError):
+            await client.get("https://help.splunk.com/")
+        await client.aclose()
+
+        assert client.stats()["errors"] == 1
@@ -0,0 +1,227 @@
+"""
+Tests for paged KV Store reads and bulk writes.
+"""
+
+import json
+import threading
+from unittest.mock import AsyncMock, MagicMock, Mock
+
+import pytest
+from fastmcp import Context
+
+from src.tools.kvstore import data as kvstore_data
+from src.tools.kvstore.data import GetKvstoreData, PutKvstoreDocuments
+
+
+class FakeCollectionData:
+    """Serves documents with KV Store limit/skip semantics and records each query."""
+
+    def __init__(self, total: int):
+        self.documents = [{"_key": str(i), "n": i} for i in range(total)]
+        self.calls: list[dict] = []
+
+    def query(self, **params):
+        self.calls.append(params)
+        skip, limit = params.get("skip", 0), params.get("limit", 0)
+        return self.documents[skip : skip + limit]
+
+
+class TestGetKvstoreDataPaging:
+    @pytest.fixture
+    def data(self):
+        return FakeCollectionData(25)
+
+    @pytest.fixture
+    def tool(self, data):
+        collection = MagicMock()
+        collection.data = data
+        service = MagicMock()
+        service.kvstore = {"assets": collection}
+        tool = GetKvstoreData("get_kvstore_data", "test")
+        tool.check_splunk_available = MagicMock(return_value=(True, service, ""))
+        return tool
+
+    async def test_reads_one_page_and_returns_cursor(self, tool, data):
+        result = await tool.execute(
+            AsyncMock(spec=Context),
+            collection="assets",
+            query={"priority": "high"},
+            limit=5,
+            skip=10,
+            fields=["_key", "n"],
+            sort=["-n", "_key"],
+        )
+
+        assert result["status"] == "success"
+        assert [d["n"] for d in result["documents"]] == [10, 11, 12, 13, 14]
+        assert result["has_more"] is True
+        assert result["next_skip"] == 15
+        assert data.calls == [
+            {
+                "limit": 6,
+                "skip": 10,
+                "query": {"priority": "high"},
+                "fields": "_key,n",
+                "sort": "n:-1,_key:1",
+            }
+        ]
+
+    async def test_last_page_has_no_cursor(self, tool):
+        result = await tool.execute(AsyncMock(spec=Context), collection="assets", skip=20)
+
+        assert result["count"] == 5
+        assert result["has_more"] is False
+        assert result["next_skip"] is None
+
+    async def test_count_only_is_capped(self, tool, data, monkeypatch):
+        monkeypatch.setattr(kvstore_data, "MAX_KVSTORE_DOCUMENTS", 20)
+        monkeypatch.setattr(kvstore_data, "KVSTORE_PAGE_SIZE", 8)
+
+        result = await tool.execute(AsyncMock(spec=Context), collection="assets", count_only=True)
+
+        assert result["count"] == 20
+        assert result["capped"] is True
+        assert "documents" not in result
+        assert [call["limit"] for call in data.calls] == [8, 8, 5]
+        assert all(call["fields"] == "_key" for call in data.calls)
+
+
+class FlakyBatchData:
+    """batch_save stub that fails chunks on request and records chunk sizes."""
+
+    def __init__(self, transient_failures: int = 0, broken_offsets: tuple[int, ...] = ()):
+        self.transient_failures = transient_failures
+        self.broken_offsets = broken_offsets
+        self.chunk_sizes: list[int] = []
+        self._lock = threading.Lock()
+
+    def batch_save(self, *documents):
+        with self._lock:
+            self.chunk_sizes.append(len(documents))
+            # Only the first chunk fails transiently, so retries are deterministic
+            if self.transient_failures and documents[0]["n"] == 0:
+                self.transient_failures -= 1
+                raise ConnectionError("connection reset")
+        if documents[0]["n"] in self.broken_offsets:
+            raise ValueError("Document is too large")
+        return [d["_key"] for d in documents]
+
+
+class TestPutKvstoreDocuments:
+    def _tool(self, data, max_per_batch="4"):
+        collection = MagicMock()
+        collection.data = data
+        service = MagicMock()
+        service.kvstore = {"assets": collection}
+        limits = Mock()
+        limits.body.read.return_value = json.dumps(
+            {"entry": [{"content": {"max_documents_per_batch_save": max_per_batch}}]}
+        ).encode("utf-8")
+        service.get.return_value = limits
+        tool = PutKvstoreDocuments("put_kvstore_documents", "test")
+        tool.check_splunk_available = MagicMock(return_value=(True, service, ""))
+        return tool
+
+    async def test_chunks_to_server_limit_and_retries(self, monkeypatch):
+        monkeypatch.setattr(kvstore_data.asyncio, "sleep", AsyncMock())
+        data = FlakyBatchData(transient_failures=1, broken_offsets=(4,))
+        tool = self._tool(data)
+        documents = [{"_key": str(i), "n": i} for i in range(10)]
+
+        result = await tool.execute(
+            AsyncMock(spec=Context), collection="assets", documents=documents, concurrency=2
+        )
+
+        assert result["status"] == "success"
+        assert result["chunks"] == 3
+        assert result["chunk_size"] == 4
+        assert result["documents_submitted"] == 10
+        assert result["documents_saved"] == 6
+        assert result["retries"] == 1
+        assert result["failed_chunks"] == [
+            {
+                "index": 1,
+                "offset": 4,
+                "size": 4,
+                "attempts": 1,
+                "error": "Document is too large",
+            }
+        ]
+        assert max(data.chunk_sizes) == 4
+
+    async def test_keyless_chunks_are_not_retried(self, monkeypatch):
+        monkeypatch.setattr(kvstore_data.asyncio, "sleep", AsyncMock())
+        data = FlakyBatchData(transient_failures=1)
+        data.batch_save = Mock(side_effect=ConnectionError("connection reset"))
+        tool = self._tool(data)
+
+        result = await tool.execute(
+            AsyncMock(spec=Context), collection="assets", documents=[{"n": 0}, {"n": 1}]
+        )
+
+        assert result["retries"] == 0
+        assert result["failed_chunks"][0]["attempts"] == 1
+        assert data.batch_save.call_count == 1
+
+    async def test_reads_ndjson_file(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("MCP_KVSTORE_IMPORT_DIR", str(tmp_path))
+        path = tmp_path / "assets.ndjson"
+        path.write_text("\n".join(json.dumps({"_key": str(i), "n": i}) for i in range(5)) + "\n")
+        data = FlakyBatchData()
+        tool = self._tool(data, max_per_batch="1000")
+
+        result = await tool.execute(
+            AsyncMock(spec=Context), collection="assets", file_path="assets.ndjson", batch_size=2
+        )
+
+        assert result["documents_saved"] == 5
+        assert data.chunk_sizes == [2, 2, 1]
+
+    async def test_malformed_line_reports_what_was_saved(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("MCP_KVSTORE_IMPORT_DIR", str(tmp_path))
+        lines = [json.dumps({"_key": str(i), "n": i}) for i in range(6)]
+        lines[4] = "{not json"
+        (tmp_path / "assets.ndjson").write_text("\n".join(lines) + "\n")
+        data = FlakyBatchData()
+        tool = self._tool(data, max_per_batch="1000")
+
+        result = await tool.execute(
+            AsyncMock(spec=Context), collection="assets", file_path="assets.ndjson", batch_size=2
+        )
+
+        assert result["status"] == "error"
+        assert result["invalid_line"] == 5
+        assert "line 5" in result["error"]
+        # The chunk sent before the bad line finished before the response
+        assert result["documents_saved"] == 2
+        assert result["chunks"] == 1
+        assert data.chunk_sizes == [2]
+
+    async def test_rejects_non_ndjson_path(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("MCP_KVSTORE_IMPORT_DIR", str(tmp_path))
+        path = tmp_path / "secrets.txt"
+        path.write_text("{}")
+        tool = self._tool(FlakyBatchData())
+
+        result = await tool.execute(
+            AsyncMock(spec=Context), collection="assets", file_path=str(path)
+        )
+
+        assert result["status"] == "error"
+
+    async def test_rejects_paths_outside_import_dir(self, tmp_path, monkeypatch):
+        import_dir = tmp_path / "import"
+        import_dir.mkdir()
+        outside = tmp_path / "other.ndjson"
+        outside.write_text("{}\n")
+        tool = self._tool(FlakyBatchData())
+        ctx = AsyncMock(spec=Context)
+
+        monkeypatch.delenv("MCP_KVSTORE_IMPORT_DIR", raising=False)
+        disabled = await tool.execute(ctx, collection="assets", file_path=str(outside))
+        assert "disabled" in disabled["error"]
+
+        monkeypatch.setenv("MCP_KVSTORE_IMPORT_DIR", str(import_dir))
+        for file_path in (str(outside), "../other.ndjson"):
+            result = await tool.execute(ctx, collection="assets", file_path=file_path)
+            assert result["error"] == "file_path must be inside MCP_KVSTORE_IMPORT_DIR"
@@ -0,0 +1,103 @@
+"""
+Tests for queued logging with session correlation, JSON output and sampling.
+"""
+
+import json
+import logging
+
+import pytest
+
+from src.core import logging_config
+from src.core.logging_config import (
+    SamplingFilter,
+    configure_logging,
+    current_session_id,
+    parse_sampling,
+    stop_logging,
+)
+
+
+@pytest.fixture
+def queued_logging(tmp_path):
+    """Configure queued logging to a file, restoring the root logger afterwards."""
+    root = logging.getLogger()
+    saved_handlers, saved_level = list(root.handlers), root.level
+    log_file = tmp_path / "server.log"
+
+    def configure(**kwargs):
+        configure_logging(logging.INFO, str(log_file), force=True, **kwargs)
+        return log_file
+
+    yield configure
+
+    stop_logging()
+    root.removeHandler(logging_config._queue_handler)
+    logging_config._queue_handler = None
+    for handler in saved_handlers:
+        root.addHandler(handler)
+    root.setLevel(saved_level)
+
+
+def _record(name: str, level: int = logging.INFO) -> logging.LogRecord:
+    return logging.LogRecord(name, level, __file__, 1, "message", None, None)
+
+
+def test_records_carry_session_from_context(queued_logging):
+    log_file = queued_logging(json_output=False)
+    token = current_session_id.set("session-123")
+    try:
+        logging.getLogger("src.test").info("hello %s", "world")
+    finally:
+        current_session_id.reset(token)
+    logging.getLogger("src.test").info("outside")
+    stop_logging()
+
+    lines = log_file.read_text().splitlines()
+    assert lines[0].endswith("[session-123] hello world")
+    assert lines[1].endswith("[-] outside")
+
+
+def test_json_output_keeps_exception_separate(queued_logging):
+    log_file = queued_logging(json_output=True)
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        logging.getLogger("src.test").exception("failed")
+    stop_logging()
+
+    entry = json.loads(log_file.read_text().splitlines()[0])
+    assert entry["message"] == "failed"
+    assert entry["level"] == "ERROR"
+    assert entry["session"] == "-"
+    assert "ValueError: boom" in entry["exception"]
+
+
+def test_sampling_keeps_one_in_n_below_warning():
+    sampler = SamplingFilter({"src.server": 0.25})
+
+    kept = [sampler.filter(_record("src.server")) for _ in range(8)]
+    child = [sampler.filter(_record("src.server.child")) for _ in range(4)]
+
+    assert kept.count(True) == 2
+    assert child.count(True) == 1
+    assert sampler.filter(_record("src.server", logging.WARNING))
+    assert all(sampler.filter(_record("src.tools")) for _ in range(3))
+    assert sampler.dropped == 9
+
+
+def test_parse_sampling_ignores_invalid_entries():
+    assert parse_sampling("src.server=0.1, src.core.loader=2,bad=x,") == {
+        "src.server": 0.1,
+        "src.core.loader": 1.0,
+    }
+
+
+def test_existing_handlers_are_kept_without_force():
+    root = logging.getLogger()
+    handler = logging.NullHandler()
+    root.addHandler(handler)
+    try:
+        assert configure_logging(logging.INFO) is None
+        assert handler in root.handlers
+    finally:
+        root.removeHandler(handler)
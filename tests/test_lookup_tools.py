@@ -1,13 +1,18 @@
 """
 Tests for lookup tools.
 
-Tests the ListLookupFiles and ListLookupDefinitions tools.
+Tests the ListLookupFiles, ListLookupDefinitions and ReadLookup tools.
 """
 
 import json
-from unittest.mock import Mock
+from io import BytesIO
+from unittest.mock import AsyncMock, MagicMock, Mock
 
 import pytest
+from fastmcp import Context
+
+from src.tools.lookups.lookup_cache import lookup_table_cache
+from src.tools.lookups.read_lookup import ReadLookup
 
 
 class TestListLookupFiles:
@@ -165,3 +170,95 @@ class TestListLookupDefinitions:
                     assert "name" in first_def
                     assert "filename" in first_def
                     assert "type" in first_def
+
+
+class TestReadLookup:
+    """Test suite for ReadLookup paging, filtering and caching."""
+
+    ROWS = [
+        {"country": "France", "iso2": "FR", "population": "68000000"},
+        {"country": "Finland", "iso2": "FI", "population": "5500000"},
+        {"country": "Germany", "iso2": "DE", "population": "84000000"},
+        {"country": "Fiji", "iso2": "FJ", "population": "900000"},
+    ]
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        lookup_table_cache.clear()
+        yield
+        lookup_table_cache.clear()
+
+    def _service(self, updated="2024-01-15T10:30:00"):
+        service = MagicMock()
+        metadata = Mock()
+        metadata.body.read.return_value = json.dumps(
+            {
+                "entry": [
+                    {
+                        "name": "countries.csv",
+                        "id": "https://localhost:8089/servicesNS/nobody/search/data/lookup-table-files/countries.csv",
+                        "updated": updated,
+                        "content": {"filename": "countries.csv"},
+                        "acl": {"app": "search", "owner": "nobody"},
+                    }
+                ]
+            }
+        ).encode("utf-8")
+        service.get.return_value = metadata
+        service.jobs.oneshot.side_effect = lambda *a, **k: BytesIO(
+            json.dumps({"preview": False, "results": self.ROWS}).encode("utf-8")
+        )
+        return service
+
+    def _tool(self, service):
+        tool = ReadLookup("read_lookup", "test")
+        tool.check_splunk_available = MagicMock(return_value=(True, service, ""))
+        return tool
+
+    async def test_filters_projects_and_pages(self):
+        service = self._service()
+        tool = self._tool(service)
+
+        result = await tool.execute(
+            AsyncMock(spec=Context),
+            lookup="countries.csv",
+            where="country=F* AND population>1000000",
+            fields=["iso2"],
+            limit=1,
+        )
+
+        assert result["status"] == "success"
+        assert result["rows"] == [{"iso2": "FR"}]
+        assert result["total_matching"] == 2
+        assert result["has_more"] is True
+        assert result["next_offset"] == 1
+        query = service.jobs.oneshot.call_args[0][0]
+        assert query.startswith("| inputlookup max=") and '"countries.csv"' in query
+
+    async def test_unchanged_lookup_is_served_from_cache(self):
+        service = self._service()
+        tool = self._tool(service)
+
+        first = await tool.execute(AsyncMock(spec=Context), lookup="countries.csv")
+        second = await tool.execute(AsyncMock(spec=Context), lookup="countries.csv", offset=2)
+
+        assert first["cache"]["hit"] is False
+        assert second["cache"]["hit"] is True
+        assert [row["iso2"] for row in second["rows"]] == ["DE", "FJ"]
+        assert service.jobs.oneshot.call_count == 1
+
+        # A new updated timestamp invalidates the cached table
+        changed = self._service(updated="2024-02-01T00:00:00")
+        result = await self._tool(changed).execute(AsyncMock(spec=Context), lookup="countries.csv")
+        assert result["cache"]["hit"] is False
+        assert changed.jobs.oneshot.call_count == 1
+
+    async def test_invalid_where_is_rejected(self):
+        tool = self._tool(self._service())
+
+        result = await tool.execute(
+            AsyncMock(spec=Context), lookup="countries.csv", where="country LIKE 'F%'"
+        )
+
+        assert result["status"] == "error"
+        assert "Unsupported where condition" in result["error"]
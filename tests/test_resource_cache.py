@@ -0,0 +1,168 @@
+"""
+Tests for the per-identity cache of rendered Splunk resources.
+"""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from src.core.resource_cache import SplunkResourceCache, resource_cache_key
+from src.resources.splunk_config import SplunkIndexesResource
+
+
+class FakeSplunk:
+    """Counts connections and renders."""
+
+    def __init__(self):
+        self.connects = 0
+        self.renders = 0
+        self.version = 1
+        self.fail = False
+        self.service = object()
+
+    async def connect(self):
+        self.connects += 1
+        return Mock(client_id="client_1"), self.service
+
+    async def render(self, identity, service):
+        self.renders += 1
+        await asyncio.sleep(0.01)
+        if self.fail:
+            raise ConnectionError("splunkd unreachable")
+        return f"content v{self.version}", True
+
+
+class TestSplunkResourceCache:
+    async def test_fresh_content_needs_no_connection(self):
+        cache = SplunkResourceCache(enabled=True)
+        splunk = FakeSplunk()
+
+        first = await cache.get("splunk://indexes/list|a", 60, splunk.connect, splunk.render)
+        second = await cache.get("splunk://indexes/list|a", 60, splunk.connect, splunk.render)
+
+        assert first == second == "content v1"
+        assert splunk.connects == 1 and splunk.renders == 1
+        assert cache.stats()["hits"] == 1
+
+    async def test_concurrent_reads_share_one_render(self):
+        cache = SplunkResourceCache(enabled=True)
+        splunk = FakeSplunk()
+
+        results = await asyncio.gather(
+            *(cache.get("key", 60, splunk.connect, splunk.render) for _ in range(5))
+        )
+
+        assert set(results) == {"content v1"}
+        assert splunk.renders == 1
+        assert cache.stats()["coalesced"] == 4
+
+    async def test_stale_content_is_served_while_refreshing(self):
+        cache = SplunkResourceCache(enabled=True, max_stale=60)
+        splunk = FakeSplunk()
+        await cache.get("key", 0.01, splunk.connect, splunk.render)
+        await asyncio.sleep(0.02)
+
+        splunk.version = 2
+        assert await cache.get("key", 0.01, splunk.connect, splunk.render) == "content v1"
+        await asyncio.sleep(0.05)
+
+        assert cache._entries["key"]["content"] == "content v2"
+        # The refresh reused the service of the first render
+        assert splunk.connects == 1
+        assert cache.stats()["refreshes"] == 1
+
+    async def test_failed_refresh_reconnects_on_the_next_read(self):
+        cache = SplunkResourceCache(enabled=True, max_stale=60)
+        splunk = FakeSplunk()
+        await cache.get("key", 0.01, splunk.connect, splunk.render)
+        await asyncio.sleep(0.02)
+
+        splunk.fail = True
+        assert await cache.get("key", 0.01, splunk.connect, splunk.render) == "content v1"
+        await asyncio.sleep(0.05)
+        # The background refresh never connects with the request's callable
+        assert splunk.connects == 1
+
+        # Still failing: the stale content is the answer
+        assert await cache.get("key", 0.01, splunk.connect, splunk.render) == "content v1"
+        assert splunk.connects == 2
+
+        splunk.fail = False
+        splunk.version = 2
+        assert await cache.get("key", 0.01, splunk.connect, splunk.render) == "content v2"
+        assert splunk.connects == 3
+        assert cache.stats()["failures"] == 2
+
+    async def test_content_past_max_stale_is_rendered_before_answering(self):
+        cache = SplunkResourceCache(enabled=True, max_stale=0)
+        splunk = FakeSplunk()
+        await cache.get("key", 0.01, splunk.connect, splunk.render)
+        await asyncio.sleep(0.02)
+
+        splunk.version = 2
+        assert await cache.get("key", 0.01, splunk.connect, splunk.render) == "content v2"
+
+    async def test_failures_and_error_reports_are_not_cached(self):
+        cache = SplunkResourceCache(enabled=True)
+        splunk = FakeSplunk()
+        splunk.fail = True
+
+        with pytest.raises(ConnectionError):
+            await cache.get("key", 60, splunk.connect, splunk.render)
+
+        async def error_report(identity, service):
+            return '{"status": "error"}', False
+
+        await cache.get("key", 60, splunk.connect, error_report)
+        splunk.fail = False
+        assert await cache.get("key", 60, splunk.connect, splunk.render) == "content v1"
+
+    async def test_disabled_cache_renders_every_read(self):
+        cache = SplunkResourceCache(enabled=False)
+        splunk = FakeSplunk()
+
+        for _ in range(3):
+            await cache.get("key", 60, splunk.connect, splunk.render)
+
+        assert splunk.renders == 3
+
+
+def test_cache_key_separates_identities_and_credentials():
+    base = {"splunk_host": "sh1", "splunk_username": "alice", "splunk_password": "a"}
+
+    key = resource_cache_key("splunk://apps/installed", base)
+
+    assert key == resource_cache_key("splunk://apps/installed", dict(base))
+    assert key != resource_cache_key("splunk://apps/installed", {**base, "splunk_password": "b"})
+    assert key != resource_cache_key("splunk://apps/installed", {**base, "splunk_username": "bob"})
+    assert key != resource_cache_key("splunk://indexes/list", base)
+    # Credentials are only present as a hash
+    assert not key.endswith("|a")
+
+
+async def test_polling_indexes_resource_reads_splunk_once(monkeypatch):
+    cache = SplunkResourceCache(enabled=True)
+    monkeypatch.setattr("src.resources.splunk_config.splunk_resource_cache", cache)
+
+    resource = SplunkIndexesResource(
+        SplunkIndexesResource.METADATA.uri,
+        SplunkIndexesResource.METADATA.name,
+        SplunkIndexesResource.METADATA.description,
+    )
+    resource.config_extractor = Mock()
+    resource.config_extractor.extract_client_config = AsyncMock(
+        return_value={"splunk_host": "sh1", "splunk_username": "alice"}
+    )
+    resource.client_manager = Mock()
+    resource.client_manager.get_client_connection = AsyncMock(
+        return_value=(Mock(client_id="client_1", splunk_host="sh1"), Mock())
+    )
+    resource._get_indexes_data = AsyncMock(return_value={"status": "success", "indexes": ["main"]})
+
+    reads = [json.loads(await resource.get_content(Mock())) for _ in range(5)]
+
+    assert all(read["indexes"] == ["main"] for read in reads)
+    assert resource.client_manager.get_client_connection.await_count == 1
+    assert resource._get_indexes_data.await_count == 1
@@ -0,0 +1,95 @@
+"""
+Tests for the shared server-side REST listing helper.
+"""
+
+import json
+from unittest.mock import AsyncMock, MagicMock, Mock
+
+from fastmcp import Context
+
+from src.core.rest_listing import RestEntityListing, acl_filters
+from src.tools.search.saved_search_tools import ListSavedSearches
+
+
+class PagedService:
+    """Fake service serving a fixed entry list with Splunk-style paging."""
+
+    def __init__(self, names):
+        self.entries = [
+            {"name": n, "updated": "2024-01-01T00:00:00", "content": {}, "acl": {"app": "search"}}
+            for n in names
+        ]
+        self.calls = []
+
+    def get(self, endpoint, **params):
+        self.calls.append((endpoint, params))
+        offset, count = params["offset"], params["count"]
+        payload = {
+            "entry": self.entries[offset : offset + count],
+            "paging": {"total": len(self.entries), "offset": offset, "perPage": count},
+        }
+        response = Mock()
+        response.body.read.return_value = json.dumps(payload).encode("utf-8")
+        return response
+
+
+class TestRestEntityListing:
+    """Test RestEntityListing paging and parameter push-down."""
+
+    def test_pages_lazily_until_count(self):
+        service = PagedService([f"e{i}" for i in range(25)])
+        listing = RestEntityListing(service, "/services/x", count=12, offset=3, page_size=5)
+
+        names = [entry["name"] for entry in listing]
+
+        assert names == [f"e{i}" for i in range(3, 15)]
+        assert [call[1]["count"] for call in service.calls] == [5, 5, 2]
+        assert listing.paging() == {"total": 25, "offset": 3, "has_more": True, "next_offset": 15}
+
+    def test_count_zero_reads_everything(self):
+        service = PagedService([f"e{i}" for i in range(7)])
+        listing = RestEntityListing(service, "/services/x", page_size=3)
+
+        assert len(list(listing)) == 7
+        assert listing.paging()["has_more"] is False
+        assert listing.paging()["next_offset"] is None
+
+    def test_pushes_filters_sort_and_projection(self):
+        service = PagedService(["a"])
+        listing = RestEntityListing(
+            service,
+            "/services/x",
+            search=["eai:acl.app=search", "disabled=0"],
+            sort_key="name",
+            fields=["label"],
+        )
+        list(listing)
+
+        params = service.calls[0][1]
+        assert params["output_mode"] == "json"
+        assert params["search"] == ["eai:acl.app=search", "disabled=0"]
+        assert params["sort_key"] == "name"
+        assert params["f"] == ["label"]
+
+    def test_acl_filters(self):
+        assert acl_filters(owner="admin", sharing="app") == [
+            "eai:acl.owner=admin",
+            "eai:acl.sharing=app",
+        ]
+        assert acl_filters() == []
+
+
+async def test_list_saved_searches_uses_server_side_filters():
+    service = PagedService(["Errors", "Logins"])
+    tool = ListSavedSearches("list_saved_searches", "test")
+    tool.check_splunk_available = MagicMock(return_value=(True, service, ""))
+
+    result = await tool.execute(AsyncMock(spec=Context), app="search", count=1)
+
+    assert result["status"] == "success"
+    assert [s["name"] for s in result["saved_searches"]] == ["Errors"]
+    assert result["total_count"] == 2
+    assert result["has_more"] is True
+    endpoint, params = service.calls[0]
+    assert endpoint == "/servicesNS/-/-/saved/searches"
+    assert params["search"] == ["eai:acl.app=search", "disabled=0"]
@@ -0,0 +1,112 @@
+"""
+Tests for saved search tools.
+
+Exercises ExecuteSavedSearch directly with mocked splunklib objects.
+"""
+
+import json
+import time
+from io import BytesIO
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastmcp import Context
+
+from src.tools.search.saved_search_tools import ExecuteSavedSearch
+
+
+def _results_stream(rows):
+    """Build a JSON results stream as returned by job.results(output_mode='json')."""
+    return BytesIO(json.dumps({"preview": False, "results": rows}).encode("utf-8"))
+
+
+def _scheduled_job(dispatched_at: int, rows=None, failed=False, scheduled=True):
+    job = MagicMock()
+    job.sid = f"scheduler__admin__search__RMD5abc_at_{dispatched_at}_42"
+    job.content = {
+        "isScheduled": "1" if scheduled else "0",
+        "isDone": "1",
+        "isFailed": "1" if failed else "0",
+        "resultCount": str(len(rows or [])),
+        "eventCount": "10",
+        "earliestTime": "2024-01-01T00:00:00.000+00:00",
+        "latestTime": "2024-01-01T01:00:00.000+00:00",
+    }
+    job.results.side_effect = lambda **kwargs: _results_stream(
+        (rows or [])[kwargs.get("offset", 0) : kwargs.get("offset", 0) + kwargs.get("count", 100)]
+    )
+    return job
+
+
+class TestExecuteSavedSearchCached:
+    """Test prefer_cached artifact reuse in ExecuteSavedSearch."""
+
+    @pytest.fixture
+    def saved_search(self):
+        saved_search = MagicMock()
+        saved_search.name = "Hourly Report"
+        saved_search.content = {"search": "index=main | stats count", "disabled": "0"}
+        return saved_search
+
+    @pytest.fixture
+    def tool(self, saved_search):
+        tool = ExecuteSavedSearch("execute_saved_search", "test")
+        service = MagicMock()
+        service.saved_searches = {"Hourly Report": saved_search}
+        tool.check_splunk_available = MagicMock(return_value=(True, service, ""))
+        return tool
+
+    async def test_fresh_artifact_is_reused(self, tool, saved_search):
+        now = int(time.time())
+        rows = [{"count": str(i)} for i in range(5)]
+        stale = _scheduled_job(now - 7200, rows)
+        failed = _scheduled_job(now - 60, rows, failed=True)
+        fresh = _scheduled_job(now - 300, rows)
+        saved_search.history.return_value = [stale, failed, fresh]
+
+        result = await tool.execute(
+            AsyncMock(spec=Context),
+            name="Hourly Report",
+            prefer_cached=True,
+            max_age=900,
+            max_results=2,
+            offset=2,
+        )
+
+        assert result["status"] == "success"
+        assert result["execution_mode"] == "cached"
+        assert result["job_id"] == fresh.sid
+        assert result["cache"]["hit"] is True
+        assert 290 <= result["cache"]["artifact_age_seconds"] <= 900
+        assert result["results"] == [{"count": "2"}, {"count": "3"}]
+        assert result["has_more"] is True
+        assert result["next_offset"] == 4
+        saved_search.dispatch.assert_not_called()
+        # Stale artifacts are rejected from the sid alone, without a refresh round trip
+        stale.refresh.assert_not_called()
+
+    async def test_falls_back_to_dispatch_without_fresh_artifact(self, tool, saved_search):
+        saved_search.history.return_value = [_scheduled_job(int(time.time()) - 7200)]
+        saved_search.dispatch.return_value = _results_stream([{"count": "1"}])
+
+        result = await tool.execute(
+            AsyncMock(spec=Context), name="Hourly Report", prefer_cached=True, max_age=600
+        )
+
+        assert result["status"] == "success"
+        assert result["execution_mode"] == "oneshot"
+        assert result["cache"]["hit"] is False
+        saved_search.dispatch.assert_called_once()
+
+    async def test_time_override_skips_cache(self, tool, saved_search):
+        saved_search.dispatch.return_value = _results_stream([])
+
+        result = await tool.execute(
+            AsyncMock(spec=Context),
+            name="Hourly Report",
+            prefer_cached=True,
+            earliest_time="-15m",
+        )
+
+        assert result["cache"] == {"hit": False, "reason": "time range overridden"}
+        saved_search.history.assert_not_called()
@@ -0,0 +1,169 @@
+"""
+Tests for the per-connection Splunk server-info cache used by the documentation tools.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from src.core import server_info
+from src.core.server_info import ServerInfoCache, connection_identity
+from src.tools.docs.splunk_docs_tools import GetSPLReference
+
+
+class FakeService:
+    """Counts ``/services/server/info`` reads."""
+
+    def __init__(self, version: str = "9.4.2", fail: bool = False):
+        self.version = version
+        self.fail = fail
+        self.reads = 0
+
+    @property
+    def info(self):
+        self.reads += 1
+        if self.fail:
+            raise ConnectionError("splunkd unreachable")
+        return {
+            "version": self.version,
+            "build": "abc123",
+            "serverName": "sh1",
+            "host": "sh1.example.com",
+            "product_type": "enterprise",
+        }
+
+
+def _connect(service):
+    return AsyncMock(return_value=service)
+
+
+class TestServerInfoCache:
+    async def test_known_version_needs_no_round_trip(self):
+        cache = ServerInfoCache(ttl=60)
+        service = FakeService()
+        connect = _connect(service)
+
+        first = await cache.get("conn", connect)
+        second = await cache.get("conn", connect)
+
+        assert first == second
+        assert first.as_dict() == {
+            "version": "9.4.2",
+            "build": "abc123",
+            "server_name": "sh1",
+            "product_type": "enterprise",
+        }
+        assert service.reads == 1
+        assert connect.await_count == 1
+        assert cache.stats()["hits"] == 1
+
+    async def test_concurrent_misses_share_one_read(self):
+        cache = ServerInfoCache(ttl=60)
+        service = FakeService()
+        connect = _connect(service)
+
+        results = await asyncio.gather(*(cache.get("conn", connect) for _ in range(5)))
+
+        assert {info.version for info in results} == {"9.4.2"}
+        assert service.reads == 1
+
+    async def test_stale_entry_is_served_while_refreshing(self):
+        cache = ServerInfoCache(ttl=0)
+        service = FakeService()
+        connect = _connect(service)
+        await cache.get("conn", connect)
+
+        service.version = "10.0.0"
+        stale = await cache.get("conn", connect)
+        assert stale.version == "9.4.2"
+        await asyncio.sleep(0.05)
+
+        refreshed = cache.peek("conn")
+        assert refreshed.version == "10.0.0"
+        # The refresh reused the service from the first read instead of reconnecting
+        assert connect.await_count == 1
+        assert cache.stats()["refreshes"] >= 1
+
+    async def test_unavailable_connection_is_not_retried_immediately(self):
+        cache = ServerInfoCache(ttl=60, retry_seconds=60)
+        service = FakeService(fail=True)
+        connect = _connect(service)
+
+        assert await cache.get("conn", connect) is None
+        assert await cache.get("conn", connect) is None
+        assert service.reads == 1
+        assert cache.stats()["failures"] == 1
+
+    async def test_connections_are_cached_separately(self):
+        cache = ServerInfoCache(ttl=60)
+        await cache.get("a", _connect(FakeService("9.3.1")))
+        await cache.get("b", _connect(FakeService("10.0.0")))
+
+        assert cache.peek("a").version == "9.3.1"
+        assert cache.peek("b").version == "10.0.0"
+
+    async def test_least_recently_used_connection_is_dropped(self):
+        cache = ServerInfoCache(ttl=60, max_entries=2)
+        await cache.get("a", _connect(FakeService()))
+        await cache.get("b", _connect(FakeService()))
+        await cache.get("a", _connect(FakeService()))
+        await cache.get("c", _connect(FakeService()))
+
+        assert cache.peek("b") is None
+        assert cache.peek("a") is not None and cache.peek("c") is not None
+        assert cache.stats()["connections"] == 2
+
+
+def test_connection_identity_distinguishes_client_configs(monkeypatch):
+    monkeypatch.setenv("SPLUNK_HOST", "default.example.com")
+    monkeypatch.setenv("SPLUNK_USERNAME", "admin")
+
+    default = connection_identity(None)
+    other = connection_identity({"splunk_host": "other.example.com", "splunk_username": "bob"})
+
+    assert default == connection_identity({})
+    assert "default.example.com" in default
+    assert other != default
+    assert (
+        connection_identity({"splunk_host": "other.example.com", "splunk_username": "bob"}) == other
+    )
+
+
+class TestDocsToolVersion:
+    @pytest.fixture
+    def cache(self, monkeypatch):
+        cache = ServerInfoCache(ttl=60)
+        monkeypatch.setattr(server_info, "server_info_cache", cache)
+        return cache
+
+    async def test_docs_tool_resolves_version_once_per_connection(self, cache):
+        service = FakeService("9.4.2")
+        tool = GetSPLReference("get_spl_reference", "SPL reference")
+        tool.get_client_config_from_context = Mock(return_value=None)
+        tool.get_splunk_service = AsyncMock(return_value=service)
+        ctx = Mock()
+
+        versions = [await server_info.get_splunk_version(ctx, tool) for _ in range(3)]
+
+        assert versions == ["9.4.2"] * 3
+        assert service.reads == 1
+        assert tool.get_splunk_service.await_count == 1
+
+    async def test_falls_back_to_latest_without_a_connection(self, cache):
+        tool = GetSPLReference("get_spl_reference", "SPL reference")
+        tool.get_client_config_from_context = Mock(return_value=None)
+        tool.get_splunk_service = AsyncMock(side_effect=Exception("not connected"))
+
+        assert await server_info.get_splunk_version(Mock(), tool) == "latest"
+        assert await server_info.get_splunk_version(None, tool) == "latest"
+
+    async def test_resources_resolve_the_connection_without_a_tool(self, cache, monkeypatch):
+        service = FakeService("9.2.0")
+        monkeypatch.setattr(server_info, "client_config_from_context", Mock(return_value=None))
+        monkeypatch.setattr(
+            server_info, "splunk_service_from_context", AsyncMock(return_value=service)
+        )
+
+        assert await server_info.get_splunk_version(Mock()) == "9.2.0"
+        assert service.reads == 1
@@ -0,0 +1,50 @@
+"""
+Tests for namespace-scoped service views.
+"""
+
+from unittest.mock import Mock
+
+from splunklib import client
+
+from src.core.service_views import service_view
+
+
+def _service():
+    return client.Service(host="splunk.example.com", token="Splunk abc", owner="admin")
+
+
+class TestServiceView:
+    def test_view_has_own_namespace_and_shares_session(self):
+        service = _service()
+
+        view = service_view(service, owner="nobody", app="search", sharing="app")
+
+        assert view._abspath("saved/searches") == "/servicesNS/nobody/search/saved/searches"
+        assert service._abspath("saved/searches") == "/servicesNS/admin/system/saved/searches"
+        assert view.http is service.http
+        assert view.token == service.token
+
+    def test_unset_parts_are_inherited(self):
+        service = _service()
+
+        view = service_view(service, app="search")
+
+        assert view.namespace.owner == "admin"
+        assert view.namespace.app == "search"
+
+    def test_sdk_properties_do_not_touch_shared_namespace(self):
+        service = _service()
+        views = [service_view(service, owner="nobody", app=app) for app in ("a", "b")]
+
+        collections = [view.kvstore for view in views]
+
+        assert service.namespace.owner == "admin"
+        assert [c.service._abspath(c.path) for c in collections] == [
+            "/servicesNS/nobody/a/storage/collections/config",
+            "/servicesNS/nobody/b/storage/collections/config",
+        ]
+
+    def test_non_splunklib_services_are_returned_unchanged(self):
+        double = Mock()
+
+        assert service_view(double, app="search") is double
@@ -0,0 +1,202 @@
+"""
+Tests for the per-session client configuration stores.
+"""
+
+import fnmatch
+import time
+
+import pytest
+from cryptography.fernet import Fernet
+
+from src.core.session_store import (
+    MemorySessionStore,
+    RedisSessionStore,
+    SessionCipher,
+    SQLiteSessionStore,
+    create_session_store,
+)
+
+CONFIG = {"splunk_host": "sh1", "splunk_username": "alice", "splunk_password": "s3cr3t-pass"}
+
+
+class FakeRedis:
+    """The subset of redis.Redis used by the store; expiry is tracked but not enforced."""
+
+    def __init__(self):
+        self.data: dict[str, bytes] = {}
+        self.expiry: dict[str, int] = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, ex=None):
+        self.data[key] = value
+        self.expiry[key] = ex
+
+    def delete(self, key):
+        return 1 if self.data.pop(key, None) is not None else 0
+
+    def ttl(self, key):
+        return self.expiry.get(key, -2) if key in self.data else -2
+
+    def expire(self, key, seconds):
+        self.expiry[key] = seconds
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    def scan_iter(self, match):
+        return [key.encode() for key in self.data if fnmatch.fnmatch(key, match)]
+
+    def close(self):
+        pass
+
+
+class FakePipeline:
+    """Queues FakeRedis calls until execute()."""
+
+    def __init__(self, client):
+        self.client = client
+        self.calls = []
+
+    def __getattr__(self, name):
+        return lambda *args: self.calls.append((getattr(self.client, name), args))
+
+    def execute(self):
+        return [method(*args) for method, args in self.calls]
+
+
+@pytest.fixture
+def cipher():
+    return SessionCipher(Fernet.generate_key())
+
+
+def test_memory_store_expires_entries():
+    store = MemorySessionStore(ttl=0.05)
+    store["s1"] = CONFIG
+
+    assert store.get("s1") == CONFIG
+    time.sleep(0.06)
+    assert store.get("s1") is None
+    assert len(store) == 0
+
+
+def test_sqlite_store_is_shared_between_replicas(tmp_path, cipher):
+    path = tmp_path / "sessions.sqlite3"
+    replica_a = SQLiteSessionStore(path, 60, cipher)
+    replica_b = SQLiteSessionStore(path, 60, cipher)
+
+    replica_a["s1"] = CONFIG
+    assert replica_b["s1"] == CONFIG
+    assert dict(replica_b.items()) == {"s1": CONFIG}
+
+    assert replica_b.pop("s1") == CONFIG
+    assert "s1" not in replica_a
+    replica_a.close()
+    replica_b.close()
+
+
+def test_sqlite_store_encrypts_and_expires(tmp_path, cipher):
+    path = tmp_path / "sessions.sqlite3"
+    store = SQLiteSessionStore(path, 0.05, cipher)
+    store["s1"] = CONFIG
+
+    assert b"s3cr3t-pass" not in path.read_bytes()
+    # Another key cannot read the entry
+    assert SQLiteSessionStore(path, 60, SessionCipher(Fernet.generate_key())).get("s1") is None
+
+    time.sleep(0.06)
+    assert store.get("s1") is None
+    store.close()
+
+
+def test_sqlite_store_sweeps_expired_rows_off_the_write_path(tmp_path, cipher):
+    path = tmp_path / "sessions.sqlite3"
+    store = SQLiteSessionStore(path, 0.05, cipher)
+    store["s1"] = CONFIG
+    time.sleep(0.06)
+    store["s2"] = CONFIG
+
+    rows = store._connection().execute("SELECT COUNT(*) FROM sessions").fetchone()[0]
+    assert rows == 2
+    assert store.purge_expired() == 1
+    assert list(store) == ["s2"]
+    store.close()
+
+
+async def test_identical_config_is_not_written_again(tmp_path, cipher, monkeypatch):
+    store = SQLiteSessionStore(tmp_path / "sessions.sqlite3", 60, cipher)
+    saves = []
+    save = store._save
+    monkeypatch.setattr(store, "_save", lambda *args: saves.append(args) or save(*args))
+
+    assert await store.write("s1", CONFIG)
+    assert not await store.write("s1", dict(CONFIG))
+    assert await store.write("s1", {**CONFIG, "splunk_host": "sh2"})
+    assert await store.read("s1") == {**CONFIG, "splunk_host": "sh2"}
+    assert len(saves) == 2
+    store.close()
+
+
+@pytest.mark.parametrize("backend", ["memory", "sqlite"])
+def test_unchanged_config_extends_expiry(tmp_path, cipher, backend):
+    if backend == "memory":
+        store = MemorySessionStore(ttl=0.3)
+    else:
+        store = SQLiteSessionStore(tmp_path / "sessions.sqlite3", 0.3, cipher)
+    store["s1"] = CONFIG
+    time.sleep(0.2)
+
+    # Past half the TTL: the equal value is not rewritten but its expiry moves
+    assert not store.put_if_changed("s1", dict(CONFIG))
+    time.sleep(0.2)
+    assert store.get("s1") == CONFIG
+    store.close()
+
+
+async def test_delete_runs_off_the_event_loop(tmp_path, cipher):
+    store = SQLiteSessionStore(tmp_path / "sessions.sqlite3", 60, cipher)
+    await store.write("s1", CONFIG)
+
+    assert await store.delete("s1")
+    assert not await store.delete("s1")
+    assert await store.read("s1") is None
+    store.close()
+
+
+def test_redis_store_sets_ttl_and_encrypts(cipher):
+    client = FakeRedis()
+    store = RedisSessionStore("redis://localhost", 120, cipher, client=client)
+
+    store["s1"] = CONFIG
+
+    assert client.expiry == {"mcp:session:s1": 120}
+    assert b"s3cr3t-pass" not in client.data["mcp:session:s1"]
+    assert list(store) == ["s1"]
+    assert store["s1"] == CONFIG
+    client.expiry["mcp:session:s1"] = 30
+    assert not store.put_if_changed("s1", CONFIG)
+    assert client.expiry == {"mcp:session:s1": 120}
+    del store["s1"]
+    assert "s1" not in store
+
+
+def test_factory_selects_backend(tmp_path, monkeypatch):
+    monkeypatch.delenv("MCP_SESSION_STORE", raising=False)
+    assert isinstance(create_session_store(), MemorySessionStore)
+
+    key = Fernet.generate_key().decode()
+    store = create_session_store(f"sqlite:///{tmp_path}/s.sqlite3", key=key)
+    assert isinstance(store, SQLiteSessionStore)
+    assert store.stats()["backend"] == "sqlite"
+    assert store.path == tmp_path / "s.sqlite3"
+    store.close()
+
+
+def test_shared_backend_requires_encryption_key(tmp_path, monkeypatch):
+    monkeypatch.delenv("MCP_SESSION_ENCRYPTION_KEY", raising=False)
+
+    with pytest.raises(ValueError, match="MCP_SESSION_ENCRYPTION_KEY"):
+        create_session_store(f"sqlite:///{tmp_path}/s.sqlite3")
+    with pytest.raises(ValueError, match="Unsupported"):
+        create_session_store("memcached://localhost")
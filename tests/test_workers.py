@@ -0,0 +1,124 @@
+"""
+Tests for pre-fork worker mode of the HTTP transport.
+"""
+
+import os
+import signal
+import socket
+import subprocess
+import sys
+import textwrap
+import time
+from pathlib import Path
+
+import httpx
+import pytest
+from cryptography.fernet import Fernet
+
+from src.core.client_identity import get_client_manager
+from src.core.resource_cache import splunk_resource_cache
+from src.core.session_store import SessionCipher, SQLiteSessionStore
+from src.core.workers import reset_worker_state, worker_count_from_env, worker_info
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+SUPERVISOR_SCRIPT = textwrap.dedent(
+    """
+    import sys
+
+    import uvicorn
+    from starlette.applications import Starlette
+    from starlette.responses import JSONResponse
+    from starlette.routing import Route
+
+    from src.core.workers import WorkerSupervisor, worker_info
+
+    async def whoami(request):
+        return JSONResponse(worker_info())
+
+    app = Starlette(routes=[Route("/", whoami)])
+    config = uvicorn.Config(app, host="127.0.0.1", port=int(sys.argv[1]), log_level="warning")
+    WorkerSupervisor(config, 2).run()
+    """
+)
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def test_worker_count_from_env(monkeypatch):
+    monkeypatch.setenv("MCP_WORKERS", "4")
+    assert worker_count_from_env() == 4
+    monkeypatch.setenv("MCP_WORKERS", "0")
+    assert worker_count_from_env() == 1
+    monkeypatch.setenv("MCP_WORKERS", "many")
+    assert worker_count_from_env() == 1
+
+
+def test_single_process_reports_worker_zero():
+    assert worker_info() == {"id": 0, "pid": os.getpid(), "workers": 1}
+
+
+async def test_health_responses_name_the_answering_worker():
+    from src.server import mcp
+
+    transport = httpx.ASGITransport(app=mcp.http_app())
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as http:
+        health = (await http.get("/health")).json()
+        cache = (await http.get("/health/cache")).json()
+
+    assert health["worker"] == cache["worker"] == worker_info()
+
+
+def test_reset_drops_state_inherited_from_supervisor():
+    manager = get_client_manager()
+    manager._connections["client_x"] = object()
+    splunk_resource_cache._store("splunk://apps/installed|x", "content", None, None)
+
+    reset_worker_state()
+
+    assert "client_x" not in manager._connections
+    assert splunk_resource_cache.stats()["entries"] == 0
+
+
+def test_sqlite_session_store_reopens_in_forked_process(tmp_path):
+    store = SQLiteSessionStore(tmp_path / "s.sqlite3", 60, SessionCipher(Fernet.generate_key()))
+    store["s1"] = {"splunk_host": "sh1"}
+    inherited = store._conn
+
+    # As seen from a worker forked after the store was opened
+    store._pid = -1
+
+    assert store["s1"] == {"splunk_host": "sh1"}
+    assert store._conn is not inherited
+    store.close()
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="worker mode requires os.fork")
+def test_supervisor_serves_from_forked_workers_and_stops_on_sigterm():
+    port = _free_port()
+    supervisor = subprocess.Popen(
+        [sys.executable, "-c", SUPERVISOR_SCRIPT, str(port)], cwd=PROJECT_ROOT
+    )
+    try:
+        info = None
+        deadline = time.monotonic() + 20
+        while info is None and time.monotonic() < deadline:
+            try:
+                info = httpx.get(f"http://127.0.0.1:{port}/", timeout=1).json()
+            except httpx.HTTPError:
+                time.sleep(0.2)
+
+        assert info is not None, "workers did not start"
+        assert info["workers"] == 2
+        assert info["id"] in (0, 1)
+        assert info["pid"] != supervisor.pid
+
+        supervisor.send_signal(signal.SIGTERM)
+        assert supervisor.wait(timeout=20) == 0
+    finally:
+        if supervisor.poll() is None:
+            supervisor.kill()